@@ -0,0 +1,321 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Async connection pool and IAM auth token cache for Aurora DSQL.
+
+Each tool invocation checks a connection out of the pool for the duration of
+its transaction and returns it afterwards, so concurrent agent sessions run in
+parallel instead of serializing on a single shared connection.
+
+DSQL authenticates with short-lived IAM tokens. Tokens are only checked when a
+connection is established, so one token can open any number of connections
+until it expires; AuthTokenCache regenerates it ahead of expiry instead of
+signing a new one for every connect.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from loguru import logger
+from psycopg.pq import TransactionStatus
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+
+# boto3 generate_db_connect_auth_token defaults to ExpiresIn=900.
+DEFAULT_TOKEN_TTL_SECONDS = 900
+# Regenerate the token once less than this much of its lifetime remains, so a
+# connect never races the expiry.
+DEFAULT_TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+# How long acquire() waits for a connection when the pool is exhausted.
+DEFAULT_POOL_TIMEOUT_SECONDS = 30.0
+# Idle connections older than this are pinged with HEALTH_CHECK_SQL on checkout.
+DEFAULT_HEALTH_CHECK_IDLE_SECONDS = 30.0
+# DSQL closes connections after 60 minutes; recycle them a little earlier.
+DEFAULT_MAX_CONNECTION_LIFETIME_SECONDS = 55 * 60
+
+HEALTH_CHECK_SQL = 'SELECT 1'
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the pool timeout."""
+
+
+class AuthTokenCache:
+    """Caches a DSQL IAM auth token and regenerates it ahead of expiry."""
+
+    def __init__(
+        self,
+        generate: Callable[[], Awaitable[str]],
+        ttl_seconds: float = DEFAULT_TOKEN_TTL_SECONDS,
+        refresh_margin_seconds: float = DEFAULT_TOKEN_REFRESH_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            generate: Coroutine function producing a fresh token
+            ttl_seconds: Lifetime of a generated token
+            refresh_margin_seconds: Remaining lifetime below which the token is regenerated
+            clock: Monotonic time source (overridable in tests)
+        """
+        self._generate = generate
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._clock = clock
+        self._token: Optional[str] = None
+        self._generated_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        age = self._clock() - self._generated_at
+        return self._token is not None and age < self.ttl_seconds - self.refresh_margin_seconds
+
+    async def get(self) -> str:
+        """Return a token with at least refresh_margin_seconds of validity left."""
+        if self._is_fresh():
+            return self._token  # type: ignore[return-value]
+        async with self._lock:
+            # Another waiter may have refreshed it while we queued on the lock.
+            if not self._is_fresh():
+                self._token = await self._generate()
+                self._generated_at = self._clock()
+                logger.debug('Generated new DSQL auth token')
+            return self._token  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        """Force the next get() to generate a new token."""
+        self._token = None
+
+
+@dataclass
+class _PooledConnection:
+    conn: Any
+    created_at: float
+    last_used: float
+
+
+class DsqlConnectionPool:
+    """A bounded asyncio pool of psycopg connections with health-checked checkout.
+
+    Connections are created lazily up to ``max_size``; ``open()`` pre-creates
+    ``min_size`` of them. On checkout an idle connection is discarded if it is
+    closed, broken or past ``max_lifetime_seconds``, and pinged first if it has
+    been idle longer than ``health_check_idle_seconds``. On release a
+    connection left inside a transaction is discarded rather than reused.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        timeout: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        health_check_idle_seconds: float = DEFAULT_HEALTH_CHECK_IDLE_SECONDS,
+        max_lifetime_seconds: float = DEFAULT_MAX_CONNECTION_LIFETIME_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the pool.
+
+        Args:
+            connect: Coroutine function opening a new connection
+            min_size: Number of connections opened by open()
+            max_size: Maximum number of connections open at once
+            timeout: Seconds acquire() waits for a free connection
+            health_check_idle_seconds: Idle time after which checkout pings the connection
+            max_lifetime_seconds: Age after which a connection is closed instead of reused
+            clock: Monotonic time source (overridable in tests)
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f'Invalid pool size: min_size={min_size}, max_size={max_size} '
+                '(require 0 <= min_size <= max_size and max_size >= 1)'
+            )
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_idle_seconds = health_check_idle_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self._clock = clock
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        # Connections open or being opened; never exceeds max_size.
+        self._size = 0
+        self._cond = asyncio.Condition()
+        self._opened = False
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of connections currently open (idle or checked out)."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of idle connections."""
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        """Number of checked-out connections."""
+        return len(self._in_use)
+
+    async def open(self) -> None:
+        """Pre-create min_size connections. Idempotent.
+
+        Failures are logged, not raised: the connection is retried (and the
+        error surfaced) by the next acquire().
+        """
+        if self._opened:
+            return
+        self._opened = True
+        async with self._cond:
+            missing = self.min_size - self._size
+            self._size += max(missing, 0)
+        if missing <= 0:
+            return
+        results = await asyncio.gather(
+            *(self._open_connection() for _ in range(missing)), return_exceptions=True
+        )
+        async with self._cond:
+            for result in results:
+                if isinstance(result, BaseException):
+                    self._size -= 1
+                    logger.warning(f'Failed to pre-create pooled connection: {result}')
+                else:
+                    self._idle.append(result)
+            self._cond.notify_all()
+
+    async def acquire(self) -> Any:
+        """Check out a healthy connection, opening one if the pool has room.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for ``timeout`` seconds
+            Exception: Whatever the connect function raises
+        """
+        if self._closed:
+            raise RuntimeError('Connection pool is closed')
+        deadline = self._clock() + self.timeout
+        while True:
+            candidate = None
+            async with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f'No connection available within {self.timeout}s '
+                            f'(max_size={self.max_size})'
+                        )
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                if self._idle:
+                    # LIFO keeps the hot connections hot and lets the rest age out.
+                    candidate = self._idle.pop()
+                else:
+                    self._size += 1
+
+            if candidate is None:
+                try:
+                    candidate = await self._open_connection()
+                except BaseException:
+                    await self._forget()
+                    raise
+            elif not await self._is_healthy(candidate):
+                await self._close_quietly(candidate.conn)
+                await self._forget()
+                continue
+
+            candidate.last_used = self._clock()
+            self._in_use[id(candidate.conn)] = candidate
+            return candidate.conn
+
+    async def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a checked-out connection to the pool.
+
+        Connections this pool did not hand out are ignored. A connection that
+        is closed, broken, or still inside a transaction is closed instead of
+        being reused.
+
+        Args:
+            conn: Connection previously returned by acquire()
+            discard: Close the connection instead of returning it to the pool
+        """
+        entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            return
+        if (
+            discard
+            or self._closed
+            or self._is_dead(conn)
+            or conn.info.transaction_status != TransactionStatus.IDLE
+        ):
+            await self._close_quietly(conn)
+            await self._forget()
+            return
+        entry.last_used = self._clock()
+        async with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    async def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when released."""
+        self._closed = True
+        async with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            await self._close_quietly(entry.conn)
+
+    async def _open_connection(self) -> _PooledConnection:
+        conn = await self._connect()
+        now = self._clock()
+        return _PooledConnection(conn=conn, created_at=now, last_used=now)
+
+    async def _forget(self) -> None:
+        async with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _is_dead(conn: Any) -> bool:
+        return bool(conn.closed) or bool(getattr(conn, 'broken', False))
+
+    async def _is_healthy(self, entry: _PooledConnection) -> bool:
+        if self._is_dead(entry.conn):
+            return False
+        now = self._clock()
+        if now - entry.created_at >= self.max_lifetime_seconds:
+            logger.debug('Recycling pooled connection past its maximum lifetime')
+            return False
+        if now - entry.last_used >= self.health_check_idle_seconds:
+            try:
+                await entry.conn.execute(HEALTH_CHECK_SQL)
+            except Exception as e:
+                logger.warning(f'Discarding pooled connection that failed health check: {e}')
+                return False
+        return True
+
+    @staticmethod
+    async def _close_quietly(conn: Any) -> None:
+        try:
+            await conn.close()
+        except Exception as e:
+            logger.debug(f'Ignoring error while closing pooled connection: {e}')
@@ -0,0 +1,214 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pooled, caching client for the remote DSQL knowledge server.
+
+The documentation tools are thin proxies to a remote MCP server. This client
+keeps one long-lived httpx.AsyncClient so calls reuse kept-alive (and, when the
+optional ``h2`` package is installed, HTTP/2) connections instead of paying a
+TCP and TLS handshake each time. Documentation search and read results are
+kept in a small LRU cache with a TTL, and identical calls that arrive while a
+request is already in flight wait for that request instead of issuing their
+own.
+"""
+
+import asyncio
+import copy
+import httpx
+import importlib.util
+import json
+import time
+from collections import OrderedDict
+from loguru import logger
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS = 900
+DEFAULT_KNOWLEDGE_CACHE_MAX_ENTRIES = 256
+
+# Tool methods whose responses depend only on their arguments. dsql_recommend
+# is deliberately excluded: it is advisory and expected to evolve server-side.
+CACHEABLE_KNOWLEDGE_METHODS = frozenset({'dsql_search_documentation', 'dsql_read_documentation'})
+
+# Connection pool limits for the shared client.
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+
+class KnowledgeServerError(Exception):
+    """The knowledge server answered with a JSON-RPC error."""
+
+
+class TTLCache:
+    """A least-recently-used cache whose entries also expire after a fixed TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_KNOWLEDGE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Maximum age of an entry. 0 disables caching.
+            clock: Monotonic time source (overridable in tests)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are retained at all."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value for ``key`` (marking it recently used), or None."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        stored_at, value = item
+        if self._clock() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries held (including not-yet-pruned expired ones)."""
+        return len(self._entries)
+
+
+class KnowledgeClient:
+    """Long-lived client for the knowledge server with caching and request coalescing."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout: float,
+        cache: Optional[TTLCache] = None,
+    ):
+        """Initialize the client. The HTTP connection pool is opened on first use.
+
+        Args:
+            endpoint: Knowledge server URL
+            timeout: Timeout in seconds for each request
+            cache: Response cache; defaults to a TTLCache with default settings
+        """
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.cache = cache if cache is not None else TTLCache()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=_HTTP_LIMITS,
+                http2=importlib.util.find_spec('h2') is not None,
+            )
+        return self._client
+
+    @staticmethod
+    def _key(method: str, params: Dict[str, Any]) -> Hashable:
+        return (method, json.dumps(params, sort_keys=True, default=str))
+
+    async def call(self, method: str, params: Dict[str, Any]) -> dict:
+        """Call a knowledge server tool and return its result.
+
+        Args:
+            method: The MCP tool method name to call
+            params: Parameters to pass to the remote tool
+
+        Returns:
+            The tool result. Callers get their own copy, so mutating it does not
+            affect the cache or other callers sharing the same request.
+
+        Raises:
+            KnowledgeServerError: If the server returns a JSON-RPC error
+            httpx.HTTPError: If the server cannot be reached or returns an HTTP error
+        """
+        key = self._key(method, params)
+        cacheable = method in CACHEABLE_KNOWLEDGE_METHODS
+
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f'Knowledge server cache hit: {method}')
+                return copy.deepcopy(cached)
+
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request(method, params))
+            self._in_flight[key] = pending
+            pending.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            logger.debug(f'Joining in-flight knowledge server request: {method}')
+
+        # shield() so one caller being cancelled does not cancel the request
+        # the other callers are waiting on.
+        result = await asyncio.shield(pending)
+        if cacheable:
+            self.cache.put(key, result)
+        return copy.deepcopy(result)
+
+    async def _request(self, method: str, params: Dict[str, Any]) -> dict:
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'tools/call',
+            'params': {
+                'name': method,
+                'arguments': params,
+            },
+            'id': 1,
+        }
+
+        response = await self._http_client().post(self.endpoint, json=payload)
+        response.raise_for_status()
+        result = response.json()
+
+        if 'error' in result:
+            raise KnowledgeServerError(
+                result['error'].get('message', 'Unknown error from knowledge server')
+            )
+
+        res = result.get('result', {})
+        if not res:
+            content = result.get('content', [])
+            if content and isinstance(content, list) and content[0].get('type') == 'text':
+                return json.loads(content[0]['text'])
+            return {'content': content}
+        return res
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -25,6 +25,12 @@ import shutil
 import subprocess
 import sys
 from awslabs.aurora_dsql_mcp_server import __version__
+from awslabs.aurora_dsql_mcp_server.connection_pool import (
+    DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_POOL_MIN_SIZE,
+    AuthTokenCache,
+    DsqlConnectionPool,
+)
 from awslabs.aurora_dsql_mcp_server.consts import (
     BEGIN_READ_ONLY_TRANSACTION_SQL,
     BEGIN_TRANSACTION_SQL,
@@ -54,6 +60,12 @@ from awslabs.aurora_dsql_mcp_server.consts import (
     RESET_SESSION_STATE_SQL,
     ROLLBACK_TRANSACTION_SQL,
 )
+from awslabs.aurora_dsql_mcp_server.knowledge_client import (
+    DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS,
+    KnowledgeClient,
+    KnowledgeServerError,
+    TTLCache,
+)
 from awslabs.aurora_dsql_mcp_server.mutable_sql_detector import (
     check_sql_injection_risk,
     detect_mutating_keywords,
@@ -77,10 +89,15 @@ database_user = None
 region = None
 read_only = False
 dsql_client: Any = None
-persistent_connection = None
+connection_pool: DsqlConnectionPool | None = None
+auth_token_cache: AuthTokenCache | None = None
+pool_min_size = DEFAULT_POOL_MIN_SIZE
+pool_max_size = DEFAULT_POOL_MAX_SIZE
 aws_profile = None
 knowledge_server = 'https://d38p8g9d7yc7ms.cloudfront.net'
 knowledge_timeout = 30.0
+knowledge_cache_ttl = DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS
+knowledge_client: KnowledgeClient | None = None
 
 mcp = FastMCP(
     'awslabs-aurora-dsql-mcp-server',
@@ -223,32 +240,34 @@ async def readonly_query(
 
     try:
         conn = await get_connection(ctx)
-
         try:
-            await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
-        except Exception as e:
-            logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
-            await ctx.error(INTERNAL_ERROR)
-            raise Exception(INTERNAL_ERROR)
+            try:
+                await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
+            except Exception as e:
+                logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
+                await ctx.error(INTERNAL_ERROR)
+                raise Exception(INTERNAL_ERROR)
 
-        try:
-            rows = await execute_query(ctx, conn, sql, params)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
-            raise e
-        finally:
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                rows = await execute_query(ctx, conn, sql, params)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except psycopg.errors.ReadOnlySqlTransaction:
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
             except Exception as e:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
-            # Scrub any session/GUC state that a SET / set_config() may have
-            # mutated so it does not persist on the pooled connection. Runs
-            # after ROLLBACK, outside the transaction, on the autocommit conn.
-            await reset_session_state(ctx, conn)
+                raise e
+            finally:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as e:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+                # Scrub any session/GUC state that a SET / set_config() may have
+                # mutated so it does not persist on the pooled connection. Runs
+                # after ROLLBACK, outside the transaction, on the autocommit conn.
+                await reset_session_state(ctx, conn)
+        finally:
+            await release_connection(conn)
 
     except Exception as e:
         await ctx.error(f'{ERROR_READONLY_QUERY}: {str(e)}')
@@ -386,48 +405,52 @@ async def transact(
 
     try:
         conn = await get_connection(ctx)
-
-        # Use read-only transaction in read-only mode, regular transaction otherwise
-        begin_sql = BEGIN_READ_ONLY_TRANSACTION_SQL if read_only else BEGIN_TRANSACTION_SQL
-
         try:
-            await execute_query(ctx, conn, begin_sql)
-        except Exception as e:
-            error_msg = ERROR_BEGIN_READ_ONLY_TRANSACTION if read_only else ERROR_BEGIN_TRANSACTION
-            logger.error(f'{error_msg}: {str(e)}')
-            await ctx.error(f'{error_msg}: {str(e)}')
-            raise Exception(f'{error_msg}: {str(e)}')
+            # Use read-only transaction in read-only mode, regular transaction otherwise
+            begin_sql = BEGIN_READ_ONLY_TRANSACTION_SQL if read_only else BEGIN_TRANSACTION_SQL
 
-        try:
-            rows = []
-            for idx, query in enumerate(sql_list):
-                p = params_list[idx] if params_list else None
-                rows = await execute_query(ctx, conn, query, p)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            # ROLLBACK before re-raising: the transaction is aborted, and without
-            # this the finally-block session scrub (and the next request) would run
-            # against an aborted transaction where Postgres ignores every command.
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
-            except Exception as re:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
+                await execute_query(ctx, conn, begin_sql)
+            except Exception as e:
+                error_msg = (
+                    ERROR_BEGIN_READ_ONLY_TRANSACTION if read_only else ERROR_BEGIN_TRANSACTION
+                )
+                logger.error(f'{error_msg}: {str(e)}')
+                await ctx.error(f'{error_msg}: {str(e)}')
+                raise Exception(f'{error_msg}: {str(e)}')
+
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
-            except Exception as re:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
-            raise e
+                rows = []
+                for idx, query in enumerate(sql_list):
+                    p = params_list[idx] if params_list else None
+                    rows = await execute_query(ctx, conn, query, p)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except psycopg.errors.ReadOnlySqlTransaction:
+                # ROLLBACK before re-raising: the transaction is aborted, and without
+                # this the finally-block session scrub (and the next request) would run
+                # against an aborted transaction where Postgres ignores every command.
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as re:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
+            except Exception as e:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as re:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
+                raise e
+            finally:
+                # In read-only mode, scrub any session/GUC state that a SET /
+                # set_config() may have mutated so it does not persist on the
+                # pooled connection into the next request. In read-write mode the
+                # caller intentionally has full session control, so leave it alone.
+                if read_only:
+                    await reset_session_state(ctx, conn)
         finally:
-            # In read-only mode, scrub any session/GUC state that a SET /
-            # set_config() may have mutated so it does not persist on the
-            # pooled connection into the next request. In read-write mode the
-            # caller intentionally has full session control, so leave it alone.
-            if read_only:
-                await reset_session_state(ctx, conn)
+            await release_connection(conn)
 
     except Exception as e:
         await ctx.error(f'{ERROR_TRANSACT}: {str(e)}')
@@ -461,11 +484,14 @@ async def get_schema(
 
     try:
         conn = await get_connection(ctx)
-        if '.' in table_name:
-            schema, table = table_name.split('.', 1)
-            return await execute_query(ctx, conn, GET_QUALIFIED_SCHEMA_SQL, [schema, table])
-        else:
-            return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        try:
+            if '.' in table_name:
+                schema, table = table_name.split('.', 1)
+                return await execute_query(ctx, conn, GET_QUALIFIED_SCHEMA_SQL, [schema, table])
+            else:
+                return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        finally:
+            await release_connection(conn)
     except Exception as e:
         await ctx.error(f'{ERROR_GET_SCHEMA}: {str(e)}')
         raise Exception(f'{ERROR_GET_SCHEMA}: {str(e)}')
@@ -716,36 +742,13 @@ async def _proxy_to_knowledge_server(
     """
     logger.info(f'Proxying to knowledge server: {method} with params: {params}')
 
-    payload = {
-        'jsonrpc': '2.0',
-        'method': 'tools/call',
-        'params': {
-            'name': method,
-            'arguments': params,
-        },
-        'id': 1,
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=knowledge_timeout) as client:
-            response = await client.post(knowledge_server, json=payload)
-            response.raise_for_status()
-            result = response.json()
-
-            if 'error' in result:
-                error_msg = result['error'].get('message', 'Unknown error from knowledge server')
-                if ctx:
-                    await ctx.error(error_msg)
-                raise Exception(error_msg)
-
-            res = result.get('result', {})
-            if not res:
-                content = result.get('content', [])
-                if content and isinstance(content, list) and content[0].get('type') == 'text':
-                    return json.loads(content[0]['text'])
-                return {'content': content}
-            return res
-
+        return await get_knowledge_client().call(method, params)
+    except KnowledgeServerError as e:
+        error_msg = str(e)
+        if ctx:
+            await ctx.error(error_msg)
+        raise Exception(error_msg)
     except httpx.HTTPError as e:
         error_msg = 'The DSQL knowledge server is currently unavailable. Please try again later.'
         logger.error(f'Knowledge server error: {e}')
@@ -754,6 +757,22 @@ async def _proxy_to_knowledge_server(
         raise Exception(error_msg)
 
 
+def get_knowledge_client() -> KnowledgeClient:
+    """Return the shared knowledge server client, (re)creating it if its settings changed."""
+    global knowledge_client
+    if (
+        knowledge_client is None
+        or knowledge_client.endpoint != knowledge_server
+        or knowledge_client.timeout != knowledge_timeout
+    ):
+        knowledge_client = KnowledgeClient(
+            knowledge_server,
+            knowledge_timeout,
+            cache=TTLCache(ttl_seconds=knowledge_cache_ttl),
+        )
+    return knowledge_client
+
+
 class NoOpCtx:
     """A No-op context class for error handling in MCP tools."""
 
@@ -766,32 +785,25 @@ class NoOpCtx:
 
 
 async def get_password_token():  # noqa: D103
-    # Generate a fresh password token for each connection, to ensure the token is not expired
-    # when the connection is established
+    # Called through auth_token_cache, which reuses the token for every connect
+    # until it is close to expiry
     if database_user == 'admin':
         return dsql_client.generate_db_connect_admin_auth_token(cluster_endpoint, region)
     else:
         return dsql_client.generate_db_connect_auth_token(cluster_endpoint, region)
 
 
-async def get_connection(ctx):  # noqa: D103
-    """Get a connection to the database, creating one if needed or reusing the existing one.
-
-    Args:
-        ctx: MCP context for logging and state management
+async def create_connection():
+    """Open a new autocommit connection to the cluster using the cached auth token.
 
     Returns:
-        A database connection
+        A new database connection
     """
-    global persistent_connection
-
-    # Return the existing connection without health check
-    # The caller will handle reconnection if needed
-    if persistent_connection is not None:
-        return persistent_connection
-
-    # Create a new connection
-    password_token = await get_password_token()
+    global auth_token_cache
+    if auth_token_cache is None:
+        # Resolve get_password_token at call time rather than binding it here.
+        auth_token_cache = AuthTokenCache(lambda: get_password_token())
+    password_token = await auth_token_cache.get()
 
     conn_params = {
         'dbname': DSQL_DB_NAME,
@@ -805,69 +817,134 @@ async def get_connection(ctx):  # noqa: D103
 
     logger.info(f'Creating new connection to {cluster_endpoint} as user {database_user}')
     try:
-        persistent_connection = await psycopg.AsyncConnection.connect(
-            **conn_params, autocommit=True
+        return await psycopg.AsyncConnection.connect(**conn_params, autocommit=True)
+    except psycopg.OperationalError:
+        # A rejected token (e.g. clock skew or revoked credentials) must not be
+        # reused for the next attempt.
+        auth_token_cache.invalidate()
+        raise
+
+
+async def get_pool() -> DsqlConnectionPool:
+    """Return the process-wide connection pool, creating and opening it on first use."""
+    global connection_pool
+    if connection_pool is None:
+        connection_pool = DsqlConnectionPool(
+            create_connection, min_size=pool_min_size, max_size=pool_max_size
         )
-        return persistent_connection
+    await connection_pool.open()
+    return connection_pool
+
+
+async def get_connection(ctx):  # noqa: D103
+    """Check a connection out of the pool.
+
+    Every connection obtained here must be handed back with release_connection
+    (or discard_connection) once the caller is done with it.
+
+    Args:
+        ctx: MCP context for logging and state management
+
+    Returns:
+        A database connection
+    """
+    try:
+        pool = await get_pool()
+        return await pool.acquire()
     except Exception as e:
         logger.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         await ctx.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         raise e
 
 
+async def release_connection(conn) -> None:
+    """Return a connection obtained from get_connection to the pool.
+
+    Args:
+        conn: Connection to return
+    """
+    if connection_pool is not None:
+        await connection_pool.release(conn)
+
+
+async def discard_connection(conn) -> None:
+    """Close a connection so it is never handed out again.
+
+    Args:
+        conn: Connection to close
+    """
+    if connection_pool is not None:
+        await connection_pool.release(conn, discard=True)
+    try:
+        if not conn.closed:
+            await conn.close()
+    except Exception as close_error:
+        # The connection is already broken; closing is best effort. Log at
+        # debug so the discard is observable without adding error noise.
+        logger.debug(f'Ignoring error while closing discarded connection: {close_error}')
+
+
+async def _run_query(conn, query: str, params=None) -> List[dict]:
+    async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
+        await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
+        if cur.rownumber is None:
+            return []
+        else:
+            return await cur.fetchall()
+
+
 async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]:
     """Execute a SQL query against the database.
 
+    With ``conn_to_use`` None the query runs on a connection checked out just
+    for it, and is retried once on a fresh connection if that one turns out to
+    be broken. With an explicit connection a connection error is re-raised
+    after discarding the connection: retrying elsewhere would silently escape
+    the caller's transaction.
+
     Args:
         ctx: MCP context for error handling
-        conn_to_use: Database connection to use, or None to get a new one
+        conn_to_use: Database connection to use, or None to check one out of the pool
         query: SQL query string to execute
         params: Optional query parameters
 
     Returns:
         List of result rows as dictionaries
     """
-    if conn_to_use is None:
-        conn = await get_connection(ctx)
-    else:
-        conn = conn_to_use
+    if conn_to_use is not None:
+        try:
+            return await _run_query(conn_to_use, query, params)
+        except (psycopg.OperationalError, psycopg.InterfaceError) as e:
+            logger.warning(f'Connection error, discarding connection: {e}')
+            await discard_connection(conn_to_use)
+            await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
+            raise e
+        except Exception as e:
+            logger.error(f'{ERROR_EXECUTE_QUERY} : {e}')
+            await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
+            raise e
 
+    conn = await get_connection(ctx)
     try:
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+        return await _run_query(conn, query, params)
     except (psycopg.OperationalError, psycopg.InterfaceError) as e:
-        # Connection issue - reconnect and retry
+        # Connection issue - discard it and retry once on a fresh connection
         logger.warning(f'Connection error, reconnecting: {e}')
-        global persistent_connection
-        try:
-            if persistent_connection:
-                await persistent_connection.close()
-        except Exception:
-            pass  # Ignore errors when closing an already broken connection
-        persistent_connection = None
-
-        # Get a fresh connection and retry
+        await discard_connection(conn)
         conn = await get_connection(ctx)
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+        return await _run_query(conn, query, params)
     except Exception as e:
         logger.error(f'{ERROR_EXECUTE_QUERY} : {e}')
         await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
         raise e
+    finally:
+        await release_connection(conn)
 
 
 async def reset_session_state(ctx, conn) -> None:
     """Reset session-level configuration on a pooled connection (best effort).
 
-    The connection returned by get_connection is persistent and reused across
+    Connections returned by get_connection are pooled and reused across
     requests. A `SET`/`set_config()` change with session (not transaction-local)
     scope survives COMMIT and would otherwise leak onto the next request's query
     on the same connection (e.g. a mutated search_path or timezone). Running the
@@ -880,8 +957,8 @@ async def reset_session_state(ctx, conn) -> None:
     is logged but never propagated, so a reset problem cannot mask the query's
     own result or error, and one failing RESET does not skip the others.
 
-    If any statement fails, the pooled connection is discarded (closed and
-    cleared) so the NEXT request establishes a fresh connection with clean
+    If any statement fails, the connection is discarded (closed and dropped
+    from the pool) so no later request can check it out with unscrubbed
     session state. Without this, a scrub that is refused (e.g. because the
     connection is wedged in an aborted transaction) would leave the mutated
     connection pooled and the state-scrub control would silently no-op for the
@@ -891,7 +968,6 @@ async def reset_session_state(ctx, conn) -> None:
         ctx: MCP context for logging and state management
         conn: Database connection whose session state should be reset
     """
-    global persistent_connection
     reset_failed = False
     for stmt in RESET_SESSION_STATE_SQL:
         try:
@@ -903,14 +979,7 @@ async def reset_session_state(ctx, conn) -> None:
     # Discard the connection if the scrub did not fully succeed, so the next
     # request cannot inherit unscrubbed session state on this pooled connection.
     if reset_failed:
-        try:
-            if persistent_connection is not None:
-                await persistent_connection.close()
-        except Exception as close_error:
-            # The connection is already broken; closing is best effort. Log at
-            # debug so the discard is observable without adding error noise.
-            logger.debug(f'Ignoring error while closing reset-failed connection: {close_error}')
-        persistent_connection = None
+        await discard_connection(conn)
 
 
 def main():
@@ -944,6 +1013,25 @@ def main():
         default=30.0,
         help='Timeout in seconds for knowledge server requests (default: 30.0)',
     )
+    parser.add_argument(
+        '--knowledge-cache-ttl',
+        type=float,
+        default=DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS,
+        help='Seconds to cache documentation search/read results; 0 disables caching '
+        f'(default: {DEFAULT_KNOWLEDGE_CACHE_TTL_SECONDS})',
+    )
+    parser.add_argument(
+        '--pool-min-size',
+        type=int,
+        default=DEFAULT_POOL_MIN_SIZE,
+        help=f'Connections opened up front by the connection pool (default: {DEFAULT_POOL_MIN_SIZE})',
+    )
+    parser.add_argument(
+        '--pool-max-size',
+        type=int,
+        default=DEFAULT_POOL_MAX_SIZE,
+        help=f'Maximum concurrent database connections (default: {DEFAULT_POOL_MAX_SIZE})',
+    )
     args = parser.parse_args()
 
     # Validate knowledge server URL
@@ -973,6 +1061,22 @@ def main():
         )
         sys.exit(1)
 
+    if args.knowledge_cache_ttl < 0:
+        logger.error(
+            f'Knowledge cache TTL must not be negative. Got: {args.knowledge_cache_ttl}. '
+            f'Example: --knowledge-cache-ttl 900'
+        )
+        sys.exit(1)
+
+    # Validate pool sizes
+    if args.pool_max_size < 1 or not 0 <= args.pool_min_size <= args.pool_max_size:
+        logger.error(
+            f'Invalid connection pool size: --pool-min-size {args.pool_min_size}, '
+            f'--pool-max-size {args.pool_max_size}. '
+            f'Require 0 <= --pool-min-size <= --pool-max-size and --pool-max-size >= 1.'
+        )
+        sys.exit(1)
+
     global cluster_endpoint
     cluster_endpoint = args.cluster_endpoint
 
@@ -994,6 +1098,13 @@ def main():
     global knowledge_timeout
     knowledge_timeout = args.knowledge_timeout
 
+    global knowledge_cache_ttl
+    knowledge_cache_ttl = args.knowledge_cache_ttl
+
+    global pool_min_size, pool_max_size
+    pool_min_size = args.pool_min_size
+    pool_max_size = args.pool_max_size
+
     # Check if cluster is configured
     if not cluster_endpoint or not database_user or not region:
         logger.warning(
@@ -0,0 +1,275 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the connection pool and auth token cache."""
+
+import asyncio
+import pytest
+from awslabs.aurora_dsql_mcp_server.connection_pool import (
+    HEALTH_CHECK_SQL,
+    AuthTokenCache,
+    DsqlConnectionPool,
+    PoolTimeoutError,
+)
+from psycopg.pq import TransactionStatus
+from unittest.mock import AsyncMock
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at t=0."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def make_conn():
+    """Create a mock connection that looks healthy and idle."""
+    conn = AsyncMock()
+    conn.closed = False
+    conn.broken = False
+    conn.info.transaction_status = TransactionStatus.IDLE
+    return conn
+
+
+def make_pool(**kwargs):
+    """Create a pool whose connect function hands out fresh mock connections."""
+    connect = AsyncMock(side_effect=lambda: make_conn())
+    return DsqlConnectionPool(connect, **kwargs), connect
+
+
+class TestAuthTokenCache:
+    """Tokens are generated once and reused until close to expiry."""
+
+    async def test_token_reused_until_refresh_margin(self):
+        """A token is regenerated only once its remaining life drops below the margin."""
+        clock = FakeClock()
+        generate = AsyncMock(side_effect=['t1', 't2'])
+        cache = AuthTokenCache(generate, ttl_seconds=900, refresh_margin_seconds=300, clock=clock)
+
+        assert await cache.get() == 't1'
+        clock.now = 599
+        assert await cache.get() == 't1'
+        assert generate.await_count == 1
+
+        clock.now = 600
+        assert await cache.get() == 't2'
+        assert generate.await_count == 2
+
+    async def test_concurrent_callers_share_one_generation(self):
+        """A burst of connects signs a single token."""
+        generate = AsyncMock(return_value='tok')
+        cache = AuthTokenCache(generate)
+
+        tokens = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+        assert tokens == ['tok'] * 10
+        assert generate.await_count == 1
+
+    async def test_invalidate_forces_regeneration(self):
+        """invalidate() drops the cached token."""
+        generate = AsyncMock(side_effect=['t1', 't2'])
+        cache = AuthTokenCache(generate)
+
+        assert await cache.get() == 't1'
+        cache.invalidate()
+        assert await cache.get() == 't2'
+
+
+class TestDsqlConnectionPool:
+    """Checkout, release, sizing and health checks."""
+
+    def test_invalid_sizes_rejected(self):
+        """min_size may not exceed max_size and max_size must be positive."""
+        with pytest.raises(ValueError):
+            DsqlConnectionPool(AsyncMock(), min_size=3, max_size=2)
+        with pytest.raises(ValueError):
+            DsqlConnectionPool(AsyncMock(), min_size=0, max_size=0)
+
+    async def test_open_prefills_min_size(self):
+        """open() creates min_size connections concurrently, once."""
+        pool, connect = make_pool(min_size=3, max_size=5)
+
+        await pool.open()
+        await pool.open()
+
+        assert connect.await_count == 3
+        assert pool.size == 3
+        assert pool.idle == 3
+
+    async def test_open_failure_is_deferred_to_acquire(self):
+        """A failed prefill is logged; the error surfaces on acquire()."""
+        connect = AsyncMock(side_effect=Exception('auth failed'))
+        pool = DsqlConnectionPool(connect, min_size=1, max_size=2)
+
+        await pool.open()
+        assert pool.size == 0
+
+        with pytest.raises(Exception, match='auth failed'):
+            await pool.acquire()
+        assert pool.size == 0
+
+    async def test_released_connection_is_reused(self):
+        """A released connection is handed out again instead of opening a new one."""
+        pool, connect = make_pool(min_size=0, max_size=2)
+
+        conn = await pool.acquire()
+        await pool.release(conn)
+        assert await pool.acquire() is conn
+        assert connect.await_count == 1
+
+    async def test_concurrent_acquires_up_to_max_size(self):
+        """Concurrent callers get distinct connections, bounded by max_size."""
+        pool, connect = make_pool(min_size=0, max_size=3)
+
+        conns = await asyncio.gather(*(pool.acquire() for _ in range(3)))
+
+        assert len({id(c) for c in conns}) == 3
+        assert pool.in_use == 3
+        assert connect.await_count == 3
+
+    async def test_exhausted_pool_waits_for_release(self):
+        """A caller blocked on a full pool is woken by a release."""
+        pool, connect = make_pool(min_size=0, max_size=1, timeout=5)
+        held = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await pool.release(held)
+        assert await asyncio.wait_for(waiter, 1) is held
+        assert connect.await_count == 1
+
+    async def test_exhausted_pool_times_out(self):
+        """acquire() gives up after the pool timeout."""
+        pool, _ = make_pool(min_size=0, max_size=1, timeout=0.05)
+        await pool.acquire()
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire()
+
+    async def test_failed_connect_frees_its_slot(self):
+        """A connect error does not permanently consume pool capacity."""
+        connect = AsyncMock(side_effect=[Exception('boom'), make_conn()])
+        pool = DsqlConnectionPool(connect, min_size=0, max_size=1)
+
+        with pytest.raises(Exception, match='boom'):
+            await pool.acquire()
+        assert pool.size == 0
+        assert await pool.acquire() is not None
+
+    async def test_closed_idle_connection_is_replaced(self):
+        """A connection that died while idle is dropped on checkout."""
+        pool, connect = make_pool(min_size=0, max_size=1)
+        conn = await pool.acquire()
+        await pool.release(conn)
+        conn.closed = True
+
+        fresh = await pool.acquire()
+
+        assert fresh is not conn
+        assert connect.await_count == 2
+        assert pool.size == 1
+
+    async def test_long_idle_connection_is_pinged(self):
+        """Connections idle past the threshold are health-checked before reuse."""
+        clock = FakeClock()
+        pool, _ = make_pool(min_size=0, max_size=1, health_check_idle_seconds=30, clock=clock)
+        conn = await pool.acquire()
+        await pool.release(conn)
+
+        clock.now = 10
+        assert await pool.acquire() is conn
+        conn.execute.assert_not_awaited()
+        await pool.release(conn)
+
+        clock.now = 50
+        assert await pool.acquire() is conn
+        conn.execute.assert_awaited_once_with(HEALTH_CHECK_SQL)
+
+    async def test_failed_health_check_discards_connection(self):
+        """A connection that fails its ping is closed and replaced."""
+        clock = FakeClock()
+        pool, connect = make_pool(
+            min_size=0, max_size=1, health_check_idle_seconds=30, clock=clock
+        )
+        conn = await pool.acquire()
+        await pool.release(conn)
+        conn.execute.side_effect = Exception('server closed the connection')
+
+        clock.now = 60
+        fresh = await pool.acquire()
+
+        assert fresh is not conn
+        conn.close.assert_awaited_once()
+        assert connect.await_count == 2
+
+    async def test_connection_past_max_lifetime_is_recycled(self):
+        """Connections are closed before DSQL's connection lifetime limit."""
+        clock = FakeClock()
+        pool, connect = make_pool(min_size=0, max_size=1, max_lifetime_seconds=100, clock=clock)
+        conn = await pool.acquire()
+        await pool.release(conn)
+
+        clock.now = 100
+        assert await pool.acquire() is not conn
+        conn.close.assert_awaited_once()
+
+    async def test_release_discards_connection_left_in_transaction(self):
+        """A connection handed back mid-transaction is never reused."""
+        pool, _ = make_pool(min_size=0, max_size=1)
+        conn = await pool.acquire()
+        conn.info.transaction_status = TransactionStatus.INTRANS
+
+        await pool.release(conn)
+
+        conn.close.assert_awaited_once()
+        assert pool.size == 0
+
+    async def test_release_with_discard(self):
+        """release(discard=True) closes the connection and frees the slot."""
+        pool, _ = make_pool(min_size=0, max_size=1)
+        conn = await pool.acquire()
+
+        await pool.release(conn, discard=True)
+
+        conn.close.assert_awaited_once()
+        assert pool.size == 0
+        assert pool.idle == 0
+
+    async def test_release_of_foreign_connection_is_ignored(self):
+        """Connections the pool did not hand out are left alone."""
+        pool, _ = make_pool(min_size=0, max_size=1)
+        foreign = make_conn()
+
+        await pool.release(foreign)
+        await pool.release(foreign, discard=True)
+
+        foreign.close.assert_not_awaited()
+        assert pool.idle == 0
+
+    async def test_close_closes_idle_connections(self):
+        """close() shuts idle connections and rejects new checkouts."""
+        pool, _ = make_pool(min_size=2, max_size=2)
+        await pool.open()
+
+        await pool.close()
+
+        assert pool.size == 0
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
@@ -3,17 +3,24 @@
 import pytest
 import psycopg
 from unittest.mock import AsyncMock, patch, MagicMock
-from awslabs.aurora_dsql_mcp_server.server import execute_query, get_connection
+from psycopg.pq import TransactionStatus
+from awslabs.aurora_dsql_mcp_server.server import (
+    execute_query,
+    get_connection,
+    release_connection,
+)
 
 ctx = AsyncMock()
 
 @pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+async def reset_connection_pool():
+    """Reset the connection pool and auth token cache before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
 
 def create_mock_connection():
     """Create a mock connection with cursor context manager."""
@@ -24,12 +31,14 @@ def create_mock_connection():
     mock_cursor.execute = AsyncMock()
     mock_conn.cursor = MagicMock(return_value=mock_cursor)
     mock_conn.closed = False
+    mock_conn.broken = False
+    mock_conn.info.transaction_status = TransactionStatus.IDLE
     return mock_conn, mock_cursor
 
 @pytest.mark.asyncio
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse(mocker, reset_persistent_connection):
+async def test_connection_reuse(mocker, reset_connection_pool):
     """Test that connections are reused when possible."""
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
@@ -44,7 +53,8 @@ async def test_connection_reuse(mocker, reset_persistent_connection):
     assert mock_connect.call_count == 1
     assert result1 is mock_conn
 
-    # Second connection attempt should reuse the existing connection
+    # Once returned to the pool, the next checkout reuses the same connection
+    await release_connection(result1)
     result2 = await get_connection(ctx)
     assert mock_connect.call_count == 1  # Connection count should not increase
     assert result2 is mock_conn  # Should be the same connection object
@@ -54,7 +64,7 @@ async def test_connection_reuse(mocker, reset_persistent_connection):
 @pytest.mark.asyncio
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse_with_broken_connection(mocker, reset_persistent_connection):
+async def test_connection_reuse_with_broken_connection(mocker, reset_connection_pool):
     """Test handling of broken connections during reuse attempts."""
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
@@ -70,3 +80,31 @@ async def test_connection_reuse_with_broken_connection(mocker, reset_persistent_
 
     await execute_query(ctx, None, "SELECT 1;")
     assert mock_connect.call_count == 2
+    # The broken connection was closed and dropped; the fresh one is pooled.
+    mock_conn1.close.assert_awaited()
+    import awslabs.aurora_dsql_mcp_server.server as server
+    assert server.connection_pool.size == 1
+    assert server.connection_pool.idle == 1
+
+
+@pytest.mark.asyncio
+@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
+@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
+async def test_concurrent_checkouts_get_distinct_connections(mocker, reset_connection_pool):
+    """Concurrent callers each get their own connection instead of sharing one."""
+    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
+    mock_auth.return_value = 'auth_token'
+    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
+    mock_connect.side_effect = lambda **kwargs: create_mock_connection()[0]
+
+    conn1 = await get_connection(ctx)
+    conn2 = await get_connection(ctx)
+    assert conn1 is not conn2
+    assert mock_connect.call_count == 2
+    # Both connects used the same pre-generated token.
+    assert mock_auth.call_count == 1
+
+    await release_connection(conn1)
+    await release_connection(conn2)
+    assert await get_connection(ctx) in (conn1, conn2)
+    assert mock_connect.call_count == 2
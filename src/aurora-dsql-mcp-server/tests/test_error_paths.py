@@ -82,9 +82,11 @@ async def test_proxy_tool_timeout():
     ctx.error = AsyncMock()
 
     with patch(
+        "awslabs.aurora_dsql_mcp_server.server.knowledge_client", None
+    ), patch(
         "awslabs.aurora_dsql_mcp_server.server.httpx.AsyncClient"
     ) as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             side_effect=httpx.TimeoutException("timeout")
         )
 
@@ -0,0 +1,228 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the pooled, caching knowledge server client."""
+
+import asyncio
+import httpx
+import pytest
+from awslabs.aurora_dsql_mcp_server.knowledge_client import (
+    KnowledgeClient,
+    KnowledgeServerError,
+    TTLCache,
+)
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at t=0."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def make_response(body):
+    """Create a mock httpx response returning ``body`` as JSON."""
+    response = MagicMock()
+    response.json.return_value = body
+    response.raise_for_status = MagicMock()
+    return response
+
+
+@pytest.fixture
+def mock_http():
+    """Patch httpx.AsyncClient; yields (client class mock, post mock)."""
+    with patch('httpx.AsyncClient') as mock_client:
+        mock_client.return_value.is_closed = False
+        post = AsyncMock(return_value=make_response({'result': {'data': 'doc'}}))
+        mock_client.return_value.post = post
+        yield mock_client, post
+
+
+class TestTTLCache:
+    """LRU eviction and TTL expiry."""
+
+    def test_expires_after_ttl(self):
+        """Entries are dropped once they are ttl_seconds old."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 9
+        assert cache.get('a') == 1
+        clock.now = 10
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """A read refreshes recency; the oldest unread entry is evicted."""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """ttl_seconds=0 stores nothing."""
+        cache = TTLCache(ttl_seconds=0)
+        cache.put('a', 1)
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+
+class TestKnowledgeClient:
+    """HTTP client reuse, response caching and in-flight coalescing."""
+
+    async def test_http_client_is_reused_across_calls(self, mock_http):
+        """One pooled AsyncClient serves every call."""
+        mock_client, post = mock_http
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        await client.call('dsql_recommend', {'url': 'a'})
+        await client.call('dsql_recommend', {'url': 'b'})
+
+        mock_client.assert_called_once()
+        assert post.await_count == 2
+
+    async def test_read_documentation_is_cached(self, mock_http):
+        """Identical documentation reads hit the upstream server once."""
+        _, post = mock_http
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        first = await client.call('dsql_read_documentation', {'url': 'u', 'max_length': 5})
+        second = await client.call('dsql_read_documentation', {'max_length': 5, 'url': 'u'})
+
+        assert first == second == {'data': 'doc'}
+        assert post.await_count == 1
+
+    async def test_different_arguments_are_cached_separately(self, mock_http):
+        """The cache key covers every argument."""
+        _, post = mock_http
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        await client.call('dsql_search_documentation', {'search_phrase': 'a'})
+        await client.call('dsql_search_documentation', {'search_phrase': 'a', 'limit': 3})
+
+        assert post.await_count == 2
+
+    async def test_recommend_is_not_cached(self, mock_http):
+        """Only documentation search and read responses are cached."""
+        _, post = mock_http
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        await client.call('dsql_recommend', {'url': 'u'})
+        await client.call('dsql_recommend', {'url': 'u'})
+
+        assert post.await_count == 2
+
+    async def test_cached_entry_expires(self, mock_http):
+        """An expired entry is fetched again."""
+        _, post = mock_http
+        clock = FakeClock()
+        client = KnowledgeClient(
+            'https://kb.example.com', 30.0, cache=TTLCache(ttl_seconds=60, clock=clock)
+        )
+
+        await client.call('dsql_read_documentation', {'url': 'u'})
+        clock.now = 61
+        await client.call('dsql_read_documentation', {'url': 'u'})
+
+        assert post.await_count == 2
+
+    async def test_mutating_result_does_not_poison_cache(self, mock_http):
+        """Callers get independent copies of cached results."""
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        first = await client.call('dsql_read_documentation', {'url': 'u'})
+        first['data'] = 'tampered'
+
+        assert await client.call('dsql_read_documentation', {'url': 'u'}) == {'data': 'doc'}
+
+    async def test_concurrent_identical_calls_share_one_request(self, mock_http):
+        """Parallel identical calls are coalesced onto a single upstream request."""
+        _, post = mock_http
+        release = asyncio.Event()
+
+        async def slow_post(*args, **kwargs):
+            await release.wait()
+            return make_response({'result': {'data': 'doc'}})
+
+        post.side_effect = slow_post
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        calls = [
+            asyncio.ensure_future(client.call('dsql_recommend', {'url': 'u'})) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == [{'data': 'doc'}] * 5
+        assert post.await_count == 1
+
+    async def test_coalesced_callers_all_see_the_error(self, mock_http):
+        """A failed shared request fails every waiter and is not cached."""
+        _, post = mock_http
+        release = asyncio.Event()
+
+        async def failing_post(*args, **kwargs):
+            await release.wait()
+            raise httpx.ConnectError('down')
+
+        post.side_effect = failing_post
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        calls = [
+            asyncio.ensure_future(client.call('dsql_read_documentation', {'url': 'u'}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+        assert post.await_count == 1
+        assert len(client.cache) == 0
+
+    async def test_json_rpc_error_raises_and_is_not_cached(self, mock_http):
+        """JSON-RPC errors surface as KnowledgeServerError and are retried next call."""
+        _, post = mock_http
+        post.return_value = make_response({'error': {'message': 'bad url'}})
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+
+        with pytest.raises(KnowledgeServerError, match='bad url'):
+            await client.call('dsql_read_documentation', {'url': 'u'})
+
+        post.return_value = make_response({'result': {'data': 'doc'}})
+        assert await client.call('dsql_read_documentation', {'url': 'u'}) == {'data': 'doc'}
+        assert post.await_count == 2
+
+    async def test_aclose_closes_http_client(self, mock_http):
+        """aclose() releases the pooled connections."""
+        mock_client, _ = mock_http
+        mock_client.return_value.aclose = AsyncMock()
+        client = KnowledgeClient('https://kb.example.com', 30.0)
+        await client.call('dsql_recommend', {'url': 'u'})
+
+        await client.aclose()
+
+        mock_client.return_value.aclose.assert_awaited_once()
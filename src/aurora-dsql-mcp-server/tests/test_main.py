@@ -212,6 +212,52 @@ class TestMain:
 
         assert exc_info.value.code == 1
 
+    @patch(
+        "sys.argv",
+        [
+            "awslabs.aurora-dsql-mcp-server",
+            "--cluster_endpoint",
+            "test_ce",
+            "--database_user",
+            "test_user",
+            "--region",
+            "us-west-2",
+            "--knowledge-cache-ttl",
+            "-1",
+        ],
+    )
+    def test_main_rejects_negative_knowledge_cache_ttl(self):
+        """Test that main rejects a negative knowledge cache TTL."""
+        import pytest
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+
+    @patch(
+        "sys.argv",
+        [
+            "awslabs.aurora-dsql-mcp-server",
+            "--cluster_endpoint",
+            "test_ce",
+            "--database_user",
+            "test_user",
+            "--region",
+            "us-west-2",
+            "--knowledge-cache-ttl",
+            "0",
+        ],
+    )
+    def test_main_accepts_zero_knowledge_cache_ttl(self, mocker):
+        """Test that --knowledge-cache-ttl 0 is accepted to disable caching."""
+        mocker.patch("awslabs.aurora_dsql_mcp_server.server.mcp.run")
+        mocker.patch("awslabs.aurora_dsql_mcp_server.server.knowledge_cache_ttl", 900)
+
+        main()
+
+        assert awslabs.aurora_dsql_mcp_server.server.knowledge_cache_ttl == 0
+
     @patch(
         "sys.argv",
         [
@@ -242,6 +288,60 @@ class TestMain:
 
         mock_mcp_run.assert_called_once()
 
+    @patch(
+        "sys.argv",
+        [
+            "awslabs.aurora-dsql-mcp-server",
+            "--cluster_endpoint",
+            "test_ce",
+            "--database_user",
+            "test_user",
+            "--region",
+            "us-west-2",
+            "--pool-min-size",
+            "2",
+            "--pool-max-size",
+            "20",
+        ],
+    )
+    def test_main_with_custom_pool_size(self, mocker):
+        """Test that main accepts custom connection pool sizes."""
+        mock_mcp_run = mocker.patch("awslabs.aurora_dsql_mcp_server.server.mcp.run")
+        mocker.patch("awslabs.aurora_dsql_mcp_server.server.pool_min_size", 1)
+        mocker.patch("awslabs.aurora_dsql_mcp_server.server.pool_max_size", 10)
+
+        main()
+
+        assert awslabs.aurora_dsql_mcp_server.server.pool_min_size == 2
+        assert awslabs.aurora_dsql_mcp_server.server.pool_max_size == 20
+
+        mock_mcp_run.assert_called_once()
+
+    @patch(
+        "sys.argv",
+        [
+            "awslabs.aurora-dsql-mcp-server",
+            "--cluster_endpoint",
+            "test_ce",
+            "--database_user",
+            "test_user",
+            "--region",
+            "us-west-2",
+            "--pool-min-size",
+            "5",
+            "--pool-max-size",
+            "2",
+        ],
+    )
+    def test_main_rejects_min_pool_size_above_max(self):
+        """Test that main rejects a minimum pool size larger than the maximum."""
+        import pytest
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+
     @patch(
         "sys.argv",
         [
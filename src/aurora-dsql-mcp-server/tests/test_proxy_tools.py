@@ -10,6 +10,16 @@ from awslabs.aurora_dsql_mcp_server.server import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_knowledge_client():
+    """Start every test with a fresh knowledge client and empty cache."""
+    import awslabs.aurora_dsql_mcp_server.server as server_module
+
+    server_module.knowledge_client = None
+    yield
+    server_module.knowledge_client = None
+
+
 @pytest.fixture
 def mock_ctx():
     """Create a mock context."""
@@ -26,7 +36,7 @@ async def test_proxy_to_knowledge_server_success(mock_ctx):
         mock_response.json.return_value = {'result': {'data': 'test'}}
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -50,14 +60,15 @@ async def test_proxy_to_knowledge_server_uses_timeout(mock_ctx):
             mock_response.json.return_value = {'result': {'data': 'test'}}
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
             await _proxy_to_knowledge_server('test_method', {'param': 'value'}, mock_ctx)
 
             # Verify AsyncClient was called with custom timeout
-            mock_client.assert_called_once_with(timeout=60.0)
+            mock_client.assert_called_once()
+            assert mock_client.call_args.kwargs['timeout'] == 60.0
     finally:
         # Restore original timeout
         server_module.knowledge_timeout = original_timeout
@@ -71,7 +82,7 @@ async def test_proxy_to_knowledge_server_error(mock_ctx):
         mock_response.json.return_value = {'error': {'message': 'Server error'}}
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -85,7 +96,7 @@ async def test_proxy_to_knowledge_server_unavailable(mock_ctx):
     import httpx
 
     with patch('httpx.AsyncClient') as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             side_effect=httpx.HTTPError('Connection failed')
         )
 
@@ -220,14 +231,14 @@ async def test_proxy_uses_configured_server_endpoint(mock_ctx):
             mock_response.json.return_value = {'result': {'data': 'test'}}
             mock_response.raise_for_status = MagicMock()
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
             await _proxy_to_knowledge_server('test_method', {'param': 'value'}, mock_ctx)
 
             # Verify the custom server was used
-            post_call = mock_client.return_value.__aenter__.return_value.post
+            post_call = mock_client.return_value.post
             post_call.assert_called_once()
             assert post_call.call_args[0][0] == 'https://custom.example.com'
     finally:
@@ -246,7 +257,7 @@ async def test_proxy_to_knowledge_server_content_text_response(mock_ctx):
         }
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -266,7 +277,7 @@ async def test_proxy_to_knowledge_server_content_non_text_response(mock_ctx):
         }
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -286,7 +297,7 @@ async def test_proxy_to_knowledge_server_empty_content_response(mock_ctx):
         }
         mock_response.raise_for_status = MagicMock()
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
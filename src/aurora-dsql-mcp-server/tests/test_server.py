@@ -44,6 +44,7 @@ from awslabs.aurora_dsql_mcp_server.server import (
 )
 from unittest.mock import AsyncMock, MagicMock, call, patch
 from psycopg.errors import ReadOnlySqlTransaction
+from psycopg.pq import TransactionStatus
 
 
 ctx = AsyncMock()
@@ -58,16 +59,20 @@ def create_mock_connection():
     mock_cursor.execute = AsyncMock()
     mock_conn.cursor = MagicMock(return_value=mock_cursor)
     mock_conn.closed = False
+    mock_conn.broken = False
+    mock_conn.info.transaction_status = TransactionStatus.IDLE
     return mock_conn, mock_cursor
 
 
 @pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+async def reset_connection_pool():
+    """Reset the connection pool and auth token cache before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
 
 
 async def test_readonly_query_throws_exception_on_empty_input():
@@ -164,7 +169,7 @@ async def test_get_password_token_for_non_admin_user(mocker):
 
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection(mocker, reset_persistent_connection):
+async def test_get_connection(mocker, reset_connection_pool):
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
     mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
@@ -191,7 +196,7 @@ async def test_get_connection(mocker, reset_persistent_connection):
 
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection_failure(mocker, reset_persistent_connection):
+async def test_get_connection_failure(mocker, reset_connection_pool):
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
     mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
@@ -741,7 +746,7 @@ async def test_transact_rolls_back_on_readonly_violation(mocker):
 
 
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_reset_failure_discards_pooled_connection(mocker, reset_persistent_connection):
+async def test_reset_failure_discards_pooled_connection(mocker, reset_connection_pool):
     """A failed session scrub must discard the pooled connection (self-heal).
 
     Otherwise the mutated connection stays pooled and the scrub silently
@@ -751,7 +756,7 @@ async def test_reset_failure_discards_pooled_connection(mocker, reset_persistent
 
     mock_conn = AsyncMock()
     mock_conn.close = AsyncMock()
-    server.persistent_connection = mock_conn
+    mock_conn.closed = False
 
     # Every reset statement fails.
     mock_execute_query = mocker.patch(
@@ -765,24 +770,21 @@ async def test_reset_failure_discards_pooled_connection(mocker, reset_persistent
     assert mock_execute_query.call_count == len(RESET_SESSION_STATE_SQL)
     # ...and the broken connection was discarded so the next request reconnects.
     mock_conn.close.assert_awaited_once()
-    assert server.persistent_connection is None
 
 
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_reset_success_keeps_pooled_connection(mocker, reset_persistent_connection):
+async def test_reset_success_keeps_pooled_connection(mocker, reset_connection_pool):
     """A successful scrub must NOT discard the pooled connection."""
     import awslabs.aurora_dsql_mcp_server.server as server
 
     mock_conn = AsyncMock()
     mock_conn.close = AsyncMock()
-    server.persistent_connection = mock_conn
 
     mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query', return_value=[])
 
     await server.reset_session_state(ctx, mock_conn)
 
     mock_conn.close.assert_not_awaited()
-    assert server.persistent_connection is mock_conn
 
 
 async def test_execute_query_connection_retry(mocker):
@@ -790,9 +792,6 @@ async def test_execute_query_connection_retry(mocker):
     from awslabs.aurora_dsql_mcp_server.server import execute_query
     from psycopg.errors import OperationalError
 
-    # Mock persistent_connection
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
-
     mock_get_connection = mocker.patch(
         'awslabs.aurora_dsql_mcp_server.server.get_connection'
     )
@@ -855,8 +854,6 @@ async def test_execute_query_with_interface_error_retry(mocker):
     from awslabs.aurora_dsql_mcp_server.server import execute_query
     from psycopg.errors import InterfaceError
 
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
-
     mock_get_connection = mocker.patch(
         'awslabs.aurora_dsql_mcp_server.server.get_connection'
     )
@@ -892,8 +889,6 @@ async def test_execute_query_retry_returns_empty(mocker):
     from awslabs.aurora_dsql_mcp_server.server import execute_query
     from psycopg.errors import OperationalError
 
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
-
     mock_get_connection = mocker.patch(
         'awslabs.aurora_dsql_mcp_server.server.get_connection'
     )
@@ -14,6 +14,10 @@
 
 """AthenaQueryHandler for Data Processing MCP Server."""
 
+import asyncio
+import json
+import re
+import time
 from awslabs.aws_dataprocessing_mcp_server.models.athena_models import (
     BatchGetNamedQueryData,
     BatchGetQueryExecutionData,
@@ -22,25 +26,57 @@ from awslabs.aws_dataprocessing_mcp_server.models.athena_models import (
     GetNamedQueryData,
     GetQueryExecutionData,
     GetQueryResultsData,
+    GetQueryResultsFromS3Data,
     GetQueryRuntimeStatisticsData,
     ListNamedQueriesData,
     ListQueryExecutionsData,
+    RunQueryData,
     StartQueryExecutionData,
     StopQueryExecutionData,
     UpdateNamedQueryData,
 )
+from awslabs.aws_dataprocessing_mcp_server.utils.athena_query_waiter import (
+    AthenaQueryWaiter,
+    QueryWaitTimeoutError,
+)
+from awslabs.aws_dataprocessing_mcp_server.utils.athena_results_reader import (
+    DEFAULT_PREVIEW_ROWS,
+    AthenaResultsReader,
+)
 from awslabs.aws_dataprocessing_mcp_server.utils.aws_helper import AwsHelper
 from awslabs.aws_dataprocessing_mcp_server.utils.logging_helper import (
     LogLevel,
     log_with_request_id,
 )
 from awslabs.aws_dataprocessing_mcp_server.utils.sql_analyzer import SqlAnalyzer
+from cachetools import TTLCache
 from mcp.server.fastmcp import Context
 from mcp.types import CallToolResult, TextContent
 from pydantic import Field
 from typing import Annotated, Any, Dict, List, Optional
 
 
+DEFAULT_RUN_QUERY_TIMEOUT_SECONDS = 60
+DEFAULT_RESULT_REUSE_MAX_AGE_MINUTES = 60
+DEFAULT_RESULT_REUSE_CONFIGURATION = {
+    'ResultReuseByAgeConfiguration': {
+        'Enabled': True,
+        'MaxAgeInMinutes': DEFAULT_RESULT_REUSE_MAX_AGE_MINUTES,
+    }
+}
+# Results of run-query kept locally, for at most the default result reuse age
+QUERY_CACHE_SIZE = 256
+
+# Whitespace outside of string literals, which does not change the meaning of a query
+_SQL_WHITESPACE_PATTERN = re.compile(r"('(?:[^']|'')*')|\s+")
+
+
+def _normalize_sql(query_string: str) -> str:
+    """Collapse whitespace outside of string literals and drop the trailing semicolon."""
+    normalized = _SQL_WHITESPACE_PATTERN.sub(lambda m: m.group(1) or ' ', query_string)
+    return normalized.strip().rstrip(';').rstrip()
+
+
 class AthenaQueryHandler:
     """Handler for Amazon Athena Query operations."""
 
@@ -56,6 +92,11 @@ class AthenaQueryHandler:
         self.allow_write = allow_write
         self.allow_sensitive_data_access = allow_sensitive_data_access
         self.athena_client = AwsHelper.create_boto3_client('athena')
+        self.s3_client = AwsHelper.create_boto3_client('s3')
+        self.query_waiter = AthenaQueryWaiter()
+        self._query_cache: TTLCache = TTLCache(
+            maxsize=QUERY_CACHE_SIZE, ttl=DEFAULT_RESULT_REUSE_MAX_AGE_MINUTES * 60
+        )
 
         # Register tools
         self.mcp.tool(name='manage_aws_athena_query_executions')(self.manage_aws_athena_queries)
@@ -67,7 +108,7 @@ class AthenaQueryHandler:
         operation: Annotated[
             str,
             Field(
-                description='Operation to perform: batch-get-query-execution, get-query-execution, get-query-results, get-query-runtime-statistics, list-query-executions, start-query-execution, stop-query-execution. Choose read-only operations when write access is disabled.',
+                description='Operation to perform: batch-get-query-execution, get-query-execution, get-query-results, get-query-runtime-statistics, list-query-executions, run-query, start-query-execution, stop-query-execution. Choose read-only operations when write access is disabled.',
             ),
         ],
         query_execution_id: Annotated[
@@ -85,49 +126,49 @@ class AthenaQueryHandler:
         query_string: Annotated[
             Optional[str],
             Field(
-                description='The SQL query string to execute (required for start-query-execution).',
+                description='The SQL query string to execute (required for run-query, start-query-execution).',
             ),
         ] = None,
         client_request_token: Annotated[
             Optional[str],
             Field(
-                description='A unique case-sensitive string used to ensure the request to create the query is idempotent (optional for start-query-execution).',
+                description='A unique case-sensitive string used to ensure the request to create the query is idempotent (optional for run-query, start-query-execution).',
             ),
         ] = None,
         query_execution_context: Annotated[
             Optional[Dict[str, str]],
             Field(
-                description='Context for the query execution, such as database name and catalog (optional for start-query-execution).',
+                description='Context for the query execution, such as database name and catalog (optional for run-query, start-query-execution).',
             ),
         ] = None,
         result_configuration: Annotated[
             Optional[Dict[str, Any]],
             Field(
-                description='Configuration for query results, such as output location and encryption (optional for start-query-execution).',
+                description='Configuration for query results, such as output location and encryption (optional for run-query, start-query-execution).',
             ),
         ] = None,
         work_group: Annotated[
             Optional[str],
             Field(
-                description='The name of the workgroup in which the query is being started (optional for start-query-execution, list-query-executions).',
+                description='The name of the workgroup in which the query is being started (optional for run-query, start-query-execution, list-query-executions).',
             ),
         ] = None,
         execution_parameters: Annotated[
             Optional[List[str]],
             Field(
-                description='Execution parameters for parameterized queries (optional for start-query-execution).',
+                description='Execution parameters for parameterized queries (optional for run-query, start-query-execution).',
             ),
         ] = None,
         result_reuse_configuration: Annotated[
             Optional[Dict[str, Any]],
             Field(
-                description='Specifies the query result reuse behavior for the query (optional for start-query-execution).',
+                description='Specifies the query result reuse behavior for the query (optional for run-query, start-query-execution). run-query reuses results up to 60 minutes old by default.',
             ),
         ] = None,
         max_results: Annotated[
             Optional[int],
             Field(
-                description='Maximum number of results to return (1-1000 for get-query-results, 0-50 for list-query-executions).',
+                description='Maximum number of results to return (1-1000 for get-query-results and run-query, 0-50 for list-query-executions). With result_mode S3, the number of preview rows (default 100).',
             ),
         ] = None,
         next_token: Annotated[
@@ -142,6 +183,18 @@ class AthenaQueryHandler:
                 description='Type of query results to return: DATA_ROWS (default) or DATA_MANIFEST (optional for get-query-results).',
             ),
         ] = None,
+        wait_timeout_seconds: Annotated[
+            Optional[int],
+            Field(
+                description='Maximum time to wait for the query to finish (optional for run-query, default 60).',
+            ),
+        ] = None,
+        result_mode: Annotated[
+            Optional[str],
+            Field(
+                description='How to read query results: API (default) pages through GetQueryResults, S3 reads the result CSV from the query output location with parallel ranged GETs and returns a columnar preview plus a local file with all the rows (optional for get-query-results).',
+            ),
+        ] = None,
     ) -> CallToolResult:
         """Execute and manage AWS Athena SQL queries.
 
@@ -156,9 +209,12 @@ class AthenaQueryHandler:
         ## Operations
         - **batch-get-query-execution**: Get details for up to 50 query executions by their IDs
         - **get-query-execution**: Get complete information about a single query execution
-        - **get-query-results**: Retrieve the results of a completed query
+        - **get-query-results**: Retrieve the results of a completed query. For large results, use
+          result_mode='S3' to read the result file directly from S3 instead of 1000 rows per call
         - **get-query-runtime-statistics**: Get performance statistics for a query execution
         - **list-query-executions**: List available query execution IDs (up to 50)
+        - **run-query**: Start a query, wait for it to finish and return the first page of results.
+          Results of the same query are reused by Athena and cached locally for up to 60 minutes
         - **start-query-execution**: Execute a new SQL query
         - **stop-query-execution**: Cancel a running query
 
@@ -193,6 +249,8 @@ class AthenaQueryHandler:
             max_results: Maximum number of results to return
             next_token: Pagination token
             query_result_type: Type of query results to return (DATA_ROWS or DATA_MANIFEST)
+            wait_timeout_seconds: Maximum time to wait for run-query to finish
+            result_mode: How to read query results (API or S3)
 
         Returns:
             Union of response types specific to the operation performed
@@ -210,53 +268,21 @@ class AthenaQueryHandler:
                         'query_string is required for start-query-execution operation'
                     )
 
-                # Reject queries that are not explicitly read-only when write access is disabled (allowlist / fail-closed)
-                if not self.allow_write and not SqlAnalyzer.is_read_only_query(query_string):
-                    error_message = (
-                        f'Operation {operation} contains write operations and is not allowed without write access. '
-                        f'Detected query type: {SqlAnalyzer.get_query_type(query_string)}'
-                    )
-                    log_with_request_id(ctx, LogLevel.ERROR, error_message)
-
-                    return CallToolResult(
-                        isError=True,
-                        content=[TextContent(type='text', text=error_message)],
-                    )
-
-                # Block caller-supplied OutputLocation when sensitive data access is disabled
-                # to prevent exfiltration of query results to attacker-controlled S3 paths
-                if not self.allow_sensitive_data_access and result_configuration is not None:
-                    if 'OutputLocation' in result_configuration:
-                        error_message = (
-                            'Custom OutputLocation in ResultConfiguration is not allowed without '
-                            '--allow-sensitive-data-access. Query results must use the workgroup default output location.'
-                        )
-                        log_with_request_id(ctx, LogLevel.ERROR, error_message)
-                        return CallToolResult(
-                            isError=True,
-                            content=[TextContent(type='text', text=error_message)],
-                        )
-
-                # Prepare parameters
-                params = {'QueryString': query_string}
-
-                if client_request_token is not None:
-                    params['ClientRequestToken'] = client_request_token
-
-                if query_execution_context is not None:
-                    params['QueryExecutionContext'] = query_execution_context
-
-                if result_configuration is not None:
-                    params['ResultConfiguration'] = result_configuration
-
-                if work_group is not None:
-                    params['WorkGroup'] = work_group
-
-                if execution_parameters is not None:
-                    params['ExecutionParameters'] = execution_parameters
-
-                if result_reuse_configuration is not None:
-                    params['ResultReuseConfiguration'] = result_reuse_configuration
+                error = self._check_query_allowed(
+                    ctx, operation, query_string, result_configuration
+                )
+                if error is not None:
+                    return error
+
+                params = self._build_start_query_params(
+                    query_string,
+                    client_request_token,
+                    query_execution_context,
+                    result_configuration,
+                    work_group,
+                    execution_parameters,
+                    result_reuse_configuration,
+                )
 
                 # Start query execution
                 response = self.athena_client.start_query_execution(**params)
@@ -274,6 +300,29 @@ class AthenaQueryHandler:
                     ],
                 )
 
+            elif operation == 'run-query':
+                if query_string is None:
+                    raise ValueError('query_string is required for run-query operation')
+
+                error = self._check_query_allowed(
+                    ctx, operation, query_string, result_configuration
+                )
+                if error is not None:
+                    return error
+
+                return await self._run_query(
+                    ctx,
+                    query_string,
+                    client_request_token,
+                    query_execution_context,
+                    result_configuration,
+                    work_group,
+                    execution_parameters,
+                    result_reuse_configuration,
+                    max_results,
+                    wait_timeout_seconds,
+                )
+
             elif operation == 'batch-get-query-execution':
                 if query_execution_ids is None:
                     raise ValueError(
@@ -346,6 +395,14 @@ class AthenaQueryHandler:
                         content=[TextContent(type='text', text=error_message)],
                     )
 
+                if result_mode is not None and result_mode not in ('API', 'S3'):
+                    raise ValueError(f'Invalid result_mode: {result_mode}. Must be API or S3')
+
+                if result_mode == 'S3':
+                    return await self._get_query_results_from_s3(
+                        ctx, query_execution_id, max_results
+                    )
+
                 # Prepare parameters
                 params: Dict[str, Any] = {'QueryExecutionId': query_execution_id}
                 if max_results is not None:
@@ -460,7 +517,7 @@ class AthenaQueryHandler:
                 )
 
             else:
-                error_message = f'Invalid operation: {operation}. Must be one of: batch-get-query-execution, get-query-execution, get-query-results, get-query-runtime-statistics, list-query-executions, start-query-execution, stop-query-execution'
+                error_message = f'Invalid operation: {operation}. Must be one of: batch-get-query-execution, get-query-execution, get-query-results, get-query-runtime-statistics, list-query-executions, run-query, start-query-execution, stop-query-execution'
                 log_with_request_id(ctx, LogLevel.ERROR, error_message)
                 return CallToolResult(
                     isError=True,
@@ -478,6 +535,255 @@ class AthenaQueryHandler:
                 content=[TextContent(type='text', text=error_message)],
             )
 
+    def _check_query_allowed(
+        self,
+        ctx: Context,
+        operation: str,
+        query_string: str,
+        result_configuration: Optional[Dict[str, Any]],
+    ) -> Optional[CallToolResult]:
+        """Return an error result if the query may not be started, None otherwise."""
+        # Reject queries that are not explicitly read-only when write access is disabled (allowlist / fail-closed)
+        if not self.allow_write and not SqlAnalyzer.is_read_only_query(query_string):
+            error_message = (
+                f'Operation {operation} contains write operations and is not allowed without write access. '
+                f'Detected query type: {SqlAnalyzer.get_query_type(query_string)}'
+            )
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+            )
+
+        # Block caller-supplied OutputLocation when sensitive data access is disabled
+        # to prevent exfiltration of query results to attacker-controlled S3 paths
+        if not self.allow_sensitive_data_access and result_configuration is not None:
+            if 'OutputLocation' in result_configuration:
+                error_message = (
+                    'Custom OutputLocation in ResultConfiguration is not allowed without '
+                    '--allow-sensitive-data-access. Query results must use the workgroup default output location.'
+                )
+                log_with_request_id(ctx, LogLevel.ERROR, error_message)
+                return CallToolResult(
+                    isError=True,
+                    content=[TextContent(type='text', text=error_message)],
+                )
+
+        return None
+
+    def _build_start_query_params(
+        self,
+        query_string: str,
+        client_request_token: Optional[str],
+        query_execution_context: Optional[Dict[str, str]],
+        result_configuration: Optional[Dict[str, Any]],
+        work_group: Optional[str],
+        execution_parameters: Optional[List[str]],
+        result_reuse_configuration: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the parameters of a StartQueryExecution request."""
+        params: Dict[str, Any] = {'QueryString': query_string}
+
+        if client_request_token is not None:
+            params['ClientRequestToken'] = client_request_token
+
+        if query_execution_context is not None:
+            params['QueryExecutionContext'] = query_execution_context
+
+        if result_configuration is not None:
+            params['ResultConfiguration'] = result_configuration
+
+        if work_group is not None:
+            params['WorkGroup'] = work_group
+
+        if execution_parameters is not None:
+            params['ExecutionParameters'] = execution_parameters
+
+        if result_reuse_configuration is not None:
+            params['ResultReuseConfiguration'] = result_reuse_configuration
+
+        return params
+
+    async def _run_query(
+        self,
+        ctx: Context,
+        query_string: str,
+        client_request_token: Optional[str],
+        query_execution_context: Optional[Dict[str, str]],
+        result_configuration: Optional[Dict[str, Any]],
+        work_group: Optional[str],
+        execution_parameters: Optional[List[str]],
+        result_reuse_configuration: Optional[Dict[str, Any]],
+        max_results: Optional[int],
+        wait_timeout_seconds: Optional[int],
+    ) -> CallToolResult:
+        """Start a query, wait for it to finish and return the first page of results."""
+        if result_reuse_configuration is None:
+            result_reuse_configuration = DEFAULT_RESULT_REUSE_CONFIGURATION
+        reuse = result_reuse_configuration.get('ResultReuseByAgeConfiguration', {})
+        max_age_seconds = (
+            reuse.get('MaxAgeInMinutes', DEFAULT_RESULT_REUSE_MAX_AGE_MINUTES) * 60
+            if reuse.get('Enabled')
+            else 0
+        )
+
+        # Only read-only queries are cached, and only while Athena could reuse their results
+        cache_key = None
+        if max_age_seconds and SqlAnalyzer.is_read_only_query(query_string):
+            context = query_execution_context or {}
+            cache_key = (
+                _normalize_sql(query_string),
+                work_group,
+                context.get('Catalog'),
+                context.get('Database'),
+                tuple(execution_parameters or ()),
+                json.dumps(result_configuration, sort_keys=True, default=str),
+                max_results,
+            )
+            cached = self._query_cache.get(cache_key)
+            if cached is not None and time.time() - cached[0] <= max_age_seconds:
+                data = cached[1].model_copy(update={'cached': True})
+                return CallToolResult(
+                    isError=False,
+                    content=[
+                        TextContent(
+                            type='text',
+                            text=f'Returned cached results of query execution {data.query_execution_id}',
+                        ),
+                        TextContent(type='text', text=data.model_dump_json()),
+                    ],
+                )
+
+        params = self._build_start_query_params(
+            query_string,
+            client_request_token,
+            query_execution_context,
+            result_configuration,
+            work_group,
+            execution_parameters,
+            result_reuse_configuration,
+        )
+        response = self.athena_client.start_query_execution(**params)
+        query_execution_id = response.get('QueryExecutionId', '')
+
+        timeout = wait_timeout_seconds or DEFAULT_RUN_QUERY_TIMEOUT_SECONDS
+        try:
+            query_execution = await self.query_waiter.wait(
+                self.athena_client, query_execution_id, timeout
+            )
+        except QueryWaitTimeoutError as e:
+            # A query that was not polled yet is still in its initial state
+            state = e.query_execution.get('Status', {}).get('State', 'QUEUED')
+            data = RunQueryData(
+                query_execution_id=query_execution_id,
+                state=state,
+                query_execution=e.query_execution,
+            )
+            return CallToolResult(
+                isError=False,
+                content=[
+                    TextContent(
+                        type='text',
+                        text=f'Query execution {query_execution_id} is still {state} after {timeout} seconds. Use get-query-execution to check its state.',
+                    ),
+                    TextContent(type='text', text=data.model_dump_json()),
+                ],
+            )
+
+        status = query_execution.get('Status', {})
+        data = RunQueryData(
+            query_execution_id=query_execution_id,
+            state=status.get('State', ''),
+            query_execution=query_execution,
+            reused_previous_result=query_execution.get('Statistics', {})
+            .get('ResultReuseInformation', {})
+            .get('ReusedPreviousResult', False),
+        )
+
+        if data.state != 'SUCCEEDED':
+            error_message = f'Query execution {query_execution_id} {data.state}: {status.get("StateChangeReason", "")}'
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+            return CallToolResult(
+                isError=True,
+                content=[
+                    TextContent(type='text', text=error_message),
+                    TextContent(type='text', text=data.model_dump_json()),
+                ],
+            )
+
+        # Result data is only returned with sensitive data access, like get-query-results
+        if self.allow_sensitive_data_access:
+            results_params: Dict[str, Any] = {'QueryExecutionId': query_execution_id}
+            if max_results is not None:
+                results_params['MaxResults'] = max_results
+            results = self.athena_client.get_query_results(**results_params)
+            data.result_set = results.get('ResultSet', {})
+            data.next_token = results.get('NextToken')
+
+        if cache_key is not None:
+            self._query_cache[cache_key] = (time.time(), data)
+
+        return CallToolResult(
+            isError=False,
+            content=[
+                TextContent(
+                    type='text',
+                    text=f'Successfully ran query execution {query_execution_id}',
+                ),
+                TextContent(type='text', text=data.model_dump_json()),
+            ],
+        )
+
+    async def _get_query_results_from_s3(
+        self, ctx: Context, query_execution_id: str, preview_rows: Optional[int]
+    ) -> CallToolResult:
+        """Read the results of a succeeded query from its output location in S3."""
+        query_execution = self.athena_client.get_query_execution(
+            QueryExecutionId=query_execution_id
+        ).get('QueryExecution', {})
+
+        state = query_execution.get('Status', {}).get('State')
+        if state != 'SUCCEEDED':
+            error_message = (
+                f'Query execution {query_execution_id} has not succeeded (state: {state})'
+            )
+            log_with_request_id(ctx, LogLevel.ERROR, error_message)
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type='text', text=error_message)],
+            )
+
+        output_location = query_execution.get('ResultConfiguration', {}).get('OutputLocation')
+        if not output_location:
+            raise ValueError(f'Query execution {query_execution_id} has no output location')
+
+        # Downloading and parsing a large result file takes a while, so it runs in a
+        # worker thread to keep serving other tool calls
+        results = await asyncio.to_thread(
+            AthenaResultsReader(self.s3_client).read,
+            output_location,
+            query_execution_id,
+            DEFAULT_PREVIEW_ROWS if preview_rows is None else preview_rows,
+        )
+
+        data = GetQueryResultsFromS3Data(
+            query_execution_id=query_execution_id,
+            output_location=output_location,
+            **results,
+        )
+
+        return CallToolResult(
+            isError=False,
+            content=[
+                TextContent(
+                    type='text',
+                    text=f'Successfully read {data.row_count} result rows for {query_execution_id} from S3',
+                ),
+                TextContent(type='text', text=data.model_dump_json()),
+            ],
+        )
+
     async def manage_aws_athena_named_queries(
         self,
         ctx: Context,
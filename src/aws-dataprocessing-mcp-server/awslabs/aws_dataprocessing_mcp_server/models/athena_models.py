@@ -56,6 +56,26 @@ class GetQueryResultsData(BaseModel):
     operation: str = Field(default='get-query-results', description='Operation performed')
 
 
+class GetQueryResultsFromS3Data(BaseModel):
+    """Data model for get query results operation reading the result file from S3."""
+
+    query_execution_id: str = Field(..., description='ID of the query execution')
+    output_location: str = Field(..., description='S3 URI of the query result file')
+    columns: List[str] = Field(..., description='Column names of the query results')
+    data: Dict[str, List[Optional[str]]] = Field(
+        ...,
+        description='Preview of the query results, as a list of values per column, with None for NULL',
+    )
+    row_count: int = Field(..., description='Total number of rows in the query results')
+    truncated: bool = Field(..., description='Whether the preview omits some of the rows')
+    spill_file: str = Field(..., description='Local path of a CSV file with all the rows')
+    bytes_read: int = Field(
+        ...,
+        description='Size in bytes of the result file read from S3, 0 if the spill file of an earlier read was reused',
+    )
+    operation: str = Field(default='get-query-results', description='Operation performed')
+
+
 class GetQueryRuntimeStatisticsData(BaseModel):
     """Data model for get query runtime statistics operation."""
 
@@ -85,6 +105,29 @@ class StartQueryExecutionData(BaseModel):
     operation: str = Field(default='start-query-execution', description='Operation performed')
 
 
+class RunQueryData(BaseModel):
+    """Data model for run query operation."""
+
+    query_execution_id: str = Field(..., description='ID of the query execution')
+    state: str = Field(..., description='State of the query execution when the wait ended')
+    query_execution: Dict[str, Any] = Field(
+        ..., description='Query execution details including status and statistics'
+    )
+    reused_previous_result: bool = Field(
+        default=False, description='Whether Athena reused the results of a previous query'
+    )
+    cached: bool = Field(
+        default=False, description='Whether the results were returned from the local cache'
+    )
+    result_set: Optional[Dict[str, Any]] = Field(
+        None, description='First page of the query results, if the query succeeded'
+    )
+    next_token: Optional[str] = Field(
+        None, description='Token to get the next page of results with get-query-results'
+    )
+    operation: str = Field(default='run-query', description='Operation performed')
+
+
 class StopQueryExecutionData(BaseModel):
     """Data model for stop query execution operation."""
 
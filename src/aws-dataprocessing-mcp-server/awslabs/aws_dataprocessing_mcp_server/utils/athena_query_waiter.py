@@ -0,0 +1,207 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Waiter for Athena query executions with adaptive polling."""
+
+import asyncio
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from loguru import logger
+from typing import Any, Dict, List, Optional, Tuple
+
+
+TERMINAL_QUERY_STATES = ('SUCCEEDED', 'FAILED', 'CANCELLED')
+
+# Polling starts fast for short exploratory queries and backs off for long ones
+INITIAL_POLL_DELAY_SECONDS = 0.25
+MAX_POLL_DELAY_SECONDS = 5.0
+POLL_BACKOFF_FACTOR = 1.5
+# Maximum number of IDs per BatchGetQueryExecution request
+BATCH_GET_MAX_IDS = 50
+
+# Error codes of polls that are retried at the next poll instead of failing the wait
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        'ThrottlingException',
+        'Throttling',
+        'TooManyRequestsException',
+        'RequestLimitExceeded',
+        'InternalServerException',
+        'InternalFailure',
+        'ServiceUnavailable',
+        'ServiceUnavailableException',
+        'RequestTimeout',
+        'RequestTimeoutException',
+    }
+)
+
+
+class QueryWaitTimeoutError(asyncio.TimeoutError):
+    """Raised when a query execution is still running after the wait timeout.
+
+    Attributes:
+        query_execution: The QueryExecution last observed, empty if none was
+    """
+
+    def __init__(self, query_execution: Dict[str, Any]):
+        """Initialize the error with the last observed QueryExecution."""
+        super().__init__()
+        self.query_execution = query_execution
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether a failed poll is likely to succeed when retried."""
+    if isinstance(error, (BotocoreConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in RETRYABLE_ERROR_CODES or status >= 500
+    return False
+
+
+class AthenaQueryWaiter:
+    """Waits for Athena query executions to finish.
+
+    Every query being waited for shares a single polling loop. The delay between polls
+    grows from INITIAL_POLL_DELAY_SECONDS to MAX_POLL_DELAY_SECONDS and is reset when
+    a new query is added. A single outstanding query is polled with GetQueryExecution,
+    several with BatchGetQueryExecution, in a worker thread. Throttling and other
+    transient errors are retried at the next poll; any other error fails only the
+    waits of the query executions it concerns.
+    """
+
+    def __init__(self):
+        """Initialize the waiter."""
+        self.athena_client: Any = None
+        self._waiting: Dict[str, asyncio.Future] = {}
+        self._last_seen: Dict[str, Dict[str, Any]] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+        self._delay = INITIAL_POLL_DELAY_SECONDS
+
+    async def wait(
+        self, athena_client: Any, query_execution_id: str, timeout_seconds: float
+    ) -> Dict[str, Any]:
+        """Wait for a query execution to reach a terminal state.
+
+        Args:
+            athena_client: Boto3 Athena client
+            query_execution_id: ID of the query execution
+            timeout_seconds: Maximum time to wait
+
+        Returns:
+            The QueryExecution of the finished query
+
+        Raises:
+            QueryWaitTimeoutError: If the query is still running after timeout_seconds
+        """
+        self.athena_client = athena_client
+        future = self._waiting.get(query_execution_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiting[query_execution_id] = future
+        self._delay = INITIAL_POLL_DELAY_SECONDS
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout_seconds)
+        except asyncio.TimeoutError:
+            if self._waiting.get(query_execution_id) is future:
+                del self._waiting[query_execution_id]
+            raise QueryWaitTimeoutError(self._last_seen.pop(query_execution_id, {})) from None
+
+    async def _poll(self) -> None:
+        """Poll the outstanding query executions until none is left."""
+        while self._waiting:
+            await asyncio.sleep(self._delay)
+            self._delay = min(self._delay * POLL_BACKOFF_FACTOR, MAX_POLL_DELAY_SECONDS)
+            query_execution_ids = list(self._waiting)
+            query_executions, errors = await self._get_query_executions(query_execution_ids)
+
+            for query_execution_id, error in errors.items():
+                if is_retryable_error(error):
+                    logger.warning(
+                        f'Retrying poll of query execution {query_execution_id}: {error}'
+                    )
+                    continue
+                self._finish(query_execution_id, error=error)
+
+            for query_execution in query_executions:
+                query_execution_id = query_execution['QueryExecutionId']
+                if query_execution_id not in self._waiting:
+                    continue
+                state = query_execution.get('Status', {}).get('State')
+                if state in TERMINAL_QUERY_STATES:
+                    self._finish(query_execution_id, result=query_execution)
+                else:
+                    self._last_seen[query_execution_id] = query_execution
+
+    def _finish(
+        self,
+        query_execution_id: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Complete the wait of a query execution with its result or error."""
+        self._last_seen.pop(query_execution_id, None)
+        future = self._waiting.pop(query_execution_id, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _get_query_executions(
+        self, query_execution_ids: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Exception]]:
+        """Get the current state of query executions.
+
+        Returns:
+            The QueryExecutions received, and the error of each ID that could not be polled
+        """
+        if len(query_execution_ids) == 1:
+            try:
+                response = await asyncio.to_thread(
+                    self.athena_client.get_query_execution,
+                    QueryExecutionId=query_execution_ids[0],
+                )
+            except Exception as e:
+                return [], {query_execution_ids[0]: e}
+            return [response['QueryExecution']], {}
+
+        query_executions: List[Dict[str, Any]] = []
+        errors: Dict[str, Exception] = {}
+        for start in range(0, len(query_execution_ids), BATCH_GET_MAX_IDS):
+            batch = query_execution_ids[start : start + BATCH_GET_MAX_IDS]
+            try:
+                response = await asyncio.to_thread(
+                    self.athena_client.batch_get_query_execution, QueryExecutionIds=batch
+                )
+            except Exception as e:
+                errors.update((query_execution_id, e) for query_execution_id in batch)
+                continue
+            query_executions.extend(response.get('QueryExecutions', []))
+            for unprocessed in response.get('UnprocessedQueryExecutionIds', []):
+                errors[unprocessed['QueryExecutionId']] = ClientError(
+                    {
+                        'Error': {
+                            'Code': unprocessed.get('ErrorCode', ''),
+                            'Message': unprocessed.get('ErrorMessage', ''),
+                        }
+                    },
+                    'BatchGetQueryExecution',
+                )
+        return query_executions, errors
@@ -0,0 +1,291 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reader for Athena query result files stored in S3."""
+
+import codecs
+import csv
+import os
+import re
+import tempfile
+import time
+from awslabs.aws_dataprocessing_mcp_server.utils.consts import ATHENA_RESULTS_DIR_ENV_VAR
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+# Size of each ranged GET of the result file
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# Ranged GETs in flight at once, which also bounds the parts held in memory
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PREVIEW_ROWS = 100
+# Local copies of result files are evicted once unused for this long, or oldest
+# first once together they exceed the size limit
+DEFAULT_RESULTS_MAX_AGE_SECONDS = 24 * 60 * 60
+DEFAULT_RESULTS_MAX_BYTES = 10 * 1024 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+_QUERY_EXECUTION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+# A quoted field, with quotes escaped by doubling them, or an unquoted one
+_CSV_FIELD_PATTERN = re.compile(r'"((?:[^"]|"")*)"|([^",\r\n]*)')
+
+
+def default_results_dir() -> str:
+    """Directory of the local copies of result files, ATHENA_RESULTS_DIR if set."""
+    return os.environ.get(ATHENA_RESULTS_DIR_ENV_VAR) or os.path.join(
+        tempfile.gettempdir(), 'aws-dataprocessing-mcp-server', 'athena-results'
+    )
+
+
+def parse_s3_uri(uri: str) -> Tuple[str, str]:
+    """Split an s3://bucket/key URI into its bucket and key.
+
+    Args:
+        uri: S3 URI
+
+    Returns:
+        Tuple of (bucket, key)
+
+    Raises:
+        ValueError: If the URI is not an S3 object URI
+    """
+    parsed = urlparse(uri)
+    key = parsed.path.lstrip('/')
+    if parsed.scheme != 's3' or not parsed.netloc or not key:
+        raise ValueError(f'Invalid S3 object URI: {uri}')
+    return parsed.netloc, key
+
+
+class AthenaResultsReader:
+    """Streams the CSV result file of an Athena query from S3.
+
+    The file is downloaded with parallel ranged GETs and parsed as the parts arrive,
+    in order. Every row is written to a local spill file, and only the header and the
+    first preview_rows rows are kept in memory.
+
+    Result files never change once a query has succeeded, so the spill file of a query
+    execution is kept at <results_dir>/<query execution ID>.csv and read again instead
+    of S3 by later calls. Spill files unused for max_age_seconds are deleted, and the
+    least recently used ones once the directory exceeds max_bytes.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        results_dir: Optional[str] = None,
+        max_age_seconds: float = DEFAULT_RESULTS_MAX_AGE_SECONDS,
+        max_bytes: int = DEFAULT_RESULTS_MAX_BYTES,
+    ):
+        """Initialize the reader.
+
+        Args:
+            s3_client: Boto3 S3 client
+            part_size: Size in bytes of each ranged GET
+            max_concurrency: Maximum number of ranged GETs in flight
+            results_dir: Directory of the spill files, default_results_dir() by default
+            max_age_seconds: Time after which an unused spill file is deleted
+            max_bytes: Total size of the spill files kept in results_dir
+        """
+        self.s3_client = s3_client
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.results_dir = results_dir or default_results_dir()
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+
+    def read(
+        self,
+        output_location: str,
+        query_execution_id: str,
+        preview_rows: int = DEFAULT_PREVIEW_ROWS,
+    ) -> Dict[str, Any]:
+        """Read a result file into a columnar preview and a local spill file.
+
+        Args:
+            output_location: S3 URI of the result CSV file
+            query_execution_id: ID of the query execution the file belongs to
+            preview_rows: Number of rows to include in the preview
+
+        Returns:
+            Dictionary with the column names, the preview values of each column
+            (None for NULL), the total row count, whether the preview is truncated,
+            the spill file path and the number of bytes read from S3
+        """
+        bucket, key = parse_s3_uri(output_location)
+        if not key.endswith('.csv'):
+            raise ValueError(
+                f'Only CSV query results can be read from S3, got {output_location}. '
+                'Use the API result mode for other statement types.'
+            )
+        if not _QUERY_EXECUTION_ID_PATTERN.match(query_execution_id):
+            raise ValueError(f'Invalid query execution ID: {query_execution_id}')
+
+        os.makedirs(self.results_dir, exist_ok=True)
+        spill_file = os.path.join(self.results_dir, f'{query_execution_id}.csv')
+
+        if os.path.isfile(spill_file):
+            # Spill files are only renamed into place once complete
+            os.utime(spill_file)
+            with open(spill_file, 'rb') as f:
+                result = _parse(iter(lambda: f.read(READ_CHUNK_SIZE), b''), preview_rows)
+            bytes_read = 0
+        else:
+            size = self.s3_client.head_object(Bucket=bucket, Key=key)['ContentLength']
+            fd, partial_file = tempfile.mkstemp(
+                dir=self.results_dir, prefix=f'{query_execution_id}.', suffix='.partial'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as spill:
+                    result = _parse(
+                        _spill(self._iter_parts(bucket, key, size), spill), preview_rows
+                    )
+                os.replace(partial_file, spill_file)
+            except BaseException:
+                os.remove(partial_file)
+                raise
+            bytes_read = size
+
+        self._evict(keep=spill_file)
+        return {**result, 'spill_file': spill_file, 'bytes_read': bytes_read}
+
+    def _iter_parts(self, bucket: str, key: str, size: int) -> Iterator[bytes]:
+        """Download the object with parallel ranged GETs, yielding the parts in order."""
+        ranges = [
+            (start, min(start + self.part_size, size) - 1)
+            for start in range(0, size, self.part_size)
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            pending: deque = deque()
+            for byte_range in ranges:
+                pending.append(executor.submit(self._get_range, bucket, key, *byte_range))
+                if len(pending) >= self.max_concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _get_range(self, bucket: str, key: str, start: int, end: int) -> bytes:
+        """Download the bytes from start to end, inclusive, of an object."""
+        response = self.s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes={start}-{end}')
+        return response['Body'].read()
+
+    def _evict(self, keep: str) -> None:
+        """Delete expired spill files, then the least recently used ones over max_bytes."""
+        now = time.time()
+        kept = []
+        for entry in os.scandir(self.results_dir):
+            if not entry.name.endswith(('.csv', '.partial')) or entry.path == keep:
+                continue
+            try:
+                stat = entry.stat()
+                if now - stat.st_mtime > self.max_age_seconds:
+                    os.remove(entry.path)
+                elif entry.name.endswith('.csv'):
+                    kept.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                # Deleted or replaced by another server process in the meantime
+                continue
+
+        total = os.path.getsize(keep) + sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def _spill(parts: Iterator[bytes], spill) -> Iterator[bytes]:
+    """Write the parts to the spill file as they pass through."""
+    for part in parts:
+        spill.write(part)
+        yield part
+
+
+def _parse(parts: Iterator[bytes], preview_rows: int) -> Dict[str, Any]:
+    """Parse the header, the preview rows and the row count of a result file."""
+    lines = _lines(_decode(parts))
+    columns = [value or '' for value in _read_record(lines) or []]
+    preview: List[List[Optional[str]]] = []
+    while len(preview) < preview_rows:
+        record = _read_record(lines)
+        if record is None:
+            break
+        preview.append(record)
+    # Rows past the preview are only counted, with the faster csv module
+    row_count = len(preview) + sum(1 for _ in csv.reader(lines))
+
+    return {
+        'columns': columns,
+        'data': {
+            column: [row[i] if i < len(row) else None for row in preview]
+            for i, column in enumerate(columns)
+        },
+        'row_count': row_count,
+        'truncated': row_count > len(preview),
+    }
+
+
+def _read_record(lines: Iterator[str]) -> Optional[List[Optional[str]]]:
+    """Parse the next CSV record, None if there is none.
+
+    Athena quotes every value and writes NULL as an unquoted empty field, so unlike
+    the csv module, unquoted empty fields are returned as None and quoted ones as ''.
+    """
+    text = next(lines, None)
+    if text is None:
+        return None
+    record: List[Optional[str]] = []
+    pos = 0
+    while True:
+        match = _CSV_FIELD_PATTERN.match(text, pos)
+        end = match.end()
+        at_separator = text.startswith(',', end)
+        if not at_separator and text[end:] not in ('', '\n', '\r\n'):
+            # A quoted value continues on the next line
+            more = next(lines, None)
+            if more is None:
+                raise ValueError('Malformed CSV record in query results')
+            text += more
+            continue
+
+        quoted, unquoted = match.groups()
+        record.append(quoted.replace('""', '"') if quoted is not None else unquoted or None)
+        if not at_separator:
+            return record
+        pos = end + 1
+
+
+def _decode(parts: Iterator[bytes]) -> Iterator[str]:
+    """Decode the parts as UTF-8 text."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for part in parts:
+        yield decoder.decode(part)
+    yield decoder.decode(b'', final=True)
+
+
+def _lines(chunks: Iterator[str]) -> Iterator[str]:
+    """Split text chunks into lines, keeping the line endings for the CSV parser."""
+    remainder = ''
+    for chunk in chunks:
+        *lines, remainder = (remainder + chunk).split('\n')
+        for line in lines:
+            yield line + '\n'
+    if remainder:
+        yield remainder
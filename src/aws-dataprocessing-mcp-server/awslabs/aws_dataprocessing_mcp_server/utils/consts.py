@@ -16,6 +16,7 @@
 
 # Environment Variables
 CUSTOM_TAGS_ENV_VAR = 'CUSTOM_TAGS'
+ATHENA_RESULTS_DIR_ENV_VAR = 'ATHENA_RESULTS_DIR'
 
 # Dataprocessing Stack Management Operations
 MCP_MANAGED_TAG_KEY = 'ManagedBy'
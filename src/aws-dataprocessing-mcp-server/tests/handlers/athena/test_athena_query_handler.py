@@ -20,6 +20,7 @@ from awslabs.aws_dataprocessing_mcp_server.handlers.athena.athena_query_handler
 )
 from botocore.exceptions import ClientError
 from mcp.server.fastmcp import Context
+from tests.test_utils import LocalS3Client
 from unittest.mock import Mock, patch
 
 
@@ -1005,3 +1006,264 @@ async def test_unload_allowed_with_write_access(handler, mock_athena_client):
     assert not response.isError
     data = extract_response_data(response)
     assert data['query_execution_id'] == 'query1'
+
+
+@pytest.mark.asyncio
+async def test_get_query_results_from_s3(handler, mock_athena_client, tmp_path, monkeypatch):
+    """Test reading query results from the output location in S3."""
+    monkeypatch.setenv('ATHENA_RESULTS_DIR', str(tmp_path))
+    handler.athena_client = mock_athena_client
+    handler.s3_client = LocalS3Client({'results/query1.csv': b'"id"\n"1"\n\n"3"\n'})
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {
+            'Status': {'State': 'SUCCEEDED'},
+            'ResultConfiguration': {'OutputLocation': 's3://results/query1.csv'},
+        }
+    }
+
+    ctx = Mock()
+    response = await handler.manage_aws_athena_queries(
+        ctx,
+        operation='get-query-results',
+        query_execution_id='query1',
+        max_results=2,
+        result_mode='S3',
+    )
+
+    assert not response.isError
+    data = extract_response_data(response)
+    assert data['output_location'] == 's3://results/query1.csv'
+    assert data['data'] == {'id': ['1', None]}
+    assert data['row_count'] == 3
+    assert data['spill_file'] == str(tmp_path / 'query1.csv')
+    assert data['truncated'] is True
+    mock_athena_client.get_query_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_query_results_from_s3_not_succeeded(handler, mock_athena_client):
+    """Test reading results from S3 of a query that has not succeeded."""
+    handler.athena_client = mock_athena_client
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {'Status': {'State': 'RUNNING'}}
+    }
+
+    ctx = Mock()
+    response = await handler.manage_aws_athena_queries(
+        ctx, operation='get-query-results', query_execution_id='query1', result_mode='S3'
+    )
+
+    assert response.isError
+    assert 'has not succeeded (state: RUNNING)' in response.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_get_query_results_invalid_result_mode(handler):
+    """Test get-query-results with an invalid result mode."""
+    ctx = Mock()
+    with pytest.raises(ValueError, match='Invalid result_mode'):
+        await handler.manage_aws_athena_queries(
+            ctx, operation='get-query-results', query_execution_id='query1', result_mode='FTP'
+        )
+
+
+@pytest.fixture
+def fast_polling():
+    """Poll query executions without waiting."""
+    with patch(
+        'awslabs.aws_dataprocessing_mcp_server.utils.athena_query_waiter.INITIAL_POLL_DELAY_SECONDS',
+        0.001,
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_run_query_success_and_local_cache(handler, mock_athena_client, fast_polling):
+    """Test run-query waits for the query, returns results and caches them locally."""
+    handler.athena_client = mock_athena_client
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query1'}
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {
+            'QueryExecutionId': 'query1',
+            'Status': {'State': 'SUCCEEDED'},
+            'Statistics': {'ResultReuseInformation': {'ReusedPreviousResult': True}},
+        }
+    }
+    mock_athena_client.get_query_results.return_value = {
+        'ResultSet': {'Rows': [{'Data': [{'VarCharValue': 'col1'}]}]},
+        'NextToken': 'next-token',
+    }
+
+    ctx = Mock()
+    response = await handler.manage_aws_athena_queries(
+        ctx,
+        operation='run-query',
+        query_string='SELECT * FROM my_table',
+        query_execution_context={'Database': 'my_database', 'Catalog': 'AwsDataCatalog'},
+        work_group='primary',
+        max_results=10,
+    )
+
+    assert not response.isError
+    data = extract_response_data(response)
+    assert data['state'] == 'SUCCEEDED'
+    assert data['reused_previous_result'] is True
+    assert data['cached'] is False
+    assert data['next_token'] == 'next-token'
+    assert data['result_set']['Rows'][0]['Data'][0]['VarCharValue'] == 'col1'
+    mock_athena_client.start_query_execution.assert_called_once_with(
+        QueryString='SELECT * FROM my_table',
+        QueryExecutionContext={'Database': 'my_database', 'Catalog': 'AwsDataCatalog'},
+        WorkGroup='primary',
+        ResultReuseConfiguration={
+            'ResultReuseByAgeConfiguration': {'Enabled': True, 'MaxAgeInMinutes': 60}
+        },
+    )
+    mock_athena_client.get_query_results.assert_called_once_with(
+        QueryExecutionId='query1', MaxResults=10
+    )
+
+    # The same query with different whitespace is returned from the local cache
+    response = await handler.manage_aws_athena_queries(
+        ctx,
+        operation='run-query',
+        query_string='SELECT *\n  FROM my_table;',
+        query_execution_context={'Database': 'my_database', 'Catalog': 'AwsDataCatalog'},
+        work_group='primary',
+        max_results=10,
+    )
+
+    data = extract_response_data(response)
+    assert data['cached'] is True
+    assert data['query_execution_id'] == 'query1'
+    assert mock_athena_client.start_query_execution.call_count == 1
+
+    # Another workgroup runs the query again
+    await handler.manage_aws_athena_queries(
+        ctx,
+        operation='run-query',
+        query_string='SELECT * FROM my_table',
+        query_execution_context={'Database': 'my_database', 'Catalog': 'AwsDataCatalog'},
+        work_group='analytics',
+        max_results=10,
+    )
+    assert mock_athena_client.start_query_execution.call_count == 2
+
+    # Another result location runs the query again
+    await handler.manage_aws_athena_queries(
+        ctx,
+        operation='run-query',
+        query_string='SELECT * FROM my_table',
+        query_execution_context={'Database': 'my_database', 'Catalog': 'AwsDataCatalog'},
+        work_group='primary',
+        result_configuration={'OutputLocation': 's3://other-results/'},
+        max_results=10,
+    )
+    assert mock_athena_client.start_query_execution.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_run_query_without_result_reuse(handler, mock_athena_client, fast_polling):
+    """Test run-query does not cache queries when result reuse is disabled."""
+    handler.athena_client = mock_athena_client
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query1'}
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {'QueryExecutionId': 'query1', 'Status': {'State': 'SUCCEEDED'}}
+    }
+    mock_athena_client.get_query_results.return_value = {'ResultSet': {}}
+    reuse = {'ResultReuseByAgeConfiguration': {'Enabled': False}}
+
+    ctx = Mock()
+    for _ in range(2):
+        await handler.manage_aws_athena_queries(
+            ctx,
+            operation='run-query',
+            query_string='SELECT 1',
+            result_reuse_configuration=reuse,
+        )
+
+    assert mock_athena_client.start_query_execution.call_count == 2
+    assert (
+        mock_athena_client.start_query_execution.call_args.kwargs['ResultReuseConfiguration']
+        == reuse
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_query_failed(handler, mock_athena_client, fast_polling):
+    """Test run-query with a query that fails."""
+    handler.athena_client = mock_athena_client
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query1'}
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {
+            'QueryExecutionId': 'query1',
+            'Status': {'State': 'FAILED', 'StateChangeReason': 'Table not found'},
+        }
+    }
+
+    ctx = Mock()
+    response = await handler.manage_aws_athena_queries(
+        ctx, operation='run-query', query_string='SELECT * FROM missing'
+    )
+
+    assert response.isError
+    assert response.content[0].text == 'Query execution query1 FAILED: Table not found'
+    mock_athena_client.get_query_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_query_timeout(handler, mock_athena_client, fast_polling):
+    """Test run-query reports the last observed state of a query after the wait timeout."""
+    handler.athena_client = mock_athena_client
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query1'}
+    query_execution = {'QueryExecutionId': 'query1', 'Status': {'State': 'QUEUED'}}
+    mock_athena_client.get_query_execution.return_value = {'QueryExecution': query_execution}
+
+    ctx = Mock()
+    with patch(
+        'awslabs.aws_dataprocessing_mcp_server.handlers.athena.athena_query_handler.DEFAULT_RUN_QUERY_TIMEOUT_SECONDS',
+        0.05,
+    ):
+        response = await handler.manage_aws_athena_queries(
+            ctx, operation='run-query', query_string='SELECT * FROM big_table'
+        )
+
+    assert not response.isError
+    assert 'is still QUEUED after' in response.content[0].text
+    data = extract_response_data(response)
+    assert data['state'] == 'QUEUED'
+    assert data['query_execution'] == query_execution
+    assert data['query_execution_id'] == 'query1'
+
+
+@pytest.mark.asyncio
+async def test_run_query_without_sensitive_data_access(
+    handler_no_sensitive_data, mock_athena_client, fast_polling
+):
+    """Test run-query does not return result data without sensitive data access."""
+    handler_no_sensitive_data.athena_client = mock_athena_client
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query1'}
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {'QueryExecutionId': 'query1', 'Status': {'State': 'SUCCEEDED'}}
+    }
+
+    ctx = Mock()
+    response = await handler_no_sensitive_data.manage_aws_athena_queries(
+        ctx, operation='run-query', query_string='SELECT 1'
+    )
+
+    assert not response.isError
+    assert extract_response_data(response)['result_set'] is None
+    mock_athena_client.get_query_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_query_blocked_in_readonly_mode(handler_readonly):
+    """Test run-query rejects write operations without write access."""
+    ctx = Mock()
+    response = await handler_readonly.manage_aws_athena_queries(
+        ctx, operation='run-query', query_string='DROP TABLE my_table'
+    )
+
+    assert response.isError
+    assert 'contains write operations' in response.content[0].text
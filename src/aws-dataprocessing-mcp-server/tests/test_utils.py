@@ -14,6 +14,7 @@
 
 """Test utilities for CallToolResult handling."""
 
+import io
 import json
 from mcp.types import CallToolResult
 from typing import Any, Dict
@@ -300,3 +301,22 @@ class CallToolResultWrapper:
     def content(self):
         """Return the content."""
         return self._result.content
+
+
+class LocalS3Client:
+    """In-memory stand-in for the boto3 S3 client, serving objects with ranged GETs."""
+
+    def __init__(self, objects: Dict[str, bytes]):
+        """Serve objects keyed by 'bucket/key'."""
+        self.objects = objects
+        self.ranges = []
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """Return the size of an object."""
+        return {'ContentLength': len(self.objects[f'{Bucket}/{Key}'])}
+
+    def get_object(self, Bucket: str, Key: str, Range: str) -> Dict[str, Any]:
+        """Return a byte range of an object, such as 'bytes=0-99'."""
+        start, end = (int(value) for value in Range.removeprefix('bytes=').split('-'))
+        self.ranges.append((start, end))
+        return {'Body': io.BytesIO(self.objects[f'{Bucket}/{Key}'][start : end + 1])}
@@ -0,0 +1,151 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the AthenaQueryWaiter utility class."""
+
+import asyncio
+from awslabs.aws_dataprocessing_mcp_server.utils.athena_query_waiter import (
+    AthenaQueryWaiter,
+    QueryWaitTimeoutError,
+)
+from botocore.exceptions import ClientError
+from unittest.mock import Mock, patch
+
+
+WAITER_MODULE = 'awslabs.aws_dataprocessing_mcp_server.utils.athena_query_waiter'
+
+
+def _execution(query_execution_id: str, state: str) -> dict:
+    return {'QueryExecutionId': query_execution_id, 'Status': {'State': state}}
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'GetQueryExecution')
+
+
+class TestAthenaQueryWaiter:
+    """Tests for the AthenaQueryWaiter utility class."""
+
+    async def test_wait_polls_with_backoff(self):
+        """A single query is polled with GetQueryExecution at growing intervals."""
+        client = Mock()
+        client.get_query_execution.side_effect = [
+            {'QueryExecution': _execution('q1', 'QUEUED')},
+            {'QueryExecution': _execution('q1', 'RUNNING')},
+            {'QueryExecution': _execution('q1', 'SUCCEEDED')},
+        ]
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        with patch(f'{WAITER_MODULE}.asyncio.sleep', sleep):
+            query_execution = await AthenaQueryWaiter().wait(client, 'q1', 10)
+
+        assert query_execution['Status']['State'] == 'SUCCEEDED'
+        assert delays == [0.25, 0.375, 0.5625]
+        client.batch_get_query_execution.assert_not_called()
+
+    async def test_concurrent_waits_share_batch_polling(self):
+        """Several outstanding queries are polled together with BatchGetQueryExecution."""
+        client = Mock()
+        client.batch_get_query_execution.side_effect = [
+            {'QueryExecutions': [_execution('q1', 'RUNNING'), _execution('q2', 'FAILED')]},
+        ]
+        client.get_query_execution.return_value = {'QueryExecution': _execution('q1', 'SUCCEEDED')}
+        waiter = AthenaQueryWaiter()
+
+        with patch(f'{WAITER_MODULE}.INITIAL_POLL_DELAY_SECONDS', 0.001):
+            first, second = await asyncio.gather(
+                waiter.wait(client, 'q1', 10), waiter.wait(client, 'q2', 10)
+            )
+
+        assert first['Status']['State'] == 'SUCCEEDED'
+        assert second['Status']['State'] == 'FAILED'
+        client.batch_get_query_execution.assert_called_once_with(QueryExecutionIds=['q1', 'q2'])
+        client.get_query_execution.assert_called_once_with(QueryExecutionId='q1')
+
+    async def test_timeout_stops_polling(self):
+        """A query still running after the timeout is no longer polled."""
+        client = Mock()
+        client.get_query_execution.return_value = {'QueryExecution': _execution('q1', 'QUEUED')}
+        waiter = AthenaQueryWaiter()
+
+        with patch(f'{WAITER_MODULE}.INITIAL_POLL_DELAY_SECONDS', 0.001):
+            try:
+                await waiter.wait(client, 'q1', 0.05)
+            except QueryWaitTimeoutError as e:
+                # The last observed state is reported
+                assert e.query_execution == _execution('q1', 'QUEUED')
+            else:
+                raise AssertionError('QueryWaitTimeoutError not raised')
+            await asyncio.sleep(0.01)
+
+        assert waiter._waiting == {}
+        assert waiter._last_seen == {}
+        assert waiter._poll_task.done()
+
+    async def test_transient_poll_errors_are_retried(self):
+        """Throttling and other transient errors are retried at the next poll."""
+        client = Mock()
+        client.get_query_execution.side_effect = [
+            _client_error('ThrottlingException'),
+            _client_error('TooManyRequestsException'),
+            {'QueryExecution': _execution('q1', 'SUCCEEDED')},
+        ]
+
+        with patch(f'{WAITER_MODULE}.INITIAL_POLL_DELAY_SECONDS', 0.001):
+            query_execution = await AthenaQueryWaiter().wait(client, 'q1', 10)
+
+        assert query_execution['Status']['State'] == 'SUCCEEDED'
+        assert client.get_query_execution.call_count == 3
+
+    async def test_poll_errors_are_raised(self):
+        """Non-retryable errors of the Athena client are raised to the waiting caller."""
+        client = Mock()
+        client.get_query_execution.side_effect = RuntimeError('access denied')
+
+        with patch(f'{WAITER_MODULE}.INITIAL_POLL_DELAY_SECONDS', 0.001):
+            try:
+                await AthenaQueryWaiter().wait(client, 'q1', 10)
+            except RuntimeError as e:
+                assert str(e) == 'access denied'
+            else:
+                raise AssertionError('RuntimeError not raised')
+
+    async def test_unprocessed_ids_fail_only_their_waits(self):
+        """An ID that BatchGetQueryExecution cannot process fails only its own wait."""
+        client = Mock()
+        client.batch_get_query_execution.return_value = {
+            'QueryExecutions': [_execution('q1', 'SUCCEEDED')],
+            'UnprocessedQueryExecutionIds': [
+                {
+                    'QueryExecutionId': 'q2',
+                    'ErrorCode': 'InvalidRequestException',
+                    'ErrorMessage': 'Query not found',
+                }
+            ],
+        }
+        waiter = AthenaQueryWaiter()
+
+        with patch(f'{WAITER_MODULE}.INITIAL_POLL_DELAY_SECONDS', 0.001):
+            first, second = await asyncio.gather(
+                waiter.wait(client, 'q1', 10),
+                waiter.wait(client, 'q2', 10),
+                return_exceptions=True,
+            )
+
+        assert first['Status']['State'] == 'SUCCEEDED'
+        assert isinstance(second, ClientError)
+        assert second.response['Error']['Code'] == 'InvalidRequestException'
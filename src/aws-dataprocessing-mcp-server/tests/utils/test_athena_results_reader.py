@@ -0,0 +1,177 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the AthenaResultsReader utility class."""
+
+import csv
+import os
+from awslabs.aws_dataprocessing_mcp_server.utils.athena_results_reader import (
+    AthenaResultsReader,
+    default_results_dir,
+    parse_s3_uri,
+)
+from tests.test_utils import LocalS3Client
+from unittest.mock import patch
+
+
+def _value_error(func, *args) -> str:
+    """Call func and return the message of the ValueError it raises."""
+    try:
+        func(*args)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError('ValueError not raised')
+
+
+def _result_csv(row_count: int) -> bytes:
+    """Athena-style CSV with quoted values, multi-byte characters and embedded newlines."""
+    lines = ['"id","name","note"']
+    for i in range(row_count):
+        lines.append(f'"{i}","nämé {i}","line one\nline two, ""quoted"""')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def _raise_os_error(**kwargs):
+    raise OSError('connection reset')
+
+
+class TestAthenaResultsReader:
+    """Tests for the AthenaResultsReader utility class."""
+
+    def test_read_preview_and_spill_file(self, tmp_path):
+        """Parts are read in parallel and parsed in order across part boundaries."""
+        content = _result_csv(1000)
+        s3 = LocalS3Client({'results/query1.csv': content})
+
+        result = AthenaResultsReader(
+            s3, part_size=1000, max_concurrency=4, results_dir=str(tmp_path)
+        ).read('s3://results/query1.csv', 'query1', preview_rows=3)
+
+        assert result['columns'] == ['id', 'name', 'note']
+        assert result['data'] == {
+            'id': ['0', '1', '2'],
+            'name': ['nämé 0', 'nämé 1', 'nämé 2'],
+            'note': ['line one\nline two, "quoted"'] * 3,
+        }
+        assert result['row_count'] == 1000
+        assert result['truncated'] is True
+        assert result['bytes_read'] == len(content)
+        assert result['spill_file'] == os.path.join(str(tmp_path), 'query1.csv')
+        assert os.listdir(tmp_path) == ['query1.csv']
+        assert len(s3.ranges) == -(-len(content) // 1000)
+        assert sorted(s3.ranges) == [
+            (start, min(start + 1000, len(content)) - 1) for start in range(0, len(content), 1000)
+        ]
+        with open(result['spill_file'], 'rb') as f:
+            assert f.read() == content
+        with open(result['spill_file'], newline='', encoding='utf-8') as f:
+            assert list(csv.reader(f))[-1] == ['999', 'nämé 999', 'line one\nline two, "quoted"']
+
+    def test_read_small_result(self, tmp_path):
+        """Results shorter than the preview are not truncated."""
+        s3 = LocalS3Client({'results/q.csv': b'"a","b"\n"1",""\n'})
+
+        result = AthenaResultsReader(s3, results_dir=str(tmp_path)).read('s3://results/q.csv', 'q')
+
+        assert result['data'] == {'a': ['1'], 'b': ['']}
+        assert result['row_count'] == 1
+        assert result['truncated'] is False
+
+    def test_read_nulls(self, tmp_path):
+        """Unquoted empty fields are NULL, quoted ones empty strings."""
+        s3 = LocalS3Client({'results/q.csv': b'"a","b","c"\n,"",\n"",,"x"\n"multi\nline",,""\n\n'})
+
+        result = AthenaResultsReader(s3, results_dir=str(tmp_path)).read('s3://results/q.csv', 'q')
+
+        assert result['data'] == {
+            'a': [None, '', 'multi\nline', None],
+            'b': ['', None, None, None],
+            'c': [None, 'x', '', None],
+        }
+        assert result['row_count'] == 4
+
+    def test_read_empty_result(self, tmp_path):
+        """An empty result file has no columns and no rows."""
+        s3 = LocalS3Client({'results/q.csv': b''})
+
+        result = AthenaResultsReader(s3, results_dir=str(tmp_path)).read('s3://results/q.csv', 'q')
+
+        assert result['columns'] == []
+        assert result['row_count'] == 0
+        assert s3.ranges == []
+
+    def test_read_reuses_spill_file(self, tmp_path):
+        """A query execution already read is parsed from its spill file, not from S3."""
+        s3 = LocalS3Client({'results/q.csv': _result_csv(10)})
+        reader = AthenaResultsReader(s3, results_dir=str(tmp_path))
+        first = reader.read('s3://results/q.csv', 'q', preview_rows=2)
+        s3.ranges.clear()
+
+        second = reader.read('s3://results/q.csv', 'q', preview_rows=2)
+
+        assert s3.ranges == []
+        assert second['bytes_read'] == 0
+        assert {**second, 'bytes_read': first['bytes_read']} == first
+
+    def test_read_evicts_old_and_excess_spill_files(self, tmp_path):
+        """Expired spill files are deleted, then the least recently used over the limit."""
+        for name, age in [('expired.csv', 100), ('old.csv', 30), ('recent.csv', 10)]:
+            path = tmp_path / name
+            path.write_bytes(b'x' * 10)
+            mtime = path.stat().st_mtime - age
+            os.utime(path, (mtime, mtime))
+        (tmp_path / 'other.txt').write_bytes(b'x' * 100)
+        s3 = LocalS3Client({'results/q.csv': b'"a"\n"1"\n'})
+
+        AthenaResultsReader(s3, results_dir=str(tmp_path), max_age_seconds=60, max_bytes=25).read(
+            's3://results/q.csv', 'q'
+        )
+
+        assert sorted(os.listdir(tmp_path)) == ['other.txt', 'q.csv', 'recent.csv']
+
+    def test_read_failure_leaves_no_spill_file(self, tmp_path):
+        """A partially downloaded result file is not kept for reuse."""
+        s3 = LocalS3Client({'results/q.csv': b'"a"\n"1"\n'})
+        s3.get_object = _raise_os_error
+
+        try:
+            AthenaResultsReader(s3, results_dir=str(tmp_path)).read('s3://results/q.csv', 'q')
+        except OSError:
+            pass
+        else:
+            raise AssertionError('OSError not raised')
+
+        assert os.listdir(tmp_path) == []
+
+    def test_default_results_dir(self, tmp_path):
+        """The results directory can be set with ATHENA_RESULTS_DIR."""
+        with patch.dict(os.environ, {'ATHENA_RESULTS_DIR': str(tmp_path)}):
+            assert default_results_dir() == str(tmp_path)
+        with patch.dict(os.environ, clear=True):
+            assert default_results_dir().endswith(os.path.join('athena-results'))
+
+    def test_read_rejects_non_csv_results(self, tmp_path):
+        """Result files of DDL and other statements are not CSV."""
+        reader = AthenaResultsReader(LocalS3Client({}), results_dir=str(tmp_path))
+
+        assert 'Only CSV query results' in _value_error(reader.read, 's3://results/q.txt', 'q')
+        assert 'Invalid query execution ID' in _value_error(
+            reader.read, 's3://results/q.csv', '../q'
+        )
+
+    def test_parse_s3_uri(self):
+        """S3 URIs are split into bucket and key."""
+        assert parse_s3_uri('s3://bucket/prefix/q.csv') == ('bucket', 'prefix/q.csv')
+        assert 'Invalid S3 object URI' in _value_error(parse_s3_uri, 'https://bucket/q.csv')
+        assert 'Invalid S3 object URI' in _value_error(parse_s3_uri, 's3://bucket/')
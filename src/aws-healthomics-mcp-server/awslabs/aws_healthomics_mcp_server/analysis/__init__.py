@@ -16,13 +16,21 @@
 
 from awslabs.aws_healthomics_mcp_server.analysis.cost_analyzer import CostAnalyzer
 from awslabs.aws_healthomics_mcp_server.analysis.instance_recommender import InstanceRecommender
+from awslabs.aws_healthomics_mcp_server.analysis.log_summarizer import LogSummarizer
+from awslabs.aws_healthomics_mcp_server.analysis.manifest_cache import ManifestAnalysisCache
 from awslabs.aws_healthomics_mcp_server.analysis.pricing_cache import PricingCache
-from awslabs.aws_healthomics_mcp_server.analysis.task_aggregator import TaskAggregator
+from awslabs.aws_healthomics_mcp_server.analysis.task_aggregator import (
+    CrossRunTaskAccumulator,
+    TaskAggregator,
+)
 
 
 __all__ = [
     'CostAnalyzer',
+    'CrossRunTaskAccumulator',
     'InstanceRecommender',
+    'LogSummarizer',
+    'ManifestAnalysisCache',
     'PricingCache',
     'TaskAggregator',
 ]
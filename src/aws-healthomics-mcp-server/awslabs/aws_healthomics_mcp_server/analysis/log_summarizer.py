@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming summaries of workflow log events."""
+
+import re
+from typing import Any, Optional
+
+
+# Log levels counted in summaries, with the spellings that map to them
+_LEVEL_PATTERN = re.compile(r'\b(TRACE|DEBUG|INFO|WARN(?:ING)?|ERROR|SEVERE|FATAL|CRITICAL)\b')
+_LEVEL_ALIASES = {'WARNING': 'WARN', 'SEVERE': 'ERROR', 'CRITICAL': 'FATAL'}
+
+# Messages that report a failure, whatever their log level
+_ERROR_PATTERN = re.compile(
+    r'\b(error|exception|fatal|failed|failure|traceback|killed|out of memory|oom)\b',
+    re.IGNORECASE,
+)
+
+# Variable parts of a message, replaced to cluster messages that only differ in them
+_VARIABLE_PATTERNS = [
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ][\d:.,]+(?:Z|[+-]\d{2}:?\d{2})?'), '<TIME>'),
+    (
+        re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I),
+        '<ID>',
+    ),
+    (re.compile(r'\b(?:s3|https?)://\S+'), '<URI>'),
+    (re.compile(r'(?:/[\w.-]+){2,}/?'), '<PATH>'),
+    (re.compile(r'\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b', re.I), '<HEX>'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '<N>'),
+]
+
+MAX_ERROR_CLUSTERS = 20
+MAX_EXAMPLE_LENGTH = 500
+
+
+class LogSummarizer:
+    """Summarize log events one at a time without keeping them.
+
+    Counts events and log levels, and clusters error messages by their template,
+    i.e. the message with timestamps, IDs, paths and numbers replaced by
+    placeholders.
+    """
+
+    def __init__(self, max_error_clusters: int = MAX_ERROR_CLUSTERS):
+        """Initialize an empty summary.
+
+        Args:
+            max_error_clusters: Maximum number of error clusters to report
+        """
+        self.max_error_clusters = max_error_clusters
+        self.event_count = 0
+        self.error_event_count = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        self.level_counts: dict[str, int] = {}
+        self._clusters: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def message_template(message: str) -> str:
+        """Return the message with its variable parts replaced by placeholders.
+
+        Args:
+            message: Log message
+
+        Returns:
+            Message template shared by messages that only differ in variable parts
+        """
+        template = message.strip()
+        for pattern, placeholder in _VARIABLE_PATTERNS:
+            template = pattern.sub(placeholder, template)
+        return template
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Add a log event to the summary.
+
+        Args:
+            event: Log event with timestamp and message
+        """
+        message = event.get('message', '')
+        timestamp = event.get('timestamp')
+        self.event_count += 1
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+
+        level_match = _LEVEL_PATTERN.search(message)
+        if level_match:
+            level = _LEVEL_ALIASES.get(level_match.group(1), level_match.group(1))
+            self.level_counts[level] = self.level_counts.get(level, 0) + 1
+
+        if not _ERROR_PATTERN.search(message):
+            return
+
+        self.error_event_count += 1
+        template = self.message_template(message)
+        cluster = self._clusters.get(template)
+        if cluster is None:
+            self._clusters[template] = {
+                'template': template,
+                'count': 1,
+                'firstTimestamp': timestamp,
+                'lastTimestamp': timestamp,
+                'example': message.strip()[:MAX_EXAMPLE_LENGTH],
+            }
+        else:
+            cluster['count'] += 1
+            cluster['lastTimestamp'] = timestamp
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary.
+
+        Returns:
+            Dictionary with event and level counts, and the largest error clusters
+        """
+        clusters = sorted(self._clusters.values(), key=lambda c: c['count'], reverse=True)
+        return {
+            'eventCount': self.event_count,
+            'firstTimestamp': self.first_timestamp,
+            'lastTimestamp': self.last_timestamp,
+            'levelCounts': dict(self.level_counts),
+            'errorEventCount': self.error_event_count,
+            'errorClusterCount': len(clusters),
+            'errorClusters': clusters[: self.max_error_clusters],
+        }
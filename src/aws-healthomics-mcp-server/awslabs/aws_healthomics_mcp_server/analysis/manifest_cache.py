@@ -0,0 +1,101 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory cache for parsed run manifest analyses."""
+
+import copy
+from awslabs.aws_healthomics_mcp_server.consts import RUN_STATUS_COMPLETED
+from collections import OrderedDict
+from loguru import logger
+from typing import Any, Optional
+
+
+class ManifestAnalysisCache:
+    """In-memory LRU cache of parsed run manifest analyses.
+
+    The manifest of a completed run never changes, so its parsed analysis can be
+    reused across analyze_run_performance calls. The cache uses the format
+    `{run_uuid}:{headroom}:{region}` as the key, since recommendations depend on
+    the headroom and costs on the pricing region. Runs in any other status are
+    never cached.
+
+    Attributes:
+        MAX_ENTRIES: Maximum number of cached analyses before the least recently
+            used one is evicted
+    """
+
+    MAX_ENTRIES = 256
+
+    _cache: 'OrderedDict[str, dict[str, Any]]' = OrderedDict()
+
+    @staticmethod
+    def _cache_key(run_uuid: str, headroom: float, region: str) -> str:
+        return f'{run_uuid}:{headroom}:{region}'
+
+    @classmethod
+    def get(cls, run_uuid: str, headroom: float, region: str) -> Optional[dict[str, Any]]:
+        """Get the cached analysis of a run.
+
+        Args:
+            run_uuid: UUID of the run
+            headroom: Headroom used for instance recommendations
+            region: AWS region used for pricing lookups
+
+        Returns:
+            A copy of the cached analysis, or None if not cached
+        """
+        cache_key = cls._cache_key(run_uuid, headroom, region)
+        analysis = cls._cache.get(cache_key)
+        if analysis is None:
+            return None
+
+        logger.debug(f'Cache hit for manifest analysis {cache_key}')
+        cls._cache.move_to_end(cache_key)
+        return copy.deepcopy(analysis)
+
+    @classmethod
+    def put(
+        cls,
+        run_uuid: str,
+        headroom: float,
+        region: str,
+        status: str,
+        analysis: dict[str, Any],
+    ) -> bool:
+        """Cache the analysis of a run if the run is completed.
+
+        Args:
+            run_uuid: UUID of the run
+            headroom: Headroom used for instance recommendations
+            region: AWS region used for pricing lookups
+            status: Status of the run when its manifest was read
+            analysis: Parsed run analysis
+
+        Returns:
+            True if the analysis was cached
+        """
+        if status != RUN_STATUS_COMPLETED:
+            return False
+
+        cache_key = cls._cache_key(run_uuid, headroom, region)
+        cls._cache[cache_key] = copy.deepcopy(analysis)
+        cls._cache.move_to_end(cache_key)
+        while len(cls._cache) > cls.MAX_ENTRIES:
+            cls._cache.popitem(last=False)
+        return True
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all cached analyses."""
+        cls._cache.clear()
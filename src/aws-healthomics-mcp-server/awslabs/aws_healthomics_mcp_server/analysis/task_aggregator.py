@@ -16,6 +16,18 @@
 
 import polars as pl
 import re
+from typing import Any, Iterable, Optional
+
+
+# Task metric columns summarized across runs, with the default for missing values
+_CROSS_RUN_COLUMNS = {
+    'runningSeconds': 0.0,
+    'cpuEfficiencyRatio': 0.0,
+    'memoryEfficiencyRatio': 0.0,
+    'maxCpuUtilization': 0.0,
+    'maxMemoryUtilizationGiB': 0.0,
+    'estimatedUSD': 0.0,
+}
 
 
 class TaskAggregator:
@@ -158,15 +170,17 @@ class TaskAggregator:
 
         return aggregated
 
-    def aggregate_cross_run_tasks(self, runs_data: list[dict]) -> pl.DataFrame:
+    def aggregate_cross_run_tasks(self, runs_data: Iterable[dict]) -> pl.DataFrame:
         """Aggregate metrics per task base name across multiple runs.
 
         Groups tasks from multiple runs by their normalized base name and calculates
         cross-run aggregate metrics including run count, total task count, runtime
-        statistics, utilization ratios, and costs.
+        statistics, utilization ratios, and costs. Runs are folded into running
+        totals one at a time, so memory grows with the number of distinct task
+        names rather than the number of tasks.
 
         Args:
-            runs_data: List of run data dictionaries. Each run should have:
+            runs_data: Iterable of run data dictionaries. Each run should have:
                 - runInfo: Run information including runId
                 - taskMetrics: List of task metric dictionaries
 
@@ -184,60 +198,95 @@ class TaskAggregator:
                 - maxObservedMemoryGiB: Maximum observed memory usage across all runs
                 - totalEstimatedUSD: Total cost across all runs
         """
-        if not runs_data:
-            return pl.DataFrame()
-
-        # Collect all tasks from all runs with run ID
-        all_tasks = []
+        accumulator = CrossRunTaskAccumulator(self.normalize_task_name)
         for run_data in runs_data:
-            run_id = run_data.get('runInfo', {}).get('runId', '')
-            task_metrics = run_data.get('taskMetrics', [])
-
-            for task in task_metrics:
-                task_entry = {
-                    'runId': run_id,
-                    'taskName': task.get('taskName', ''),
-                    'runningSeconds': task.get('runningSeconds', 0.0),
-                    'cpuEfficiencyRatio': task.get('cpuEfficiencyRatio', 0.0),
-                    'memoryEfficiencyRatio': task.get('memoryEfficiencyRatio', 0.0),
-                    'maxCpuUtilization': task.get('maxCpuUtilization', 0.0),
-                    'maxMemoryUtilizationGiB': task.get('maxMemoryUtilizationGiB', 0.0),
-                    'estimatedUSD': task.get('estimatedUSD', 0.0),
-                }
-                all_tasks.append(task_entry)
+            accumulator.add_run(run_data)
+        return accumulator.to_dataframe()
+
+
+class _TaskNameTotals:
+    """Running totals of one base task name across runs."""
+
+    def __init__(self):
+        self.run_ids: set = set()
+        self.task_count = 0
+        # Sum, non-null count and maximum of each column
+        self.sums = dict.fromkeys(_CROSS_RUN_COLUMNS, 0)
+        self.counts = dict.fromkeys(_CROSS_RUN_COLUMNS, 0)
+        self.maximums: dict[str, Any] = dict.fromkeys(_CROSS_RUN_COLUMNS)
+
+    def add(self, run_id: str, task: dict) -> None:
+        self.run_ids.add(run_id)
+        self.task_count += 1
+        for column, default in _CROSS_RUN_COLUMNS.items():
+            value = task.get(column, default)
+            if value is None:
+                continue
+            self.sums[column] += value
+            self.counts[column] += 1
+            if self.maximums[column] is None or value > self.maximums[column]:
+                self.maximums[column] = value
+
+    def mean(self, column: str) -> Optional[float]:
+        count = self.counts[column]
+        return self.sums[column] / count if count else None
+
+
+class CrossRunTaskAccumulator:
+    """Streaming cross-run aggregation of task metrics by base task name.
+
+    Runs are added one at a time and only running totals per base task name are
+    kept, producing the same columns as TaskAggregator.aggregate_cross_run_tasks.
+    """
 
-        if not all_tasks:
-            return pl.DataFrame()
+    def __init__(self, normalize_task_name=TaskAggregator.normalize_task_name):
+        """Initialize an empty accumulator.
 
-        # Convert to Polars DataFrame
-        df = pl.DataFrame(all_tasks)
+        Args:
+            normalize_task_name: Function mapping task names to base task names
+        """
+        self._normalize_task_name = normalize_task_name
+        self._totals: dict[Optional[str], _TaskNameTotals] = {}
 
-        # Add normalized task name column
-        df = df.with_columns(
-            pl.col('taskName')
-            .map_elements(self.normalize_task_name, return_dtype=pl.Utf8)
-            .alias('baseTaskName')
-        )
+    def add_run(self, run_data: dict) -> None:
+        """Fold the task metrics of one run into the running totals.
 
-        # Aggregate by base task name across all runs
-        aggregated = df.group_by('baseTaskName').agg(
+        Args:
+            run_data: Run data dictionary with runInfo and taskMetrics
+        """
+        run_id = run_data.get('runInfo', {}).get('runId', '')
+        for task in run_data.get('taskMetrics', []):
+            task_name = task.get('taskName', '')
+            base_name = self._normalize_task_name(task_name) if task_name is not None else None
+            totals = self._totals.get(base_name)
+            if totals is None:
+                totals = self._totals[base_name] = _TaskNameTotals()
+            totals.add(run_id, task)
+
+    def to_dataframe(self) -> pl.DataFrame:
+        """Return the cross-run aggregates, one row per base task name.
+
+        Returns:
+            Polars DataFrame with the columns of aggregate_cross_run_tasks, empty if
+            no run had task metrics
+        """
+        if not self._totals:
+            return pl.DataFrame()
+
+        return pl.DataFrame(
             [
-                # Count unique runs containing this task
-                pl.col('runId').n_unique().alias('runCount'),
-                # Total task instances across all runs
-                pl.len().alias('totalTaskCount'),
-                # Runtime statistics
-                pl.col('runningSeconds').mean().alias('meanRunningSeconds'),
-                pl.col('runningSeconds').max().alias('maximumRunningSeconds'),
-                # Utilization ratios
-                pl.col('cpuEfficiencyRatio').mean().alias('meanCpuUtilizationRatio'),
-                pl.col('memoryEfficiencyRatio').mean().alias('meanMemoryUtilizationRatio'),
-                # Maximum observed resources
-                pl.col('maxCpuUtilization').max().alias('maxObservedCpus'),
-                pl.col('maxMemoryUtilizationGiB').max().alias('maxObservedMemoryGiB'),
-                # Cost aggregation
-                pl.col('estimatedUSD').sum().alias('totalEstimatedUSD'),
+                {
+                    'baseTaskName': base_name,
+                    'runCount': len(totals.run_ids),
+                    'totalTaskCount': totals.task_count,
+                    'meanRunningSeconds': totals.mean('runningSeconds'),
+                    'maximumRunningSeconds': totals.maximums['runningSeconds'],
+                    'meanCpuUtilizationRatio': totals.mean('cpuEfficiencyRatio'),
+                    'meanMemoryUtilizationRatio': totals.mean('memoryEfficiencyRatio'),
+                    'maxObservedCpus': totals.maximums['maxCpuUtilization'],
+                    'maxObservedMemoryGiB': totals.maximums['maxMemoryUtilizationGiB'],
+                    'totalEstimatedUSD': totals.sums['estimatedUSD'],
+                }
+                for base_name, totals in self._totals.items()
             ]
         )
-
-        return aggregated
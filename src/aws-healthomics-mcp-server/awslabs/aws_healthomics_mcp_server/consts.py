@@ -117,6 +117,11 @@ GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH_ENV = 'GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH
 GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE_ENV = 'GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE'
 GENOMICS_SEARCH_RESULT_CACHE_TTL_ENV = 'GENOMICS_SEARCH_RESULT_CACHE_TTL'
 GENOMICS_SEARCH_TAG_CACHE_TTL_ENV = 'GENOMICS_SEARCH_TAG_CACHE_TTL'
+GENOMICS_SEARCH_CATALOG_PATH_ENV = 'GENOMICS_SEARCH_CATALOG_PATH'
+GENOMICS_SEARCH_CATALOG_MAX_STALENESS_ENV = 'GENOMICS_SEARCH_CATALOG_MAX_STALENESS'
+GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL_ENV = 'GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL'
+GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS_ENV = 'GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS'
+GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE_ENV = 'GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE'
 
 # Default values for genomics search
 DEFAULT_GENOMICS_SEARCH_MAX_CONCURRENT = 10
@@ -126,6 +131,9 @@ DEFAULT_GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH = True
 DEFAULT_GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE = 100
 DEFAULT_GENOMICS_SEARCH_RESULT_CACHE_TTL = 600
 DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL = 300
+DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS = 300  # Serve catalogued listings for 5 minutes
+DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL = 86400  # Re-list catalogued scopes daily
+DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE = 172800  # Tolerate one missed daily inventory
 
 # Cache size limits - Maximum number of entries in the cache
 DEFAULT_GENOMICS_SEARCH_MAX_FILE_CACHE_SIZE = 10000
@@ -61,6 +61,7 @@ from .s3 import (
     S3File,
     build_s3_uri,
     create_s3_file_from_object,
+    get_s3_association_keys,
     get_s3_file_associations,
     parse_s3_uri,
 )
@@ -141,6 +142,7 @@ __all__ = [
     'S3File',
     'build_s3_uri',
     'create_s3_file_from_object',
+    'get_s3_association_keys',
     'get_s3_file_associations',
     'parse_s3_uri',
     # Store models
@@ -372,45 +372,54 @@ def parse_s3_uri(uri: str) -> Tuple[str, str]:
     return bucket, key
 
 
-def get_s3_file_associations(primary_file: S3File) -> List[S3File]:
-    """Get potential associated files for a primary S3 file based on naming conventions.
+def get_s3_association_keys(key: str) -> List[str]:
+    """Get the keys of potential associated files of an S3 object key.
 
     Args:
-        primary_file: Primary S3File to find associations for
+        key: Key of the primary S3 object
 
     Returns:
-        List of potential associated S3File instances
-
-    Note:
-        This function generates potential associations based on common patterns.
-        The actual existence of these files should be verified separately.
+        Keys of potential associated files (index files and FASTQ mates)
     """
-    associations = []
+    association_keys = []
 
     # Check for index files using patterns from consts
     for ext, index_exts in GENOMICS_INDEX_PATTERNS.items():
-        if primary_file.key.endswith(ext):
+        if key.endswith(ext):
             for index_ext in index_exts:
                 if index_ext.startswith(ext):
                     # Full extension replacement (e.g., .bam -> .bam.bai)
-                    index_key = f'{primary_file.key}{index_ext[len(ext) :]}'
+                    association_keys.append(f'{key}{index_ext[len(ext) :]}')
                 else:
                     # Replace extension (e.g., .bam -> .bai)
-                    base_key = primary_file.key[: -len(ext)]
-                    index_key = f'{base_key}{index_ext}'
-
-                associations.append(S3File(bucket=primary_file.bucket, key=index_key))
+                    association_keys.append(f'{key[: -len(ext)]}{index_ext}')
 
     # FASTQ pair patterns (R1/R2) - check extension properly
-    filename = primary_file.filename
+    filename = key.split('/')[-1]
     if any(filename.endswith(f'.{ext}') for ext in FASTQ_EXTENSIONS):
-        key = primary_file.key
-
         # Look for paired-end read patterns using patterns from consts
         for pattern1, pattern2 in FASTQ_PAIR_PATTERNS:
             if pattern1 in key:
-                pair_key = key.replace(pattern1, pattern2)
-                associations.append(S3File(bucket=primary_file.bucket, key=pair_key))
+                association_keys.append(key.replace(pattern1, pattern2))
                 break  # Only match the first pattern found
 
-    return associations
+    return association_keys
+
+
+def get_s3_file_associations(primary_file: S3File) -> List[S3File]:
+    """Get potential associated files for a primary S3 file based on naming conventions.
+
+    Args:
+        primary_file: Primary S3File to find associations for
+
+    Returns:
+        List of potential associated S3File instances
+
+    Note:
+        This function generates potential associations based on common patterns.
+        The actual existence of these files should be verified separately.
+    """
+    return [
+        S3File(bucket=primary_file.bucket, key=association_key)
+        for association_key in get_s3_association_keys(primary_file.key)
+    ]
@@ -194,6 +194,15 @@ class SearchConfig:
     result_cache_ttl_seconds: int = 600  # Result cache TTL (10 minutes)
     tag_cache_ttl_seconds: int = 300  # Tag cache TTL (5 minutes)
 
+    # Persistent listing catalog (disabled when no path is configured)
+    catalog_path: Optional[str] = None  # SQLite database file for the catalog
+    catalog_max_staleness_seconds: int = 300  # Age after which a scope is synced incrementally
+    catalog_full_sync_interval_seconds: int = 86400  # Age after which a scope is fully re-listed
+
+    # S3 Inventory listing backend (disabled when no locations are configured)
+    s3_inventory_locations: List[str] = field(default_factory=list)  # Inventory report folders
+    s3_inventory_max_age_seconds: int = 172800  # Oldest snapshot used instead of live listing
+
     # Cache size limits
     max_tag_cache_size: int = 1000  # Maximum number of tag cache entries
     max_result_cache_size: int = 100  # Maximum number of result cache entries
@@ -0,0 +1,469 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent on-disk catalog of genomics storage listings.
+
+The S3 and HealthOmics search engines only cache for the lifetime of one tool
+call, so every search re-lists whole buckets and stores. The catalog keeps S3
+object listings, S3 object tags, read sets and references in a local SQLite
+database shared by all searches in the process (and across restarts), so
+searches are answered from disk and the storage APIs are only used to bring
+the catalog up to date.
+
+Each listed location (an S3 bucket prefix or a HealthOmics store) is a scope
+with its own sync state:
+
+- While a scope is younger than the staleness bound it is served as is.
+- Once it is older, an incremental sync picks up what was added since the last
+  sync: S3 listing resumes with StartAfter set to the greatest key listed so far,
+  and read sets and references are listed with a createdAfter filter.
+- Incremental syncs cannot see deletions, overwrites, or keys that sort before
+  the marker, so at a longer interval a full sync re-lists the scope, drops
+  entries that are gone and invalidates tags of objects whose ETag changed.
+
+Searches report the sync state of every scope they used so callers know how
+current an answer is.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from loguru import logger
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+SYNC_FULL = 'full'
+SYNC_INCREMENTAL = 'incremental'
+
+# Sorts after every character that can appear in an S3 key; bounds prefix range scans.
+_KEY_RANGE_END = '\U0010ffff'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scopes (
+    scope TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL,
+    marker TEXT
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS s3_objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER,
+    last_modified TEXT,
+    etag TEXT,
+    storage_class TEXT,
+    seen_sync INTEGER NOT NULL,
+    PRIMARY KEY (bucket, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS s3_tags (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    etag TEXT,
+    tags TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (bucket, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS store_records (
+    kind TEXT NOT NULL,
+    store TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    seen_sync INTEGER NOT NULL,
+    PRIMARY KEY (kind, store, record_id)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class CatalogScopeState:
+    """Sync state of one catalogued scope.
+
+    Attributes:
+        scope: Scope identifier (e.g. 's3://bucket/prefix/' or 'read_sets:<store ARN>')
+        synced_at: Start time (epoch seconds) of the last completed sync of any kind
+        full_synced_at: Start time (epoch seconds) of the last completed full sync
+        marker: Incremental sync position (greatest S3 key or newest creation time)
+    """
+
+    scope: str
+    synced_at: float
+    full_synced_at: float
+    marker: Optional[str]
+
+
+def _encode_record(record: Dict[str, Any]) -> str:
+    def default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return {'__datetime__': value.isoformat()}
+        return str(value)
+
+    return json.dumps(record, default=default)
+
+
+def _decode_record(data: str) -> Dict[str, Any]:
+    def object_hook(value: Dict[str, Any]) -> Any:
+        if len(value) == 1 and '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+        return value
+
+    return json.loads(data, object_hook=object_hook)
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class GenomicsCatalog:
+    """SQLite-backed catalog of S3 objects, S3 tags, read sets and references."""
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """Open (creating if needed) the catalog database.
+
+        Args:
+            path: Database file path, or ':memory:' for a transient catalog
+            clock: Wall clock returning epoch seconds (overridable in tests)
+        """
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._sync_locks: Dict[str, asyncio.Lock] = {}
+        self._sync_locks_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def sync_lock(self, scope: str) -> asyncio.Lock:
+        """Return the lock serializing syncs of a scope on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._sync_locks_loop:
+            self._sync_locks_loop = loop
+            self._sync_locks = {}
+        return self._sync_locks.setdefault(scope, asyncio.Lock())
+
+    # Scope sync state
+
+    def scope_state(self, scope: str) -> Optional[CatalogScopeState]:
+        """Return the sync state of a scope, or None if it was never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT synced_at, full_synced_at, marker FROM scopes WHERE scope = ?', (scope,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CatalogScopeState(scope, row[0], row[1], row[2])
+
+    def plan_sync(
+        self, scope: str, max_staleness_seconds: float, full_sync_interval_seconds: float
+    ) -> Optional[str]:
+        """Decide how a scope has to be synced before it can be served.
+
+        Args:
+            scope: Scope identifier
+            max_staleness_seconds: Age after which new entries have to be picked up
+            full_sync_interval_seconds: Age after which the scope is re-listed completely
+
+        Returns:
+            SYNC_FULL, SYNC_INCREMENTAL, or None if the catalog is fresh enough
+        """
+        state = self.scope_state(scope)
+        now = self._clock()
+        if state is None or now - state.full_synced_at >= full_sync_interval_seconds:
+            return SYNC_FULL
+        if now - state.synced_at >= max_staleness_seconds:
+            return SYNC_INCREMENTAL
+        return None
+
+    def begin_sync(self, scope: str) -> int:
+        """Register the start of a sync and return its ID.
+
+        Entries listed by the sync are stamped with the ID, so a full sync can
+        afterwards remove the entries it did not see.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                'INSERT INTO syncs (scope, started_at) VALUES (?, ?)', (scope, self._clock())
+            )
+            return cursor.lastrowid
+
+    def finish_sync(self, scope: str, sync_id: int, mode: str, marker: Optional[str]) -> None:
+        """Record a completed sync.
+
+        The scope is considered current as of the start of the sync, since entries
+        created while it was listing may have been missed.
+
+        Args:
+            scope: Scope identifier
+            sync_id: ID returned by begin_sync
+            mode: SYNC_FULL or SYNC_INCREMENTAL
+            marker: Position the next incremental sync resumes from
+        """
+        with self._lock:
+            (started_at,) = self._conn.execute(
+                'SELECT started_at FROM syncs WHERE id = ?', (sync_id,)
+            ).fetchone()
+            if mode == SYNC_FULL:
+                self._conn.execute(
+                    'INSERT INTO scopes (scope, synced_at, full_synced_at, marker) '
+                    'VALUES (?, ?, ?, ?) ON CONFLICT (scope) DO UPDATE SET '
+                    'synced_at = excluded.synced_at, full_synced_at = excluded.full_synced_at, '
+                    'marker = excluded.marker',
+                    (scope, started_at, started_at, marker),
+                )
+            else:
+                self._conn.execute(
+                    'UPDATE scopes SET synced_at = ?, marker = ? WHERE scope = ?',
+                    (started_at, marker, scope),
+                )
+            self._conn.execute('DELETE FROM syncs WHERE scope = ? AND id <= ?', (scope, sync_id))
+
+    def scope_status(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Describe how current a scope is, for inclusion in search responses.
+
+        Returns:
+            Dictionary with the last sync times and their ages in seconds, or None
+        """
+        state = self.scope_state(scope)
+        if state is None:
+            return None
+        now = self._clock()
+        return {
+            'synced_at': _isoformat(state.synced_at),
+            'staleness_seconds': round(max(now - state.synced_at, 0.0), 3),
+            'full_synced_at': _isoformat(state.full_synced_at),
+            'full_sync_age_seconds': round(max(now - state.full_synced_at, 0.0), 3),
+        }
+
+    # S3 objects and tags
+
+    def upsert_s3_objects(
+        self, bucket: str, objects: Iterable[Dict[str, Any]], sync_id: int
+    ) -> None:
+        """Insert or refresh listed S3 objects.
+
+        Args:
+            bucket: Bucket name
+            objects: Object dictionaries as returned in list_objects_v2 Contents
+            sync_id: ID of the sync that listed the objects
+        """
+        rows = [
+            (
+                bucket,
+                obj['Key'],
+                obj.get('Size'),
+                obj['LastModified'].isoformat()
+                if isinstance(obj.get('LastModified'), datetime)
+                else obj.get('LastModified'),
+                obj.get('ETag'),
+                obj.get('StorageClass'),
+                sync_id,
+            )
+            for obj in objects
+        ]
+        with self._lock:
+            # Keep the highest sync stamp so a slower, earlier sync of an enclosing
+            # prefix cannot make a later full sync treat the object as unseen.
+            self._conn.executemany(
+                'INSERT INTO s3_objects '
+                '(bucket, key, size, last_modified, etag, storage_class, seen_sync) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (bucket, key) DO UPDATE SET '
+                'size = excluded.size, last_modified = excluded.last_modified, '
+                'etag = excluded.etag, storage_class = excluded.storage_class, '
+                'seen_sync = MAX(seen_sync, excluded.seen_sync)',
+                rows,
+            )
+
+    def remove_unseen_s3_objects(self, bucket: str, prefix: str, sync_id: int) -> int:
+        """Delete objects under a prefix that the given full sync did not list.
+
+        Returns:
+            Number of objects removed
+        """
+        low, high = prefix, prefix + _KEY_RANGE_END
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.execute(
+                    'DELETE FROM s3_tags WHERE bucket = ? AND key >= ? AND key < ? AND key IN '
+                    '(SELECT key FROM s3_objects WHERE bucket = ? AND key >= ? AND key < ? '
+                    'AND seen_sync < ?)',
+                    (bucket, low, high, bucket, low, high, sync_id),
+                )
+                cursor = self._conn.execute(
+                    'DELETE FROM s3_objects WHERE bucket = ? AND key >= ? AND key < ? '
+                    'AND seen_sync < ?',
+                    (bucket, low, high, sync_id),
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return cursor.rowcount
+
+    def list_s3_objects(self, bucket: str, prefix: str) -> List[Dict[str, Any]]:
+        """Return the catalogued objects under a prefix in key order.
+
+        Returns:
+            Object dictionaries shaped like list_objects_v2 Contents entries
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, size, last_modified, etag, storage_class FROM s3_objects '
+                'WHERE bucket = ? AND key >= ? AND key < ? ORDER BY key',
+                (bucket, prefix, prefix + _KEY_RANGE_END),
+            ).fetchall()
+
+        objects = []
+        for key, size, last_modified, etag, storage_class in rows:
+            obj: Dict[str, Any] = {'Key': key, 'Size': size}
+            if last_modified:
+                obj['LastModified'] = datetime.fromisoformat(last_modified)
+            if etag is not None:
+                obj['ETag'] = etag
+            if storage_class is not None:
+                obj['StorageClass'] = storage_class
+            objects.append(obj)
+        return objects
+
+    def get_s3_tags(
+        self, bucket: str, keys: List[str], max_age_seconds: float
+    ) -> Dict[str, Dict[str, str]]:
+        """Return catalogued tags that are still valid for the given keys.
+
+        Tags are valid while the object's ETag is the one they were fetched for
+        and they are younger than max_age_seconds (tag changes do not alter the
+        ETag, so they are only picked up by expiry).
+
+        Returns:
+            Dictionary mapping keys to tags; keys without valid tags are omitted
+        """
+        if not keys:
+            return {}
+        oldest = self._clock() - max_age_seconds
+        tag_map = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    'SELECT t.key, t.tags FROM s3_tags t JOIN s3_objects o '
+                    'ON o.bucket = t.bucket AND o.key = t.key '
+                    f'WHERE t.bucket = ? AND t.key IN ({placeholders}) '
+                    'AND t.etag IS o.etag AND t.fetched_at > ?',
+                    (bucket, *chunk, oldest),
+                ).fetchall()
+                for key, tags in rows:
+                    tag_map[key] = json.loads(tags)
+        return tag_map
+
+    def put_s3_tags(self, bucket: str, tag_map: Dict[str, Dict[str, str]]) -> None:
+        """Store fetched tags against the current ETag of each catalogued object."""
+        now = self._clock()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO s3_tags (bucket, key, etag, tags, fetched_at) '
+                'SELECT bucket, key, etag, ?, ? FROM s3_objects WHERE bucket = ? AND key = ?',
+                [(json.dumps(tags), now, bucket, key) for key, tags in tag_map.items()],
+            )
+
+    # HealthOmics store records (read sets and references)
+
+    def upsert_store_records(
+        self, kind: str, store: str, records: Iterable[Dict[str, Any]], sync_id: int
+    ) -> None:
+        """Insert or refresh listed store records.
+
+        Args:
+            kind: Record kind ('read_sets' or 'references')
+            store: Store identifier (the store ARN)
+            records: Records as returned by ListReadSets or ListReferences
+            sync_id: ID of the sync that listed the records
+        """
+        rows = [(kind, store, record['id'], _encode_record(record), sync_id) for record in records]
+        with self._lock:
+            self._conn.executemany(
+                'INSERT INTO store_records (kind, store, record_id, record, seen_sync) '
+                'VALUES (?, ?, ?, ?, ?) ON CONFLICT (kind, store, record_id) DO UPDATE SET '
+                'record = excluded.record, seen_sync = MAX(seen_sync, excluded.seen_sync)',
+                rows,
+            )
+
+    def remove_unseen_store_records(self, kind: str, store: str, sync_id: int) -> int:
+        """Delete records of a store that the given full sync did not list.
+
+        Returns:
+            Number of records removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM store_records WHERE kind = ? AND store = ? AND seen_sync < ?',
+                (kind, store, sync_id),
+            )
+        return cursor.rowcount
+
+    def list_store_records(self, kind: str, store: str) -> List[Dict[str, Any]]:
+        """Return the catalogued records of a store in record ID order."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT record FROM store_records WHERE kind = ? AND store = ? ORDER BY record_id',
+                (kind, store),
+            ).fetchall()
+        return [_decode_record(row[0]) for row in rows]
+
+
+_catalogs: Dict[str, GenomicsCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_genomics_catalog(path: Optional[str]) -> Optional[GenomicsCatalog]:
+    """Return the process-wide catalog stored at a path.
+
+    Args:
+        path: Catalog database path; None or empty disables the catalog
+
+    Returns:
+        The shared GenomicsCatalog for the path, or None if disabled or unusable
+    """
+    if not path:
+        return None
+    with _catalogs_lock:
+        catalog = _catalogs.get(path)
+        if catalog is None:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                catalog = GenomicsCatalog(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f'Genomics catalog at {path} unavailable, listing live: {e}')
+                return None
+            _catalogs[path] = catalog
+            logger.info(f'Opened genomics catalog at {path}')
+        return catalog
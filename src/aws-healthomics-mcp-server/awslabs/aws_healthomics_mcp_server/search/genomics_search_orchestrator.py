@@ -149,6 +149,7 @@ class GenomicsSearchOrchestrator:
             self._validate_search_request(request)
 
             # Execute parallel searches across storage systems
+            tag_counters = self._get_tag_retrieval_counters()
             all_files = await self._execute_parallel_searches(request)
             logger.info(f'Found {len(all_files)} total files across all storage systems')
 
@@ -211,6 +212,20 @@ class GenomicsSearchOrchestrator:
                 pagination_info=pagination_info,
             )
 
+            # Report how current catalogued listings were, if any were used
+            catalog_status = self._get_catalog_status()
+            if catalog_status:
+                response_dict['catalog'] = catalog_status
+
+            # Report how many S3 tag lookups the result limit made unnecessary
+            tag_retrieval = self._get_tag_retrieval_status(tag_counters)
+            if tag_retrieval:
+                response_dict['s3_tag_retrieval'] = tag_retrieval
+                logger.info(
+                    f'Fetched S3 tags for {tag_retrieval["tags_fetched"]} of '
+                    f'{tag_retrieval["candidates"]} tag search candidates'
+                )
+
             # Create GenomicsFileSearchResponse object for compatibility
             response = GenomicsFileSearchResponse(
                 results=response_dict['results'],
@@ -431,6 +446,11 @@ class GenomicsSearchOrchestrator:
                 pagination_info=pagination_info,
             )
 
+            # Report how current catalogued listings were, if any were used
+            catalog_status = self._get_catalog_status()
+            if catalog_status:
+                response_dict['catalog'] = catalog_status
+
             # Create GenomicsFileSearchResponse object for compatibility
             response = GenomicsFileSearchResponse(
                 results=response_dict['results'],
@@ -736,7 +756,10 @@ class GenomicsSearchOrchestrator:
         try:
             return await asyncio.wait_for(
                 self.s3_engine.search_buckets(
-                    self.config.s3_bucket_paths, request.file_type, request.search_terms
+                    self.config.s3_bucket_paths,
+                    request.file_type,
+                    request.search_terms,
+                    result_limit=request.offset + request.max_results,
                 ),
                 timeout=self.config.search_timeout_seconds,
             )
@@ -766,7 +789,10 @@ class GenomicsSearchOrchestrator:
         try:
             return await asyncio.wait_for(
                 self.s3_engine.search_buckets(
-                    bucket_paths, request.file_type, request.search_terms
+                    bucket_paths,
+                    request.file_type,
+                    request.search_terms,
+                    result_limit=request.offset + request.max_results,
                 ),
                 timeout=self.config.search_timeout_seconds,
             )
@@ -1062,6 +1088,55 @@ class GenomicsSearchOrchestrator:
 
         return systems
 
+    def _get_catalog_status(self) -> Dict[str, Dict[str, Any]]:
+        """Collect the sync state of every catalogued scope used by the storage engines.
+
+        Returns:
+            Dictionary mapping scopes (S3 prefixes and HealthOmics stores) to their
+            last sync times and staleness, empty if the catalog is not in use
+        """
+        catalog_status = {}
+        for engine in (self.s3_engine, self.healthomics_engine):
+            scopes = getattr(engine, 'catalog_scopes', None)
+            if isinstance(scopes, dict):
+                catalog_status.update(
+                    {scope: status for scope, status in scopes.items() if status}
+                )
+        return catalog_status
+
+    def _get_tag_retrieval_counters(self) -> Tuple[int, int]:
+        """Read the S3 engine's running counts of tag candidates and avoided tag fetches.
+
+        Returns:
+            Tuple of (tag_candidates, tag_fetches_avoided), zeros without an S3 engine
+        """
+        candidates = getattr(self.s3_engine, 'tag_candidates', 0)
+        avoided = getattr(self.s3_engine, 'tag_fetches_avoided', 0)
+        if not isinstance(candidates, int) or not isinstance(avoided, int):
+            return 0, 0
+        return candidates, avoided
+
+    def _get_tag_retrieval_status(self, counters_before: Tuple[int, int]) -> Dict[str, int]:
+        """Summarize the S3 tag lookups made and avoided since the counters were read.
+
+        Args:
+            counters_before: Counters returned by _get_tag_retrieval_counters before the search
+
+        Returns:
+            Dictionary with candidate, fetched and avoided counts, empty if no object
+            needed its tags
+        """
+        candidates, avoided = self._get_tag_retrieval_counters()
+        candidates -= counters_before[0]
+        avoided -= counters_before[1]
+        if candidates <= 0:
+            return {}
+        return {
+            'candidates': candidates,
+            'tags_fetched': candidates - avoided,
+            'tag_fetches_avoided': avoided,
+        }
+
     def _extract_healthomics_associations(self, files: List[GenomicsFile]) -> List[GenomicsFile]:
         """Extract associated files from HealthOmics files and add them to the file list.
 
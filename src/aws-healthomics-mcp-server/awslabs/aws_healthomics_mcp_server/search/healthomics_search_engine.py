@@ -28,6 +28,11 @@ from awslabs.aws_healthomics_mcp_server.models import (
     StoragePaginationResponse,
 )
 from awslabs.aws_healthomics_mcp_server.search.file_type_detector import FileTypeDetector
+from awslabs.aws_healthomics_mcp_server.search.genomics_catalog import (
+    SYNC_FULL,
+    SYNC_INCREMENTAL,
+    get_genomics_catalog,
+)
 from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_omics_client
 from botocore.exceptions import ClientError
@@ -59,6 +64,11 @@ class HealthOmicsSearchEngine:
         self.file_type_detector = FileTypeDetector()
         self.pattern_matcher = PatternMatcher()
 
+        # Persistent listing catalog shared across tool calls (None when not configured),
+        # and the sync state of each catalogued scope this engine has served.
+        self.catalog = get_genomics_catalog(config.catalog_path)
+        self.catalog_scopes: Dict[str, Dict[str, Any]] = {}
+
     async def search_sequence_stores(
         self, file_type: Optional[str], search_terms: List[str]
     ) -> List[GenomicsFile]:
@@ -511,7 +521,12 @@ class HealthOmicsSearchEngine:
             logger.debug(f'Searching sequence store {store_id}')
 
             # List read sets in the sequence store
-            read_sets = await self._list_read_sets(store_id)
+            if self.catalog is not None:
+                read_sets = await self._list_store_records_from_catalog(
+                    'read_sets', store_id, store_info
+                )
+            else:
+                read_sets = await self._list_read_sets(store_id)
             logger.debug(f'Found {len(read_sets)} read sets in store {store_id}')
 
             genomics_files = []
@@ -552,8 +567,14 @@ class HealthOmicsSearchEngine:
         try:
             logger.debug(f'Searching reference store {store_id}')
 
-            # List references in the reference store with server-side filtering
-            references = await self._list_references(store_id, search_terms)
+            # List references in the reference store with server-side filtering. The
+            # catalog holds the complete listing; search terms are applied client-side.
+            if self.catalog is not None:
+                references = await self._list_store_records_from_catalog(
+                    'references', store_id, store_info
+                )
+            else:
+                references = await self._list_references(store_id, search_terms)
             logger.debug(f'Found {len(references)} references in store {store_id}')
 
             genomics_files = []
@@ -573,6 +594,106 @@ class HealthOmicsSearchEngine:
             logger.error(f'Error searching reference store {store_id}: {e}')
             raise
 
+    async def _list_store_records_from_catalog(
+        self, kind: str, store_id: str, store_info: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """List read sets or references of a store from the catalog, syncing it if stale.
+
+        A full sync lists the whole store and removes records it no longer
+        contains. An incremental sync only lists records created after the newest
+        one seen so far, using the createdAfter filter.
+
+        Args:
+            kind: 'read_sets' for a sequence store or 'references' for a reference store
+            store_id: ID of the store
+            store_info: Store information from the store listing
+
+        Returns:
+            List of read set or reference dictionaries
+        """
+        if kind == 'read_sets':
+            list_operation = self.omics_client.list_read_sets
+            store_param, response_key = 'sequenceStoreId', 'readSets'
+        else:
+            list_operation = self.omics_client.list_references
+            store_param, response_key = 'referenceStoreId', 'references'
+
+        # Store IDs are only unique within an account and region; ARNs are global.
+        store = store_info.get('arn') or store_id
+        scope = f'{kind}:{store}'
+
+        # Catalog calls run SQLite queries, so they are kept off the event loop
+        loop = asyncio.get_event_loop()
+        async with self.catalog.sync_lock(scope):
+            mode = await loop.run_in_executor(
+                None,
+                self.catalog.plan_sync,
+                scope,
+                self.config.catalog_max_staleness_seconds,
+                self.config.catalog_full_sync_interval_seconds,
+            )
+            if mode is not None:
+                state = await loop.run_in_executor(None, self.catalog.scope_state, scope)
+                marker = state.marker if mode == SYNC_INCREMENTAL and state else None
+                created_after = datetime.fromisoformat(marker) if marker else None
+                newest = created_after
+                sync_id = await loop.run_in_executor(None, self.catalog.begin_sync, scope)
+                listed = 0
+                next_token = None
+
+                while True:
+                    params: Dict[str, Any] = {store_param: store_id, 'maxResults': 100}
+                    if created_after is not None:
+                        params['filter'] = {'createdAfter': created_after}
+                    if next_token:
+                        params['nextToken'] = next_token
+
+                    try:
+                        response = await loop.run_in_executor(
+                            None, lambda: list_operation(**params)
+                        )
+                    except ClientError as e:
+                        logger.error(f'Error syncing catalog for {scope}: {e}')
+                        raise
+
+                    records = response.get(response_key, [])
+                    await loop.run_in_executor(
+                        None, self.catalog.upsert_store_records, kind, store, records, sync_id
+                    )
+                    listed += len(records)
+                    for record in records:
+                        creation_time = record.get('creationTime')
+                        if isinstance(creation_time, datetime) and (
+                            newest is None or creation_time > newest
+                        ):
+                            newest = creation_time
+
+                    next_token = response.get('nextToken')
+                    if not next_token:
+                        break
+
+                removed = 0
+                if mode == SYNC_FULL:
+                    removed = await loop.run_in_executor(
+                        None, self.catalog.remove_unseen_store_records, kind, store, sync_id
+                    )
+                await loop.run_in_executor(
+                    None,
+                    self.catalog.finish_sync,
+                    scope,
+                    sync_id,
+                    mode,
+                    newest.isoformat() if newest else None,
+                )
+                logger.info(
+                    f'Catalog {mode} sync of {scope}: {listed} records listed, {removed} removed'
+                )
+
+        self.catalog_scopes[scope] = await loop.run_in_executor(
+            None, self.catalog.scope_status, scope
+        )
+        return await loop.run_in_executor(None, self.catalog.list_store_records, kind, store)
+
     async def _list_read_sets(self, sequence_store_id: str) -> List[Dict[str, Any]]:
         """List read sets in a HealthOmics sequence store.
 
@@ -12,7 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Pattern matching algorithms for genomics file search."""
+"""Pattern matching algorithms for genomics file search.
+
+Fuzzy matching scores a text by ``difflib.SequenceMatcher.ratio()``, which is
+by far the most expensive part of matching a file against search terms. The
+ratio is ``2 * M / T`` where ``M`` is the number of matched characters and
+``T`` the combined length, and ``M`` can exceed neither the shorter length nor
+the number of characters the two strings have in common. Both bounds are
+checked before running SequenceMatcher, so texts that cannot reach the fuzzy
+threshold are rejected without it and scores are unchanged.
+"""
 
 from awslabs.aws_healthomics_mcp_server.consts import (
     FUZZY_MATCH_MAX_MULTIPLIER,
@@ -21,10 +30,16 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     SUBSTRING_MATCH_MAX_MULTIPLIER,
     TAG_MATCH_PENALTY_MULTIPLIER,
 )
+from collections import Counter
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
 
+# Upper bound on the number of cached pattern profiles and fuzzy similarities,
+# the cache is cleared when it is reached
+_MAX_CACHED_FUZZY_ENTRIES = 10000
+
+
 class PatternMatcher:
     """Handles pattern matching for genomics file search with fuzzy matching algorithms."""
 
@@ -32,6 +47,12 @@ class PatternMatcher:
         """Initialize the pattern matcher."""
         self.fuzzy_threshold = FUZZY_MATCH_THRESHOLD
 
+        # Character counts of lowercased patterns, used to bound fuzzy similarity
+        self._pattern_char_counts: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        # Similarities of (text, pattern) pairs that passed the bounds; tag keys
+        # and values repeat across files
+        self._similarity_cache: Dict[Tuple[str, str], float] = {}
+
     def calculate_match_score(self, text: str, patterns: List[str]) -> Tuple[float, List[str]]:
         """Calculate match score for text against multiple patterns.
 
@@ -162,13 +183,49 @@ class PatternMatcher:
         text_lower = text.lower()
         pattern_lower = pattern.lower()
 
+        if not self._may_reach_fuzzy_threshold(text_lower, pattern_lower):
+            return 0.0
+
         # Use SequenceMatcher for fuzzy matching
-        similarity = SequenceMatcher(None, text_lower, pattern_lower).ratio()
+        similarity = self._similarity_cache.get((text_lower, pattern_lower))
+        if similarity is None:
+            similarity = SequenceMatcher(None, text_lower, pattern_lower).ratio()
+            if len(self._similarity_cache) >= _MAX_CACHED_FUZZY_ENTRIES:
+                self._similarity_cache.clear()
+            self._similarity_cache[(text_lower, pattern_lower)] = similarity
 
         if similarity >= self.fuzzy_threshold:
             return FUZZY_MATCH_MAX_MULTIPLIER * similarity  # Max score for fuzzy matches
         return 0.0
 
+    def _may_reach_fuzzy_threshold(self, text_lower: str, pattern_lower: str) -> bool:
+        """Check whether the similarity of two lowercased strings can reach the fuzzy threshold.
+
+        Args:
+            text_lower: Lowercased text
+            pattern_lower: Lowercased pattern
+
+        Returns:
+            False only if SequenceMatcher.ratio() is certain to be below the threshold
+        """
+        length = len(text_lower) + len(pattern_lower)
+        if not length:
+            return True
+
+        # Computed like SequenceMatcher.ratio() so that the bounds compare exactly
+        max_matches = min(len(text_lower), len(pattern_lower))
+        if 2.0 * max_matches / length < self.fuzzy_threshold:
+            return False
+
+        char_counts = self._pattern_char_counts.get(pattern_lower)
+        if char_counts is None:
+            char_counts = tuple(Counter(pattern_lower).items())
+            if len(self._pattern_char_counts) >= _MAX_CACHED_FUZZY_ENTRIES:
+                self._pattern_char_counts.clear()
+            self._pattern_char_counts[pattern_lower] = char_counts
+        common = sum(min(count, text_lower.count(char)) for char, count in char_counts)
+        return 2.0 * common / length >= self.fuzzy_threshold
+
     def extract_filename_components(self, file_path: str) -> Dict[str, Optional[str]]:
         """Extract useful components from a file path for matching.
 
@@ -0,0 +1,312 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""S3 Inventory reader used as a listing backend for the S3 search engine.
+
+For buckets with S3 Inventory configured, reading the latest inventory
+snapshot is much faster than walking ListObjectsV2 1000 keys at a time. An
+inventory location is the folder S3 Inventory writes a configuration's reports
+to, ``<destination prefix>/<source bucket>/<configuration ID>/``, either in S3
+or copied to a local directory. Each report lives in a timestamped
+sub-folder holding ``manifest.json``, and its data files are in ``data/``.
+
+Data files are read one at a time and filtered by key prefix in batches, so
+only the matching rows of one batch are turned into objects at once. CSV
+reports are streamed row by row with the standard library. Parquet reports
+are read with polars and ORC reports, stripe by stripe, with pyarrow when it
+is installed; both keep their footer at the end of the file, so a data file
+is downloaded whole but only the columns the search uses are decoded.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import re
+from awslabs.aws_healthomics_mcp_server.utils.s3_utils import parse_s3_path
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from loguru import logger
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+from urllib.parse import unquote_plus
+
+
+# Report folders are named after the time the inventory was taken, e.g. 2024-01-31T01-00Z.
+_SNAPSHOT_FOLDER_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}-\d{2}Z$')
+
+# Inventory fields mapped to list_objects_v2 object fields. CSV reports name
+# fields as in the manifest fileSchema; Parquet and ORC reports use snake_case.
+_CSV_FIELDS = {
+    'Key': 'Key',
+    'Size': 'Size',
+    'LastModifiedDate': 'LastModified',
+    'ETag': 'ETag',
+    'StorageClass': 'StorageClass',
+}
+_COLUMNAR_FIELDS = {
+    'key': 'Key',
+    'size': 'Size',
+    'last_modified_date': 'LastModified',
+    'e_tag': 'ETag',
+    'storage_class': 'StorageClass',
+}
+_COLUMNAR_COLUMNS = (*_COLUMNAR_FIELDS, 'is_latest', 'is_delete_marker')
+# Rows of a Parquet data file converted to objects at once
+_COLUMNAR_BATCH_ROWS = 10_000
+
+
+@dataclass(frozen=True)
+class InventorySnapshot:
+    """The latest inventory report of a source bucket.
+
+    Attributes:
+        location: Inventory location the report was found in
+        source_bucket: Bucket the inventory describes
+        created_at: Time the inventory was taken
+        file_format: CSV, Parquet or ORC
+        file_schema: Field names of CSV data files, in column order
+        data_files: Keys of the data files in the destination bucket
+    """
+
+    location: str
+    source_bucket: str
+    created_at: datetime
+    file_format: str
+    file_schema: List[str]
+    data_files: List[str]
+
+
+class _S3InventoryLocation:
+    """Inventory location in S3, read with the engine's S3 client."""
+
+    def __init__(self, location: str, s3_client: Any):
+        self.location = location
+        self.bucket, self.prefix = parse_s3_path(location)
+        self.s3_client = s3_client
+
+    def snapshot_folders(self) -> List[str]:
+        folders = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix, Delimiter='/'):
+            for common_prefix in page.get('CommonPrefixes', []):
+                folders.append(common_prefix['Prefix'][len(self.prefix) :].rstrip('/'))
+        return folders
+
+    def read_manifest(self, folder: str) -> Dict[str, Any]:
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=f'{self.prefix}{folder}/manifest.json'
+        )
+        return json.loads(response['Body'].read())
+
+    def open_data_file(self, key: str) -> BinaryIO:
+        return self.s3_client.get_object(Bucket=self.bucket, Key=key)['Body']
+
+
+class _LocalInventoryLocation:
+    """Inventory location copied to a local directory (also used for test fixtures)."""
+
+    def __init__(self, location: str):
+        self.location = location
+        self.path = os.path.abspath(os.path.expanduser(location))
+
+    def snapshot_folders(self) -> List[str]:
+        return [
+            name for name in os.listdir(self.path) if os.path.isdir(os.path.join(self.path, name))
+        ]
+
+    def read_manifest(self, folder: str) -> Dict[str, Any]:
+        with open(os.path.join(self.path, folder, 'manifest.json'), 'rb') as f:
+            return json.load(f)
+
+    def open_data_file(self, key: str) -> BinaryIO:
+        # Data files sit in data/ next to the report folders, as in the destination bucket.
+        return open(os.path.join(self.path, 'data', os.path.basename(key)), 'rb')
+
+
+class S3InventoryReader:
+    """Finds the latest inventory snapshot of a bucket and streams its objects."""
+
+    def __init__(self, locations: List[str], s3_client: Any = None):
+        """Initialize the reader.
+
+        Args:
+            locations: Inventory locations, as S3 paths or local directories
+            s3_client: S3 client used for locations in S3
+        """
+        self._locations = [
+            _S3InventoryLocation(location, s3_client)
+            if location.startswith('s3://')
+            else _LocalInventoryLocation(location)
+            for location in locations
+        ]
+        self._snapshots: Optional[Dict[str, InventorySnapshot]] = None
+
+    def latest_snapshot(self, bucket_name: str) -> Optional[InventorySnapshot]:
+        """Return the latest inventory snapshot of a bucket.
+
+        Manifests are read once per reader; locations that cannot be read are
+        skipped with a warning.
+
+        Args:
+            bucket_name: Source bucket name
+
+        Returns:
+            The most recent InventorySnapshot of the bucket, or None if it has none
+        """
+        if self._snapshots is None:
+            self._snapshots = {}
+            for location in self._locations:
+                try:
+                    snapshot = self._read_latest_snapshot(location)
+                except Exception as e:
+                    logger.warning(f'Could not read S3 inventory at {location.location}: {e}')
+                    continue
+                if snapshot is None:
+                    continue
+                current = self._snapshots.get(snapshot.source_bucket)
+                if current is None or snapshot.created_at > current.created_at:
+                    self._snapshots[snapshot.source_bucket] = snapshot
+        return self._snapshots.get(bucket_name)
+
+    def iter_objects(self, snapshot: InventorySnapshot, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Stream the current objects under a prefix from an inventory snapshot.
+
+        Noncurrent versions and delete markers of versioned inventories are skipped.
+
+        Args:
+            snapshot: Snapshot to read
+            prefix: Object key prefix to filter by
+
+        Yields:
+            Object dictionaries shaped like list_objects_v2 Contents entries
+
+        Raises:
+            ValueError: If the report format is not supported
+        """
+        location = next(loc for loc in self._locations if loc.location == snapshot.location)
+        file_format = snapshot.file_format.upper()
+        for key in snapshot.data_files:
+            body = location.open_data_file(key)
+            try:
+                if file_format == 'CSV':
+                    yield from _iter_csv_objects(body, snapshot.file_schema, prefix)
+                elif file_format == 'PARQUET':
+                    yield from _iter_parquet_objects(body, prefix)
+                elif file_format == 'ORC':
+                    yield from _iter_orc_objects(body, prefix)
+                else:
+                    raise ValueError(f'Unsupported S3 inventory format: {snapshot.file_format}')
+            finally:
+                body.close()
+
+    def _read_latest_snapshot(self, location: Any) -> Optional[InventorySnapshot]:
+        folders = sorted(
+            folder
+            for folder in location.snapshot_folders()
+            if _SNAPSHOT_FOLDER_PATTERN.match(folder)
+        )
+        if not folders:
+            logger.debug(f'No S3 inventory reports found at {location.location}')
+            return None
+
+        manifest = location.read_manifest(folders[-1])
+        created_at = datetime.fromtimestamp(
+            int(manifest['creationTimestamp']) / 1000, tz=timezone.utc
+        )
+        return InventorySnapshot(
+            location=location.location,
+            source_bucket=manifest['sourceBucket'],
+            created_at=created_at,
+            file_format=manifest['fileFormat'],
+            file_schema=[field.strip() for field in manifest.get('fileSchema', '').split(',')],
+            data_files=[data_file['key'] for data_file in manifest.get('files', [])],
+        )
+
+
+def _is_current(is_latest: Any, is_delete_marker: Any) -> bool:
+    """Whether a row describes the current version of an object."""
+    return str(is_latest).lower() != 'false' and str(is_delete_marker).lower() != 'true'
+
+
+def _iter_csv_objects(body: BinaryIO, schema: List[str], prefix: str) -> Iterator[Dict[str, Any]]:
+    index = {name: position for position, name in enumerate(schema)}
+    key_index = index['Key']
+    with gzip.GzipFile(fileobj=body) as decompressed:
+        for row in csv.reader(io.TextIOWrapper(decompressed, encoding='utf-8', newline='')):
+            # Keys in CSV reports are URL-encoded
+            key = unquote_plus(row[key_index])
+            if not key.startswith(prefix):
+                continue
+            if not _is_current(
+                row[index['IsLatest']] if 'IsLatest' in index else None,
+                row[index['IsDeleteMarker']] if 'IsDeleteMarker' in index else None,
+            ):
+                continue
+
+            obj: Dict[str, Any] = {'Key': key}
+            for field, object_field in _CSV_FIELDS.items():
+                if field == 'Key' or field not in index or not row[index[field]]:
+                    continue
+                value: Any = row[index[field]]
+                if field == 'Size':
+                    value = int(value)
+                elif field == 'LastModifiedDate':
+                    value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+                obj[object_field] = value
+            yield obj
+
+
+def _columnar_rows_to_objects(rows: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for row in rows:
+        if not _is_current(row.get('is_latest'), row.get('is_delete_marker')):
+            continue
+        obj = {
+            object_field: row[field]
+            for field, object_field in _COLUMNAR_FIELDS.items()
+            if row.get(field) is not None
+        }
+        last_modified = obj.get('LastModified')
+        if isinstance(last_modified, datetime) and last_modified.tzinfo is None:
+            obj['LastModified'] = last_modified.replace(tzinfo=timezone.utc)
+        yield obj
+
+
+def _iter_parquet_objects(body: BinaryIO, prefix: str) -> Iterator[Dict[str, Any]]:
+    import polars as pl
+
+    data = io.BytesIO(body.read())
+    schema = pl.read_parquet_schema(data)
+    data.seek(0)
+    frame = pl.read_parquet(data, columns=[name for name in _COLUMNAR_COLUMNS if name in schema])
+    for batch in frame.iter_slices(_COLUMNAR_BATCH_ROWS):
+        if prefix:
+            batch = batch.filter(pl.col('key').str.starts_with(prefix))
+        yield from _columnar_rows_to_objects(batch.to_dicts())
+
+
+def _iter_orc_objects(body: BinaryIO, prefix: str) -> Iterator[Dict[str, Any]]:
+    try:
+        import pyarrow.compute as pc
+        from pyarrow import orc
+    except ImportError as e:
+        raise ValueError('Reading ORC S3 inventory reports requires pyarrow') from e
+
+    orc_file = orc.ORCFile(io.BytesIO(body.read()))
+    columns = [name for name in _COLUMNAR_COLUMNS if name in orc_file.schema.names]
+    for stripe in range(orc_file.nstripes):
+        batch = orc_file.read_stripe(stripe, columns=columns)
+        if prefix:
+            batch = batch.filter(pc.starts_with(batch.column('key'), prefix))
+        yield from _columnar_rows_to_objects(batch.to_pylist())
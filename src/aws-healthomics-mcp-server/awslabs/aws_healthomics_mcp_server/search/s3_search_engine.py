@@ -15,9 +15,11 @@
 """S3 search engine for genomics files."""
 
 import asyncio
+import bisect
 import hashlib
+import heapq
 import time
-from awslabs.aws_healthomics_mcp_server.consts import DEFAULT_S3_PAGE_SIZE
+from awslabs.aws_healthomics_mcp_server.consts import DEFAULT_S3_PAGE_SIZE, FASTQ_PAIR_PATTERNS
 from awslabs.aws_healthomics_mcp_server.models import (
     GenomicsFile,
     GenomicsFileType,
@@ -27,8 +29,16 @@ from awslabs.aws_healthomics_mcp_server.models import (
     build_s3_uri,
     create_genomics_file_from_s3_object,
 )
+from awslabs.aws_healthomics_mcp_server.search.file_association_engine import FileAssociationEngine
 from awslabs.aws_healthomics_mcp_server.search.file_type_detector import FileTypeDetector
+from awslabs.aws_healthomics_mcp_server.search.genomics_catalog import (
+    SYNC_FULL,
+    SYNC_INCREMENTAL,
+    get_genomics_catalog,
+)
 from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
+from awslabs.aws_healthomics_mcp_server.search.s3_inventory import S3InventoryReader
+from awslabs.aws_healthomics_mcp_server.search.scoring_engine import ScoringEngine
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_aws_session
 from awslabs.aws_healthomics_mcp_server.utils.s3_utils import parse_s3_path
 from awslabs.aws_healthomics_mcp_server.utils.search_config import (
@@ -36,8 +46,49 @@ from awslabs.aws_healthomics_mcp_server.utils.search_config import (
     validate_bucket_access_permissions,
 )
 from botocore.exceptions import ClientError
+from collections import Counter
+from datetime import datetime, timezone
 from loguru import logger
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+# Continuation tokens of catalog- and inventory-backed pages carry the last returned
+# key. Unlike native S3 tokens they stay valid when a later page has to be listed live.
+_INVENTORY_TOKEN_PREFIX = 'inventory-after:'
+
+# Large prefixes are listed in key ranges split at sub-prefixes: the number of
+# ranges per concurrent listing, and how many levels deep sub-prefixes are looked for.
+_SHARDS_PER_WORKER = 4
+_MAX_SHARD_DISCOVERY_DEPTH = 2
+
+# Files the association engine may group under another file: indexes and FASTQ mates.
+_GROUPABLE_FILE_TYPES = frozenset(
+    {
+        GenomicsFileType.BAI,
+        GenomicsFileType.CRAI,
+        GenomicsFileType.FAI,
+        GenomicsFileType.DICT,
+        GenomicsFileType.TBI,
+        GenomicsFileType.CSI,
+        GenomicsFileType.BWA_AMB,
+        GenomicsFileType.BWA_ANN,
+        GenomicsFileType.BWA_BWT,
+        GenomicsFileType.BWA_PAC,
+        GenomicsFileType.BWA_SA,
+    }
+)
+# Lowercase markers of paired-end FASTQ mates, including the dot-separated ones, such as
+# sample.R1.fastq, that the association engine pairs right before the extension
+_FASTQ_MATE_MARKERS = tuple(
+    sorted(
+        {marker.lower() for pair in FASTQ_PAIR_PATTERNS for marker in pair}
+        | {
+            f'{marker.lower()}.'
+            for pair in FileAssociationEngine.FASTQ_MATE_MARKERS
+            for marker in pair
+        }
+    )
+)
 
 
 class S3SearchEngine:
@@ -73,12 +124,32 @@ class S3SearchEngine:
         self.s3_client = self.session.client('s3')
         self.file_type_detector = FileTypeDetector()
         self.pattern_matcher = PatternMatcher()
+        self.scoring_engine = ScoringEngine()
 
         # Instance-level caches — scoped to this engine's lifetime (typically one tool call).
         # Cache isolation between profiles/regions relies on creating a new engine per call.
         self._tag_cache = {}  # Cache for object tags
         self._result_cache = {}  # Cache for search results
 
+        # Persistent listing catalog shared across tool calls (None when not configured),
+        # and the sync state of each catalogued scope this engine has served.
+        self.catalog = get_genomics_catalog(config.catalog_path)
+        self.catalog_scopes: Dict[str, Dict[str, Any]] = {}
+
+        # S3 Inventory reports used instead of live listing (None when not configured),
+        # and the inventory-backed listings already built by this engine.
+        self.inventory = (
+            S3InventoryReader(config.s3_inventory_locations, self.s3_client)
+            if config.s3_inventory_locations
+            else None
+        )
+        self._inventory_listings: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Objects that needed their tags to match, and how many of them were never
+        # fetched because they could not rank among the requested results.
+        self.tag_candidates = 0
+        self.tag_fetches_avoided = 0
+
         logger.info(
             f'S3SearchEngine initialized with tag search: {config.enable_s3_tag_search}, '
             f'tag batch size: {config.max_tag_retrieval_batch_size}, '
@@ -146,7 +217,11 @@ class S3SearchEngine:
         return cls(config, _internal=True)
 
     async def search_buckets(
-        self, bucket_paths: List[str], file_type: Optional[str], search_terms: List[str]
+        self,
+        bucket_paths: List[str],
+        file_type: Optional[str],
+        search_terms: List[str],
+        result_limit: Optional[int] = None,
     ) -> List[GenomicsFile]:
         """Search for genomics files across multiple S3 bucket paths with result caching.
 
@@ -154,6 +229,9 @@ class S3SearchEngine:
             bucket_paths: List of S3 bucket paths to search
             file_type: Optional file type filter
             search_terms: List of search terms to match against
+            result_limit: Number of top-ranked results the caller will return, if known.
+                Objects that can only match by tag are skipped without fetching their
+                tags when they cannot rank among these results.
 
         Returns:
             List of GenomicsFile objects matching the search criteria
@@ -167,7 +245,9 @@ class S3SearchEngine:
             return []
 
         # Check result cache first
-        cache_key = self._create_search_cache_key(bucket_paths, file_type, search_terms)
+        cache_key = self._create_search_cache_key(
+            bucket_paths, file_type, search_terms, result_limit
+        )
         cached_result = self._get_cached_result(cache_key)
         if cached_result is not None:
             logger.info(f'Returning cached search results for {len(bucket_paths)} bucket paths')
@@ -178,7 +258,9 @@ class S3SearchEngine:
         # Create tasks for concurrent bucket searches
         tasks = []
         for bucket_path in bucket_paths:
-            task = self._search_single_bucket_path_optimized(bucket_path, file_type, search_terms)
+            task = self._search_single_bucket_path_optimized(
+                bucket_path, file_type, search_terms, result_limit
+            )
             tasks.append(task)
 
         # Execute searches concurrently with semaphore to limit concurrent operations
@@ -333,19 +415,26 @@ class S3SearchEngine:
         )
 
     async def _search_single_bucket_path_optimized(
-        self, bucket_path: str, file_type: Optional[str], search_terms: List[str]
+        self,
+        bucket_path: str,
+        file_type: Optional[str],
+        search_terms: List[str],
+        result_limit: Optional[int] = None,
     ) -> List[GenomicsFile]:
         """Search a single S3 bucket path for genomics files using optimized strategy.
 
         This method implements smart filtering to minimize S3 API calls:
-        1. List all objects (single API call per page of objects)
-        2. Filter by file type and path patterns (no additional S3 calls)
-        3. Only retrieve tags for objects that need tag-based matching (batch calls)
+        1. List all objects (single API call per page of objects, large prefixes
+           are listed in concurrent key ranges)
+        2. Filter each page by file type and path patterns as it arrives (no additional S3 calls)
+        3. Only retrieve tags for objects that need tag-based matching (batch calls) and,
+           given a result limit, that could still rank among the top results
 
         Args:
             bucket_path: S3 bucket path (e.g., 's3://bucket-name/prefix/')
             file_type: Optional file type filter
             search_terms: List of search terms to match against
+            result_limit: Number of top-ranked results the caller will return, if known
 
         Returns:
             List of GenomicsFile objects found in this bucket path
@@ -356,50 +445,62 @@ class S3SearchEngine:
             # Validate bucket access
             await self._validate_bucket_access(bucket_name)
 
-            # Phase 1: Get all objects (minimal S3 calls)
-            objects = await self._list_s3_objects(bucket_name, prefix)
-            logger.debug(f'Listed {len(objects)} objects in {bucket_path}')
-
-            # Phase 2: Filter by file type and path patterns (no S3 calls)
+            # Phases 1 and 2: List objects page by page (minimal S3 calls) and filter
+            # each page by file type and path patterns as it arrives (no S3 calls)
             path_matched_objects = []
             objects_needing_tags = []
+            objects_listed = 0
 
-            for obj in objects:
-                key = obj['Key']
+            async for page in self._iter_s3_object_pages(bucket_name, prefix):
+                objects_listed += len(page)
+                for obj in page:
+                    key = obj['Key']
 
-                # File type filtering
-                detected_file_type = self.file_type_detector.detect_file_type(key)
-                if not detected_file_type:
-                    continue
+                    # File type filtering
+                    detected_file_type = self.file_type_detector.detect_file_type(key)
+                    if not detected_file_type:
+                        continue
 
-                if not self._matches_file_type_filter(detected_file_type, file_type):
-                    continue
+                    if not self._matches_file_type_filter(detected_file_type, file_type):
+                        continue
 
-                # Path-based search term matching
-                if search_terms:
-                    # Use centralized URI construction for pattern matching
-                    s3_path = build_s3_uri(bucket_name, key)
-                    path_score, _ = self.pattern_matcher.match_file_path(s3_path, search_terms)
-                    if path_score > 0:
-                        # Path matched, no need for tags
+                    # Path-based search term matching
+                    if search_terms:
+                        # Use centralized URI construction for pattern matching
+                        s3_path = build_s3_uri(bucket_name, key)
+                        path_score, _ = self.pattern_matcher.match_file_path(s3_path, search_terms)
+                        if path_score > 0:
+                            # Path matched, no need for tags
+                            path_matched_objects.append((obj, {}, detected_file_type))
+                            continue
+                        elif self.config.enable_s3_tag_search:
+                            # Need to check tags
+                            objects_needing_tags.append((obj, detected_file_type))
+                        # If path doesn't match and tag search is disabled, skip
+                    else:
+                        # No search terms, include all type-matched files
                         path_matched_objects.append((obj, {}, detected_file_type))
-                        continue
-                    elif self.config.enable_s3_tag_search:
-                        # Need to check tags
-                        objects_needing_tags.append((obj, detected_file_type))
-                    # If path doesn't match and tag search is disabled, skip
-                else:
-                    # No search terms, include all type-matched files
-                    path_matched_objects.append((obj, {}, detected_file_type))
 
             logger.debug(
-                f'After path filtering: {len(path_matched_objects)} path matches, '
+                f'Listed {objects_listed} objects in {bucket_path}, after path filtering: '
+                f'{len(path_matched_objects)} path matches, '
                 f'{len(objects_needing_tags)} objects need tag checking'
             )
 
-            # Phase 3: Batch retrieve tags only for objects that need them
+            # Phase 3: Batch retrieve tags only for objects that need them and,
+            # with a result limit, could still rank among the results
             tag_matched_objects = []
             if objects_needing_tags and self.config.enable_s3_tag_search:
+                self.tag_candidates += len(objects_needing_tags)
+                if result_limit is not None:
+                    objects_needing_tags = self._select_tag_candidates(
+                        bucket_name,
+                        path_matched_objects,
+                        objects_needing_tags,
+                        file_type,
+                        search_terms,
+                        result_limit,
+                    )
                 object_keys = [obj[0]['Key'] for obj in objects_needing_tags]
                 tag_map = await self._get_tags_for_objects_batch(bucket_name, object_keys)
 
@@ -548,6 +649,109 @@ class S3SearchEngine:
             logger.error(f'Error in paginated search of bucket path {bucket_path}: {e}')
             raise
 
+    def _select_tag_candidates(
+        self,
+        bucket_name: str,
+        path_matched_objects: List[Tuple[Dict[str, Any], Dict[str, str], GenomicsFileType]],
+        objects_needing_tags: List[Tuple[Dict[str, Any], GenomicsFileType]],
+        file_type: Optional[str],
+        search_terms: List[str],
+        result_limit: int,
+    ) -> List[Tuple[Dict[str, Any], GenomicsFileType]]:
+        """Keep only the tag candidates that could still rank among the top results.
+
+        Path matches are results whatever their tags say, so the result_limit-th
+        best lower bound of their scores is a score the returned results are
+        guaranteed to reach. A candidate whose score could not reach it even with
+        the best possible tag match is dropped without fetching its tags.
+
+        Associated files share the directory of their primary file and its name up
+        to the first dot, so a candidate without such a neighbour in the listing can
+        only get the neutral association score.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            path_matched_objects: Objects matched by path, as (object, tags, file type)
+            objects_needing_tags: Objects that only match if their tags do
+            file_type: Optional file type filter
+            search_terms: List of search terms to match against
+            result_limit: Number of top-ranked results the caller will return
+
+        Returns:
+            The tag candidates whose tags are worth fetching
+        """
+        lower_bounds = []
+        for obj, tags, detected_file_type in path_matched_objects:
+            # Files that may be grouped under another one do not rank on their own
+            if self._may_be_grouped(obj['Key'], detected_file_type):
+                continue
+            genomics_file = self._create_genomics_file_from_object(
+                obj, bucket_name, tags, detected_file_type
+            )
+            lower, _ = self.scoring_engine.calculate_score_bounds(
+                genomics_file, search_terms, file_type
+            )
+            lower_bounds.append(lower)
+
+        if len(lower_bounds) < result_limit:
+            return objects_needing_tags
+        threshold = heapq.nlargest(result_limit, lower_bounds)[-1]
+
+        listed_keys = [obj['Key'] for obj, _, _ in path_matched_objects]
+        listed_keys.extend(obj['Key'] for obj, _ in objects_needing_tags)
+        name_stems = Counter(self._name_stem(key) for key in listed_keys)
+        selected = []
+        for obj, detected_file_type in objects_needing_tags:
+            # Companion files are kept so that matching ones stay associated with their primary
+            if self._may_be_grouped(obj['Key'], detected_file_type):
+                selected.append((obj, detected_file_type))
+                continue
+            genomics_file = self._create_genomics_file_from_object(
+                obj, bucket_name, {}, detected_file_type
+            )
+            # Candidates did not match by path, so only their tags can add a pattern score
+            _, upper = self.scoring_engine.calculate_score_bounds(
+                genomics_file,
+                search_terms,
+                file_type,
+                pattern_score=0.0,
+                may_have_associations=name_stems[self._name_stem(obj['Key'])] > 1,
+            )
+            if upper >= threshold:
+                selected.append((obj, detected_file_type))
+
+        avoided = len(objects_needing_tags) - len(selected)
+        self.tag_fetches_avoided += avoided
+        logger.debug(
+            f'Fetching tags for {len(selected)} of {len(objects_needing_tags)} candidates in '
+            f'bucket {bucket_name}, {avoided} cannot reach the top {result_limit} results'
+        )
+        return selected
+
+    @staticmethod
+    def _name_stem(key: str) -> str:
+        """Return an object key up to the first dot of its file name."""
+        directory, _, name = key.rpartition('/')
+        return f'{directory}/{name.split(".", 1)[0]}'
+
+    @staticmethod
+    def _may_be_grouped(key: str, detected_file_type: GenomicsFileType) -> bool:
+        """Whether the association engine may group a file under another file.
+
+        Args:
+            key: S3 object key
+            detected_file_type: Detected file type of the object
+
+        Returns:
+            True for index files and paired-end FASTQ mates
+        """
+        if detected_file_type in _GROUPABLE_FILE_TYPES:
+            return True
+        if detected_file_type != GenomicsFileType.FASTQ:
+            return False
+        name = key.rpartition('/')[2].lower()
+        return any(marker in name for marker in _FASTQ_MATE_MARKERS)
+
     async def _validate_bucket_access(self, bucket_name: str) -> None:
         """Validate that we have access to the specified S3 bucket.
 
@@ -600,45 +804,517 @@ class S3SearchEngine:
             List of S3 object dictionaries
         """
         objects = []
-        continuation_token = None
+        async for page in self._iter_s3_object_pages(bucket_name, prefix):
+            objects.extend(page)
+        return objects
 
-        while True:
-            try:
-                # Prepare list_objects_v2 parameters
-                params = {
-                    'Bucket': bucket_name,
-                    'Prefix': prefix,
-                    'MaxKeys': DEFAULT_S3_PAGE_SIZE,
-                }
+    async def _iter_s3_object_pages(
+        self, bucket_name: str, prefix: str
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the objects under a prefix page by page, in key order.
 
-                if continuation_token:
-                    params['ContinuationToken'] = continuation_token
+        Catalogued and inventory-backed listings are yielded as a single page;
+        otherwise the prefix is listed live, see _iter_s3_object_pages_live.
 
-                # Execute the list operation asynchronously
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None, lambda: self.s3_client.list_objects_v2(**params)
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Yields:
+            Non-empty lists of S3 object dictionaries
+        """
+        objects = await self._list_s3_objects_indexed(bucket_name, prefix)
+        if objects is not None:
+            if objects:
+                yield objects
+            return
+
+        async for page in self._iter_s3_object_pages_live(bucket_name, prefix):
+            yield page
+
+    async def _list_s3_objects_indexed(
+        self, bucket_name: str, prefix: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """List objects under a prefix from the catalog or the S3 inventory.
+
+        The catalog takes precedence over the inventory when both are configured:
+        it is kept current by incremental syncs, while an inventory snapshot can
+        be up to a day or two old. Both the full and the paginated listing go
+        through here, so they always read from the same source.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Returns:
+            List of S3 object dictionaries sorted by key, or None if neither is
+            configured or usable and the prefix must be listed live
+        """
+        if self.catalog is not None:
+            return await self._list_s3_objects_from_catalog(bucket_name, prefix)
+        if self.inventory is not None:
+            return await self._list_s3_objects_from_inventory(bucket_name, prefix)
+        return None
+
+    async def _list_s3_objects_live(self, bucket_name: str, prefix: str) -> List[Dict[str, Any]]:
+        """List objects in an S3 bucket with the given prefix using ListObjectsV2.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Returns:
+            List of S3 object dictionaries
+        """
+        objects = []
+        async for page in self._iter_s3_object_pages_live(bucket_name, prefix):
+            objects.extend(page)
+        logger.debug(f'Listed {len(objects)} objects in s3://{bucket_name}/{prefix}')
+        return objects
+
+    async def _iter_s3_object_pages_live(
+        self, bucket_name: str, prefix: str, start_after: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """List objects under a prefix with ListObjectsV2, yielding pages in key order.
+
+        A prefix that fits in one page costs a single call. When the first page is
+        truncated, the rest of the prefix is split into key ranges at sub-prefix
+        boundaries and the ranges are listed concurrently, up to
+        max_concurrent_searches at a time. Pages of a range are yielded once all
+        earlier ranges are exhausted, so the overall order is preserved.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+            start_after: Only list keys after this key
+
+        Yields:
+            Non-empty lists of S3 object dictionaries
+        """
+        response = await self._list_objects_v2_page(bucket_name, prefix, start_after=start_after)
+        first_page = response.get('Contents', [])
+        if first_page:
+            yield first_page
+        if not response.get('IsTruncated', False):
+            return
+
+        after = first_page[-1]['Key']
+        boundaries = await self._find_shard_boundaries(bucket_name, prefix, after)
+        if not boundaries:
+            # No sub-prefixes to split at, continue serially
+            continuation_token = response.get('NextContinuationToken')
+            while continuation_token:
+                response = await self._list_objects_v2_page(
+                    bucket_name, prefix, continuation_token=continuation_token
+                )
+                if response.get('Contents'):
+                    yield response['Contents']
+                continuation_token = (
+                    response.get('NextContinuationToken')
+                    if response.get('IsTruncated', False)
+                    else None
                 )
+            return
 
-                # Add objects from this page
-                if 'Contents' in response:
-                    objects.extend(response['Contents'])
+        # Each range holds the keys after its first bound, up to and including its second
+        ranges = list(zip([after] + boundaries, boundaries + [None]))
+        logger.debug(
+            f'Listing s3://{bucket_name}/{prefix} in {len(ranges)} key ranges concurrently'
+        )
+        queues: List[asyncio.Queue] = [asyncio.Queue() for _ in ranges]
+        tasks: List[asyncio.Task] = []
+
+        def start_next_range() -> None:
+            index = len(tasks)
+            range_start, range_end = ranges[index]
+            tasks.append(
+                asyncio.create_task(
+                    self._list_s3_key_range(
+                        bucket_name, prefix, range_start, range_end, queues[index]
+                    )
+                )
+            )
 
-                # Check if there are more pages
-                if response.get('IsTruncated', False):
-                    continuation_token = response.get('NextContinuationToken')
-                else:
-                    break
+        try:
+            for _ in range(min(max(self.config.max_concurrent_searches, 1), len(ranges))):
+                start_next_range()
+            for queue in queues:
+                while (item := await queue.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+                if len(tasks) < len(ranges):
+                    start_next_range()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _list_s3_key_range(
+        self,
+        bucket_name: str,
+        prefix: str,
+        range_start: str,
+        range_end: Optional[str],
+        queue: asyncio.Queue,
+    ) -> None:
+        """List the keys of a prefix in (range_start, range_end] into a queue.
 
-            except ClientError as e:
-                logger.error(
-                    f'Error listing objects in bucket {bucket_name} with prefix {prefix}: {e}'
+        Pages are put on the queue as they arrive, followed by None when the range
+        is exhausted, or by the exception that stopped the listing.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+            range_start: Exclusive lower bound of the range
+            range_end: Inclusive upper bound of the range, None for the end of the prefix
+            queue: Queue receiving the pages
+        """
+        try:
+            continuation_token = None
+            while True:
+                response = await self._list_objects_v2_page(
+                    bucket_name,
+                    prefix,
+                    continuation_token=continuation_token,
+                    start_after=range_start,
                 )
-                raise
+                page = response.get('Contents', [])
+                if range_end is not None and page and page[-1]['Key'] > range_end:
+                    page = [obj for obj in page if obj['Key'] <= range_end]
+                    if page:
+                        await queue.put(page)
+                    break
+                if page:
+                    await queue.put(page)
+                if not response.get('IsTruncated', False):
+                    break
+                continuation_token = response.get('NextContinuationToken')
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
 
-        logger.debug(f'Listed {len(objects)} objects in s3://{bucket_name}/{prefix}')
+    async def _find_shard_boundaries(self, bucket_name: str, prefix: str, after: str) -> List[str]:
+        """Find sub-prefixes after a key at which to split the listing of a prefix.
+
+        Sub-prefixes are discovered with Delimiter='/' listings, descending one
+        more level when there are too few for every concurrent listing to get
+        several key ranges.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+            after: Last key already listed
+
+        Returns:
+            Sorted range boundaries, at most _SHARDS_PER_WORKER per concurrent listing
+        """
+        workers = max(self.config.max_concurrent_searches, 1)
+        target = workers * _SHARDS_PER_WORKER
+        semaphore = asyncio.Semaphore(workers)
+        boundaries: List[str] = []
+        level = [prefix]
+
+        async def list_common_prefixes(sub_prefix: str) -> List[str]:
+            async with semaphore:
+                return await self._list_common_prefixes(bucket_name, sub_prefix, after)
+
+        for _ in range(_MAX_SHARD_DISCOVERY_DEPTH):
+            listings = await asyncio.gather(*(list_common_prefixes(p) for p in level))
+            # Sub-prefixes holding keys after the listed ones; those sorting
+            # before the last listed key can only be descended into.
+            level = [
+                p for listing in listings for p in listing if p > after or after.startswith(p)
+            ]
+            boundaries.extend(p for p in level if p > after)
+            if not level or len(boundaries) >= target:
+                break
+            level = level[:target]
+
+        boundaries = sorted(set(boundaries))
+        if len(boundaries) > target:
+            boundaries = [boundaries[i * len(boundaries) // target] for i in range(target)]
+        return boundaries
+
+    async def _list_common_prefixes(
+        self, bucket_name: str, prefix: str, start_after: str
+    ) -> List[str]:
+        """List the sub-prefixes of a prefix with Delimiter='/'.
+
+        Listing stops at the first page without sub-prefixes, so that finding
+        none in a flat prefix does not cost a second walk over all its keys.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+            start_after: Only list sub-prefixes holding keys after this key
+
+        Returns:
+            Sub-prefixes in key order
+        """
+        common_prefixes = []
+        continuation_token = None
+        while True:
+            response = await self._list_objects_v2_page(
+                bucket_name,
+                prefix,
+                continuation_token=continuation_token,
+                start_after=start_after,
+                delimiter='/',
+            )
+            page_prefixes = [p['Prefix'] for p in response.get('CommonPrefixes', [])]
+            common_prefixes.extend(page_prefixes)
+            if not page_prefixes or not response.get('IsTruncated', False):
+                return common_prefixes
+            continuation_token = response.get('NextContinuationToken')
+
+    async def _list_objects_v2_page(
+        self,
+        bucket_name: str,
+        prefix: str,
+        continuation_token: Optional[str] = None,
+        start_after: Optional[str] = None,
+        delimiter: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch one ListObjectsV2 page.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+            continuation_token: Token of the page to fetch
+            start_after: Key to start listing after (ignored with a continuation token)
+            delimiter: Delimiter grouping keys into common prefixes
+
+        Returns:
+            The ListObjectsV2 response
+        """
+        params = {
+            'Bucket': bucket_name,
+            'Prefix': prefix,
+            'MaxKeys': DEFAULT_S3_PAGE_SIZE,
+        }
+        if continuation_token:
+            params['ContinuationToken'] = continuation_token
+        elif start_after:
+            params['StartAfter'] = start_after
+        if delimiter:
+            params['Delimiter'] = delimiter
+
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                None, lambda: self.s3_client.list_objects_v2(**params)
+            )
+        except ClientError as e:
+            logger.error(
+                f'Error listing objects in bucket {bucket_name} with prefix {prefix}: {e}'
+            )
+            raise
+
+    async def _list_s3_objects_from_catalog(
+        self, bucket_name: str, prefix: str
+    ) -> List[Dict[str, Any]]:
+        """List objects under a prefix from the persistent catalog, syncing it if stale.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Returns:
+            List of S3 object dictionaries
+        """
+        scope = f's3://{bucket_name}/{prefix}'
+        # Catalog calls run SQLite queries, so they are kept off the event loop
+        loop = asyncio.get_event_loop()
+        async with self.catalog.sync_lock(scope):
+            mode = await loop.run_in_executor(
+                None,
+                self.catalog.plan_sync,
+                scope,
+                self.config.catalog_max_staleness_seconds,
+                self.config.catalog_full_sync_interval_seconds,
+            )
+            if mode is not None:
+                await self._sync_catalog_scope(bucket_name, prefix, scope, mode)
+
+        self.catalog_scopes[scope] = await loop.run_in_executor(
+            None, self.catalog.scope_status, scope
+        )
+        objects = await loop.run_in_executor(
+            None, lambda: self.catalog.list_s3_objects(bucket_name, prefix)
+        )
+        logger.debug(f'Read {len(objects)} catalogued objects for {scope}')
         return objects
 
+    async def _list_s3_objects_from_inventory(
+        self, bucket_name: str, prefix: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """List objects under a prefix from the bucket's latest S3 Inventory snapshot.
+
+        The snapshot listing is patched with a live listing of the top level of
+        the prefix, see _refresh_inventory_listing.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix to filter by
+
+        Returns:
+            List of S3 object dictionaries sorted by key, or None if the bucket has no
+            usable snapshot and must be listed live
+        """
+        scope = f's3://{bucket_name}/{prefix}'
+        if scope in self._inventory_listings:
+            return self._inventory_listings[scope]
+
+        loop = asyncio.get_event_loop()
+        snapshot = await loop.run_in_executor(
+            None, lambda: self.inventory.latest_snapshot(bucket_name)
+        )
+        if snapshot is None:
+            return None
+
+        age = (datetime.now(timezone.utc) - snapshot.created_at).total_seconds()
+        if age > self.config.s3_inventory_max_age_seconds:
+            logger.info(
+                f'S3 inventory of {bucket_name} is {int(age)}s old, listing {scope} live instead'
+            )
+            return None
+
+        try:
+            objects = await loop.run_in_executor(
+                None, lambda: list(self.inventory.iter_objects(snapshot, prefix))
+            )
+        except Exception as e:
+            logger.warning(f'Could not read S3 inventory for {scope}, listing live instead: {e}')
+            return None
+
+        inventoried = len(objects)
+        objects = await self._refresh_inventory_listing(bucket_name, prefix, objects)
+        objects.sort(key=lambda obj: obj['Key'])
+
+        self._inventory_listings[scope] = objects
+        self.catalog_scopes[scope] = {
+            'source': 's3_inventory',
+            'synced_at': snapshot.created_at.isoformat(),
+            'staleness_seconds': round(max(age, 0.0), 3),
+        }
+        logger.debug(
+            f'Read {inventoried} inventoried objects for {scope}, {len(objects)} after live refresh'
+        )
+        return objects
+
+    async def _refresh_inventory_listing(
+        self, bucket_name: str, prefix: str, objects: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Bring an inventory listing up to date with the top level of its prefix.
+
+        The prefix is listed live with a '/' delimiter. Objects directly under the
+        prefix are taken from that listing, sub-prefixes created since the snapshot
+        are listed live in full, and sub-prefixes that no longer exist are dropped.
+        Changes inside sub-prefixes the snapshot already knows about show up with
+        the next inventory.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+            objects: Objects read from the inventory snapshot
+
+        Returns:
+            The refreshed list of S3 object dictionaries
+        """
+        direct_objects: List[Dict[str, Any]] = []
+        live_prefixes: List[str] = []
+        continuation_token = None
+        loop = asyncio.get_event_loop()
+
+        while True:
+            params = {
+                'Bucket': bucket_name,
+                'Prefix': prefix,
+                'Delimiter': '/',
+                'MaxKeys': DEFAULT_S3_PAGE_SIZE,
+            }
+            if continuation_token:
+                params['ContinuationToken'] = continuation_token
+
+            response = await loop.run_in_executor(
+                None, lambda: self.s3_client.list_objects_v2(**params)
+            )
+            direct_objects.extend(response.get('Contents', []))
+            live_prefixes.extend(p['Prefix'] for p in response.get('CommonPrefixes', []))
+
+            if not response.get('IsTruncated', False):
+                break
+            continuation_token = response.get('NextContinuationToken')
+
+        live_prefix_set = set(live_prefixes)
+        inventoried_prefixes = set()
+        refreshed = list(direct_objects)
+        for obj in objects:
+            relative_key = obj['Key'][len(prefix) :]
+            if '/' not in relative_key:
+                continue
+            sub_prefix = prefix + relative_key.split('/', 1)[0] + '/'
+            inventoried_prefixes.add(sub_prefix)
+            if sub_prefix in live_prefix_set:
+                refreshed.append(obj)
+
+        new_prefixes = [p for p in live_prefixes if p not in inventoried_prefixes]
+        if new_prefixes:
+            logger.debug(
+                f'Listing {len(new_prefixes)} prefixes of s3://{bucket_name}/{prefix} '
+                'created since the inventory snapshot'
+            )
+            listings = await asyncio.gather(
+                *(self._list_s3_objects_live(bucket_name, p) for p in new_prefixes)
+            )
+            for listing in listings:
+                refreshed.extend(listing)
+
+        return refreshed
+
+    async def _sync_catalog_scope(
+        self, bucket_name: str, prefix: str, scope: str, mode: str
+    ) -> None:
+        """Bring the catalogued listing of a prefix up to date.
+
+        A full sync lists the whole prefix and removes objects it no longer
+        contains. An incremental sync only lists keys after the greatest key
+        listed before, using StartAfter.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Object key prefix
+            scope: Catalog scope of the prefix
+            mode: SYNC_FULL or SYNC_INCREMENTAL
+        """
+        loop = asyncio.get_event_loop()
+        state = await loop.run_in_executor(None, self.catalog.scope_state, scope)
+        start_after = state.marker if mode == SYNC_INCREMENTAL and state else None
+        marker = start_after
+        sync_id = await loop.run_in_executor(None, self.catalog.begin_sync, scope)
+        listed = 0
+
+        try:
+            async for page in self._iter_s3_object_pages_live(bucket_name, prefix, start_after):
+                await loop.run_in_executor(
+                    None, self.catalog.upsert_s3_objects, bucket_name, page, sync_id
+                )
+                # Pages are yielded in ascending key order
+                marker = page[-1]['Key']
+                listed += len(page)
+        except ClientError as e:
+            logger.error(f'Error syncing catalog for {scope}: {e}')
+            raise
+
+        removed = 0
+        if mode == SYNC_FULL:
+            removed = await loop.run_in_executor(
+                None, self.catalog.remove_unseen_s3_objects, bucket_name, prefix, sync_id
+            )
+        await loop.run_in_executor(None, self.catalog.finish_sync, scope, sync_id, mode, marker)
+        logger.info(f'Catalog {mode} sync of {scope}: {listed} objects listed, {removed} removed')
+
     async def _list_s3_objects_paginated(
         self,
         bucket_name: str,
@@ -657,6 +1333,25 @@ class S3SearchEngine:
         Returns:
             Tuple of (objects, next_continuation_token, total_objects_scanned)
         """
+        start_after = None
+        if continuation_token and continuation_token.startswith(_INVENTORY_TOKEN_PREFIX):
+            start_after = continuation_token[len(_INVENTORY_TOKEN_PREFIX) :]
+            continuation_token = None
+
+        if continuation_token is None:
+            indexed_objects = await self._list_s3_objects_indexed(bucket_name, prefix)
+            if indexed_objects is not None:
+                start = (
+                    bisect.bisect_right(indexed_objects, start_after, key=lambda obj: obj['Key'])
+                    if start_after is not None
+                    else 0
+                )
+                objects = indexed_objects[start : start + max_results]
+                next_token = None
+                if start + max_results < len(indexed_objects):
+                    next_token = f'{_INVENTORY_TOKEN_PREFIX}{objects[-1]["Key"]}'
+                return objects, next_token, len(objects)
+
         objects = []
         total_scanned = 0
         current_token = continuation_token
@@ -676,6 +1371,8 @@ class S3SearchEngine:
 
                 if current_token:
                     params['ContinuationToken'] = current_token
+                elif start_after is not None:
+                    params['StartAfter'] = start_after
 
                 # Execute the list operation asynchronously
                 loop = asyncio.get_event_loop()
@@ -830,6 +1527,19 @@ class S3SearchEngine:
         tag_map = {}
         keys_to_fetch = []
 
+        loop = asyncio.get_event_loop()
+        if self.catalog is not None:
+            tag_map.update(
+                await loop.run_in_executor(
+                    None,
+                    self.catalog.get_s3_tags,
+                    bucket_name,
+                    object_keys,
+                    self.config.catalog_full_sync_interval_seconds,
+                )
+            )
+            object_keys = [key for key in object_keys if key not in tag_map]
+
         for key in object_keys:
             cache_key = f'{bucket_name}/{key}'
             if cache_key in self._tag_cache:
@@ -844,7 +1554,7 @@ class S3SearchEngine:
             keys_to_fetch.append(key)
 
         if not keys_to_fetch:
-            logger.debug(f'All {len(object_keys)} object tags found in cache')
+            logger.debug(f'All {len(tag_map)} object tags found in cache')
             return tag_map
 
         logger.debug(
@@ -878,6 +1588,14 @@ class S3SearchEngine:
                 else:
                     logger.warning(f'Unexpected result type in tag batch: {type(result)}')
 
+        if self.catalog is not None:
+            await loop.run_in_executor(
+                None,
+                self.catalog.put_s3_tags,
+                bucket_name,
+                {key: tag_map[key] for key in keys_to_fetch if key in tag_map},
+            )
+
         logger.debug(f'Retrieved tags for {len(tag_map)} objects total')
         return tag_map
 
@@ -907,7 +1625,11 @@ class S3SearchEngine:
         return False
 
     def _create_search_cache_key(
-        self, bucket_paths: List[str], file_type: Optional[str], search_terms: List[str]
+        self,
+        bucket_paths: List[str],
+        file_type: Optional[str],
+        search_terms: List[str],
+        result_limit: Optional[int] = None,
     ) -> str:
         """Create a cache key for search results.
 
@@ -915,6 +1637,7 @@ class S3SearchEngine:
             bucket_paths: List of S3 bucket paths
             file_type: Optional file type filter
             search_terms: List of search terms
+            result_limit: Number of top-ranked results the search was limited to
 
         Returns:
             Cache key string
@@ -925,6 +1648,9 @@ class S3SearchEngine:
             'file_type': file_type or '',
             'search_terms': sorted(search_terms),  # Sort for consistency
         }
+        if result_limit is not None:
+            # Rank-limited results omit tag matches that a larger limit may include
+            key_data['result_limit'] = result_limit
 
         # Create hash of the key data
         key_str = str(key_data)
@@ -14,6 +14,7 @@
 
 """Scoring engine for genomics file search results."""
 
+from ..consts import TAG_MATCH_PENALTY_MULTIPLIER
 from ..models import GenomicsFile, GenomicsFileType
 from .pattern_matcher import PatternMatcher
 from typing import Any, Dict, List, Optional, Tuple
@@ -137,6 +138,57 @@ class ScoringEngine:
 
         return final_score, scoring_reasons
 
+    def calculate_score_bounds(
+        self,
+        file: GenomicsFile,
+        search_terms: List[str],
+        file_type_filter: Optional[str] = None,
+        pattern_score: Optional[float] = None,
+        may_have_associations: bool = True,
+    ) -> Tuple[float, float]:
+        """Bound the score calculate_score can give a file before tags and associations are known.
+
+        The file type and storage components are exact. The pattern component lies
+        between the best match known so far and the best possible tag match, and
+        the association component between neutral (no associated files) and its
+        maximum, or is neutral for files that cannot have associated files.
+
+        Args:
+            file: The genomics file to bound the score of
+            search_terms: List of search terms to match against
+            file_type_filter: Optional file type filter from search request
+            pattern_score: Best path or metadata match score, if already known
+            may_have_associations: Whether any associated file of this file may exist
+
+        Returns:
+            Tuple of (lower_bound, upper_bound)
+        """
+        if search_terms:
+            if pattern_score is None:
+                pattern_score = max(
+                    self.pattern_matcher.match_file_path(file.path, search_terms)[0],
+                    self.pattern_matcher.match_tags(file.tags, search_terms)[0],
+                    self._match_metadata(file.metadata, search_terms)[0],
+                )
+            pattern_bounds = (pattern_score, max(pattern_score, TAG_MATCH_PENALTY_MULTIPLIER))
+        else:
+            pattern_bounds = (0.5, 0.5)
+
+        type_score, _ = self._calculate_file_type_score(file, file_type_filter)
+        storage_score, _ = self._calculate_storage_score(file)
+
+        # Summed in the same order as calculate_score so the bounds are exact at the extremes
+        lower, upper = (
+            pattern * self.weights['pattern_match']
+            + type_score * self.weights['file_type_relevance']
+            + association * self.weights['associated_files']
+            + storage_score * self.weights['storage_accessibility']
+            for pattern, association in zip(
+                pattern_bounds, (0.5, 1.0 if may_have_associations else 0.5)
+            )
+        )
+        return max(0.0, min(1.0, lower)), max(0.0, min(1.0, upper))
+
     def _calculate_pattern_score(
         self, file: GenomicsFile, search_terms: List[str]
     ) -> Tuple[float, List[str]]:
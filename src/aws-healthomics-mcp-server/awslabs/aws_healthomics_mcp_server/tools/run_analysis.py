@@ -14,9 +14,11 @@
 
 """Run analysis tools for the AWS HealthOmics MCP server."""
 
+import asyncio
 import json
 from awslabs.aws_healthomics_mcp_server.analysis.cost_analyzer import CostAnalyzer
 from awslabs.aws_healthomics_mcp_server.analysis.instance_recommender import InstanceRecommender
+from awslabs.aws_healthomics_mcp_server.analysis.manifest_cache import ManifestAnalysisCache
 from awslabs.aws_healthomics_mcp_server.analysis.pricing_cache import PricingCache
 from awslabs.aws_healthomics_mcp_server.analysis.task_aggregator import TaskAggregator
 from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
@@ -27,7 +29,7 @@ from datetime import datetime, timezone
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 
 # Default region for cost analysis
@@ -36,6 +38,9 @@ DEFAULT_REGION = 'us-east-1'
 # Default headroom for instance recommendations (20%)
 DEFAULT_HEADROOM = 0.20
 
+# Maximum number of runs whose manifests are fetched and parsed at the same time
+MAX_CONCURRENT_RUN_ANALYSES = 8
+
 
 def _json_serializer(obj):
     """JSON serializer for objects not serializable by default json code."""
@@ -875,43 +880,22 @@ async def _get_run_analysis_data(
             },
         }
 
-        # Process each run
-        for run_id in run_ids:
-            try:
-                logger.debug(f'Processing run {run_id}')
-
-                # Get basic run information
-                run_response = omics_client.get_run(id=run_id)
-                run_uuid = run_response.get('uuid')
-
-                if not run_uuid:
-                    logger.warning(f'No UUID found for run {run_id}, skipping manifest analysis')
-                    continue
+        # Process runs concurrently, keeping the order of run_ids in the results
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUN_ANALYSES)
 
-                # Get manifest logs
-                manifest_logs = await get_run_manifest_logs_internal(
-                    run_id=run_id,
-                    run_uuid=run_uuid,
-                    limit=2999,  # Get comprehensive manifest data
-                )
-
-                # Parse and structure the manifest data
-                run_analysis = await _parse_manifest_for_analysis(
+        async def analyze_run(run_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await _analyze_single_run(
                     run_id,
-                    run_response,
-                    manifest_logs,
+                    omics_client,
                     cost_analyzer=cost_analyzer,
                     instance_recommender=instance_recommender,
+                    headroom=headroom,
                     region=region,
                 )
 
-                if run_analysis:
-                    analysis_results['runs'].append(run_analysis)
-
-            except Exception as e:
-                logger.error(f'Error processing run {run_id}: {str(e)}')
-                # Continue with other runs rather than failing completely
-                continue
+        run_analyses = await asyncio.gather(*(analyze_run(run_id) for run_id in run_ids))
+        analysis_results['runs'] = [analysis for analysis in run_analyses if analysis]
 
         # Calculate grand total cost across all runs
         if analysis_results['runs']:
@@ -942,6 +926,73 @@ async def _get_run_analysis_data(
         return {}
 
 
+async def _analyze_single_run(
+    run_id: str,
+    omics_client: Any,
+    cost_analyzer: CostAnalyzer,
+    instance_recommender: InstanceRecommender,
+    headroom: float = DEFAULT_HEADROOM,
+    region: str = DEFAULT_REGION,
+) -> Optional[Dict[str, Any]]:
+    """Fetch and parse the manifest of one run, reusing cached analyses of completed runs.
+
+    Args:
+        run_id: The run ID to analyze
+        omics_client: HealthOmics client
+        cost_analyzer: CostAnalyzer for cost calculations
+        instance_recommender: InstanceRecommender for recommendations
+        headroom: Headroom percentage used by the instance recommender
+        region: AWS region for pricing lookups
+
+    Returns:
+        Dictionary with run analysis data, or None if the run could not be analyzed
+    """
+    try:
+        logger.debug(f'Processing run {run_id}')
+
+        # Get basic run information
+        loop = asyncio.get_event_loop()
+        run_response = await loop.run_in_executor(None, lambda: omics_client.get_run(id=run_id))
+        run_uuid = run_response.get('uuid')
+
+        if not run_uuid:
+            logger.warning(f'No UUID found for run {run_id}, skipping manifest analysis')
+            return None
+
+        # The manifest of a completed run never changes
+        cached_analysis = ManifestAnalysisCache.get(run_uuid, headroom, region)
+        if cached_analysis is not None:
+            return cached_analysis
+
+        # Get manifest logs
+        manifest_logs = await get_run_manifest_logs_internal(
+            run_id=run_id,
+            run_uuid=run_uuid,
+            limit=2999,  # Get comprehensive manifest data
+        )
+
+        # Parse and structure the manifest data
+        run_analysis = await _parse_manifest_for_analysis(
+            run_id,
+            run_response,
+            manifest_logs,
+            cost_analyzer=cost_analyzer,
+            instance_recommender=instance_recommender,
+            region=region,
+        )
+
+        if run_analysis:
+            ManifestAnalysisCache.put(
+                run_uuid, headroom, region, run_response.get('status', ''), run_analysis
+            )
+        return run_analysis
+
+    except Exception as e:
+        logger.error(f'Error processing run {run_id}: {str(e)}')
+        # Continue with other runs rather than failing completely
+        return None
+
+
 async def _parse_manifest_for_analysis(
     run_id: str,
     run_response: Any,
@@ -952,6 +1003,44 @@ async def _parse_manifest_for_analysis(
 ) -> Optional[Dict[str, Any]]:
     """Parse manifest logs to extract key metrics for analysis.
 
+    Parsing runs in a worker thread, since pricing lookups made while costing
+    tasks are blocking API calls.
+
+    Args:
+        run_id: The run ID being analyzed
+        run_response: Response from get_run API call
+        manifest_logs: Manifest log events from CloudWatch
+        cost_analyzer: Optional CostAnalyzer for cost calculations
+        instance_recommender: Optional InstanceRecommender for recommendations
+        region: AWS region for pricing lookups
+
+    Returns:
+        Dictionary with run analysis data, or None on error
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None,
+        lambda: _parse_manifest(
+            run_id,
+            run_response,
+            manifest_logs,
+            cost_analyzer=cost_analyzer,
+            instance_recommender=instance_recommender,
+            region=region,
+        ),
+    )
+
+
+def _parse_manifest(
+    run_id: str,
+    run_response: Any,
+    manifest_logs: Dict[str, Any],
+    cost_analyzer: Optional[CostAnalyzer] = None,
+    instance_recommender: Optional[InstanceRecommender] = None,
+    region: str = DEFAULT_REGION,
+) -> Optional[Dict[str, Any]]:
+    """Synchronously parse manifest logs to extract key metrics for analysis.
+
     Args:
         run_id: The run ID being analyzed
         run_response: Response from get_run API call
@@ -1182,25 +1271,23 @@ def _aggregate_task_metrics(
 
 
 def _aggregate_cross_run_metrics(
-    runs_data: List[Dict[str, Any]],
+    runs_data: Iterable[Dict[str, Any]],
     instance_recommender: Optional[InstanceRecommender] = None,
 ) -> List[Dict[str, Any]]:
     """Aggregate metrics per task base name across multiple runs.
 
     Groups tasks from multiple runs by their normalized base name and calculates
     cross-run aggregate metrics including run count, total task count, runtime
-    statistics, utilization ratios, and costs.
+    statistics, utilization ratios, and costs. Runs are folded into running totals
+    one at a time, so no table of all tasks across runs is built.
 
     Args:
-        runs_data: List of run data dictionaries with runInfo and taskMetrics
+        runs_data: Iterable of run data dictionaries with runInfo and taskMetrics
         instance_recommender: Optional InstanceRecommender for sizing recommendations
 
     Returns:
         List of cross-run aggregated task metric dictionaries
     """
-    if not runs_data:
-        return []
-
     # Use TaskAggregator to aggregate tasks across runs
     aggregator = TaskAggregator()
     aggregated_df = aggregator.aggregate_cross_run_tasks(runs_data)
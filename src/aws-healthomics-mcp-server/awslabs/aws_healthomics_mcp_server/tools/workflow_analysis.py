@@ -14,6 +14,8 @@
 
 """Workflow analysis tools for the AWS HealthOmics MCP server."""
 
+import asyncio
+from awslabs.aws_healthomics_mcp_server.analysis.log_summarizer import LogSummarizer
 from awslabs.aws_healthomics_mcp_server.utils.aws_utils import get_logs_client
 from awslabs.aws_healthomics_mcp_server.utils.error_utils import handle_tool_error
 from botocore.exceptions import ClientError
@@ -21,7 +23,36 @@ from datetime import datetime, timezone
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+# Largest number of events CloudWatch Logs returns in one page
+MAX_LOG_PAGE_EVENTS = 10000
+
+# Default budgets of log message bytes read when following pages
+DEFAULT_LOG_MAX_BYTES = 1024 * 1024
+DEFAULT_SUMMARY_MAX_BYTES = 16 * 1024 * 1024
+
+# Maximum pages read per call (GetLogEvents may return empty pages before the end)
+MAX_LOG_PAGES = 200
+
+
+def _to_epoch_millis(timestamp: Any) -> int:
+    """Convert an ISO format timestamp to milliseconds since the epoch."""
+    # Ensure the timestamp is a string before calling replace
+    timestamp_str = str(timestamp) if not isinstance(timestamp, str) else timestamp
+    timestamp_dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    return int(timestamp_dt.timestamp() * 1000)
+
+
+def _format_log_event(event: Dict[str, Any]) -> Dict[str, str]:
+    """Convert a CloudWatch Logs event to a timestamp in UTC ISO format and a message."""
+    timestamp_ms = event.get('timestamp', 0)
+    timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return {
+        'timestamp': timestamp_dt.isoformat().replace('+00:00', 'Z'),
+        'message': event.get('message', ''),
+    }
 
 
 async def _get_logs_from_stream(
@@ -60,31 +91,17 @@ async def _get_logs_from_stream(
         params['nextToken'] = next_token
 
     if start_time:
-        # Ensure start_time is a string before calling replace
-        start_time_str = str(start_time) if not isinstance(start_time, str) else start_time
-        start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-        params['startTime'] = int(start_dt.timestamp() * 1000)
+        params['startTime'] = _to_epoch_millis(start_time)
 
     if end_time:
-        # Ensure end_time is a string before calling replace
-        end_time_str = str(end_time) if not isinstance(end_time, str) else end_time
-        end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-        params['endTime'] = int(end_dt.timestamp() * 1000)
+        params['endTime'] = _to_epoch_millis(end_time)
 
-    response = client.get_log_events(**params)
+    # Run the blocking call in a worker thread so concurrent log reads overlap
+    loop = asyncio.get_event_loop()
+    response = await loop.run_in_executor(None, lambda: client.get_log_events(**params))
 
     # Transform the response to a more user-friendly format
-    events = []
-    for event in response.get('events', []):
-        # Convert timestamp from milliseconds to UTC ISO format
-        timestamp_ms = event.get('timestamp', 0)
-        timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-        events.append(
-            {
-                'timestamp': timestamp_dt.isoformat().replace('+00:00', 'Z'),
-                'message': event.get('message', ''),
-            }
-        )
+    events = [_format_log_event(event) for event in response.get('events', [])]
 
     result = {'events': events}
     if 'nextForwardToken' in response:
@@ -93,6 +110,188 @@ async def _get_logs_from_stream(
     return result
 
 
+async def _iter_log_pages(
+    client,
+    log_group_name: str,
+    log_stream_name: str,
+    start_time: Optional[str],
+    end_time: Optional[str],
+    next_token: Optional[str],
+    start_from_head: bool,
+    filter_pattern: Optional[str],
+    max_events: Optional[int],
+    max_bytes: int,
+) -> AsyncIterator[Tuple[List[Dict[str, str]], Optional[str]]]:
+    """Read pages of a log stream until the end of the stream or a budget is reached.
+
+    With a filter pattern, events are filtered server-side with FilterLogEvents,
+    which always reads in chronological order. Otherwise GetLogEvents pages are
+    followed forward, or backward when not starting from the head.
+
+    Args:
+        client: CloudWatch Logs client
+        log_group_name: Name of the log group
+        log_stream_name: Name of the log stream
+        start_time: Optional start time for log retrieval (ISO format)
+        end_time: Optional end time for log retrieval (ISO format)
+        next_token: Token of the first page to read
+        start_from_head: Whether to start from the beginning (True) or end (False)
+        filter_pattern: Optional CloudWatch Logs filter pattern
+        max_events: Optional maximum number of events to read
+        max_bytes: Stop after the page that reaches this many bytes of messages
+
+    Yields:
+        Tuples of the events of a page and the token of the next page, None at the
+        end of the stream
+    """
+    params: Dict[str, Any] = {'logGroupName': log_group_name}
+    if filter_pattern:
+        fetch_page = client.filter_log_events
+        params['logStreamNames'] = [log_stream_name]
+        params['filterPattern'] = filter_pattern
+    else:
+        fetch_page = client.get_log_events
+        params['logStreamName'] = log_stream_name
+        params['startFromHead'] = start_from_head
+    if start_time:
+        params['startTime'] = _to_epoch_millis(start_time)
+    if end_time:
+        params['endTime'] = _to_epoch_millis(end_time)
+    token_key = 'nextForwardToken' if start_from_head else 'nextBackwardToken'
+
+    loop = asyncio.get_event_loop()
+    events_read = 0
+    bytes_read = 0
+    token = next_token
+    for _ in range(MAX_LOG_PAGES):
+        page_params = dict(params)
+        page_params['limit'] = (
+            min(MAX_LOG_PAGE_EVENTS, max_events - events_read)
+            if max_events
+            else MAX_LOG_PAGE_EVENTS
+        )
+        if token:
+            page_params['nextToken'] = token
+        response = await loop.run_in_executor(None, lambda: fetch_page(**page_params))
+
+        events = [_format_log_event(event) for event in response.get('events', [])]
+        if filter_pattern:
+            page_token = response.get('nextToken')
+        else:
+            page_token = response.get(token_key)
+            # GetLogEvents returns the token it was given at the end of the stream
+            if page_token == token:
+                page_token = None
+        events_read += len(events)
+        bytes_read += sum(len(event['message'].encode('utf-8')) for event in events)
+
+        yield events, page_token
+
+        token = page_token
+        if token is None:
+            return
+        if (max_events and events_read >= max_events) or bytes_read >= max_bytes:
+            return
+
+
+async def _read_logs(
+    client,
+    log_group_name: str,
+    log_stream_name: str,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    limit: int = 100,
+    next_token: Optional[str] = None,
+    start_from_head: bool = True,
+    filter_pattern: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    summarize: bool = False,
+) -> Dict[str, Any]:
+    """Retrieve logs from a log stream, following pages and summarizing if requested.
+
+    Without a filter pattern, byte budget or summary a single page is returned, as
+    by _get_logs_from_stream. Otherwise pages are read until limit events (not
+    applied when summarizing) or max_bytes bytes of messages have been read.
+
+    Args:
+        client: CloudWatch Logs client
+        log_group_name: Name of the log group
+        log_stream_name: Name of the log stream
+        start_time: Optional start time for log retrieval (ISO format)
+        end_time: Optional end time for log retrieval (ISO format)
+        limit: Maximum number of log events to return
+        next_token: Token for pagination
+        start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        filter_pattern: Optional CloudWatch Logs filter pattern applied server-side
+        max_bytes: Optional budget of log message bytes to read
+        summarize: Whether to return a summary instead of the log events
+
+    Returns:
+        Dictionary containing log events or their summary, and next token if available
+    """
+    # Handle Field objects for optional parameters (FastMCP compatibility)
+    if not isinstance(filter_pattern, (str, type(None))):
+        filter_pattern = getattr(filter_pattern, 'default', None)
+    if not isinstance(max_bytes, (int, type(None))):
+        max_bytes = getattr(max_bytes, 'default', None)
+    if not isinstance(summarize, bool):
+        summarize = getattr(summarize, 'default', False)
+
+    if not filter_pattern and max_bytes is None and not summarize:
+        return await _get_logs_from_stream(
+            client,
+            log_group_name,
+            log_stream_name,
+            start_time,
+            end_time,
+            limit,
+            next_token,
+            start_from_head,
+        )
+
+    default_max_bytes = DEFAULT_SUMMARY_MAX_BYTES if summarize else DEFAULT_LOG_MAX_BYTES
+    summarizer = LogSummarizer() if summarize else None
+    # Pages read backward arrive newest first; they are reordered chronologically
+    reverse_pages = not start_from_head and not filter_pattern
+    pages: List[List[Dict[str, str]]] = []
+    pages_read = 0
+    bytes_read = 0
+    token = next_token
+    async for events, token in _iter_log_pages(
+        client,
+        log_group_name,
+        log_stream_name,
+        start_time,
+        end_time,
+        next_token,
+        start_from_head,
+        filter_pattern,
+        None if summarize else limit,
+        max_bytes if max_bytes is not None else default_max_bytes,
+    ):
+        pages_read += 1
+        bytes_read += sum(len(event['message'].encode('utf-8')) for event in events)
+        if summarizer is not None:
+            for event in events:
+                summarizer.add(event)
+        else:
+            pages.append(events)
+
+    if reverse_pages:
+        pages.reverse()
+
+    result: Dict[str, Any]
+    if summarizer is not None:
+        result = {'summary': summarizer.to_dict()}
+    else:
+        result = {'events': [event for page in pages for event in page]}
+    result['pagesRead'] = pages_read
+    result['bytesRead'] = bytes_read
+    if token:
+        result['nextToken'] = token
+    return result
+
+
 async def get_run_logs(
     ctx: Context,
     run_id: str = Field(
@@ -121,6 +320,22 @@ async def get_run_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    filter_pattern: Optional[str] = Field(
+        None,
+        description='Optional CloudWatch Logs filter pattern (e.g. "ERROR" or "?Exception ?Killed"). '
+        'Only matching events are read, filtered server-side',
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        description='Follow further pages until limit events or about this many bytes of log '
+        'messages are read, instead of returning a single page',
+        ge=1,
+    ),
+    summarize: bool = Field(
+        False,
+        description='Return event counts, log level counts and clustered error messages '
+        'instead of the log events. Reads up to max_bytes (default 16 MiB) regardless of limit',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -147,18 +362,21 @@ async def get_run_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        filter_pattern: Optional CloudWatch Logs filter pattern applied server-side
+        max_bytes: Optional budget of log message bytes to read across pages
+        summarize: Whether to return a summary instead of the log events
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
     Returns:
-        Dictionary containing log events and next token if available
+        Dictionary containing log events (or their summary) and next token if available
     """
     client = get_logs_client(region_name=aws_region, profile_name=aws_profile)
     log_group_name = '/aws/omics/WorkflowLog'
     log_stream_name = f'run/{run_id}'
 
     try:
-        return await _get_logs_from_stream(
+        return await _read_logs(
             client,
             log_group_name,
             log_stream_name,
@@ -167,6 +385,9 @@ async def get_run_logs(
             limit,
             next_token,
             start_from_head,
+            filter_pattern,
+            max_bytes,
+            summarize,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving run logs')
@@ -198,30 +419,16 @@ async def _get_run_manifest_logs_internal(
             params['nextToken'] = next_token
 
         if start_time:
-            # Ensure start_time is a string before calling replace
-            start_time_str = str(start_time) if not isinstance(start_time, str) else start_time
-            start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-            params['startTime'] = int(start_dt.timestamp() * 1000)
+            params['startTime'] = _to_epoch_millis(start_time)
 
         if end_time:
-            # Ensure end_time is a string before calling replace
-            end_time_str = str(end_time) if not isinstance(end_time, str) else end_time
-            end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-            params['endTime'] = int(end_dt.timestamp() * 1000)
+            params['endTime'] = _to_epoch_millis(end_time)
 
-        response = client.get_log_events(**params)
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(None, lambda: client.get_log_events(**params))
 
         # Transform the response to a more user-friendly format
-        events = []
-        for event in response.get('events', []):
-            timestamp_ms = event.get('timestamp', 0)
-            timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            events.append(
-                {
-                    'timestamp': timestamp_dt.isoformat().replace('+00:00', 'Z'),
-                    'message': event.get('message', ''),
-                }
-            )
+        events = [_format_log_event(event) for event in response.get('events', [])]
 
         return {
             'events': events,
@@ -274,6 +481,22 @@ async def get_run_manifest_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    filter_pattern: Optional[str] = Field(
+        None,
+        description='Optional CloudWatch Logs filter pattern (e.g. "ERROR" or "?Exception ?Killed"). '
+        'Only matching events are read, filtered server-side',
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        description='Follow further pages until limit events or about this many bytes of log '
+        'messages are read, instead of returning a single page',
+        ge=1,
+    ),
+    summarize: bool = Field(
+        False,
+        description='Return event counts, log level counts and clustered error messages '
+        'instead of the log events. Reads up to max_bytes (default 16 MiB) regardless of limit',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -300,17 +523,20 @@ async def get_run_manifest_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        filter_pattern: Optional CloudWatch Logs filter pattern applied server-side
+        max_bytes: Optional budget of log message bytes to read across pages
+        summarize: Whether to return a summary instead of the log events
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
     Returns:
-        Dictionary containing log events and next token if available
+        Dictionary containing log events (or their summary) and next token if available
     """
     client = get_logs_client(region_name=aws_region, profile_name=aws_profile)
     log_group_name = '/aws/omics/WorkflowLog'
     log_stream_name = f'manifest/run/{run_id}/{run_uuid}' if run_uuid else f'manifest/run/{run_id}'
     try:
-        return await _get_logs_from_stream(
+        return await _read_logs(
             client,
             log_group_name,
             log_stream_name,
@@ -319,6 +545,9 @@ async def get_run_manifest_logs(
             limit,
             next_token,
             start_from_head,
+            filter_pattern,
+            max_bytes,
+            summarize,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving manifest logs')
@@ -352,6 +581,22 @@ async def get_run_engine_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    filter_pattern: Optional[str] = Field(
+        None,
+        description='Optional CloudWatch Logs filter pattern (e.g. "ERROR" or "?Exception ?Killed"). '
+        'Only matching events are read, filtered server-side',
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        description='Follow further pages until limit events or about this many bytes of log '
+        'messages are read, instead of returning a single page',
+        ge=1,
+    ),
+    summarize: bool = Field(
+        False,
+        description='Return event counts, log level counts and clustered error messages '
+        'instead of the log events. Reads up to max_bytes (default 16 MiB) regardless of limit',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -377,18 +622,21 @@ async def get_run_engine_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        filter_pattern: Optional CloudWatch Logs filter pattern applied server-side
+        max_bytes: Optional budget of log message bytes to read across pages
+        summarize: Whether to return a summary instead of the log events
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
     Returns:
-        Dictionary containing log events and next token if available
+        Dictionary containing log events (or their summary) and next token if available
     """
     client = get_logs_client(region_name=aws_region, profile_name=aws_profile)
     log_group_name = '/aws/omics/WorkflowLog'
     log_stream_name = f'run/{run_id}/engine'
 
     try:
-        return await _get_logs_from_stream(
+        return await _read_logs(
             client,
             log_group_name,
             log_stream_name,
@@ -397,6 +645,9 @@ async def get_run_engine_logs(
             limit,
             next_token,
             start_from_head,
+            filter_pattern,
+            max_bytes,
+            summarize,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving engine logs')
@@ -434,6 +685,22 @@ async def get_task_logs(
         True,
         description='Whether to start from the beginning (True) or end (False) of the log stream',
     ),
+    filter_pattern: Optional[str] = Field(
+        None,
+        description='Optional CloudWatch Logs filter pattern (e.g. "ERROR" or "?Exception ?Killed"). '
+        'Only matching events are read, filtered server-side',
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        description='Follow further pages until limit events or about this many bytes of log '
+        'messages are read, instead of returning a single page',
+        ge=1,
+    ),
+    summarize: bool = Field(
+        False,
+        description='Return event counts, log level counts and clustered error messages '
+        'instead of the log events. Reads up to max_bytes (default 16 MiB) regardless of limit',
+    ),
     aws_profile: Optional[str] = Field(
         None,
         description='AWS profile name for this operation. Overrides the default credential chain.',
@@ -459,18 +726,21 @@ async def get_task_logs(
         limit: Maximum number of log events to return (default: 100)
         next_token: Token for pagination from a previous response
         start_from_head: Whether to start from the beginning (True) or end (False) of the log stream
+        filter_pattern: Optional CloudWatch Logs filter pattern applied server-side
+        max_bytes: Optional budget of log message bytes to read across pages
+        summarize: Whether to return a summary instead of the log events
         aws_profile: Optional AWS profile name override
         aws_region: Optional AWS region override
 
     Returns:
-        Dictionary containing log events and next token if available
+        Dictionary containing log events (or their summary) and next token if available
     """
     client = get_logs_client(region_name=aws_region, profile_name=aws_profile)
     log_group_name = '/aws/omics/WorkflowLog'
     log_stream_name = f'run/{run_id}/task/{task_id}'
 
     try:
-        return await _get_logs_from_stream(
+        return await _read_logs(
             client,
             log_group_name,
             log_stream_name,
@@ -479,6 +749,9 @@ async def get_task_logs(
             limit,
             next_token,
             start_from_head,
+            filter_pattern,
+            max_bytes,
+            summarize,
         )
     except Exception as e:
         return await handle_tool_error(ctx, e, 'Error retrieving task logs')
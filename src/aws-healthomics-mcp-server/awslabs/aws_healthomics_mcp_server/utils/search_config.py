@@ -17,6 +17,8 @@
 import os
 from awslabs.aws_healthomics_mcp_server.consts import (
     DEFAULT_CACHE_CLEANUP_KEEP_RATIO,
+    DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL,
+    DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS,
     DEFAULT_GENOMICS_SEARCH_ENABLE_HEALTHOMICS,
     DEFAULT_GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH,
     DEFAULT_GENOMICS_SEARCH_MAX_CONCURRENT,
@@ -25,15 +27,21 @@ from awslabs.aws_healthomics_mcp_server.consts import (
     DEFAULT_GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE,
     DEFAULT_GENOMICS_SEARCH_MAX_TAG_CACHE_SIZE,
     DEFAULT_GENOMICS_SEARCH_RESULT_CACHE_TTL,
+    DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE,
     DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL,
     DEFAULT_GENOMICS_SEARCH_TIMEOUT,
     ERROR_INVALID_S3_BUCKET_PATH,
+    GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL_ENV,
+    GENOMICS_SEARCH_CATALOG_MAX_STALENESS_ENV,
+    GENOMICS_SEARCH_CATALOG_PATH_ENV,
     GENOMICS_SEARCH_ENABLE_HEALTHOMICS_ENV,
     GENOMICS_SEARCH_ENABLE_S3_TAG_SEARCH_ENV,
     GENOMICS_SEARCH_MAX_CONCURRENT_ENV,
     GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE_ENV,
     GENOMICS_SEARCH_RESULT_CACHE_TTL_ENV,
     GENOMICS_SEARCH_S3_BUCKETS_ENV,
+    GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS_ENV,
+    GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE_ENV,
     GENOMICS_SEARCH_TAG_CACHE_TTL_ENV,
     GENOMICS_SEARCH_TIMEOUT_ENV,
 )
@@ -43,7 +51,7 @@ from awslabs.aws_healthomics_mcp_server.utils.s3_utils import (
     validate_bucket_access,
 )
 from loguru import logger
-from typing import List
+from typing import List, Optional
 
 
 def get_genomics_search_config() -> SearchConfig:
@@ -77,6 +85,15 @@ def get_genomics_search_config() -> SearchConfig:
     result_cache_ttl = get_result_cache_ttl()
     tag_cache_ttl = get_tag_cache_ttl()
 
+    # Get persistent catalog configuration
+    catalog_path = get_catalog_path()
+    catalog_max_staleness = get_catalog_max_staleness()
+    catalog_full_sync_interval = get_catalog_full_sync_interval()
+
+    # Get S3 Inventory listing configuration
+    s3_inventory_locations = get_s3_inventory_locations()
+    s3_inventory_max_age = get_s3_inventory_max_age()
+
     return SearchConfig(
         s3_bucket_paths=s3_bucket_paths,
         max_concurrent_searches=max_concurrent,
@@ -90,6 +107,11 @@ def get_genomics_search_config() -> SearchConfig:
         max_result_cache_size=DEFAULT_GENOMICS_SEARCH_MAX_RESULT_CACHE_SIZE,
         max_pagination_cache_size=DEFAULT_GENOMICS_SEARCH_MAX_PAGINATION_CACHE_SIZE,
         cache_cleanup_keep_ratio=DEFAULT_CACHE_CLEANUP_KEEP_RATIO,
+        catalog_path=catalog_path,
+        catalog_max_staleness_seconds=catalog_max_staleness,
+        catalog_full_sync_interval_seconds=catalog_full_sync_interval,
+        s3_inventory_locations=s3_inventory_locations,
+        s3_inventory_max_age_seconds=s3_inventory_max_age,
     )
 
 
@@ -309,6 +331,120 @@ def get_tag_cache_ttl() -> int:
         return DEFAULT_GENOMICS_SEARCH_TAG_CACHE_TTL
 
 
+def get_catalog_path() -> Optional[str]:
+    """Get the persistent catalog database path from environment variables.
+
+    Returns:
+        Absolute path of the catalog database, or None if the catalog is disabled
+    """
+    catalog_path = os.environ.get(GENOMICS_SEARCH_CATALOG_PATH_ENV, '').strip()
+    if not catalog_path:
+        return None
+    return os.path.abspath(os.path.expanduser(catalog_path))
+
+
+def get_catalog_max_staleness() -> int:
+    """Get the catalog staleness bound in seconds from environment variables.
+
+    Returns:
+        Maximum age of a catalogued listing before it is synced incrementally
+    """
+    try:
+        staleness = int(
+            os.environ.get(
+                GENOMICS_SEARCH_CATALOG_MAX_STALENESS_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS),
+            )
+        )
+        if staleness < 0:
+            logger.warning(
+                f'Invalid catalog max staleness value: {staleness}. Using default: {DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS
+        return staleness
+    except ValueError:
+        logger.warning(
+            f'Invalid catalog max staleness value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_CATALOG_MAX_STALENESS
+
+
+def get_catalog_full_sync_interval() -> int:
+    """Get the catalog full sync interval in seconds from environment variables.
+
+    Returns:
+        Maximum age of the last full listing of a catalogued scope
+    """
+    try:
+        interval = int(
+            os.environ.get(
+                GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL),
+            )
+        )
+        if interval <= 0:
+            logger.warning(
+                f'Invalid catalog full sync interval value: {interval}. Using default: {DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL
+        return interval
+    except ValueError:
+        logger.warning(
+            f'Invalid catalog full sync interval value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL
+
+
+def get_s3_inventory_locations() -> List[str]:
+    """Get the S3 Inventory report locations from environment variables.
+
+    Locations are S3 paths or local directories. Invalid S3 paths are skipped
+    with a warning, since buckets without an inventory are still listed live.
+
+    Returns:
+        List of inventory locations (empty if the inventory backend is disabled)
+    """
+    locations_env = os.environ.get(GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS_ENV, '').strip()
+    locations = []
+    for location in (path.strip() for path in locations_env.split(',')):
+        if not location:
+            continue
+        if not location.startswith('s3://'):
+            locations.append(os.path.abspath(os.path.expanduser(location)))
+            continue
+        try:
+            locations.append(validate_and_normalize_s3_path(location))
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid S3 inventory location '{location}': {e}")
+    return locations
+
+
+def get_s3_inventory_max_age() -> int:
+    """Get the maximum S3 Inventory snapshot age in seconds from environment variables.
+
+    Returns:
+        Maximum age of an inventory snapshot used instead of live listing
+    """
+    try:
+        max_age = int(
+            os.environ.get(
+                GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE_ENV,
+                str(DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE),
+            )
+        )
+        if max_age <= 0:
+            logger.warning(
+                f'Invalid S3 inventory max age value: {max_age}. Using default: {DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE}'
+            )
+            return DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE
+        return max_age
+    except ValueError:
+        logger.warning(
+            f'Invalid S3 inventory max age value in environment. Using default: {DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE}'
+        )
+        return DEFAULT_GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE
+
+
 def validate_bucket_access_permissions() -> List[str]:
     """Validate that we have access to all configured S3 buckets.
 
@@ -580,23 +580,29 @@ class TestFileAssociationEngine:
         group_type = self.engine._determine_group_type(primary, associated)
         assert group_type == 'fasta_bwa_dict'
 
-    def test_regex_error_handling(self):
-        """Test handling of regex errors in association patterns."""
-        # Create a mock file map
-        file_map = {
-            's3://bucket/test.bam': self.create_test_file(
-                's3://bucket/test.bam', GenomicsFileType.BAM
-            )
-        }
+    def test_determine_group_type_uses_exact_extension(self):
+        """Genomics extensions earlier in a file name do not decide the group type."""
+        primary = self.create_test_file('s3://bucket/x.fasta.bcf', GenomicsFileType.BCF)
+        associated = [self.create_test_file('s3://bucket/x.fasta.bcf.csi', GenomicsFileType.CSI)]
+        assert self.engine._determine_group_type(primary, associated) == 'bcf_index'
 
-        # Test with a file that might cause regex issues
-        primary_file = self.create_test_file('s3://bucket/test[invalid].bam', GenomicsFileType.BAM)
+        primary = self.create_test_file('s3://bucket/x.vcf.gz', GenomicsFileType.VCF)
+        associated = [self.create_test_file('s3://bucket/x.vcf.gz.tbi', GenomicsFileType.TBI)]
+        assert self.engine._determine_group_type(primary, associated) == 'vcf_index'
 
-        # This should not raise an exception even with potentially problematic regex patterns
-        associated_files = self.engine._find_associated_files(primary_file, file_map)
+        primary = self.create_test_file('s3://bucket/fastq_dir/x.bcf', GenomicsFileType.BCF)
+        associated = [
+            self.create_test_file('s3://bucket/fastq_dir/x_2.bcf.csi', GenomicsFileType.CSI)
+        ]
+        assert self.engine._determine_group_type(primary, associated) == 'bcf_index'
 
-        # Should return empty list if no valid associations found
-        assert isinstance(associated_files, list)
+        groups = self.engine.find_associations(
+            [
+                self.create_test_file('s3://bucket/x.fasta.bcf', GenomicsFileType.BCF),
+                self.create_test_file('s3://bucket/x.fasta.bcf.csi', GenomicsFileType.CSI),
+            ]
+        )
+        assert [group.group_type for group in groups] == ['bcf_index']
 
     def test_invalid_file_type_in_determine_group_type(self):
         """Test _determine_group_type with unknown file types."""
@@ -641,104 +647,11 @@ class TestFileAssociationEngine:
         # Should still process the file
         assert len(groups) >= 1
 
-    def test_compiled_patterns_initialization(self):
-        """Test that patterns are pre-compiled during initialization."""
-        engine = FileAssociationEngine()
-
-        # Verify compiled patterns exist
-        assert hasattr(engine, '_compiled_patterns')
-        assert len(engine._compiled_patterns) == len(FileAssociationEngine.ASSOCIATION_PATTERNS)
-
-        # Verify each pattern is a compiled regex
-        import re
-
-        for compiled_pattern, assoc_pattern, group_type in engine._compiled_patterns:
-            assert isinstance(compiled_pattern, re.Pattern)
-            assert isinstance(assoc_pattern, str)
-            assert isinstance(group_type, str)
-
-    def test_extension_pattern_map_initialization(self):
-        """Test that extension pattern map is built during initialization."""
-        engine = FileAssociationEngine()
-
-        # Verify extension map exists
-        assert hasattr(engine, '_extension_pattern_map')
-        assert isinstance(engine._extension_pattern_map, dict)
-
-        # Verify common extensions are mapped
-        expected_extensions = ['.bam', '.cram', '.fastq', '.fasta', '.vcf']
-        for ext in expected_extensions:
-            assert ext in engine._extension_pattern_map
-            assert isinstance(engine._extension_pattern_map[ext], list)
-            assert len(engine._extension_pattern_map[ext]) > 0
-
-    def test_get_relevant_pattern_indices_bam(self):
-        """Test pattern index filtering for BAM files."""
-        engine = FileAssociationEngine()
-
-        # Test BAM file
-        indices = engine._get_relevant_pattern_indices('s3://bucket/sample.bam')
-        assert isinstance(indices, list)
-        assert len(indices) > 0
-
-        # Verify indices are valid
-        for idx in indices:
-            assert 0 <= idx < len(engine._compiled_patterns)
-
-        # BAM patterns should be included
-        bam_patterns_found = False
-        for idx in indices:
-            _, _, group_type = engine._compiled_patterns[idx]
-            if 'bam' in group_type:
-                bam_patterns_found = True
-                break
-        assert bam_patterns_found
-
-    def test_get_relevant_pattern_indices_fastq(self):
-        """Test pattern index filtering for FASTQ files."""
-        engine = FileAssociationEngine()
-
-        # Test FASTQ file
-        indices = engine._get_relevant_pattern_indices('s3://bucket/sample_R1.fastq.gz')
-        assert isinstance(indices, list)
-        assert len(indices) > 0
-
-        # FASTQ patterns should be included
-        fastq_patterns_found = False
-        for idx in indices:
-            _, _, group_type = engine._compiled_patterns[idx]
-            if 'fastq' in group_type:
-                fastq_patterns_found = True
-                break
-        assert fastq_patterns_found
-
-    def test_get_relevant_pattern_indices_unknown_extension(self):
-        """Test pattern index filtering for unknown file extensions."""
+    def test_common_associations(self):
+        """Test the associations of common primary file types."""
         engine = FileAssociationEngine()
 
-        # Test file with unknown extension
-        indices = engine._get_relevant_pattern_indices('s3://bucket/sample.xyz')
-        assert isinstance(indices, list)
-
-        # Should return all patterns when extension is unknown
-        assert len(indices) == len(engine._compiled_patterns)
-
-    def test_get_relevant_pattern_indices_case_insensitive(self):
-        """Test that pattern index filtering is case-insensitive."""
-        engine = FileAssociationEngine()
-
-        # Test with uppercase extension
-        indices_upper = engine._get_relevant_pattern_indices('s3://bucket/sample.BAM')
-        indices_lower = engine._get_relevant_pattern_indices('s3://bucket/sample.bam')
-
-        # Should return same indices regardless of case
-        assert indices_upper == indices_lower
-
-    def test_compiled_patterns_preserve_functionality(self):
-        """Test that pre-compiled patterns produce same results as original implementation."""
-        engine = FileAssociationEngine()
-
-        # Test various file associations to ensure compiled patterns work correctly
+        # Test various file associations
         test_cases = [
             # BAM with index
             (
@@ -800,55 +713,8 @@ class TestFileAssociationEngine:
         # Performance should be reasonable (< 1 second for 200 files)
         assert elapsed_time < 1.0, f'Performance test failed: took {elapsed_time:.3f}s'
 
-    def test_extension_map_coverage(self):
-        """Test that extension map covers all major genomics file types."""
-        engine = FileAssociationEngine()
-
-        # Test that all major file types have pattern mappings
-        major_extensions = {
-            '.bam': 'bam',
-            '.cram': 'cram',
-            '.fastq': 'fastq',
-            '.fastq.gz': 'fastq',
-            '.fasta': 'fasta',
-            '.fa': 'fasta',
-            '.vcf': 'vcf',
-            '.vcf.gz': 'vcf',
-            '.gvcf': 'gvcf',
-            '.bcf': 'bcf',
-        }
-
-        for ext, expected_keyword in major_extensions.items():
-            assert ext in engine._extension_pattern_map, f'Extension {ext} not in map'
-
-            # Verify patterns contain expected keyword
-            indices = engine._extension_pattern_map[ext]
-            found_keyword = False
-            for idx in indices:
-                _, _, group_type = engine._compiled_patterns[idx]
-                if expected_keyword in group_type:
-                    found_keyword = True
-                    break
-            assert found_keyword, f'No patterns with keyword {expected_keyword} for {ext}'
-
-    def test_pattern_optimization_reduces_checks(self):
-        """Test that pattern optimization reduces the number of regex checks."""
-        engine = FileAssociationEngine()
-
-        # For a BAM file, should only check BAM-related patterns
-        bam_indices = engine._get_relevant_pattern_indices('s3://bucket/sample.bam')
-
-        # Should be fewer than total patterns
-        assert len(bam_indices) < len(engine._compiled_patterns)
-
-        # Verify only BAM-related patterns are included
-        for idx in bam_indices:
-            _, _, group_type = engine._compiled_patterns[idx]
-            # BAM patterns should have 'bam' in group_type
-            assert 'bam' in group_type.lower()
-
-    def test_compiled_patterns_handle_special_characters(self):
-        """Test that compiled patterns handle special characters correctly."""
+    def test_associations_with_special_characters(self):
+        """Test that paths with regex special characters are associated."""
         engine = FileAssociationEngine()
 
         # Test with file paths containing special regex characters
@@ -857,26 +723,10 @@ class TestFileAssociationEngine:
             self.create_test_file('s3://bucket/sample[1].bam.bai', GenomicsFileType.BAI),
         ]
 
-        # Should not raise exceptions
         groups = engine.find_associations(files)
-        assert isinstance(groups, list)
-
-    def test_build_extension_pattern_map_completeness(self):
-        """Test that _build_extension_pattern_map creates valid mappings."""
-        engine = FileAssociationEngine()
-
-        ext_map = engine._build_extension_pattern_map()
-
-        # Verify structure
-        assert isinstance(ext_map, dict)
-
-        # Verify all values are lists of integers
-        for ext, indices in ext_map.items():
-            assert isinstance(ext, str)
-            assert isinstance(indices, list)
-            for idx in indices:
-                assert isinstance(idx, int)
-                assert 0 <= idx < len(engine._compiled_patterns)
+        assert len(groups) == 1
+        assert groups[0].group_type == 'bam_index'
+        assert groups[0].associated_files[0].path == 's3://bucket/sample[1].bam.bai'
 
     def test_pattern_matching_with_optimization(self):
         """Test that pattern matching works correctly with optimization enabled."""
@@ -917,23 +767,6 @@ class TestFileAssociationEngine:
             assert len(groups) == 1, f'Failed for {primary_path}'
             assert len(groups[0].associated_files) == 1, f'Failed for {primary_path}'
 
-    def test_multiple_extensions_in_path(self):
-        """Test files with multiple extensions in the path."""
-        engine = FileAssociationEngine()
-
-        # Test file with multiple dots
-        indices = engine._get_relevant_pattern_indices('s3://bucket/sample.sorted.bam')
-        assert len(indices) > 0
-
-        # Should still identify as BAM file
-        bam_patterns_found = False
-        for idx in indices:
-            _, _, group_type = engine._compiled_patterns[idx]
-            if 'bam' in group_type:
-                bam_patterns_found = True
-                break
-        assert bam_patterns_found
-
     def test_fasta_with_bwa_and_dict(self):
         """Test FASTA file with both BWA indexes and dict file."""
         files = [
@@ -980,23 +813,6 @@ class TestFileAssociationEngine:
         assert len(groups) == 1
         assert len(groups[0].associated_files) == 1
 
-    def test_regex_error_in_pattern_matching(self):
-        """Test handling of regex errors during pattern matching."""
-        engine = FileAssociationEngine()
-
-        # Create a file with characters that might cause regex issues
-        primary_file = self.create_test_file('s3://bucket/test(special).bam', GenomicsFileType.BAM)
-        file_map = {
-            's3://bucket/test(special).bam': primary_file,
-            's3://bucket/test(special).bam.bai': self.create_test_file(
-                's3://bucket/test(special).bam.bai', GenomicsFileType.BAI
-            ),
-        }
-
-        # Should handle gracefully without raising exceptions
-        associated_files = engine._find_associated_files(primary_file, file_map)
-        assert isinstance(associated_files, list)
-
     def test_sequence_store_with_index_info_metadata(self):
         """Test sequence store files with _healthomics_index_info metadata."""
         # This metadata should cause the file to be skipped in sequence store associations
@@ -1031,38 +847,74 @@ class TestFileAssociationEngine:
         # Should create a single-file group
         assert len(groups) == 1
 
-    def test_extension_pattern_map_with_compressed_files(self):
-        """Test that compressed file extensions are properly mapped."""
-        engine = FileAssociationEngine()
+    def test_uppercase_extensions(self):
+        """Test that primary file extensions are matched case-insensitively."""
+        files = [
+            self.create_test_file('s3://bucket/SAMPLE.BAM', GenomicsFileType.BAM),
+            self.create_test_file('s3://bucket/SAMPLE.bam.bai', GenomicsFileType.BAI),
+            self.create_test_file('s3://bucket/reads_r1.FASTQ', GenomicsFileType.FASTQ),
+            self.create_test_file('s3://bucket/reads_R2.fastq', GenomicsFileType.FASTQ),
+        ]
 
-        # Test compressed FASTQ files
-        for ext in ['.fastq.gz', '.fastq.bz2']:
-            assert ext in engine._extension_pattern_map
-            indices = engine._extension_pattern_map[ext]
-            assert len(indices) > 0
+        groups = self.engine.find_associations(files)
 
-            # Verify patterns are FASTQ-related
-            for idx in indices:
-                _, _, group_type = engine._compiled_patterns[idx]
-                assert 'fastq' in group_type
+        assert [(g.primary_file.path, g.group_type) for g in groups] == [
+            ('s3://bucket/SAMPLE.BAM', 'bam_index'),
+            ('s3://bucket/reads_r1.FASTQ', 'fastq_pair'),
+        ]
 
-    def test_all_pattern_types_have_compiled_versions(self):
-        """Test that all original patterns have compiled versions."""
-        engine = FileAssociationEngine()
+    def test_extension_in_directory_name(self):
+        """Test that extensions in directory names do not select the file type."""
+        files = [
+            self.create_test_file('s3://bucket/bam_files.bam/sample.vcf', GenomicsFileType.VCF),
+            self.create_test_file(
+                's3://bucket/bam_files.bam/sample.vcf.tbi', GenomicsFileType.TBI
+            ),
+            self.create_test_file('s3://bucket/fasta.fa/reads.bam', GenomicsFileType.BAM),
+            self.create_test_file('s3://bucket/fasta.fa/reads.bai', GenomicsFileType.BAI),
+        ]
+
+        groups = self.engine.find_associations(files)
+
+        assert [(g.primary_file.path, g.group_type) for g in groups] == [
+            ('s3://bucket/bam_files.bam/sample.vcf', 'vcf_index'),
+            ('s3://bucket/fasta.fa/reads.bam', 'bam_index'),
+        ]
 
-        # Verify counts match
-        assert len(engine._compiled_patterns) == len(FileAssociationEngine.ASSOCIATION_PATTERNS)
+    def test_compressed_vcf_index_associations(self):
+        """Test that compressed VCF and GVCF files are associated with their indexes."""
+        files = [
+            self.create_test_file('s3://bucket/calls.vcf.gz', GenomicsFileType.VCF),
+            self.create_test_file('s3://bucket/calls.vcf.gz.csi', GenomicsFileType.CSI),
+            self.create_test_file('s3://bucket/calls.g.vcf.gz', GenomicsFileType.GVCF),
+            self.create_test_file('s3://bucket/calls.g.vcf.gz.tbi', GenomicsFileType.TBI),
+            self.create_test_file('s3://bucket/sample.gvcf.gz', GenomicsFileType.GVCF),
+            self.create_test_file('s3://bucket/sample.gvcf.gz.tbi', GenomicsFileType.TBI),
+        ]
 
-        # Verify each compiled pattern corresponds to an original pattern
-        for idx, (compiled_pat, assoc_pat, group_type) in enumerate(engine._compiled_patterns):
-            orig_primary, orig_assoc, orig_group = FileAssociationEngine.ASSOCIATION_PATTERNS[idx]
+        groups = self.engine.find_associations(files)
 
-            # Verify the pattern strings match
-            assert compiled_pat.pattern == orig_primary
-            assert assoc_pat == orig_assoc
-            assert group_type == orig_group
+        assert [(g.primary_file.path, [f.path for f in g.associated_files]) for g in groups] == [
+            ('s3://bucket/calls.vcf.gz', ['s3://bucket/calls.vcf.gz.csi']),
+            ('s3://bucket/calls.g.vcf.gz', ['s3://bucket/calls.g.vcf.gz.tbi']),
+            ('s3://bucket/sample.gvcf.gz', ['s3://bucket/sample.gvcf.gz.tbi']),
+        ]
 
-            # Verify case-insensitive flag is set
-            import re
+    def test_companion_paths(self):
+        """Test the candidate companion paths of primary files."""
+        bam_file = self.create_test_file('s3://bucket/dir/sample.bam', GenomicsFileType.BAM)
+        assert self.engine._get_companion_paths(bam_file) == [
+            's3://bucket/dir/sample.bam.bai',
+            's3://bucket/dir/sample.bai',
+        ]
+
+        fastq_file = self.create_test_file(
+            's3://bucket/run_1/sample_R1.fastq.gz', GenomicsFileType.FASTQ
+        )
+        assert self.engine._get_companion_paths(fastq_file) == [
+            's3://bucket/run_1/sample_R2.fastq.gz'
+        ]
 
-            assert compiled_pat.flags & re.IGNORECASE
+        # Files without a genomics extension have no companions
+        bed_file = self.create_test_file('s3://bucket/regions.bed', GenomicsFileType.BED)
+        assert self.engine._get_companion_paths(bed_file) == []
@@ -0,0 +1,426 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the persistent genomics listing catalog."""
+
+import pytest
+import threading
+from awslabs.aws_healthomics_mcp_server.models import SearchConfig
+from awslabs.aws_healthomics_mcp_server.search.genomics_catalog import (
+    SYNC_FULL,
+    SYNC_INCREMENTAL,
+    GenomicsCatalog,
+    get_genomics_catalog,
+)
+from awslabs.aws_healthomics_mcp_server.search.healthomics_search_engine import (
+    HealthOmicsSearchEngine,
+)
+from awslabs.aws_healthomics_mcp_server.search.s3_search_engine import S3SearchEngine
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        """Start at a fixed epoch time."""
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def s3_object(key, etag='"e1"', day=1):
+    """Build a list_objects_v2 Contents entry."""
+    return {
+        'Key': key,
+        'Size': 100,
+        'LastModified': datetime(2024, 1, day, tzinfo=timezone.utc),
+        'ETag': etag,
+        'StorageClass': 'STANDARD',
+    }
+
+
+def list_response(objects, next_token=None):
+    """Build a list_objects_v2 response page."""
+    response = {'Contents': objects, 'IsTruncated': next_token is not None}
+    if next_token:
+        response['NextContinuationToken'] = next_token
+    return response
+
+
+def record_catalog_threads(catalog):
+    """Record the threads the SQLite-backed methods of a catalog are called on."""
+    threads = set()
+    for name in (
+        'plan_sync',
+        'scope_state',
+        'begin_sync',
+        'finish_sync',
+        'scope_status',
+        'upsert_s3_objects',
+        'remove_unseen_s3_objects',
+        'list_s3_objects',
+        'get_s3_tags',
+        'put_s3_tags',
+        'upsert_store_records',
+        'remove_unseen_store_records',
+        'list_store_records',
+    ):
+
+        def recorder(*args, _method=getattr(catalog, name), **kwargs):
+            threads.add(threading.get_ident())
+            return _method(*args, **kwargs)
+
+        setattr(catalog, name, recorder)
+    return threads
+
+
+class TestGenomicsCatalog:
+    """Storage, sync planning and invalidation."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def catalog(self, clock):
+        """Create an in-memory catalog."""
+        return GenomicsCatalog(':memory:', clock=clock)
+
+    def test_plan_sync_follows_staleness_bounds(self, catalog, clock):
+        """Never-synced scopes need a full sync, stale ones an incremental one."""
+        scope = 's3://bucket/runs/'
+        assert catalog.plan_sync(scope, 300, 3600) == SYNC_FULL
+
+        catalog.finish_sync(scope, catalog.begin_sync(scope), SYNC_FULL, 'runs/a.bam')
+        assert catalog.plan_sync(scope, 300, 3600) is None
+
+        clock.now += 300
+        assert catalog.plan_sync(scope, 300, 3600) == SYNC_INCREMENTAL
+
+        catalog.finish_sync(scope, catalog.begin_sync(scope), SYNC_INCREMENTAL, 'runs/b.bam')
+        assert catalog.plan_sync(scope, 300, 3600) is None
+        assert catalog.scope_state(scope).marker == 'runs/b.bam'
+
+        clock.now += 3300
+        assert catalog.plan_sync(scope, 300, 3600) == SYNC_FULL
+
+    def test_scope_is_current_as_of_sync_start(self, catalog, clock):
+        """A slow sync reports the time it started, not when it finished."""
+        scope = 's3://bucket/'
+        sync_id = catalog.begin_sync(scope)
+        clock.now += 60
+        catalog.finish_sync(scope, sync_id, SYNC_FULL, None)
+
+        status = catalog.scope_status(scope)
+
+        assert status['staleness_seconds'] == 60
+        assert status['full_sync_age_seconds'] == 60
+
+    def test_list_is_limited_to_prefix(self, catalog):
+        """Objects are listed in key order and only under the requested prefix."""
+        catalog.upsert_s3_objects(
+            'bucket',
+            [s3_object('runs/b.bam'), s3_object('runs/a.bam'), s3_object('runsx/c.bam')],
+            catalog.begin_sync('s3://bucket/'),
+        )
+        catalog.upsert_s3_objects('other', [s3_object('runs/d.bam')], 1)
+
+        objects = catalog.list_s3_objects('bucket', 'runs/')
+
+        assert [obj['Key'] for obj in objects] == ['runs/a.bam', 'runs/b.bam']
+        assert objects[0]['LastModified'] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert objects[0]['StorageClass'] == 'STANDARD'
+
+    def test_full_sync_removes_unseen_objects_and_their_tags(self, catalog):
+        """Objects missing from a full listing are dropped along with cached tags."""
+        first = catalog.begin_sync('s3://bucket/runs/')
+        catalog.upsert_s3_objects(
+            'bucket', [s3_object('runs/a.bam'), s3_object('runs/b.bam')], first
+        )
+        catalog.upsert_s3_objects('bucket', [s3_object('other/c.bam')], first)
+        catalog.put_s3_tags('bucket', {'runs/b.bam': {'k': 'v'}})
+
+        second = catalog.begin_sync('s3://bucket/runs/')
+        catalog.upsert_s3_objects('bucket', [s3_object('runs/a.bam')], second)
+        removed = catalog.remove_unseen_s3_objects('bucket', 'runs/', second)
+
+        assert removed == 1
+        assert [obj['Key'] for obj in catalog.list_s3_objects('bucket', '')] == [
+            'other/c.bam',
+            'runs/a.bam',
+        ]
+        assert catalog.get_s3_tags('bucket', ['runs/b.bam'], 3600) == {}
+
+    def test_tags_are_invalidated_by_etag_change_and_age(self, catalog, clock):
+        """Tags are only served for the object version and time window they were fetched in."""
+        sync_id = catalog.begin_sync('s3://bucket/')
+        catalog.upsert_s3_objects('bucket', [s3_object('a.bam'), s3_object('b.bam')], sync_id)
+        catalog.put_s3_tags('bucket', {'a.bam': {'sample': 'NA12878'}, 'b.bam': {}})
+
+        assert catalog.get_s3_tags('bucket', ['a.bam', 'b.bam', 'c.bam'], 3600) == {
+            'a.bam': {'sample': 'NA12878'},
+            'b.bam': {},
+        }
+
+        catalog.upsert_s3_objects('bucket', [s3_object('a.bam', etag='"e2"')], sync_id)
+        assert catalog.get_s3_tags('bucket', ['a.bam', 'b.bam'], 3600) == {'b.bam': {}}
+
+        clock.now += 3600
+        assert catalog.get_s3_tags('bucket', ['b.bam'], 3600) == {}
+
+    def test_store_records_round_trip_datetimes(self, catalog):
+        """Read set records come back with their datetime fields intact."""
+        created = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        record = {
+            'id': 'rs1',
+            'name': 'sample',
+            'creationTime': created,
+            'sequenceInformation': {},
+        }
+        sync_id = catalog.begin_sync('read_sets:arn')
+        catalog.upsert_store_records('read_sets', 'arn', [record], sync_id)
+
+        assert catalog.list_store_records('read_sets', 'arn') == [record]
+
+        later = catalog.begin_sync('read_sets:arn')
+        assert catalog.remove_unseen_store_records('read_sets', 'arn', later) == 1
+        assert catalog.list_store_records('read_sets', 'arn') == []
+
+    def test_catalog_persists_across_instances(self, tmp_path):
+        """A reopened catalog still holds earlier listings and sync state."""
+        path = str(tmp_path / 'catalog.db')
+        catalog = GenomicsCatalog(path)
+        sync_id = catalog.begin_sync('s3://bucket/')
+        catalog.upsert_s3_objects('bucket', [s3_object('a.bam')], sync_id)
+        catalog.finish_sync('s3://bucket/', sync_id, SYNC_FULL, 'a.bam')
+        catalog.close()
+
+        reopened = GenomicsCatalog(path)
+
+        assert [obj['Key'] for obj in reopened.list_s3_objects('bucket', '')] == ['a.bam']
+        assert reopened.scope_state('s3://bucket/').marker == 'a.bam'
+
+    def test_get_genomics_catalog_is_shared_per_path(self, tmp_path):
+        """The accessor returns one catalog per path, and None when disabled."""
+        path = str(tmp_path / 'nested' / 'catalog.db')
+
+        assert get_genomics_catalog(None) is None
+        assert get_genomics_catalog(path) is get_genomics_catalog(path)
+
+
+class TestS3SearchEngineCatalog:
+    """S3 listing served from and refreshed into the catalog."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def engine(self, clock):
+        """Create an S3 search engine backed by an in-memory catalog."""
+        config = SearchConfig(
+            s3_bucket_paths=['s3://bucket/runs/'],
+            catalog_max_staleness_seconds=300,
+            catalog_full_sync_interval_seconds=3600,
+        )
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value = MagicMock()
+            engine = S3SearchEngine._create_for_testing(config)
+        engine.catalog = GenomicsCatalog(':memory:', clock=clock)
+        return engine
+
+    async def test_first_search_lists_and_later_searches_use_catalog(self, engine):
+        """A fresh catalog answers repeat listings without calling S3."""
+        engine.s3_client.list_objects_v2.side_effect = [
+            list_response([s3_object('runs/a.bam')], next_token='t1'),
+            # Sub-prefix discovery finds none, so listing continues serially
+            list_response([]),
+            list_response([s3_object('runs/b.fastq.gz')]),
+        ]
+
+        first = await engine._list_s3_objects('bucket', 'runs/')
+        second = await engine._list_s3_objects('bucket', 'runs/')
+
+        assert [obj['Key'] for obj in first] == ['runs/a.bam', 'runs/b.fastq.gz']
+        assert second == first
+        assert engine.s3_client.list_objects_v2.call_count == 3
+        assert engine.catalog_scopes['s3://bucket/runs/']['staleness_seconds'] == 0
+
+    async def test_incremental_sync_resumes_after_last_key(self, engine, clock):
+        """Once stale, only keys after the greatest listed key are requested."""
+        engine.s3_client.list_objects_v2.return_value = list_response([s3_object('runs/a.bam')])
+        await engine._list_s3_objects('bucket', 'runs/')
+
+        clock.now += 301
+        engine.s3_client.list_objects_v2.return_value = list_response([s3_object('runs/c.bam')])
+        objects = await engine._list_s3_objects('bucket', 'runs/')
+
+        params = engine.s3_client.list_objects_v2.call_args.kwargs
+        assert params['StartAfter'] == 'runs/a.bam'
+        assert [obj['Key'] for obj in objects] == ['runs/a.bam', 'runs/c.bam']
+
+    async def test_full_sync_reconciles_deletions(self, engine, clock):
+        """A full re-list after the full sync interval drops deleted objects."""
+        engine.s3_client.list_objects_v2.return_value = list_response(
+            [s3_object('runs/a.bam'), s3_object('runs/b.bam')]
+        )
+        await engine._list_s3_objects('bucket', 'runs/')
+
+        clock.now += 3600
+        engine.s3_client.list_objects_v2.return_value = list_response([s3_object('runs/b.bam')])
+        objects = await engine._list_s3_objects('bucket', 'runs/')
+
+        assert 'StartAfter' not in engine.s3_client.list_objects_v2.call_args.kwargs
+        assert [obj['Key'] for obj in objects] == ['runs/b.bam']
+
+    async def test_failed_sync_keeps_scope_stale(self, engine):
+        """An interrupted sync is not recorded, so the next search retries it."""
+        engine.s3_client.list_objects_v2.side_effect = [
+            list_response([s3_object('runs/a.bam')], next_token='t1'),
+            Exception('throttled'),
+        ]
+
+        with pytest.raises(Exception, match='throttled'):
+            await engine._list_s3_objects('bucket', 'runs/')
+
+        assert engine.catalog.scope_state('s3://bucket/runs/') is None
+
+    async def test_tags_are_fetched_once_across_engines(self, engine):
+        """Catalogued tags survive the per-call tag cache."""
+        engine.s3_client.list_objects_v2.return_value = list_response([s3_object('runs/a.bam')])
+        engine.s3_client.get_object_tagging.return_value = {
+            'TagSet': [{'Key': 'sample', 'Value': 'NA12878'}]
+        }
+        await engine._list_s3_objects('bucket', 'runs/')
+
+        first = await engine._get_tags_for_objects_batch('bucket', ['runs/a.bam'])
+        engine._tag_cache.clear()
+        second = await engine._get_tags_for_objects_batch('bucket', ['runs/a.bam'])
+
+        assert first == second == {'runs/a.bam': {'sample': 'NA12878'}}
+        assert engine.s3_client.get_object_tagging.call_count == 1
+
+    async def test_catalog_takes_precedence_over_inventory_in_both_paths(self, engine):
+        """With an inventory also configured, full and paginated listings use the catalog."""
+        engine.inventory = MagicMock()
+        engine.s3_client.list_objects_v2.return_value = list_response(
+            [s3_object('runs/a.bam'), s3_object('runs/b.bam'), s3_object('runs/c.bam')]
+        )
+
+        listed = await engine._list_s3_objects('bucket', 'runs/')
+        first, token, _ = await engine._list_s3_objects_paginated('bucket', 'runs/', None, 2)
+        second, next_token, _ = await engine._list_s3_objects_paginated(
+            'bucket', 'runs/', token, 2
+        )
+
+        assert [obj['Key'] for obj in listed] == ['runs/a.bam', 'runs/b.bam', 'runs/c.bam']
+        assert [obj['Key'] for obj in first + second] == [obj['Key'] for obj in listed]
+        assert next_token is None
+        engine.inventory.latest_snapshot.assert_not_called()
+        assert engine.s3_client.list_objects_v2.call_count == 1
+
+    async def test_catalog_queries_run_off_event_loop(self, engine, clock):
+        """Syncing, listing and tag lookups do not run SQLite on the event loop thread."""
+        threads = record_catalog_threads(engine.catalog)
+        engine.s3_client.list_objects_v2.return_value = list_response([s3_object('runs/a.bam')])
+        engine.s3_client.get_object_tagging.return_value = {'TagSet': []}
+
+        await engine._list_s3_objects('bucket', 'runs/')
+        clock.now += 3600
+        await engine._list_s3_objects('bucket', 'runs/')
+        await engine._get_tags_for_objects_batch('bucket', ['runs/a.bam'])
+
+        assert threads
+        assert threading.get_ident() not in threads
+
+
+class TestHealthOmicsSearchEngineCatalog:
+    """Read set and reference listings served from the catalog."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def engine(self, clock):
+        """Create a HealthOmics search engine backed by an in-memory catalog."""
+        config = SearchConfig(
+            catalog_max_staleness_seconds=300, catalog_full_sync_interval_seconds=3600
+        )
+        engine = HealthOmicsSearchEngine(config)
+        engine.omics_client = MagicMock()
+        engine.catalog = GenomicsCatalog(':memory:', clock=clock)
+        return engine
+
+    async def test_incremental_sync_uses_created_after(self, engine, clock):
+        """Stale stores are refreshed with a createdAfter filter on the newest record."""
+        store_info = {'id': 'store1', 'arn': 'arn:aws:omics:us-east-1:123:sequenceStore/store1'}
+        first_created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        second_created = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        engine.omics_client.list_read_sets.return_value = {
+            'readSets': [{'id': 'rs1', 'creationTime': first_created}]
+        }
+
+        first = await engine._list_store_records_from_catalog('read_sets', 'store1', store_info)
+        again = await engine._list_store_records_from_catalog('read_sets', 'store1', store_info)
+
+        clock.now += 301
+        engine.omics_client.list_read_sets.return_value = {
+            'readSets': [{'id': 'rs2', 'creationTime': second_created}]
+        }
+        refreshed = await engine._list_store_records_from_catalog(
+            'read_sets', 'store1', store_info
+        )
+
+        assert [r['id'] for r in first] == [r['id'] for r in again] == ['rs1']
+        assert engine.omics_client.list_read_sets.call_count == 2
+        params = engine.omics_client.list_read_sets.call_args.kwargs
+        assert params['filter'] == {'createdAfter': first_created}
+        assert [r['id'] for r in refreshed] == ['rs1', 'rs2']
+        assert f'read_sets:{store_info["arn"]}' in engine.catalog_scopes
+
+    async def test_references_listing_is_unfiltered(self, engine):
+        """The catalog keeps every reference; search terms are applied client-side."""
+        engine.omics_client.list_references.return_value = {
+            'references': [{'id': 'ref1', 'name': 'hg38'}]
+        }
+
+        references = await engine._list_store_records_from_catalog(
+            'references', 'store2', {'id': 'store2'}
+        )
+
+        assert references == [{'id': 'ref1', 'name': 'hg38'}]
+        params = engine.omics_client.list_references.call_args.kwargs
+        assert params == {'referenceStoreId': 'store2', 'maxResults': 100}
+
+    async def test_catalog_queries_run_off_event_loop(self, engine, clock):
+        """Store syncs and listings do not run SQLite on the event loop thread."""
+        threads = record_catalog_threads(engine.catalog)
+        engine.omics_client.list_read_sets.return_value = {'readSets': [{'id': 'rs1'}]}
+
+        await engine._list_store_records_from_catalog('read_sets', 'store1', {'id': 'store1'})
+        clock.now += 3600
+        await engine._list_store_records_from_catalog('read_sets', 'store1', {'id': 'store1'})
+
+        assert threads
+        assert threading.get_ident() not in threads
@@ -190,6 +190,47 @@ class TestGenomicsSearchOrchestrator:
         paths = [f.path for f in result]
         assert len(set(paths)) == len(paths)  # All paths should be unique
 
+    def test_get_catalog_status_merges_engine_scopes(self, orchestrator):
+        """Test that catalog staleness from both engines is reported together."""
+        s3_status = {'synced_at': '2024-01-01T00:00:00+00:00', 'staleness_seconds': 12.0}
+        store_status = {'synced_at': '2024-01-01T00:00:05+00:00', 'staleness_seconds': 7.0}
+        orchestrator.s3_engine.catalog_scopes = {'s3://bucket/runs/': s3_status}
+        orchestrator.healthomics_engine.catalog_scopes = {
+            'read_sets:arn:store': store_status,
+            'references:arn:ref': None,
+        }
+
+        assert orchestrator._get_catalog_status() == {
+            's3://bucket/runs/': s3_status,
+            'read_sets:arn:store': store_status,
+        }
+
+    def test_get_catalog_status_without_catalog(self, orchestrator):
+        """Test that no catalog status is reported when engines have no catalog scopes."""
+        assert orchestrator._get_catalog_status() == {}
+
+    def test_get_tag_retrieval_status_counts_since_search_start(self, orchestrator):
+        """Test that tag lookups made and avoided are reported for the current search only."""
+        orchestrator.s3_engine.tag_candidates = 5
+        orchestrator.s3_engine.tag_fetches_avoided = 2
+        counters = orchestrator._get_tag_retrieval_counters()
+
+        orchestrator.s3_engine.tag_candidates = 15
+        orchestrator.s3_engine.tag_fetches_avoided = 9
+
+        assert orchestrator._get_tag_retrieval_status(counters) == {
+            'candidates': 10,
+            'tags_fetched': 3,
+            'tag_fetches_avoided': 7,
+        }
+
+    def test_get_tag_retrieval_status_without_candidates(self, orchestrator):
+        """Test that nothing is reported when no object needed its tags."""
+        counters = orchestrator._get_tag_retrieval_counters()
+
+        assert counters == (0, 0)
+        assert orchestrator._get_tag_retrieval_status(counters) == {}
+
     def test_get_searched_storage_systems_s3_only(self, mock_config):
         """Test getting searched storage systems with S3 only."""
         mock_config.enable_healthomics_search = False
@@ -895,6 +936,7 @@ class TestGenomicsSearchOrchestrator:
                 orchestrator.config.s3_bucket_paths,
                 sample_search_request.file_type,
                 sample_search_request.search_terms,
+                result_limit=sample_search_request.max_results,
             )
 
     @pytest.mark.asyncio
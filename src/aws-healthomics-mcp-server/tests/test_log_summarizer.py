@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for LogSummarizer class."""
+
+from awslabs.aws_healthomics_mcp_server.analysis.log_summarizer import LogSummarizer
+
+
+class TestLogSummarizer:
+    """Test cases for LogSummarizer."""
+
+    def test_message_template_replaces_variable_parts(self):
+        """Timestamps, IDs, URIs, paths and numbers are replaced by placeholders."""
+        template = LogSummarizer.message_template(
+            '2024-01-02T03:04:05.123Z Task 1a2b3c4d-0000-1111-2222-333344445555 failed '
+            'reading s3://bucket/key.bam at /mnt/workflow/x.txt with code 137 (0xdeadbeef)'
+        )
+
+        assert template == (
+            '<TIME> Task <ID> failed reading <URI> at <PATH> with code <N> (<HEX>)'
+        )
+
+    def test_counts_and_clusters(self):
+        """Events are counted by level and errors clustered by template."""
+        summarizer = LogSummarizer()
+        messages = [
+            'INFO starting',
+            'WARNING disk at 91%',
+            'ERROR sample 1 failed',
+            'java.lang.OutOfMemoryError: Java heap space',
+            'ERROR sample 22 failed',
+            'Task exited: Killed',
+        ]
+        for i, message in enumerate(messages):
+            summarizer.add({'timestamp': f't{i}', 'message': message})
+
+        summary = summarizer.to_dict()
+
+        assert summary['eventCount'] == 6
+        assert summary['firstTimestamp'] == 't0'
+        assert summary['lastTimestamp'] == 't5'
+        assert summary['levelCounts'] == {'INFO': 1, 'WARN': 1, 'ERROR': 2}
+        assert summary['errorEventCount'] == 3
+        top = summary['errorClusters'][0]
+        assert top == {
+            'template': 'ERROR sample <N> failed',
+            'count': 2,
+            'firstTimestamp': 't2',
+            'lastTimestamp': 't4',
+            'example': 'ERROR sample 1 failed',
+        }
+
+    def test_cluster_count_is_bounded(self):
+        """Only the largest clusters are reported, with the total number of clusters."""
+        summarizer = LogSummarizer(max_error_clusters=2)
+        for message in ['error a', 'error b', 'error b', 'error c', 'error c', 'error c']:
+            summarizer.add({'timestamp': 't', 'message': message})
+
+        summary = summarizer.to_dict()
+
+        assert summary['errorClusterCount'] == 3
+        assert [c['template'] for c in summary['errorClusters']] == ['error c', 'error b']
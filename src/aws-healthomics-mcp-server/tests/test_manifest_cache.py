@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ManifestAnalysisCache class."""
+
+import pytest
+from awslabs.aws_healthomics_mcp_server.analysis.manifest_cache import ManifestAnalysisCache
+from unittest.mock import patch
+
+
+@pytest.fixture(autouse=True)
+def clear_manifest_cache():
+    """Start every test with an empty cache."""
+    ManifestAnalysisCache.clear()
+    yield
+    ManifestAnalysisCache.clear()
+
+
+class TestManifestAnalysisCache:
+    """Test cases for ManifestAnalysisCache."""
+
+    def test_completed_run_is_cached(self):
+        """Analyses of completed runs are returned for the same headroom and region."""
+        analysis = {'runInfo': {'runId': 'run-1'}, 'taskMetrics': [{'taskName': 'a'}]}
+
+        assert ManifestAnalysisCache.put('uuid-1', 0.2, 'us-east-1', 'COMPLETED', analysis)
+
+        assert ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1') == analysis
+        assert ManifestAnalysisCache.get('uuid-1', 0.3, 'us-east-1') is None
+        assert ManifestAnalysisCache.get('uuid-1', 0.2, 'us-west-2') is None
+
+    @pytest.mark.parametrize('status', ['RUNNING', 'FAILED', 'CANCELLED', ''])
+    def test_other_statuses_are_not_cached(self, status):
+        """Runs that are not completed may still change and are never cached."""
+        assert not ManifestAnalysisCache.put('uuid-1', 0.2, 'us-east-1', status, {'a': 1})
+
+        assert ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1') is None
+
+    def test_cached_analysis_is_copied(self):
+        """Callers cannot modify the cached analysis."""
+        analysis = {'taskMetrics': [{'taskName': 'a'}]}
+        ManifestAnalysisCache.put('uuid-1', 0.2, 'us-east-1', 'COMPLETED', analysis)
+        analysis['taskMetrics'].append({'taskName': 'b'})
+
+        cached = ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1')
+        cached['taskMetrics'].clear()
+
+        assert ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1') == {
+            'taskMetrics': [{'taskName': 'a'}]
+        }
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The cache is bounded, evicting the least recently used analysis."""
+        with patch.object(ManifestAnalysisCache, 'MAX_ENTRIES', 2):
+            for uuid in ('uuid-1', 'uuid-2'):
+                ManifestAnalysisCache.put(uuid, 0.2, 'us-east-1', 'COMPLETED', {'id': uuid})
+            ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1')
+            ManifestAnalysisCache.put('uuid-3', 0.2, 'us-east-1', 'COMPLETED', {'id': 'uuid-3'})
+
+            assert ManifestAnalysisCache.get('uuid-1', 0.2, 'us-east-1') is not None
+            assert ManifestAnalysisCache.get('uuid-2', 0.2, 'us-east-1') is None
+            assert ManifestAnalysisCache.get('uuid-3', 0.2, 'us-east-1') is not None
@@ -14,7 +14,10 @@
 
 """Unit tests for pattern matching algorithms."""
 
+import random
 from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
+from difflib import SequenceMatcher
+from unittest.mock import patch
 
 
 class TestPatternMatcher:
@@ -69,6 +72,42 @@ class TestPatternMatcher:
         score = self.pattern_matcher._fuzzy_match_score('completely', 'different')
         assert score == 0.0
 
+    def test_fuzzy_bounds_reject_without_sequence_matcher(self):
+        """Test that texts too long or too different for the threshold skip SequenceMatcher."""
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.pattern_matcher.SequenceMatcher'
+        ) as mock_matcher:
+            # Length bound: at most 4 of 24 characters can match
+            assert self.pattern_matcher._fuzzy_match_score('sample_tumor_normal', 'samp') == 0.0
+            # Character bound: 'abcd' and 'wxyz' have no character in common
+            assert self.pattern_matcher._fuzzy_match_score('abcd', 'wxyz') == 0.0
+
+        mock_matcher.assert_not_called()
+
+    def test_fuzzy_bounds_preserve_scores(self):
+        """Test that bounded fuzzy scores equal unbounded SequenceMatcher scores."""
+        rng = random.Random(42)
+        alphabet = 'acgt_r12.'
+        for _ in range(2000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16)))
+            pattern = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+            similarity = SequenceMatcher(None, text, pattern).ratio()
+            expected = 0.6 * similarity if similarity >= 0.6 else 0.0
+
+            assert self.pattern_matcher._fuzzy_match_score(text, pattern) == expected
+
+    def test_fuzzy_similarity_is_cached(self):
+        """Test that repeated texts are compared with SequenceMatcher once."""
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.pattern_matcher.SequenceMatcher',
+            wraps=SequenceMatcher,
+        ) as mock_matcher:
+            for _ in range(3):
+                score, _ = self.pattern_matcher.match_tags({'patient': 'tumour'}, ['tumor'])
+                assert score > 0.0
+
+        assert mock_matcher.call_count == 1
+
     def test_calculate_match_score_single_pattern(self):
         """Test match score calculation with single pattern."""
         # Test exact match gets highest score
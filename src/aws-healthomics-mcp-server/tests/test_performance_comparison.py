@@ -12,12 +12,167 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Performance comparison test for pre-compiled patterns optimization."""
+"""Performance comparison tests for search optimizations."""
 
+import os
+import random
+import re
 import time
-from awslabs.aws_healthomics_mcp_server.models import GenomicsFile, GenomicsFileType
+from awslabs.aws_healthomics_mcp_server.consts import FUZZY_MATCH_MAX_MULTIPLIER
+from awslabs.aws_healthomics_mcp_server.models import (
+    FileGroup,
+    GenomicsFile,
+    GenomicsFileType,
+    get_s3_file_associations,
+)
 from awslabs.aws_healthomics_mcp_server.search.file_association_engine import FileAssociationEngine
+from awslabs.aws_healthomics_mcp_server.search.pattern_matcher import PatternMatcher
 from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+
+
+# Number of paths matched by the pattern matcher benchmark. The reference
+# implementation takes about 0.7ms per path, so set this to 1000000 to
+# reproduce the full-scale benchmark (roughly 15 minutes).
+PATTERN_MATCHER_BENCHMARK_PATHS = int(os.environ.get('PATTERN_MATCHER_BENCHMARK_PATHS', '2000'))
+
+
+class _UnboundedPatternMatcher(PatternMatcher):
+    """Pattern matcher running SequenceMatcher for every text, as before the fuzzy bounds."""
+
+    def _fuzzy_match_score(self, text: str, pattern: str) -> float:
+        similarity = SequenceMatcher(None, text.lower(), pattern.lower()).ratio()
+        if similarity >= self.fuzzy_threshold:
+            return FUZZY_MATCH_MAX_MULTIPLIER * similarity
+        return 0.0
+
+
+# Number of files grouped by the file association benchmark. Set this to 1000000
+# to reproduce the full-scale benchmark.
+FILE_ASSOCIATION_BENCHMARK_FILES = int(os.environ.get('FILE_ASSOCIATION_BENCHMARK_FILES', '5000'))
+
+
+class _RegexFileAssociationEngine(FileAssociationEngine):
+    """File association engine matching each file against regex patterns, as before."""
+
+    _FASTQ_SUFFIX = r'\.fastq(\.gz|\.bz2)?$'
+    ASSOCIATION_PATTERNS = [
+        (r'(.+)\.bam$', r'\1.bam.bai', 'bam_index'),
+        (r'(.+)\.bam$', r'\1.bai', 'bam_index'),
+        (r'(.+)\.cram$', r'\1.cram.crai', 'cram_index'),
+        (r'(.+)\.cram$', r'\1.crai', 'cram_index'),
+        (r'(.+)_R1' + _FASTQ_SUFFIX, r'\1_R2.fastq\2', 'fastq_pair'),
+        (r'(.+)_1' + _FASTQ_SUFFIX, r'\1_2.fastq\2', 'fastq_pair'),
+        (r'(.+)\.R1' + _FASTQ_SUFFIX, r'\1.R2.fastq\2', 'fastq_pair'),
+        (r'(.+)\.1' + _FASTQ_SUFFIX, r'\1.2.fastq\2', 'fastq_pair'),
+        *[
+            (rf'(.+)\.{ext}$', assoc, group_type)
+            for ext in ['fasta', 'fa', 'fna']
+            for assoc, group_type in [
+                (rf'\1.{ext}.fai', 'fasta_index'),
+                (r'\1.fai', 'fasta_index'),
+                (r'\1.dict', 'fasta_dict'),
+            ]
+        ],
+        (r'(.+)\.vcf(\.gz)?$', r'\1.vcf\2.tbi', 'vcf_index'),
+        (r'(.+)\.vcf(\.gz)?$', r'\1.vcf\2.csi', 'vcf_index'),
+        (r'(.+)\.gvcf(\.gz)?$', r'\1.gvcf\2.tbi', 'gvcf_index'),
+        (r'(.+)\.gvcf(\.gz)?$', r'\1.gvcf\2.csi', 'gvcf_index'),
+        (r'(.+)\.bcf$', r'\1.bcf.csi', 'bcf_index'),
+        *[
+            (r'(.+\.(fasta|fa|fna))$', rf'\1{ext}', 'bwa_index')
+            for ext in FileAssociationEngine.BWA_INDEX_EXTENSIONS
+        ],
+    ]
+    EXTENSION_KEYWORDS = {
+        '.bam': 'bam',
+        '.cram': 'cram',
+        '.fastq': 'fastq',
+        '.fastq.gz': 'fastq',
+        '.fastq.bz2': 'fastq',
+        '.fq': 'fastq',
+        '.fq.gz': 'fastq',
+        '.fasta': 'fasta',
+        '.fa': 'fasta',
+        '.fna': 'fasta',
+        '.vcf': 'vcf',
+        '.vcf.gz': 'vcf',
+        '.gvcf': 'gvcf',
+        '.gvcf.gz': 'gvcf',
+        '.bcf': 'bcf',
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._compiled_patterns = [
+            (re.compile(primary, re.IGNORECASE), assoc, group_type)
+            for primary, assoc, group_type in self.ASSOCIATION_PATTERNS
+        ]
+
+    def _relevant_patterns(self, path):
+        path_lower = path.lower()
+        for ext, keyword in self.EXTENSION_KEYWORDS.items():
+            if ext in path_lower:
+                return [p for p in self._compiled_patterns if keyword in p[2]]
+        return self._compiled_patterns
+
+    def _regex_associated_files(self, primary_file, file_map):
+        associated_files = []
+        if primary_file.path.startswith('s3://') and primary_file.s3_file:
+            for s3_assoc in get_s3_file_associations(primary_file.s3_file):
+                if s3_assoc.uri in file_map and s3_assoc.uri != primary_file.path:
+                    associated_files.append(file_map[s3_assoc.uri])
+        for compiled_primary, assoc_pattern, _ in self._relevant_patterns(primary_file.path):
+            if compiled_primary.search(primary_file.path):
+                assoc_path = compiled_primary.sub(assoc_pattern, primary_file.path)
+                if assoc_path in file_map and assoc_path != primary_file.path:
+                    if not any(f.path == assoc_path for f in associated_files):
+                        associated_files.append(file_map[assoc_path])
+        return associated_files
+
+    def find_associations(self, files):
+        file_map = {file.path: file for file in files}
+
+        # Separate passes over all files for each kind of group
+        bwa_index_files = {}
+        for file in files:
+            path = Path(file.path)
+            for ext in self.BWA_INDEX_EXTENSIONS:
+                if path.name.endswith(ext):
+                    base_name = self._normalize_bwa_base_name(str(path)[: -len(ext)])
+                    bwa_index_files.setdefault(base_name, []).append(file)
+                    break
+        reference_files = {}
+        for file in files:
+            if file.path.startswith('omics://') and file.source_system == 'reference_store':
+                self._index_healthomics_reference(file, reference_files)
+        sequence_store_groups = [
+            group for group in map(self._build_sequence_store_group, files) if group
+        ]
+        file_groups = (
+            self._build_bwa_index_groups(bwa_index_files)
+            + self._build_healthomics_groups(reference_files)
+            + sequence_store_groups
+        )
+        grouped_files = {
+            f.path for group in file_groups for f in [group.primary_file] + group.associated_files
+        }
+
+        for file in files:
+            if file.path in grouped_files:
+                continue
+            associated_files = self._regex_associated_files(file, file_map)
+            if associated_files:
+                group_type = self._determine_group_type(file, associated_files)
+                file_groups.append(FileGroup(file, associated_files, group_type))
+                grouped_files.add(file.path)
+                grouped_files.update(f.path for f in associated_files)
+
+        for file in files:
+            if file.path not in grouped_files:
+                file_groups.append(FileGroup(file, [], 'single_file'))
+        return file_groups
 
 
 def test_performance_improvement_demonstration():
@@ -82,5 +237,136 @@ def test_performance_improvement_demonstration():
     print(f'  Throughput: {500 / elapsed_time:.0f} files/second')
 
 
+def _benchmark_paths(count):
+    """Build S3 paths laid out like sequencing project output."""
+    rng = random.Random(7)
+    extensions = ['bam', 'bam.bai', 'fastq.gz', 'vcf.gz', 'cram', 'g.vcf.gz']
+    conditions = ['tumor', 'normal', 'tumour', 'control']
+    return [
+        f's3://genomics-data/project{rng.randint(1, 50)}/run{rng.randint(1, 9)}/'
+        f'sample{i}_{rng.choice(conditions)}/NA{rng.randint(10000, 99999)}_L00{rng.randint(1, 4)}'
+        f'.{rng.choice(extensions)}'
+        for i in range(count)
+    ]
+
+
+def _rank_paths(matcher, paths, patterns):
+    """Score paths with a matcher and rank them like the result ranker."""
+    start_time = time.perf_counter()
+    scores = [matcher.match_file_path(path, patterns) for path in paths]
+    elapsed_time = time.perf_counter() - start_time
+    ranking = sorted(range(len(paths)), key=lambda i: scores[i][0], reverse=True)
+    return scores, ranking, elapsed_time
+
+
+def test_pattern_matcher_fuzzy_bounds_speedup():
+    """Compare path matching with and without the fuzzy similarity bounds.
+
+    Both matchers must produce the same scores, reasons and ranking; the bounded
+    matcher skips SequenceMatcher for texts that cannot reach the fuzzy threshold.
+    The timings are only reported, as they depend on the machine.
+    """
+    paths = _benchmark_paths(PATTERN_MATCHER_BENCHMARK_PATHS)
+    patterns = ['sample42_tumor', 'NA1234']
+
+    reference_scores, reference_ranking, reference_time = _rank_paths(
+        _UnboundedPatternMatcher(), paths, patterns
+    )
+    scores, ranking, elapsed_time = _rank_paths(PatternMatcher(), paths, patterns)
+
+    assert scores == reference_scores
+    assert ranking == reference_ranking
+    assert any('Fuzzy match' in reason for _, reasons in scores for reason in reasons)
+
+    print(
+        f'\n✓ Matched {len(paths)} paths in {elapsed_time:.3f}s ({reference_time:.3f}s unbounded)'
+    )
+    print(f'  Speedup: {reference_time / elapsed_time:.1f}x')
+
+
+def _benchmark_files(count):
+    """Build a listing of sequencing project output with index files and read pairs."""
+    rng = random.Random(11)
+    base_datetime = datetime(2023, 1, 1, 12, 0, 0)
+    layouts = [
+        ['.bam', '.bam.bai'],
+        ['.bam', '.bai'],
+        ['.cram', '.cram.crai'],
+        ['.cram', '.crai'],
+        ['_R1.fastq.gz', '_R2.fastq.gz'],
+        ['_1.fastq', '_2.fastq'],
+        ['.vcf.gz', '.vcf.gz.tbi'],
+        ['.g.vcf.gz', '.g.vcf.gz.csi'],
+        ['.fasta', '.fasta.fai', '.dict'],
+        ['.fa', '.fa.amb', '.fa.ann', '.fa.bwt', '.fa.64.pac', '.fa.sa'],
+        ['.bcf', '.bcf.csi'],
+        ['.bam'],
+        ['.fastq.gz'],
+        ['.txt'],
+    ]
+    paths = []
+    while len(paths) < count:
+        prefix = (
+            f's3://genomics-data/project{rng.randint(1, 50)}/run{rng.randint(1, 9)}/'
+            f'sample{len(paths)}/NA{rng.randint(10000, 99999)}_L00{rng.randint(1, 4)}'
+        )
+        layout = rng.choice(layouts)
+        # Drop some companions so that primaries without their index remain
+        paths.extend(prefix + suffix for suffix in layout if rng.random() < 0.9)
+    rng.shuffle(paths)
+    return [
+        GenomicsFile(
+            path=path,
+            file_type=GenomicsFileType.BAM,
+            size_bytes=1000,
+            storage_class='STANDARD',
+            last_modified=base_datetime,
+            tags={},
+            source_system='s3',
+            metadata={},
+        )
+        for path in paths[:count]
+    ]
+
+
+def _group_files(engine, files):
+    """Group files with an engine and return comparable groups."""
+    start_time = time.perf_counter()
+    groups = engine.find_associations(files)
+    elapsed_time = time.perf_counter() - start_time
+    return [
+        (g.primary_file.path, [f.path for f in g.associated_files], g.group_type) for g in groups
+    ], elapsed_time
+
+
+def test_file_association_single_pass_speedup():
+    """Compare single-pass file grouping with per-file regex matching.
+
+    Both engines must produce the same groups in the same order; the single-pass
+    engine looks companions up by base name instead of matching regex patterns.
+    The timings are only reported, as they depend on the machine.
+    """
+    files = _benchmark_files(FILE_ASSOCIATION_BENCHMARK_FILES)
+
+    reference_groups, reference_time = _group_files(_RegexFileAssociationEngine(), files)
+    groups, elapsed_time = _group_files(FileAssociationEngine(), files)
+
+    assert groups == reference_groups
+    assert {group_type for _, _, group_type in groups} >= {
+        'bam_index',
+        'cram_index',
+        'fastq_pair',
+        'vcf_index',
+        'fasta_index',
+        'bwa_index_collection',
+        'single_file',
+    }
+
+    print(f'\n✓ Grouped {len(files)} files in {elapsed_time:.3f}s ({reference_time:.3f}s regex)')
+    print(f'  Speedup: {reference_time / elapsed_time:.1f}x')
+
+
 if __name__ == '__main__':
     test_performance_improvement_demonstration()
+    test_pattern_matcher_fuzzy_bounds_speedup()
+    test_file_association_single_pass_speedup()
@@ -14,8 +14,12 @@
 
 """Tests for run analysis tools."""
 
+import asyncio
 import json
 import pytest
+import time
+from awslabs.aws_healthomics_mcp_server.analysis.manifest_cache import ManifestAnalysisCache
+from awslabs.aws_healthomics_mcp_server.tools import run_analysis
 from awslabs.aws_healthomics_mcp_server.tools.run_analysis import (
     _aggregate_task_metrics,
     _convert_datetime_to_string,
@@ -36,6 +40,35 @@ from hypothesis import strategies as st
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_manifest_cache():
+    """Keep parsed manifests of one test from being reused by another."""
+    ManifestAnalysisCache.clear()
+    yield
+    ManifestAnalysisCache.clear()
+
+
+def _task_manifest_event(task_name: str, running_seconds: int = 1800) -> dict:
+    """Build a manifest log event for a task."""
+    return {
+        'message': json.dumps(
+            {
+                'name': task_name,
+                'cpus': 4,
+                'memory': 8,
+                'instanceType': 'omics.c.large',
+                'metrics': {
+                    'cpusReserved': 4,
+                    'cpusAverage': 3.2,
+                    'memoryReservedGiB': 8,
+                    'memoryAverageGiB': 6.4,
+                    'runningSeconds': running_seconds,
+                },
+            }
+        )
+    }
+
+
 class TestNormalizeRunIds:
     """Test the _normalize_run_ids function."""
 
@@ -983,6 +1016,69 @@ class TestGetRunAnalysisData:
         assert result['summary']['totalRuns'] == 1
         assert len(result['runs']) == 0  # No runs processed due to manifest failure
 
+    @pytest.mark.asyncio
+    @patch('awslabs.aws_healthomics_mcp_server.tools.run_analysis.get_omics_client')
+    @patch('awslabs.aws_healthomics_mcp_server.tools.run_analysis.get_run_manifest_logs_internal')
+    async def test_get_run_analysis_data_reuses_completed_manifests(
+        self, mock_get_logs, mock_get_omics_client
+    ):
+        """Manifests of completed runs are parsed once; other runs are read every time."""
+        statuses = {'run-1': 'COMPLETED', 'run-2': 'RUNNING'}
+        mock_get_omics_client.return_value.get_run.side_effect = lambda id: {
+            'uuid': f'uuid-{id}',
+            'name': id,
+            'status': statuses[id],
+        }
+        mock_get_logs.return_value = {'events': [_task_manifest_event('task1')]}
+
+        first = await _get_run_analysis_data(['run-1', 'run-2'])
+        second = await _get_run_analysis_data(['run-1', 'run-2'])
+
+        assert mock_get_logs.call_count == 3
+        assert [call.kwargs['run_id'] for call in mock_get_logs.call_args_list] == [
+            'run-1',
+            'run-2',
+            'run-2',
+        ]
+        assert first['runs'] == second['runs']
+        # A different headroom changes the recommendations, so the manifest is parsed again
+        await _get_run_analysis_data(['run-1'], headroom=0.5)
+        assert mock_get_logs.call_count == 4
+
+    @pytest.mark.asyncio
+    @patch('awslabs.aws_healthomics_mcp_server.tools.run_analysis.get_omics_client')
+    @patch('awslabs.aws_healthomics_mcp_server.tools.run_analysis.get_run_manifest_logs_internal')
+    async def test_get_run_analysis_data_processes_runs_concurrently(
+        self, mock_get_logs, mock_get_omics_client
+    ):
+        """Runs are fetched concurrently up to the limit and reported in request order."""
+        run_ids = [f'run-{i}' for i in range(6)]
+        in_flight = 0
+        max_in_flight = 0
+
+        def get_run(id):
+            time.sleep(0.01)
+            return {'uuid': f'uuid-{id}', 'name': id, 'status': 'COMPLETED'}
+
+        async def get_logs(run_id, run_uuid, limit):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later runs finish first
+            await asyncio.sleep(0.01 * (len(run_ids) - int(run_id.split('-')[1])))
+            in_flight -= 1
+            return {'events': [_task_manifest_event(f'task-{run_id}')]}
+
+        mock_get_omics_client.return_value.get_run.side_effect = get_run
+        mock_get_logs.side_effect = get_logs
+
+        with patch.object(run_analysis, 'MAX_CONCURRENT_RUN_ANALYSES', 4):
+            result = await _get_run_analysis_data(run_ids)
+
+        assert max_in_flight == 4
+        assert [run['runInfo']['runId'] for run in result['runs']] == run_ids
+        assert len(result['crossRunAggregates']) == len(run_ids)
+
 
 class TestAnalyzeRunPerformance:
     """Test the analyze_run_performance function."""
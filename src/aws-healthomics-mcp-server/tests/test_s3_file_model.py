@@ -22,6 +22,7 @@ from awslabs.aws_healthomics_mcp_server.models import (
     build_s3_uri,
     create_genomics_file_from_s3_object,
     create_s3_file_from_object,
+    get_s3_association_keys,
     get_s3_file_associations,
     parse_s3_uri,
 )
@@ -472,3 +473,24 @@ class TestS3Utilities:
         associations = get_s3_file_associations(single_file)
         # Should be empty since no R1/R2 or _1/_2 patterns
         assert len(associations) == 0
+
+    def test_get_s3_association_keys(self):
+        """Test association keys match the keys of the associated S3 files."""
+        for key in [
+            'data/sample.bam',
+            'data/sample.vcf.gz',
+            'reads/sample_R1_001.fastq.gz',
+            'reads/sample_2.fq',
+            'reads.fastq/notes.txt',
+        ]:
+            s3_file = S3File(bucket='test-bucket', key=key)
+            assert get_s3_association_keys(key) == [
+                assoc.key for assoc in get_s3_file_associations(s3_file)
+            ]
+
+        assert get_s3_association_keys('data/sample.bam') == [
+            'data/sample.bam.bai',
+            'data/sample.bai',
+        ]
+        # The FASTQ extension must be on the file name, not a directory
+        assert get_s3_association_keys('reads_R1_.fastq/notes.txt') == []
@@ -0,0 +1,317 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the S3 Inventory listing backend."""
+
+import io
+import json
+import os
+import polars as pl
+import pytest
+import sys
+from awslabs.aws_healthomics_mcp_server.models import SearchConfig
+from awslabs.aws_healthomics_mcp_server.search.s3_inventory import S3InventoryReader
+from awslabs.aws_healthomics_mcp_server.search.s3_search_engine import S3SearchEngine
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+
+FIXTURE_LOCATION = os.path.join(
+    os.path.dirname(__file__), 'fixtures', 's3_inventory', 'genomics-data', 'daily'
+)
+
+
+def _write_columnar_inventory(root, file_format, rows, created_at):
+    """Write a single-file Parquet (or other columnar) inventory report under root."""
+    os.makedirs(os.path.join(root, 'data'))
+    os.makedirs(os.path.join(root, '2024-01-02T01-00Z'))
+    pl.DataFrame(rows).write_parquet(os.path.join(root, 'data', 'part-1.parquet'))
+    manifest = {
+        'sourceBucket': 'genomics-data',
+        'creationTimestamp': str(int(created_at.timestamp() * 1000)),
+        'fileFormat': file_format,
+        'fileSchema': 'message s3.inventory { required binary bucket; required binary key; }',
+        'files': [{'key': 'genomics-data/daily/data/part-1.parquet'}],
+    }
+    with open(os.path.join(root, '2024-01-02T01-00Z', 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+
+
+class TestS3InventoryReader:
+    """Tests for S3InventoryReader."""
+
+    def test_latest_snapshot_is_used(self):
+        """The most recent report folder of a location is read."""
+        reader = S3InventoryReader([FIXTURE_LOCATION])
+
+        snapshot = reader.latest_snapshot('genomics-data')
+
+        assert snapshot is not None
+        assert snapshot.created_at == datetime(2024, 1, 2, 1, 0, tzinfo=timezone.utc)
+        assert snapshot.file_format == 'CSV'
+        assert len(snapshot.data_files) == 2
+        assert reader.latest_snapshot('other-bucket') is None
+
+    def test_csv_objects_are_streamed_and_filtered(self):
+        """Rows are decoded, filtered by prefix and mapped to list_objects_v2 fields."""
+        reader = S3InventoryReader([FIXTURE_LOCATION])
+        snapshot = reader.latest_snapshot('genomics-data')
+
+        objects = list(reader.iter_objects(snapshot, 'data/'))
+
+        keys = [obj['Key'] for obj in objects]
+        assert keys == [
+            'data/sample1/sample1.bam',
+            'data/sample1/sample1.bam.bai',
+            'data/sample2/sample 2_R1.fastq.gz',
+            'data/sample2/variants.vcf.gz',
+            'data/readme.txt',
+        ]
+        fastq = objects[2]
+        assert fastq['Size'] == 2048
+        assert fastq['StorageClass'] == 'INTELLIGENT_TIERING'
+        assert fastq['ETag'] == 'etag3'
+        assert fastq['LastModified'] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # The current version replaces the noncurrent one
+        assert objects[3]['Size'] == 200
+
+    def test_parquet_objects(self, tmp_path):
+        """Parquet reports are read with polars."""
+        root = str(tmp_path / 'inventory')
+        _write_columnar_inventory(
+            root,
+            'Parquet',
+            {
+                'bucket': ['genomics-data'] * 3,
+                'key': ['data/a.bam', 'data/b.vcf', 'other/c.bam'],
+                'size': [10, 20, 30],
+                'last_modified_date': [datetime(2024, 1, 1)] * 3,
+                'e_tag': ['e1', 'e2', 'e3'],
+                'storage_class': ['STANDARD', 'GLACIER', 'STANDARD'],
+                'is_delete_marker': [False, True, False],
+            },
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+        reader = S3InventoryReader([root])
+
+        objects = list(reader.iter_objects(reader.latest_snapshot('genomics-data'), 'data/'))
+
+        assert objects == [
+            {
+                'Key': 'data/a.bam',
+                'Size': 10,
+                'LastModified': datetime(2024, 1, 1, tzinfo=timezone.utc),
+                'ETag': 'e1',
+                'StorageClass': 'STANDARD',
+            }
+        ]
+
+    def test_parquet_objects_are_filtered_in_batches(self, tmp_path):
+        """Parquet rows are filtered and converted batch by batch, in order."""
+        root = str(tmp_path / 'inventory')
+        keys = ['data/0.bam', 'other/1.bam', 'data/2.bam', 'data/3.bam', 'other/4.bam']
+        _write_columnar_inventory(
+            root,
+            'Parquet',
+            {
+                'bucket': ['genomics-data'] * 5,
+                'key': keys,
+                'size': list(range(5)),
+                'encryption_status': ['SSE-S3'] * 5,
+            },
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+        reader = S3InventoryReader([root])
+
+        with patch(f'{S3InventoryReader.__module__}._COLUMNAR_BATCH_ROWS', 2):
+            objects = list(reader.iter_objects(reader.latest_snapshot('genomics-data'), 'data/'))
+
+        assert objects == [
+            {'Key': 'data/0.bam', 'Size': 0},
+            {'Key': 'data/2.bam', 'Size': 2},
+            {'Key': 'data/3.bam', 'Size': 3},
+        ]
+
+    def test_orc_requires_pyarrow(self, tmp_path):
+        """ORC reports cannot be read without pyarrow."""
+        root = str(tmp_path / 'inventory')
+        _write_columnar_inventory(
+            root, 'ORC', {'key': ['data/a.bam']}, datetime(2024, 1, 2, tzinfo=timezone.utc)
+        )
+        reader = S3InventoryReader([root])
+        snapshot = reader.latest_snapshot('genomics-data')
+
+        with patch.dict(sys.modules, {'pyarrow': None}):
+            with pytest.raises(ValueError, match='requires pyarrow'):
+                list(reader.iter_objects(snapshot, 'data/'))
+
+    def test_unreadable_location_is_skipped(self, tmp_path):
+        """A location that cannot be read does not hide the others."""
+        reader = S3InventoryReader([str(tmp_path / 'missing'), FIXTURE_LOCATION])
+
+        assert reader.latest_snapshot('genomics-data') is not None
+
+    def test_s3_location(self):
+        """Manifests and data files in S3 are read with the S3 client."""
+        with open(os.path.join(FIXTURE_LOCATION, '2024-01-02T01-00Z', 'manifest.json'), 'rb') as f:
+            manifest = f.read()
+
+        def get_object(Bucket, Key):
+            if Key.endswith('manifest.json'):
+                return {'Body': io.BytesIO(manifest)}
+            with open(os.path.join(FIXTURE_LOCATION, 'data', os.path.basename(Key)), 'rb') as f:
+                return {'Body': io.BytesIO(f.read())}
+
+        s3_client = MagicMock()
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {'CommonPrefixes': [{'Prefix': 'genomics-data/daily/2024-01-02T01-00Z/'}]},
+            {'CommonPrefixes': [{'Prefix': 'genomics-data/daily/hive/'}]},
+        ]
+        s3_client.get_object.side_effect = get_object
+        reader = S3InventoryReader(['s3://inventory-reports/genomics-data/daily/'], s3_client)
+
+        snapshot = reader.latest_snapshot('genomics-data')
+        objects = list(reader.iter_objects(snapshot, 'archive/'))
+
+        assert [obj['Key'] for obj in objects] == ['archive/old.bam']
+        s3_client.get_object.assert_any_call(
+            Bucket='inventory-reports', Key='genomics-data/daily/2024-01-02T01-00Z/manifest.json'
+        )
+        s3_client.get_object.assert_any_call(
+            Bucket='inventory-reports', Key='genomics-data/daily/data/0d4f4e1c-part-1.csv.gz'
+        )
+
+
+class TestInventoryBackedListing:
+    """Tests for S3SearchEngine listing from S3 Inventory."""
+
+    @pytest.fixture
+    def s3_client(self):
+        """S3 client whose live listing differs from the inventory snapshot.
+
+        Since the snapshot, data/sample4/ was created and data/sample3/ removed.
+        """
+
+        def list_objects_v2(**params):
+            if params.get('Delimiter') == '/':
+                return {
+                    'CommonPrefixes': [
+                        {'Prefix': 'data/sample1/'},
+                        {'Prefix': 'data/sample2/'},
+                        {'Prefix': 'data/sample4/'},
+                    ],
+                    'Contents': [{'Key': 'data/readme.txt', 'Size': 11}],
+                    'IsTruncated': False,
+                }
+            if params['Prefix'] == 'data/sample4/':
+                return {
+                    'Contents': [{'Key': 'data/sample4/sample4.cram', 'Size': 5}],
+                    'IsTruncated': False,
+                }
+            return {
+                'Contents': [{'Key': f'{params["Prefix"]}live.bam', 'Size': 1}],
+                'IsTruncated': False,
+            }
+
+        client = MagicMock()
+        client.list_objects_v2.side_effect = list_objects_v2
+        return client
+
+    def _create_engine(self, s3_client, **config):
+        config.setdefault('s3_inventory_locations', [FIXTURE_LOCATION])
+        config.setdefault('s3_inventory_max_age_seconds', 10**10)
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value = s3_client
+            return S3SearchEngine._create_for_testing(SearchConfig(**config))
+
+    async def test_listing_comes_from_inventory_with_live_refresh(self, s3_client):
+        """Inventoried objects are returned, patched with the live top level of the prefix."""
+        engine = self._create_engine(s3_client)
+
+        objects = await engine._list_s3_objects('genomics-data', 'data/')
+
+        assert [obj['Key'] for obj in objects] == [
+            'data/readme.txt',
+            'data/sample1/sample1.bam',
+            'data/sample1/sample1.bam.bai',
+            'data/sample2/sample 2_R1.fastq.gz',
+            'data/sample2/variants.vcf.gz',
+            'data/sample4/sample4.cram',
+        ]
+        # The direct object comes from the live listing
+        assert objects[0]['Size'] == 11
+        # One delimiter listing plus one full listing of the new prefix
+        assert s3_client.list_objects_v2.call_count == 2
+        status = engine.catalog_scopes['s3://genomics-data/data/']
+        assert status['source'] == 's3_inventory'
+        assert status['synced_at'] == '2024-01-02T01:00:00+00:00'
+
+    async def test_listing_is_reused_within_engine(self, s3_client):
+        """The inventory is read once per prefix and engine."""
+        engine = self._create_engine(s3_client)
+
+        await engine._list_s3_objects('genomics-data', 'data/')
+        await engine._list_s3_objects('genomics-data', 'data/')
+
+        assert s3_client.list_objects_v2.call_count == 2
+
+    async def test_stale_snapshot_falls_back_to_live_listing(self, s3_client):
+        """Snapshots older than the maximum age are not used."""
+        engine = self._create_engine(s3_client, s3_inventory_max_age_seconds=3600)
+
+        objects = await engine._list_s3_objects('genomics-data', 'data/')
+
+        assert [obj['Key'] for obj in objects] == ['data/live.bam']
+        assert engine.catalog_scopes == {}
+
+    async def test_bucket_without_inventory_is_listed_live(self, s3_client):
+        """Buckets with no inventory snapshot are listed live."""
+        engine = self._create_engine(s3_client)
+
+        objects = await engine._list_s3_objects('other-bucket', 'data/')
+
+        assert [obj['Key'] for obj in objects] == ['data/live.bam']
+
+    async def test_paginated_listing_from_inventory(self, s3_client):
+        """Inventory-backed pages carry the last key as continuation token."""
+        engine = self._create_engine(s3_client)
+
+        first, token, scanned = await engine._list_s3_objects_paginated(
+            'genomics-data', 'data/', None, 4
+        )
+        second, next_token, _ = await engine._list_s3_objects_paginated(
+            'genomics-data', 'data/', token, 4
+        )
+
+        assert len(first) == scanned == 4
+        assert token == 'inventory-after:data/sample2/sample 2_R1.fastq.gz'
+        assert [obj['Key'] for obj in second] == [
+            'data/sample2/variants.vcf.gz',
+            'data/sample4/sample4.cram',
+        ]
+        assert next_token is None
+
+    async def test_inventory_token_resumes_live_listing(self, s3_client):
+        """An inventory token is honoured with StartAfter when the inventory is unavailable."""
+        engine = self._create_engine(s3_client, s3_inventory_max_age_seconds=3600)
+
+        await engine._list_s3_objects_paginated(
+            'genomics-data', 'data/', 'inventory-after:data/sample2/x.bam', 10
+        )
+
+        params = s3_client.list_objects_v2.call_args.kwargs
+        assert params['StartAfter'] == 'data/sample2/x.bam'
+        assert 'ContinuationToken' not in params
@@ -16,6 +16,7 @@
 
 import asyncio
 import pytest
+import threading
 import time
 from awslabs.aws_healthomics_mcp_server.models import (
     GenomicsFile,
@@ -29,6 +30,16 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _object_pages(*pages):
+    """Build a mock of S3SearchEngine._iter_s3_object_pages yielding the given pages."""
+
+    async def iter_pages(bucket_name, prefix):
+        for page in pages:
+            yield page
+
+    return MagicMock(side_effect=iter_pages)
+
+
 class TestS3SearchEngine:
     """Test cases for S3 search engine."""
 
@@ -565,6 +576,12 @@ class TestS3SearchEngine:
         )
         assert key != key3
 
+        # Rank-limited results are cached separately
+        key4 = search_engine._create_search_cache_key(
+            's3://bucket/path/', 'fastq', ['cancer', 'patient'], result_limit=10
+        )
+        assert key != key4
+
     def test_cache_operations(self, search_engine):
         """Test cache operations."""
         cache_key = 'test_key'
@@ -861,8 +878,8 @@ class TestS3SearchEngine:
         """Test the optimized single bucket path search method."""
         # Mock the dependencies
         search_engine._validate_bucket_access = AsyncMock()
-        search_engine._list_s3_objects = AsyncMock(
-            return_value=[
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
                 {
                     'Key': 'data/sample1.fastq',
                     'Size': 1000,
@@ -878,11 +895,13 @@ class TestS3SearchEngine:
             ]
         )
         search_engine.file_type_detector.detect_file_type = MagicMock(
-            side_effect=lambda x: GenomicsFileType.FASTQ
-            if x.endswith('.fastq')
-            else GenomicsFileType.BAM
-            if x.endswith('.bam')
-            else None
+            side_effect=lambda x: (
+                GenomicsFileType.FASTQ
+                if x.endswith('.fastq')
+                else GenomicsFileType.BAM
+                if x.endswith('.bam')
+                else None
+            )
         )
         search_engine._matches_file_type_filter = MagicMock(return_value=True)
         search_engine.pattern_matcher.match_file_path = MagicMock(return_value=(0.8, ['sample']))
@@ -906,7 +925,7 @@ class TestS3SearchEngine:
         assert len(result) == 2
         assert all(isinstance(f, GenomicsFile) for f in result)
         search_engine._validate_bucket_access.assert_called_once_with('test-bucket')
-        search_engine._list_s3_objects.assert_called_once_with('test-bucket', 'data/')
+        search_engine._iter_s3_object_pages.assert_called_once_with('test-bucket', 'data/')
 
     @pytest.mark.asyncio
     async def test_search_single_bucket_path_optimized_with_tags(self, search_engine):
@@ -916,8 +935,8 @@ class TestS3SearchEngine:
 
         # Mock dependencies
         search_engine._validate_bucket_access = AsyncMock()
-        search_engine._list_s3_objects = AsyncMock(
-            return_value=[
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
                 {
                     'Key': 'data/file1.fastq',
                     'Size': 1000,
@@ -949,12 +968,90 @@ class TestS3SearchEngine:
             'test-bucket', ['data/file1.fastq']
         )
 
+    @pytest.mark.asyncio
+    async def test_search_single_bucket_path_optimized_skips_tags_below_result_limit(
+        self, search_engine
+    ):
+        """Test that tags are not fetched for objects that cannot reach the requested results."""
+        search_engine._validate_bucket_access = AsyncMock()
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
+                {'Key': 'data/patient1.bam', 'Size': 10, 'StorageClass': 'STANDARD'},
+                {'Key': 'data/patient1.bam.bai', 'Size': 1, 'StorageClass': 'STANDARD'},
+                {'Key': 'data/archived.bam', 'Size': 10, 'StorageClass': 'DEEP_ARCHIVE'},
+                {'Key': 'data/sample2.bam', 'Size': 10, 'StorageClass': 'STANDARD'},
+                {'Key': 'data/sample2.bam.bai', 'Size': 1, 'StorageClass': 'STANDARD'},
+            ]
+        )
+        search_engine._get_tags_for_objects_batch = AsyncMock(
+            return_value={'data/sample2.bam': {'patient': 'patient1'}}
+        )
+
+        result = await search_engine._search_single_bucket_path_optimized(
+            's3://test-bucket/data/', 'bam', ['patient1'], result_limit=1
+        )
+
+        # sample2.bam may gain associated files and outrank the path match, its index is
+        # kept to stay associated with it; archived.bam cannot reach the top result
+        search_engine._get_tags_for_objects_batch.assert_called_once_with(
+            'test-bucket', ['data/sample2.bam', 'data/sample2.bam.bai']
+        )
+        assert [f.path for f in result] == [
+            's3://test-bucket/data/patient1.bam',
+            's3://test-bucket/data/patient1.bam.bai',
+            's3://test-bucket/data/sample2.bam',
+        ]
+        assert search_engine.tag_candidates == 3
+        assert search_engine.tag_fetches_avoided == 1
+
+    def test_may_be_grouped_fastq_mates(self):
+        """Test that underscore and dot separated FASTQ mates may be grouped."""
+        for key in [
+            'data/sample_R1_001.fastq.gz',
+            'data/sample_R2.fastq',
+            'data/sample_1.fq',
+            'data/sample.R1.fastq',
+            'data/sample.R2.fastq',
+            'data/sample.r2.fastq.gz',
+            'data/sample.1.fastq',
+            'data/sample.2.fastq',
+        ]:
+            assert S3SearchEngine._may_be_grouped(key, GenomicsFileType.FASTQ), key
+
+        assert not S3SearchEngine._may_be_grouped('data/sample.fastq', GenomicsFileType.FASTQ)
+        assert not S3SearchEngine._may_be_grouped('run_1.0/sample.fastq', GenomicsFileType.FASTQ)
+        assert not S3SearchEngine._may_be_grouped('data/sample.1.bam', GenomicsFileType.BAM)
+        assert S3SearchEngine._may_be_grouped('data/sample.bam.bai', GenomicsFileType.BAI)
+
+    @pytest.mark.asyncio
+    async def test_search_single_bucket_path_optimized_fetches_all_tags_without_enough_matches(
+        self, search_engine
+    ):
+        """Test that all tag candidates are checked when path matches cannot fill the results."""
+        search_engine._validate_bucket_access = AsyncMock()
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
+                {'Key': 'data/patient1.bam', 'Size': 10, 'StorageClass': 'STANDARD'},
+                {'Key': 'data/archived.bam', 'Size': 10, 'StorageClass': 'DEEP_ARCHIVE'},
+            ]
+        )
+        search_engine._get_tags_for_objects_batch = AsyncMock(return_value={})
+
+        await search_engine._search_single_bucket_path_optimized(
+            's3://test-bucket/data/', 'bam', ['patient1'], result_limit=2
+        )
+
+        search_engine._get_tags_for_objects_batch.assert_called_once_with(
+            'test-bucket', ['data/archived.bam']
+        )
+        assert search_engine.tag_fetches_avoided == 0
+
     @pytest.mark.asyncio
     async def test_search_single_bucket_path_optimized_no_search_terms(self, search_engine):
         """Test optimized search with no search terms (return all matching file types)."""
         search_engine._validate_bucket_access = AsyncMock()
-        search_engine._list_s3_objects = AsyncMock(
-            return_value=[
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
                 {
                     'Key': 'file1.fastq',
                     'Size': 1000,
@@ -985,8 +1082,8 @@ class TestS3SearchEngine:
     async def test_search_single_bucket_path_optimized_file_type_filtering(self, search_engine):
         """Test optimized search with file type filtering."""
         search_engine._validate_bucket_access = AsyncMock()
-        search_engine._list_s3_objects = AsyncMock(
-            return_value=[
+        search_engine._iter_s3_object_pages = _object_pages(
+            [
                 {
                     'Key': 'file1.fastq',
                     'Size': 1000,
@@ -1002,17 +1099,19 @@ class TestS3SearchEngine:
             ]
         )
         search_engine.file_type_detector.detect_file_type = MagicMock(
-            side_effect=lambda x: GenomicsFileType.FASTQ
-            if x.endswith('.fastq')
-            else GenomicsFileType.BAM
-            if x.endswith('.bam')
-            else None
+            side_effect=lambda x: (
+                GenomicsFileType.FASTQ
+                if x.endswith('.fastq')
+                else GenomicsFileType.BAM
+                if x.endswith('.bam')
+                else None
+            )
         )
         # Only FASTQ files should match
         search_engine._matches_file_type_filter = MagicMock(
-            side_effect=lambda detected, filter_type: detected == GenomicsFileType.FASTQ
-            if filter_type == 'fastq'
-            else True
+            side_effect=lambda detected, filter_type: (
+                detected == GenomicsFileType.FASTQ if filter_type == 'fastq' else True
+            )
         )
         search_engine._create_genomics_file_from_object = MagicMock(
             return_value=MagicMock(spec=GenomicsFile)
@@ -1406,3 +1505,151 @@ class TestS3SearchEngine:
         assert isinstance(result, dict)
         assert 'test-key' in result
         assert result['test-key'] == {}
+
+
+class _FakeBucket:
+    """In-memory bucket answering list_objects_v2 with small pages.
+
+    Supports Prefix, StartAfter, ContinuationToken and Delimiter, and records the
+    calls made and the peak number of calls in flight at once.
+    """
+
+    def __init__(self, keys, page_size=3, latency=0.0, fail_after=None):
+        self.keys = sorted(keys)
+        self.page_size = page_size
+        self.latency = latency
+        self.fail_after = fail_after
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys, **params):
+        with self._lock:
+            self.calls.append(params)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            start = params.get('ContinuationToken') or params.get('StartAfter') or ''
+            if self.fail_after is not None and start >= self.fail_after:
+                raise ClientError({'Error': {'Code': 'SlowDown'}}, 'ListObjectsV2')
+            return self._page(Prefix, start, params.get('Delimiter'))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _page(self, prefix, start, delimiter):
+        entries = []  # (continuation key, object or common prefix)
+        for key in self.keys:
+            if not key.startswith(prefix) or key <= start:
+                continue
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                common_prefix = prefix + rest.split(delimiter, 1)[0] + delimiter
+                if entries and entries[-1][1] == {'Prefix': common_prefix}:
+                    continue
+                entries.append((common_prefix + '\uffff', {'Prefix': common_prefix}))
+            else:
+                entries.append((key, {'Key': key, 'Size': 1}))
+
+        page = entries[: self.page_size]
+        response = {
+            'Contents': [entry for _, entry in page if 'Key' in entry],
+            'CommonPrefixes': [entry for _, entry in page if 'Prefix' in entry],
+            'IsTruncated': len(entries) > self.page_size,
+        }
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = page[-1][0]
+        return response
+
+
+class TestShardedListing:
+    """Test cases for listing large prefixes in concurrent key ranges."""
+
+    def _create_engine(self, bucket, max_concurrent_searches=4):
+        with patch(
+            'awslabs.aws_healthomics_mcp_server.search.s3_search_engine.get_aws_session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value.list_objects_v2.side_effect = (
+                bucket.list_objects_v2
+            )
+            return S3SearchEngine._create_for_testing(
+                SearchConfig(max_concurrent_searches=max_concurrent_searches)
+            )
+
+    @pytest.mark.asyncio
+    async def test_large_prefix_is_listed_in_order_without_duplicates(self):
+        """Ranges split at sub-prefixes cover every key exactly once, in key order."""
+        keys = [f'runs/r{i:02d}/file{j}.bam' for i in range(12) for j in range(5)]
+        keys += ['runs/a.bam', 'runs/readme.txt', 'runs/r05', 'runs/r05.txt', 'other/x.bam']
+        bucket = _FakeBucket(keys)
+        engine = self._create_engine(bucket)
+
+        objects = await engine._list_s3_objects('bucket', 'runs/')
+
+        assert [obj['Key'] for obj in objects] == sorted(k for k in keys if k.startswith('runs/'))
+        assert any('Delimiter' in call for call in bucket.calls)
+        assert sum('StartAfter' in call for call in bucket.calls) > 1
+
+    @pytest.mark.asyncio
+    async def test_ranges_are_listed_concurrently_within_limit(self):
+        """Key ranges are listed in parallel, never more than max_concurrent_searches at once."""
+        keys = [f'runs/r{i:02d}/file{j}.bam' for i in range(16) for j in range(6)]
+        bucket = _FakeBucket(keys, latency=0.02)
+        engine = self._create_engine(bucket, max_concurrent_searches=3)
+
+        objects = await engine._list_s3_objects('bucket', 'runs/')
+
+        assert len(objects) == len(keys)
+        assert 1 < bucket.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_few_sub_prefixes_are_descended_into(self):
+        """Boundaries are looked for one level deeper when the prefix has few sub-prefixes."""
+        keys = [f'runs/{run}/s{i:02d}/out.vcf' for run in ('a', 'b') for i in range(10)]
+        bucket = _FakeBucket(keys)
+        engine = self._create_engine(bucket)
+
+        objects = await engine._list_s3_objects('bucket', 'runs/')
+
+        assert [obj['Key'] for obj in objects] == sorted(keys)
+        delimited = [call for call in bucket.calls if 'Delimiter' in call]
+        assert len(delimited) > 1
+
+    @pytest.mark.asyncio
+    async def test_flat_prefix_is_listed_serially(self):
+        """Without sub-prefixes the listing continues with continuation tokens."""
+        keys = [f'flat/file{i:02d}.bam' for i in range(10)]
+        bucket = _FakeBucket(keys)
+        engine = self._create_engine(bucket)
+
+        objects = await engine._list_s3_objects('bucket', 'flat/')
+
+        assert [obj['Key'] for obj in objects] == keys
+        assert sum('ContinuationToken' in call for call in bucket.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_range_error_is_raised(self):
+        """A failure listing one range fails the whole listing."""
+        keys = [f'runs/r{i:02d}/file{j}.bam' for i in range(8) for j in range(4)]
+        bucket = _FakeBucket(keys, fail_after='runs/r05/')
+        engine = self._create_engine(bucket)
+
+        with pytest.raises(ClientError):
+            await engine._list_s3_objects('bucket', 'runs/')
+
+    @pytest.mark.asyncio
+    async def test_search_filters_pages_as_they_stream(self):
+        """The optimized search filters the streamed pages of a sharded listing."""
+        keys = [f'runs/r{i:02d}/sample{i}.bam' for i in range(12)]
+        keys += [f'runs/r{i:02d}/notes.txt' for i in range(12)]
+        bucket = _FakeBucket(keys)
+        engine = self._create_engine(bucket)
+        engine._validate_bucket_access = AsyncMock()
+
+        results = await engine._search_single_bucket_path_optimized('s3://bucket/runs/', 'bam', [])
+
+        assert sorted(f.path for f in results) == sorted(
+            f's3://bucket/{k}' for k in keys if k.endswith('.bam')
+        )
@@ -463,6 +463,56 @@ class TestScoringEngine:
                 f'No reasons provided for scenario {search_terms}, {file_type_filter}'
             )
 
+    def test_calculate_score_bounds_contain_actual_scores(self):
+        """Test that score bounds contain the score for any tags and associated files."""
+        path_match = self.create_test_file('s3://bucket/patient1/sample.bam', GenomicsFileType.BAM)
+        index = self.create_test_file('s3://bucket/patient1/sample.bam.bai', GenomicsFileType.BAI)
+
+        lower, upper = self.scoring_engine.calculate_score_bounds(path_match, ['patient1'], 'bam')
+
+        for associated_files in ([], [index]):
+            score, _ = self.scoring_engine.calculate_score(
+                path_match, ['patient1'], 'bam', associated_files
+            )
+            assert lower <= score <= upper
+
+        assert lower == self.scoring_engine.calculate_score(path_match, ['patient1'], 'bam', [])[0]
+
+    def test_calculate_score_bounds_tag_candidate(self):
+        """Test that the upper bound of an unmatched file allows the best possible tag match."""
+        untagged = self.create_test_file('s3://bucket/data/sample.bam', GenomicsFileType.BAM)
+        tagged = self.create_test_file(
+            's3://bucket/data/sample.bam', GenomicsFileType.BAM, tags={'patient': 'patient1'}
+        )
+
+        lower, upper = self.scoring_engine.calculate_score_bounds(
+            untagged, ['patient1'], 'bam', pattern_score=0.0
+        )
+        tagged_score, _ = self.scoring_engine.calculate_score(tagged, ['patient1'], 'bam', [])
+
+        assert lower < tagged_score <= upper
+
+    def test_calculate_score_bounds_without_associations(self):
+        """Test that tag candidates that cannot have associated files are bounded tighter."""
+        archived = self.create_test_file(
+            's3://bucket/data/archived.bam', GenomicsFileType.BAM, 'DEEP_ARCHIVE'
+        )
+        path_match = self.create_test_file('s3://bucket/data/patient1.bam', GenomicsFileType.BAM)
+        path_match_lower, _ = self.scoring_engine.calculate_score_bounds(
+            path_match, ['patient1'], 'bam'
+        )
+
+        _, archived_upper = self.scoring_engine.calculate_score_bounds(
+            archived, ['patient1'], 'bam', pattern_score=0.0
+        )
+        assert archived_upper >= path_match_lower
+
+        # Without files to associate with, the tag candidate cannot catch up
+        _, archived_upper = self.scoring_engine.calculate_score_bounds(
+            archived, ['patient1'], 'bam', pattern_score=0.0, may_have_associations=False
+        )
+        assert archived_upper < path_match_lower
+
     def test_comprehensive_scoring_scenario(self):
         """Test a comprehensive scoring scenario with all components."""
         # Create a file that should score well
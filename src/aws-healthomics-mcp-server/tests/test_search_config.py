@@ -18,6 +18,9 @@ import os
 import pytest
 from awslabs.aws_healthomics_mcp_server.models import SearchConfig
 from awslabs.aws_healthomics_mcp_server.utils.search_config import (
+    get_catalog_full_sync_interval,
+    get_catalog_max_staleness,
+    get_catalog_path,
     get_enable_healthomics_search,
     get_enable_s3_tag_search,
     get_genomics_search_config,
@@ -25,6 +28,8 @@ from awslabs.aws_healthomics_mcp_server.utils.search_config import (
     get_max_tag_batch_size,
     get_result_cache_ttl,
     get_s3_bucket_paths,
+    get_s3_inventory_locations,
+    get_s3_inventory_max_age,
     get_search_timeout_seconds,
     get_tag_cache_ttl,
     validate_bucket_access_permissions,
@@ -92,6 +97,11 @@ class TestSearchConfig:
             'GENOMICS_SEARCH_MAX_TAG_BATCH_SIZE',
             'GENOMICS_SEARCH_RESULT_CACHE_TTL',
             'GENOMICS_SEARCH_TAG_CACHE_TTL',
+            'GENOMICS_SEARCH_CATALOG_PATH',
+            'GENOMICS_SEARCH_CATALOG_MAX_STALENESS',
+            'GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL',
+            'GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS',
+            'GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE',
         ]
         for var in env_vars_to_clear:
             if var in os.environ:
@@ -429,6 +439,71 @@ class TestSearchConfig:
 
         assert result == 0  # Zero is valid for cache TTL (disables caching)
 
+    def test_get_catalog_path_unset(self, monkeypatch):
+        """Test that the catalog is disabled when no path is configured."""
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_PATH', '  ')
+
+        assert get_catalog_path() is None
+
+    def test_get_catalog_path_expands_user(self, monkeypatch):
+        """Test that the catalog path is expanded to an absolute path."""
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_PATH', '~/genomics/catalog.db')
+
+        assert get_catalog_path() == os.path.expanduser('~/genomics/catalog.db')
+
+    def test_get_catalog_max_staleness(self, monkeypatch):
+        """Test getting the catalog staleness bound, including invalid values."""
+        assert get_catalog_max_staleness() == 300
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_MAX_STALENESS', '0')
+        assert get_catalog_max_staleness() == 0
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_MAX_STALENESS', '-1')
+        assert get_catalog_max_staleness() == 300
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_MAX_STALENESS', 'soon')
+        assert get_catalog_max_staleness() == 300
+
+    def test_get_catalog_full_sync_interval(self, monkeypatch):
+        """Test getting the catalog full sync interval, including invalid values."""
+        assert get_catalog_full_sync_interval() == 86400
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL', '3600')
+        assert get_catalog_full_sync_interval() == 3600
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL', '0')
+        assert get_catalog_full_sync_interval() == 86400
+
+        monkeypatch.setenv('GENOMICS_SEARCH_CATALOG_FULL_SYNC_INTERVAL', 'daily')
+        assert get_catalog_full_sync_interval() == 86400
+
+    def test_get_s3_inventory_locations(self, monkeypatch):
+        """Test parsing S3 and local inventory locations, skipping invalid S3 paths."""
+        assert get_s3_inventory_locations() == []
+
+        monkeypatch.setenv(
+            'GENOMICS_SEARCH_S3_INVENTORY_LOCATIONS',
+            's3://inventory-reports/genomics-data/daily, ~/inventory, s3://Invalid_Bucket/x,',
+        )
+
+        assert get_s3_inventory_locations() == [
+            's3://inventory-reports/genomics-data/daily/',
+            os.path.expanduser('~/inventory'),
+        ]
+
+    def test_get_s3_inventory_max_age(self, monkeypatch):
+        """Test getting the inventory snapshot age bound, including invalid values."""
+        assert get_s3_inventory_max_age() == 172800
+
+        monkeypatch.setenv('GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE', '90000')
+        assert get_s3_inventory_max_age() == 90000
+
+        monkeypatch.setenv('GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE', '0')
+        assert get_s3_inventory_max_age() == 172800
+
+        monkeypatch.setenv('GENOMICS_SEARCH_S3_INVENTORY_MAX_AGE', 'weekly')
+        assert get_s3_inventory_max_age() == 172800
+
     @patch('awslabs.aws_healthomics_mcp_server.utils.search_config.validate_and_normalize_s3_path')
     def test_get_genomics_search_config_complete(self, mock_validate):
         """Test getting complete genomics search configuration."""
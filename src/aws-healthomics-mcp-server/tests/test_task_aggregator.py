@@ -14,8 +14,12 @@
 
 """Unit and property-based tests for TaskAggregator class."""
 
+import polars as pl
 import pytest
-from awslabs.aws_healthomics_mcp_server.analysis.task_aggregator import TaskAggregator
+from awslabs.aws_healthomics_mcp_server.analysis.task_aggregator import (
+    CrossRunTaskAccumulator,
+    TaskAggregator,
+)
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
@@ -354,3 +358,92 @@ class TestTaskAggregatorAggregationPropertyBased:
                 f'Count invariant violated: sum of counts ({total_count}) '
                 f'!= input task count ({len(tasks)})'
             )
+
+
+def _reference_cross_run_aggregation(runs_data: list[dict]) -> dict:
+    """Aggregate runs with a single polars group_by over all tasks."""
+    all_tasks = [
+        {
+            'runId': run['runInfo']['runId'],
+            'baseTaskName': TaskAggregator.normalize_task_name(task['taskName']),
+            **{column: task[column] for column in task if column != 'taskName'},
+        }
+        for run in runs_data
+        for task in run['taskMetrics']
+    ]
+    aggregated = (
+        pl.DataFrame(all_tasks)
+        .group_by('baseTaskName')
+        .agg(
+            pl.col('runId').n_unique().alias('runCount'),
+            pl.len().alias('totalTaskCount'),
+            pl.col('runningSeconds').mean().alias('meanRunningSeconds'),
+            pl.col('runningSeconds').max().alias('maximumRunningSeconds'),
+            pl.col('cpuEfficiencyRatio').mean().alias('meanCpuUtilizationRatio'),
+            pl.col('memoryEfficiencyRatio').mean().alias('meanMemoryUtilizationRatio'),
+            pl.col('maxCpuUtilization').max().alias('maxObservedCpus'),
+            pl.col('maxMemoryUtilizationGiB').max().alias('maxObservedMemoryGiB'),
+            pl.col('estimatedUSD').sum().alias('totalEstimatedUSD'),
+        )
+    )
+    return {row['baseTaskName']: row for row in aggregated.to_dicts()}
+
+
+class TestCrossRunTaskAccumulator:
+    """Test cases for streaming cross-run aggregation."""
+
+    metric = st.floats(min_value=0.0, max_value=1000.0, allow_nan=False)
+    task = st.fixed_dictionaries(
+        {
+            'taskName': st.sampled_from(['align-0-1', 'align-1-1', 'call-0-1', 'sort', 'sort.1']),
+            'runningSeconds': metric,
+            'cpuEfficiencyRatio': metric,
+            'memoryEfficiencyRatio': metric,
+            'maxCpuUtilization': metric,
+            'maxMemoryUtilizationGiB': metric,
+            'estimatedUSD': metric,
+        }
+    )
+
+    @given(runs_tasks=st.lists(st.lists(task, max_size=8), min_size=1, max_size=6))
+    @settings(max_examples=100)
+    def test_property_matches_group_by_over_all_tasks(self, runs_tasks: list[list[dict]]):
+        """Property: Streaming aggregation matches a group_by over all tasks of all runs."""
+        runs_data = [
+            {'runInfo': {'runId': f'run-{i}'}, 'taskMetrics': tasks}
+            for i, tasks in enumerate(runs_tasks)
+        ]
+        accumulator = CrossRunTaskAccumulator()
+        for run_data in runs_data:
+            accumulator.add_run(run_data)
+
+        result = {row['baseTaskName']: row for row in accumulator.to_dataframe().to_dicts()}
+
+        if not any(runs_tasks):
+            assert result == {}
+            return
+        expected = _reference_cross_run_aggregation(runs_data)
+        assert result.keys() == expected.keys()
+        for base_name, row in result.items():
+            for column, value in expected[base_name].items():
+                assert row[column] == pytest.approx(value), (base_name, column)
+
+    def test_runs_can_be_consumed_lazily(self):
+        """Runs are read from any iterable, one at a time."""
+        consumed = []
+
+        def runs():
+            for i in range(3):
+                consumed.append(i)
+                yield {
+                    'runInfo': {'runId': f'run-{i}'},
+                    'taskMetrics': [{'taskName': 'align-0-1', 'estimatedUSD': 1.0}],
+                }
+
+        result = TaskAggregator().aggregate_cross_run_tasks(runs()).to_dicts()
+
+        assert consumed == [0, 1, 2]
+        assert result[0]['runCount'] == 3
+        assert result[0]['totalEstimatedUSD'] == 3.0
+        # Missing metrics default to zero like the per-run aggregation
+        assert result[0]['maximumRunningSeconds'] == 0.0
@@ -16,6 +16,7 @@
 
 import botocore.exceptions
 import pytest
+from awslabs.aws_healthomics_mcp_server.tools import workflow_analysis
 from awslabs.aws_healthomics_mcp_server.tools.run_analysis import (
     _convert_datetime_to_string,
     _normalize_run_ids,
@@ -23,6 +24,7 @@ from awslabs.aws_healthomics_mcp_server.tools.run_analysis import (
 )
 from awslabs.aws_healthomics_mcp_server.tools.workflow_analysis import (
     _get_logs_from_stream,
+    _read_logs,
     get_run_engine_logs,
     get_run_logs,
     get_run_manifest_logs,
@@ -1397,3 +1399,173 @@ class TestGetTaskLogsErrorHandling:
         # Assert
         assert 'error' in result
         assert 'Error retrieving task logs' in result['error']
+
+
+def _log_page(messages, start=0):
+    """Build GetLogEvents/FilterLogEvents events for messages, one second apart."""
+    return [
+        {'timestamp': 1640995200000 + (start + i) * 1000, 'message': message}
+        for i, message in enumerate(messages)
+    ]
+
+
+class TestReadLogs:
+    """Test reading several log pages with budgets, filters and summaries."""
+
+    @pytest.mark.asyncio
+    async def test_single_page_without_streaming_options(self, mock_logs_client):
+        """Without a filter, budget or summary exactly one page is read."""
+        mock_logs_client.get_log_events.return_value = {
+            'events': _log_page(['a']),
+            'nextForwardToken': 'f/1',
+        }
+
+        result = await _read_logs(mock_logs_client, 'group', 'stream', limit=10)
+
+        assert result == {
+            'events': [{'timestamp': '2022-01-01T00:00:00Z', 'message': 'a'}],
+            'nextToken': 'f/1',
+        }
+        mock_logs_client.get_log_events.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_follows_forward_tokens_to_end_of_stream(self, mock_logs_client):
+        """Pages are followed until GetLogEvents returns the token it was given."""
+        pages = {
+            None: {'events': _log_page(['a', 'b']), 'nextForwardToken': 'f/1'},
+            'f/1': {'events': [], 'nextForwardToken': 'f/2'},
+            'f/2': {'events': _log_page(['c'], 2), 'nextForwardToken': 'f/3'},
+            'f/3': {'events': [], 'nextForwardToken': 'f/3'},
+        }
+        mock_logs_client.get_log_events.side_effect = lambda **params: pages[
+            params.get('nextToken')
+        ]
+
+        result = await _read_logs(mock_logs_client, 'group', 'stream', limit=100, max_bytes=1024)
+
+        assert [event['message'] for event in result['events']] == ['a', 'b', 'c']
+        assert result['pagesRead'] == 4
+        assert result['bytesRead'] == 3
+        assert 'nextToken' not in result
+        assert mock_logs_client.get_log_events.call_args.kwargs['limit'] == 97
+
+    @pytest.mark.asyncio
+    async def test_stops_at_event_and_byte_budgets(self, mock_logs_client):
+        """Reading stops once limit events or max_bytes bytes have been read."""
+        mock_logs_client.get_log_events.side_effect = lambda **params: {
+            'events': _log_page(['x' * 10] * min(params['limit'], 2)),
+            'nextForwardToken': f'{params.get("nextToken", "")}+',
+        }
+
+        by_events = await _read_logs(mock_logs_client, 'group', 'stream', limit=5, max_bytes=10**6)
+        by_bytes = await _read_logs(mock_logs_client, 'group', 'stream', limit=100, max_bytes=35)
+
+        assert len(by_events['events']) == 5
+        assert by_events['nextToken'] == '+++'
+        assert len(by_bytes['events']) == 4
+        assert by_bytes['bytesRead'] == 40
+        assert by_bytes['nextToken'] == '++'
+
+    @pytest.mark.asyncio
+    async def test_backward_pages_are_returned_in_order(self, mock_logs_client):
+        """Pages read from the tail follow backward tokens and are returned chronologically."""
+        pages = {
+            None: {'events': _log_page(['c', 'd'], 2), 'nextBackwardToken': 'b/1'},
+            'b/1': {'events': _log_page(['a', 'b']), 'nextBackwardToken': 'b/2'},
+        }
+        mock_logs_client.get_log_events.side_effect = lambda **params: pages[
+            params.get('nextToken')
+        ]
+
+        result = await _read_logs(
+            mock_logs_client, 'group', 'stream', limit=4, start_from_head=False, max_bytes=1024
+        )
+
+        assert [event['message'] for event in result['events']] == ['a', 'b', 'c', 'd']
+        assert result['nextToken'] == 'b/2'
+
+    @pytest.mark.asyncio
+    async def test_filter_pattern_uses_filter_log_events(self, mock_logs_client):
+        """Filter patterns are applied server-side, following nextToken."""
+        pages = {
+            None: {'events': [], 'nextToken': 'n/1'},
+            'n/1': {'events': _log_page(['ERROR one'])},
+        }
+        mock_logs_client.filter_log_events.side_effect = lambda **params: pages[
+            params.get('nextToken')
+        ]
+
+        result = await _read_logs(
+            mock_logs_client,
+            'group',
+            'stream',
+            start_time='2022-01-01T00:00:00Z',
+            limit=10,
+            filter_pattern='ERROR',
+        )
+
+        assert [event['message'] for event in result['events']] == ['ERROR one']
+        assert 'nextToken' not in result
+        params = mock_logs_client.filter_log_events.call_args.kwargs
+        assert params['logStreamNames'] == ['stream']
+        assert params['filterPattern'] == 'ERROR'
+        assert params['startTime'] == 1640995200000
+        mock_logs_client.get_log_events.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_summarize_ignores_limit_and_returns_no_events(self, mock_logs_client):
+        """Summaries cover all pages within the byte budget instead of returning events."""
+        pages = {
+            None: {
+                'events': _log_page(['INFO start', 'ERROR task 1 failed after 12 s']),
+                'nextForwardToken': 'f/1',
+            },
+            'f/1': {
+                'events': _log_page(['ERROR task 2 failed after 30 s', 'WARN slow'], 2),
+                'nextForwardToken': 'f/1',
+            },
+        }
+        mock_logs_client.get_log_events.side_effect = lambda **params: pages[
+            params.get('nextToken')
+        ]
+
+        result = await _read_logs(mock_logs_client, 'group', 'stream', limit=1, summarize=True)
+
+        assert 'events' not in result
+        summary = result['summary']
+        assert summary['eventCount'] == 4
+        assert summary['levelCounts'] == {'INFO': 1, 'ERROR': 2, 'WARN': 1}
+        assert summary['errorClusterCount'] == 1
+        assert summary['errorClusters'][0]['count'] == 2
+        assert summary['errorClusters'][0]['template'] == 'ERROR task <N> failed after <N> s'
+        assert mock_logs_client.get_log_events.call_args.kwargs['limit'] == (
+            workflow_analysis.MAX_LOG_PAGE_EVENTS
+        )
+
+    @patch('awslabs.aws_healthomics_mcp_server.tools.workflow_analysis.get_logs_client')
+    @pytest.mark.asyncio
+    async def test_task_logs_tool_passes_streaming_options(
+        self, mock_get_logs_client, mock_context
+    ):
+        """The log tools accept the streaming options."""
+        mock_client = MagicMock()
+        mock_get_logs_client.return_value = mock_client
+        mock_client.filter_log_events.return_value = {'events': _log_page(['Killed'])}
+
+        result = await get_task_logs(
+            ctx=mock_context,
+            run_id='run-12345',
+            task_id='task-1',
+            start_time=None,
+            end_time=None,
+            limit=100,
+            next_token=None,
+            start_from_head=True,
+            filter_pattern='Killed',
+            summarize=True,
+        )
+
+        assert result['summary']['errorEventCount'] == 1
+        params = mock_client.filter_log_events.call_args.kwargs
+        assert params['logGroupName'] == '/aws/omics/WorkflowLog'
+        assert params['logStreamNames'] == ['run/run-12345/task/task-1']
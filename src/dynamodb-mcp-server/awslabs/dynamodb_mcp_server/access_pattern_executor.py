@@ -0,0 +1,418 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Direct execution of data model validation access patterns with boto3."""
+
+import asyncio
+import base64
+import datetime
+import json
+import shlex
+import time
+from botocore import xform_name
+from dataclasses import dataclass
+from loguru import logger
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set
+
+
+MAX_CONCURRENT_ACCESS_PATTERNS = 8
+
+# Operations that only read items; every other operation is ordered as a write
+READ_OPERATIONS = frozenset({'GetItem', 'Query', 'Scan', 'BatchGetItem', 'TransactGetItems'})
+
+# Operations whose pages the AWS CLI aggregates into a single response
+PAGINATED_OPERATIONS = frozenset({'Query', 'Scan'})
+
+# AWS CLI global options that do not change the DynamoDB request
+IGNORED_CLI_OPTIONS = frozenset({'--output', '--region', '--endpoint-url', '--color'})
+IGNORED_CLI_FLAGS = frozenset({'--no-cli-pager', '--debug'})
+
+
+class UnsupportedCommandError(Exception):
+    """Raised when an AWS CLI command cannot be translated into a DynamoDB API request."""
+
+
+@dataclass(frozen=True)
+class DynamoDBRequest:
+    """DynamoDB API request parsed from an AWS CLI command.
+
+    Attributes:
+        operation: API operation name (e.g. 'Query')
+        params: Request parameters
+        tables: Tables accessed by the request, or None if they are not known
+        paginate: Whether to follow LastEvaluatedKey and aggregate the pages
+    """
+
+    operation: str
+    params: Dict[str, Any]
+    tables: Optional[FrozenSet[str]]
+    paginate: bool
+
+    @property
+    def is_read(self) -> bool:
+        """Whether the request only reads items."""
+        if self.operation == 'ExecuteStatement':
+            return self.params.get('Statement', '').lstrip().upper().startswith('SELECT')
+        return self.operation in READ_OPERATIONS
+
+
+class DynamoDBCommandParser:
+    """Parse `aws dynamodb` CLI commands into DynamoDB API requests.
+
+    Options are mapped to request parameters with the DynamoDB service model, the
+    same way the AWS CLI names them. JSON values, integers, strings and boolean
+    flags (`--flag`/`--no-flag`) are supported; commands using shorthand syntax,
+    `file://` values or CLI-only options such as `--query` and `--max-items` raise
+    UnsupportedCommandError.
+    """
+
+    def __init__(self, service_model):
+        """Initialize the parser.
+
+        Args:
+            service_model: botocore service model of DynamoDB
+        """
+        self._service_model = service_model
+        self._operations = {xform_name(name, '-'): name for name in service_model.operation_names}
+
+    def parse(self, command: str) -> DynamoDBRequest:
+        """Parse an AWS CLI command.
+
+        Args:
+            command: AWS CLI command string (must start with 'aws dynamodb')
+
+        Returns:
+            The DynamoDB API request of the command
+
+        Raises:
+            ValueError: If command doesn't start with 'aws dynamodb'
+            UnsupportedCommandError: If the command cannot be translated
+        """
+        if not command.strip().startswith('aws dynamodb'):
+            raise ValueError("Command must start with 'aws dynamodb'")
+
+        try:
+            tokens = shlex.split(command)
+        except ValueError as e:
+            raise UnsupportedCommandError(f'Cannot split command: {e}')
+        if len(tokens) < 3 or tokens[1] != 'dynamodb':
+            raise UnsupportedCommandError('Missing DynamoDB operation')
+
+        operation = self._operations.get(tokens[2])
+        if operation is None:
+            raise UnsupportedCommandError(f'Unknown DynamoDB operation: {tokens[2]}')
+        input_shape = self._service_model.operation_model(operation).input_shape
+        members = input_shape.members if input_shape else {}
+        options = {xform_name(name, '-'): name for name in members}
+
+        params: Dict[str, Any] = {}
+        paginate = operation in PAGINATED_OPERATIONS
+        args = tokens[3:]
+        index = 0
+        while index < len(args):
+            option = args[index]
+            index += 1
+            value = None
+            if '=' in option:
+                option, value = option.split('=', 1)
+            if not option.startswith('--'):
+                raise UnsupportedCommandError(f'Unexpected argument: {option}')
+
+            if option in IGNORED_CLI_FLAGS:
+                continue
+            if option == '--no-paginate':
+                paginate = False
+                continue
+            if option in IGNORED_CLI_OPTIONS:
+                if value is None:
+                    index += 1
+                continue
+
+            name = option[2:]
+            negated = name not in options and name.startswith('no-')
+            member = options.get(name[3:] if negated else name)
+            if member is None:
+                raise UnsupportedCommandError(f'Unsupported option: {option}')
+
+            shape = members[member]
+            if shape.type_name == 'boolean' and value is None:
+                params[member] = not negated
+                continue
+            if negated:
+                raise UnsupportedCommandError(f'Unsupported option: {option}')
+            if value is None:
+                if index >= len(args):
+                    raise UnsupportedCommandError(f'Missing value for {option}')
+                value = args[index]
+                index += 1
+            params[member] = self._convert_value(option, value, shape.type_name)
+
+        if 'ReturnConsumedCapacity' in members and 'ReturnConsumedCapacity' not in params:
+            params['ReturnConsumedCapacity'] = 'TOTAL'
+        if 'Limit' in params:
+            paginate = False
+
+        return DynamoDBRequest(
+            operation=operation,
+            params=params,
+            tables=self._get_tables(params),
+            paginate=paginate,
+        )
+
+    @staticmethod
+    def _convert_value(option: str, value: str, type_name: str) -> Any:
+        """Convert a CLI option value to the type of its request parameter."""
+        if value.startswith(('file://', 'fileb://')):
+            raise UnsupportedCommandError(f'File values are not supported: {option}')
+        if type_name in ('structure', 'map', 'list'):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                raise UnsupportedCommandError(f'Value of {option} is not JSON')
+        if type_name in ('integer', 'long'):
+            try:
+                return int(value)
+            except ValueError:
+                raise UnsupportedCommandError(f'Value of {option} is not an integer')
+        if type_name == 'string':
+            return value
+        if type_name == 'boolean' and value.lower() in ('true', 'false'):
+            return value.lower() == 'true'
+        raise UnsupportedCommandError(f'Unsupported value type for {option}: {type_name}')
+
+    @staticmethod
+    def _get_tables(params: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """Get the tables accessed by a request, or None if they are not known."""
+        if isinstance(params.get('TableName'), str):
+            return frozenset([params['TableName']])
+        if isinstance(params.get('RequestItems'), dict):
+            return frozenset(params['RequestItems'])
+        if isinstance(params.get('TransactItems'), list):
+            tables = set()
+            for transact_item in params['TransactItems']:
+                for action in transact_item.values() if isinstance(transact_item, dict) else []:
+                    if not isinstance(action, dict) or 'TableName' not in action:
+                        return None
+                    tables.add(action['TableName'])
+            return frozenset(tables)
+        return None
+
+
+def _conflicts(earlier: Optional[DynamoDBRequest], later: Optional[DynamoDBRequest]) -> bool:
+    """Whether a request must wait for an earlier request to keep the sequential results.
+
+    Requests that could not be parsed are run through the AWS CLI and conflict with
+    every other request.
+    """
+    if earlier is None or later is None:
+        return True
+    if earlier.is_read and later.is_read:
+        return False
+    if earlier.tables is None or later.tables is None:
+        return True
+    return not earlier.tables.isdisjoint(later.tables)
+
+
+def _get_modified_tables(
+    access_patterns: List[Dict[str, Any]], requests: List[Optional[DynamoDBRequest]]
+) -> Optional[FrozenSet[str]]:
+    """Get the tables that access patterns may write to, or None if they are not known."""
+    tables: Set[str] = set()
+    for pattern, request in zip(access_patterns, requests):
+        if 'implementation' not in pattern:
+            continue
+        if request is None or (not request.is_read and request.tables is None):
+            return None
+        if not request.is_read:
+            tables.update(request.tables)
+    return frozenset(tables)
+
+
+def _merge_pages(response: Dict[str, Any], page: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregate a Query or Scan page into the response of the previous pages."""
+    merged = dict(page)
+    merged['Items'] = response.get('Items', []) + page.get('Items', [])
+    for key in ('Count', 'ScannedCount'):
+        merged[key] = response.get(key, 0) + page.get(key, 0)
+    if 'ConsumedCapacity' in response and 'ConsumedCapacity' in page:
+        merged['ConsumedCapacity'] = {
+            **page['ConsumedCapacity'],
+            'CapacityUnits': response['ConsumedCapacity'].get('CapacityUnits', 0)
+            + page['ConsumedCapacity'].get('CapacityUnits', 0),
+        }
+    return merged
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Convert binary values to base64 and timestamps to ISO 8601 strings, like the AWS CLI."""
+    if isinstance(value, dict):
+        return {key: _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode('ascii')
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+class AccessPatternExecutor:
+    """Execute data model validation access patterns with a shared DynamoDB client.
+
+    The AWS CLI implementation of each access pattern is parsed once into a DynamoDB
+    API request and sent with the same client. Reads run concurrently, up to
+    max_concurrency at a time, while a pattern waits for the earlier patterns on the
+    same tables whenever either of them writes, so every pattern sees the same table
+    state as in a sequential run. Implementations that cannot be translated are run
+    with the fallback command runner, one at a time.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client,
+        fallback: Optional[Callable[[str], Awaitable[Any]]] = None,
+        max_concurrency: int = MAX_CONCURRENT_ACCESS_PATTERNS,
+    ):
+        """Initialize the executor.
+
+        Args:
+            dynamodb_client: boto3 DynamoDB client
+            fallback: Coroutine function running an AWS CLI command that cannot be
+                translated into an API request
+            max_concurrency: Maximum number of access patterns executed at a time
+        """
+        self._client = dynamodb_client
+        self._parser = DynamoDBCommandParser(dynamodb_client.meta.service_model)
+        self._fallback = fallback
+        self.max_concurrency = max_concurrency
+        # Tables the last execution may have written to, None if not known
+        self.modified_tables: Optional[FrozenSet[str]] = None
+
+    async def execute(self, access_patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute access patterns.
+
+        Args:
+            access_patterns: Access patterns with AWS CLI implementations
+
+        Returns:
+            Execution result of each access pattern, in order. Patterns without an
+            implementation are returned unchanged.
+
+        Raises:
+            ValueError: If an implementation doesn't start with 'aws dynamodb'
+        """
+        requests: List[Optional[DynamoDBRequest]] = []
+        for pattern in access_patterns:
+            requests.append(
+                self._parse(pattern['implementation']) if 'implementation' in pattern else None
+            )
+        self.modified_tables = _get_modified_tables(access_patterns, requests)
+
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: Dict[int, asyncio.Task] = {}
+        for index, pattern in enumerate(access_patterns):
+            if 'implementation' not in pattern:
+                continue
+            dependencies = [
+                task
+                for earlier_index, task in tasks.items()
+                if _conflicts(requests[earlier_index], requests[index])
+            ]
+            tasks[index] = asyncio.create_task(
+                self._execute_pattern(pattern, requests[index], dependencies, semaphore)
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        cli_count = sum(1 for index in tasks if requests[index] is None)
+        logger.info(
+            f'Executed {len(tasks)} access patterns ({cli_count} with the AWS CLI) in '
+            f'{(time.perf_counter() - start_time) * 1000:.1f}ms'
+        )
+        return [
+            tasks[index].result() if index in tasks else pattern
+            for index, pattern in enumerate(access_patterns)
+        ]
+
+    def _parse(self, command: str) -> Optional[DynamoDBRequest]:
+        """Parse a command, or return None if it has to be run with the AWS CLI."""
+        try:
+            return self._parser.parse(command)
+        except UnsupportedCommandError as e:
+            logger.debug(f'Running access pattern with the AWS CLI ({e}): {command}')
+            return None
+
+    async def _execute_pattern(
+        self,
+        pattern: Dict[str, Any],
+        request: Optional[DynamoDBRequest],
+        dependencies: List[asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        """Execute an access pattern once the patterns it depends on are done."""
+        if dependencies:
+            await asyncio.wait(dependencies)
+
+        command = pattern['implementation']
+        async with semaphore:
+            start_time = time.perf_counter()
+            if request is None:
+                response = await self._run_fallback(command)
+                consumed_capacity = None
+            else:
+                response = await asyncio.to_thread(self._send_request, request)
+                consumed_capacity = (
+                    response.get('ConsumedCapacity') if isinstance(response, dict) else None
+                )
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+        return {
+            'pattern_id': pattern.get('pattern'),
+            'description': pattern.get('description'),
+            'dynamodb_operation': pattern.get('dynamodb_operation'),
+            'command': command,
+            'response': response,
+            'latency_ms': round(latency_ms, 3),
+            'consumed_capacity': consumed_capacity,
+        }
+
+    async def _run_fallback(self, command: str) -> Any:
+        """Run a command that cannot be translated with the fallback command runner."""
+        if self._fallback is None:
+            return f'Unsupported command: {command}'
+        result = await self._fallback(command)
+        return result if isinstance(result, dict) else str(result)
+
+    def _send_request(self, request: DynamoDBRequest) -> Any:
+        """Send a request, following the pages of paginated operations.
+
+        Returns:
+            The JSON compatible response, or the error message if the request failed
+        """
+        method = getattr(self._client, xform_name(request.operation))
+        params = dict(request.params)
+        try:
+            response = method(**params)
+            while request.paginate and response.get('LastEvaluatedKey'):
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                response = _merge_pages(response, method(**params))
+        except Exception as e:
+            return str(e)
+        response.pop('ResponseMetadata', None)
+        return _to_json_compatible(response)
@@ -25,6 +25,7 @@ from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
     PutItemAccessPattern,
     QueryAccessPattern,
     ScanAccessPattern,
+    ScenarioSweep,
     Table,
     TransactGetItemsAccessPattern,
     TransactWriteItemsAccessPattern,
@@ -45,6 +46,7 @@ __all__ = [
     'PutItemAccessPattern',
     'QueryAccessPattern',
     'ScanAccessPattern',
+    'ScenarioSweep',
     'Table',
     'TransactGetItemsAccessPattern',
     'TransactWriteItemsAccessPattern',
@@ -15,37 +15,46 @@
 """Runner for DynamoDB Cost & Performance Calculator workflow."""
 
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.cost_calculator import calculate_cost
-from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import DataModel
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
+    DataModel,
+    ScenarioSweep,
+)
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.report_generator import (
     REPORT_END_MARKER,
     REPORT_START_MARKER,
     generate_report,
 )
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.scenario_sweep import sweep_costs
 from pathlib import Path
 
 
 _REPORT_FILENAME = 'dynamodb_data_model.md'
 
 
-def run_cost_calculator(data_model: DataModel, workspace_dir: str) -> str:
+def run_cost_calculator(
+    data_model: DataModel, workspace_dir: str, scenario_sweep: ScenarioSweep | None = None
+) -> str:
     """Execute cost calculator workflow: calculate costs and generate report.
 
     Args:
         data_model: Validated DataModel instance.
         workspace_dir: Pre-validated path to append report to dynamodb_data_model.md.
+        scenario_sweep: Optional what-if scenarios to summarize in the report.
 
     Returns:
         Summary message describing what was analyzed.
     """
     cost_model = calculate_cost(data_model)
-    report = generate_report(data_model, cost_model)
+    sweep_result = sweep_costs(data_model, scenario_sweep) if scenario_sweep else None
+    report = generate_report(data_model, cost_model, sweep_result)
     _replace_or_append_report(report, workspace_dir)
 
     pattern_count = len(data_model.access_pattern_list)
     table_count = len(data_model.table_list)
+    sweep_summary = f', swept {len(sweep_result)} what-if scenarios' if sweep_result else ''
     return (
         f'Cost analysis complete. Analyzed {pattern_count} access patterns '
-        f'across {table_count} tables. Report written to {_REPORT_FILENAME}'
+        f'across {table_count} tables{sweep_summary}. Report written to {_REPORT_FILENAME}'
     )
 
 
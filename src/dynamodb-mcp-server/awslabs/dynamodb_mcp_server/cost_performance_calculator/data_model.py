@@ -25,7 +25,7 @@ from pydantic import (
     model_validator,
 )
 from pydantic.types import StringConstraints
-from typing import Annotated, List, Literal, Optional, Union
+from typing import Annotated, Dict, List, Literal, Optional, Union
 from typing_extensions import Self
 
 
@@ -53,6 +53,8 @@ WCU_SIZE = 1024
 # https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/CapacityUnitCalculations.html
 STORAGE_OVERHEAD_BYTES = 100
 
+MAX_SWEEP_SCENARIOS = 100_000
+
 
 NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
 ItemSizeBytes = Annotated[int, Field(ge=1, le=MAX_ITEM_SIZE_BYTES)]
@@ -423,6 +425,44 @@ class DataModel(BaseModel):
                 )
 
 
+class ScenarioSweep(BaseModel):
+    """Grid of what-if scenarios evaluated against a data model.
+
+    Every combination of the multipliers and GSI item sizes is one scenario.
+    Item size multipliers apply to tables, GSIs and access patterns; GSI item
+    sizes stand for projection choices (e.g. KEYS_ONLY vs ALL) and apply to
+    the GSIs of that name.
+    """
+
+    rps_multipliers: Annotated[List[PositiveFloat], Field(min_length=1)] = [1.0]
+    item_size_multipliers: Annotated[List[PositiveFloat], Field(min_length=1)] = [1.0]
+    item_count_multipliers: Annotated[List[PositiveFloat], Field(min_length=1)] = [1.0]
+    gsi_item_size_bytes: Dict[NonEmptyStr, Annotated[List[ItemSizeBytes], Field(min_length=1)]] = (
+        Field(default_factory=dict)
+    )
+
+    def scenario_count(self) -> int:
+        """Number of scenarios in the grid."""
+        count = (
+            len(self.rps_multipliers)
+            * len(self.item_size_multipliers)
+            * len(self.item_count_multipliers)
+        )
+        for sizes in self.gsi_item_size_bytes.values():
+            count *= len(sizes)
+        return count
+
+    @model_validator(mode='after')
+    def _validate_scenario_count(self) -> 'ScenarioSweep':
+        """Validate the number of scenarios."""
+        if self.scenario_count() > MAX_SWEEP_SCENARIOS:
+            raise ValueError(
+                f'too many scenarios. scenario_count: {self.scenario_count()}, '
+                f'max: {MAX_SWEEP_SCENARIOS}'
+            )
+        return self
+
+
 _ERROR_MESSAGE_MAP = {
     'string_too_short': 'cannot be empty',
     'greater_than': 'must be greater than {gt}',
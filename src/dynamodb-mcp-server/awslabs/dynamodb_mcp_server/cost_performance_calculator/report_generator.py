@@ -24,6 +24,7 @@ from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
     AccessPattern,
     DataModel,
 )
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.scenario_sweep import SweepResult
 
 
 REPORT_START_MARKER = '## Cost Report'
@@ -80,12 +81,15 @@ def _generate_padded_table(headers: list[str], rows: list[list[str]]) -> str:
     return '\n'.join([header_line, separator_line] + data_lines)
 
 
-def generate_report(data_model: DataModel, cost_model: CostModel) -> str:
+def generate_report(
+    data_model: DataModel, cost_model: CostModel, sweep_result: SweepResult | None = None
+) -> str:
     """Generate concise markdown report.
 
     Args:
         data_model: Validated data model
         cost_model: Cost model with computed metrics
+        sweep_result: Optional what-if scenario sweep to summarize
 
     Returns:
         Markdown-formatted report string
@@ -111,6 +115,8 @@ def generate_report(data_model: DataModel, cost_model: CostModel) -> str:
         _generate_storage_section(storage_rows, storage_cost),
         _generate_rw_section(data_model, cost_model, rw_summary_rows, rw_cost),
     ]
+    if sweep_result is not None and len(sweep_result):
+        sections.append(_generate_sweep_section(sweep_result))
 
     report = '\n\n'.join(sections)
 
@@ -362,3 +368,85 @@ def _generate_rw_section(
             lines.append(_generate_padded_table(detail_headers, read_rows + amp_rows))
 
     return '\n'.join(lines)
+
+
+def _format_multiplier(value: float) -> str:
+    """Format a scenario multiplier as Nx."""
+    return f'{value:g}x'
+
+
+def _sweep_scenario_row(label: str, sweep_result: SweepResult, index: int) -> list[str]:
+    """Build a what-if scenario table row."""
+    gsi_sizes = ', '.join(
+        f'{name}={size:g}'
+        for name, size in zip(sweep_result.gsi_names, sweep_result.gsi_item_size[index])
+    )
+    return [
+        label,
+        _format_multiplier(sweep_result.rps_multiplier[index]),
+        _format_multiplier(sweep_result.item_size_multiplier[index]),
+        _format_multiplier(sweep_result.item_count_multiplier[index]),
+        gsi_sizes or '-',
+        f'{sweep_result.read_units_per_second[index]:.2f}',
+        f'{sweep_result.write_units_per_second[index]:.2f}',
+        _format_cost(
+            sweep_result.read_cost[index]
+            + sweep_result.write_cost[index]
+            + sweep_result.gsi_write_cost[index]
+        ),
+        _format_cost(sweep_result.storage_cost[index]),
+        _format_cost(sweep_result.total_cost[index]),
+    ]
+
+
+def _generate_sweep_section(sweep_result: SweepResult) -> str:
+    """Generate the what-if scenarios section.
+
+    Shows the lowest, median, 90th percentile and highest cost scenarios, and the
+    range of total costs for each traffic multiplier.
+    """
+    total_cost = sweep_result.total_cost
+    order = total_cost.argsort(kind='stable')
+    picks = {
+        'Lowest': order[0],
+        'Median': order[(len(order) - 1) // 2],
+        'P90': order[min(int(len(order) * 0.9), len(order) - 1)],
+        'Highest': order[-1],
+    }
+    scenario_rows = []
+    seen = set()
+    for label, index in picks.items():
+        if index not in seen:
+            seen.add(index)
+            scenario_rows.append(_sweep_scenario_row(label, sweep_result, index))
+
+    traffic_rows = []
+    for multiplier in sorted(set(sweep_result.rps_multiplier.tolist())):
+        costs = total_cost[sweep_result.rps_multiplier == multiplier]
+        traffic_rows.append(
+            [_format_multiplier(multiplier), _format_cost(costs.min()), _format_cost(costs.max())]
+        )
+
+    scenario_headers = [
+        'Scenario',
+        'Traffic',
+        'Item Size',
+        'Item Count',
+        'GSI Item Size (bytes)',
+        'RRU/s',
+        'WRU/s',
+        'Requests',
+        'Storage',
+        'Monthly Cost',
+    ]
+    lines = [
+        '### What-If Scenarios',
+        '',
+        f'**Scenarios:** {len(sweep_result)}',
+        '',
+        _generate_padded_table(scenario_headers, scenario_rows),
+        '',
+        _generate_padded_table(['Traffic', 'Lowest Cost', 'Highest Cost'], traffic_rows),
+    ]
+
+    return '\n'.join(lines)
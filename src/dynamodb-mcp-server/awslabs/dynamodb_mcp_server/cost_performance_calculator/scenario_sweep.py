@@ -0,0 +1,284 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized what-if cost sweeps for DynamoDB Cost & Performance Calculator."""
+
+import numpy as np
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.cost_calculator import (
+    RCU_PRICE,
+    SECONDS_PER_MONTH,
+    STORAGE_PRICE,
+    WCU_PRICE,
+)
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
+    MAX_ITEM_SIZE_BYTES,
+    RCU_SIZE,
+    STORAGE_OVERHEAD_BYTES,
+    WCU_SIZE,
+    DataModel,
+    ScenarioSweep,
+)
+from dataclasses import dataclass
+
+
+# Scenarios evaluated at a time, bounding the size of the (scenario, pattern) arrays
+SWEEP_CHUNK_SIZE = 10_000
+
+_READ_OPERATIONS = ('GetItem', 'Query', 'Scan', 'BatchGetItem', 'TransactGetItems')
+# Operations whose item_count multiplies the size of a single read
+_AGGREGATED_READ_OPERATIONS = ('Query', 'Scan')
+_TRANSACTIONAL_OPERATIONS = ('TransactGetItems', 'TransactWriteItems')
+
+
+@dataclass(frozen=True)
+class CompiledDataModel:
+    """Data model compiled into arrays, indexed by pattern (P), table (T) and GSI (G).
+
+    Capacity units of pattern p for an item size s are
+    `read_factor[p] * ceil(s * size_count[p] / RCU_SIZE) * unit_count[p]` and
+    `write_factor[p] * ceil(s / WCU_SIZE) * unit_count[p]`, which covers every
+    operation of the data model.
+    """
+
+    rps: np.ndarray
+    item_size: np.ndarray
+    size_count: np.ndarray
+    unit_count: np.ndarray
+    read_factor: np.ndarray
+    write_factor: np.ndarray
+    read_gsi: np.ndarray  # GSI read by the pattern, -1 for the base table
+    gsi_writes: np.ndarray  # (P, G) GSI writes per request
+    table_item_size: np.ndarray
+    table_item_count: np.ndarray
+    gsi_names: list[str]
+    gsi_table: np.ndarray
+    gsi_item_size: np.ndarray
+    gsi_item_count: np.ndarray
+
+
+def compile_data_model(data_model: DataModel) -> CompiledDataModel:
+    """Compile a data model into arrays.
+
+    Args:
+        data_model: Validated data model
+
+    Returns:
+        Compiled data model
+    """
+    table_index = {table.name: i for i, table in enumerate(data_model.table_list)}
+    gsi_index = {}
+    gsi_names, gsi_table, gsi_item_size, gsi_item_count = [], [], [], []
+    for table in data_model.table_list:
+        for gsi in table.gsi_list:
+            gsi_index[(table.name, gsi.name)] = len(gsi_names)
+            gsi_names.append(gsi.name)
+            gsi_table.append(table_index[table.name])
+            gsi_item_size.append(gsi.item_size_bytes)
+            gsi_item_count.append(gsi.item_count)
+
+    patterns = data_model.access_pattern_list
+    read_factor = np.zeros(len(patterns))
+    write_factor = np.zeros(len(patterns))
+    size_count = np.ones(len(patterns))
+    unit_count = np.ones(len(patterns))
+    read_gsi = np.full(len(patterns), -1)
+    gsi_writes = np.zeros((len(patterns), len(gsi_names)))
+    for p, ap in enumerate(patterns):
+        item_count = getattr(ap, 'item_count', 1)
+        transactional = 2.0 if ap.operation in _TRANSACTIONAL_OPERATIONS else 1.0
+        if ap.operation in _AGGREGATED_READ_OPERATIONS:
+            size_count[p] = item_count
+        else:
+            unit_count[p] = item_count
+        if ap.operation in _READ_OPERATIONS:
+            consistency = ap.consistency_multiplier() if hasattr(ap, 'strongly_consistent') else 1
+            read_factor[p] = transactional * consistency
+        else:
+            write_factor[p] = transactional
+        if getattr(ap, 'gsi', None) is not None:
+            read_gsi[p] = gsi_index[(ap.table, ap.gsi)]
+        for gsi_name in getattr(ap, 'gsi_list', []):
+            gsi_writes[p, gsi_index[(ap.table, gsi_name)]] = item_count
+
+    return CompiledDataModel(
+        rps=np.array([ap.rps for ap in patterns], dtype=float),
+        item_size=np.array([ap.item_size_bytes for ap in patterns], dtype=float),
+        size_count=size_count,
+        unit_count=unit_count,
+        read_factor=read_factor,
+        write_factor=write_factor,
+        read_gsi=read_gsi,
+        gsi_writes=gsi_writes,
+        table_item_size=np.array([t.item_size_bytes for t in data_model.table_list], dtype=float),
+        table_item_count=np.array([t.item_count for t in data_model.table_list], dtype=float),
+        gsi_names=gsi_names,
+        gsi_table=np.array(gsi_table, dtype=int),
+        gsi_item_size=np.array(gsi_item_size, dtype=float),
+        gsi_item_count=np.array(gsi_item_count, dtype=float),
+    )
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Monthly costs and throughput of every scenario of a sweep, indexed by scenario.
+
+    gsi_item_size is a (scenario, GSI) array of the item sizes set by the sweep for
+    the GSIs in gsi_names.
+    """
+
+    rps_multiplier: np.ndarray
+    item_size_multiplier: np.ndarray
+    item_count_multiplier: np.ndarray
+    gsi_names: list[str]
+    gsi_item_size: np.ndarray
+    read_units_per_second: np.ndarray
+    write_units_per_second: np.ndarray
+    read_cost: np.ndarray
+    write_cost: np.ndarray
+    gsi_write_cost: np.ndarray
+    storage_cost: np.ndarray
+
+    @property
+    def total_cost(self) -> np.ndarray:
+        """Total monthly cost of each scenario."""
+        return self.read_cost + self.write_cost + self.gsi_write_cost + self.storage_cost
+
+    def __len__(self) -> int:
+        """Number of scenarios."""
+        return len(self.rps_multiplier)
+
+
+def _scaled_size(size: np.ndarray, multiplier: np.ndarray) -> np.ndarray:
+    """Scale item sizes, rounded up to whole bytes within the DynamoDB item size limits."""
+    return np.clip(np.ceil(size * multiplier), 1, MAX_ITEM_SIZE_BYTES)
+
+
+def _expand_grid(sweep: ScenarioSweep) -> tuple[np.ndarray, ...]:
+    """Expand the sweep into one array per dimension, with an entry per scenario."""
+    dimensions = [
+        np.array(sweep.rps_multipliers, dtype=float),
+        np.array(sweep.item_size_multipliers, dtype=float),
+        np.array(sweep.item_count_multipliers, dtype=float),
+    ] + [np.array(sizes, dtype=float) for sizes in sweep.gsi_item_size_bytes.values()]
+    grid = np.meshgrid(*dimensions, indexing='ij')
+    return tuple(axis.ravel() for axis in grid)
+
+
+def sweep_costs(data_model: DataModel, sweep: ScenarioSweep) -> SweepResult:
+    """Evaluate the cost of every scenario of a sweep.
+
+    With all multipliers at 1 and no GSI item sizes, a scenario costs the same as
+    calculate_cost for the data model.
+
+    Args:
+        data_model: Validated data model
+        sweep: Grid of scenarios
+
+    Returns:
+        Costs and throughput of each scenario, in grid order
+
+    Raises:
+        ValueError: If the sweep sets the item size of a GSI that does not exist
+    """
+    model = compile_data_model(data_model)
+    for name in sweep.gsi_item_size_bytes:
+        if name not in model.gsi_names:
+            raise ValueError(f'GSI does not exist. gsi: "{name}"')
+    rps_multiplier, size_multiplier, count_multiplier, *gsi_dimensions = _expand_grid(sweep)
+    scenario_count = len(rps_multiplier)
+
+    # GSI item size of each scenario, NaN to scale the item size of the data model
+    gsi_override = np.full((scenario_count, len(model.gsi_names)), np.nan)
+    gsi_names = np.array(model.gsi_names, dtype=object)
+    for name, sizes in zip(sweep.gsi_item_size_bytes, gsi_dimensions):
+        gsi_override[:, gsi_names == name] = sizes[:, None]
+
+    columns = {
+        name: np.empty(scenario_count)
+        for name in (
+            'read_units_per_second',
+            'write_units_per_second',
+            'read_cost',
+            'write_cost',
+            'gsi_write_cost',
+            'storage_cost',
+        )
+    }
+    for start in range(0, scenario_count, SWEEP_CHUNK_SIZE):
+        chunk = slice(start, start + SWEEP_CHUNK_SIZE)
+        for name, values in _evaluate(
+            model,
+            rps_multiplier[chunk, None],
+            size_multiplier[chunk, None],
+            count_multiplier[chunk, None],
+            gsi_override[chunk],
+        ).items():
+            columns[name][chunk] = values
+
+    return SweepResult(
+        rps_multiplier=rps_multiplier,
+        item_size_multiplier=size_multiplier,
+        item_count_multiplier=count_multiplier,
+        gsi_names=list(sweep.gsi_item_size_bytes),
+        gsi_item_size=np.stack(gsi_dimensions, axis=1)
+        if gsi_dimensions
+        else np.empty((scenario_count, 0)),
+        **columns,
+    )
+
+
+def _evaluate(
+    model: CompiledDataModel,
+    rps_multiplier: np.ndarray,
+    size_multiplier: np.ndarray,
+    count_multiplier: np.ndarray,
+    gsi_override: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Evaluate a chunk of scenarios; multipliers are (S, 1) columns."""
+    table_size = _scaled_size(model.table_item_size, size_multiplier)
+    scaled_gsi_size = _scaled_size(model.gsi_item_size, size_multiplier)
+    gsi_size = np.where(np.isnan(gsi_override), scaled_gsi_size, gsi_override)
+    # A GSI projects at most the attributes of its table
+    gsi_size = np.minimum(gsi_size, table_size[:, model.gsi_table])
+
+    item_size = _scaled_size(model.item_size, size_multiplier)
+    reads_gsi = model.read_gsi >= 0
+    if reads_gsi.any():
+        # GSI reads return the projected attributes, so they scale with the GSI item size
+        gsi = model.read_gsi[reads_gsi]
+        projected = np.ceil(item_size[:, reads_gsi] * gsi_size[:, gsi] / scaled_gsi_size[:, gsi])
+        item_size[:, reads_gsi] = np.minimum(projected, gsi_size[:, gsi])
+
+    rcus = model.read_factor * np.ceil(item_size * model.size_count / RCU_SIZE) * model.unit_count
+    wcus = model.write_factor * np.ceil(item_size / WCU_SIZE) * model.unit_count
+    gsi_wcus = np.ceil(gsi_size / WCU_SIZE) @ model.gsi_writes.T
+    rps = model.rps * rps_multiplier
+
+    read_units = (rcus * rps).sum(axis=1)
+    write_units = (wcus * rps).sum(axis=1)
+    gsi_write_units = (gsi_wcus * rps).sum(axis=1)
+    storage_bytes = (
+        model.table_item_count * count_multiplier * (table_size + STORAGE_OVERHEAD_BYTES)
+    ).sum(axis=1) + (
+        model.gsi_item_count * count_multiplier * (gsi_size + STORAGE_OVERHEAD_BYTES)
+    ).sum(axis=1)
+
+    return {
+        'read_units_per_second': read_units,
+        'write_units_per_second': write_units + gsi_write_units,
+        'read_cost': read_units * RCU_PRICE * SECONDS_PER_MONTH,
+        'write_cost': write_units * WCU_PRICE * SECONDS_PER_MONTH,
+        'gsi_write_cost': gsi_write_units * WCU_PRICE * SECONDS_PER_MONTH,
+        'storage_cost': storage_bytes / (1024**3) * STORAGE_PRICE,
+    }
@@ -17,10 +17,14 @@
 import os
 from awslabs.dynamodb_mcp_server.common import validate_path_within_directory
 from awslabs.dynamodb_mcp_server.db_analyzer.base_plugin import DatabasePlugin
+from awslabs.dynamodb_mcp_server.db_analyzer.mysql import (
+    DEFAULT_QUERY_CONCURRENCY,
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
+)
 from awslabs.dynamodb_mcp_server.markdown_formatter import MarkdownFormatter
 from datetime import datetime
 from loguru import logger
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 DEFAULT_ANALYSIS_DAYS = 30
@@ -68,6 +72,24 @@ def build_connection_params(source_db_type: str, **kwargs) -> Dict[str, Any]:
         port_value = kwargs.get('port') or os.getenv('MYSQL_PORT', str(DEFAULT_MYSQL_PORT))
         port = int(port_value) if str(port_value).isdigit() else DEFAULT_MYSQL_PORT
 
+        # Validate query concurrency and timeout parameters
+        concurrency_value = kwargs.get('query_concurrency') or os.getenv(
+            'MYSQL_QUERY_CONCURRENCY', str(DEFAULT_QUERY_CONCURRENCY)
+        )
+        query_concurrency = (
+            int(concurrency_value)
+            if str(concurrency_value).isdigit() and int(concurrency_value) > 0
+            else DEFAULT_QUERY_CONCURRENCY
+        )
+        timeout_value = kwargs.get('query_timeout_seconds') or os.getenv(
+            'MYSQL_QUERY_TIMEOUT_SECONDS', str(DEFAULT_QUERY_TIMEOUT_SECONDS)
+        )
+        query_timeout_seconds = (
+            int(timeout_value)
+            if str(timeout_value).isdigit() and int(timeout_value) > 0
+            else DEFAULT_QUERY_TIMEOUT_SECONDS
+        )
+
         # Determine connection method
         # Priority: explicit args > env vars, and cluster_arn > hostname within each level
         cluster_arn = kwargs.get('aws_cluster_arn')
@@ -95,6 +117,8 @@ def build_connection_params(source_db_type: str, **kwargs) -> Dict[str, Any]:
             or int(os.getenv('MYSQL_MAX_QUERY_RESULTS', str(DEFAULT_MAX_QUERY_RESULTS))),
             'pattern_analysis_days': kwargs.get('pattern_analysis_days', DEFAULT_ANALYSIS_DAYS),
             'output_dir': output_dir,
+            'query_concurrency': query_concurrency,
+            'query_timeout_seconds': query_timeout_seconds,
         }
     raise ValueError(f'Unsupported database type: {source_db_type}')
 
@@ -158,6 +182,7 @@ def save_analysis_files(
     plugin: DatabasePlugin,
     performance_enabled: bool = True,
     skipped_queries: List[str] = None,
+    query_timings: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Tuple[List[str], List[str]]:
     """Save analysis results to Markdown files using MarkdownFormatter.
 
@@ -171,6 +196,7 @@ def save_analysis_files(
         plugin: DatabasePlugin instance for getting query definitions (REQUIRED)
         performance_enabled: Whether performance schema is enabled
         skipped_queries: List of query names that were skipped during analysis
+        query_timings: Duration, status and row count of each query executed in managed mode
 
     Returns:
         Tuple of (saved_files, save_errors)
@@ -207,6 +233,7 @@ def save_analysis_files(
         'max_query_results': max_results,
         'performance_enabled': performance_enabled,
         'skipped_queries': skipped_queries or [],
+        'query_timings': query_timings or {},
     }
 
     # Use MarkdownFormatter to generate files
@@ -308,6 +335,7 @@ async def execute_managed_analysis(plugin, connection_params: dict, source_db_ty
         plugin,
         analysis_result.get('performance_enabled', True),
         analysis_result.get('skipped_queries', []),
+        analysis_result.get('query_timings'),
     )
 
     if analysis_result['results']:
@@ -14,8 +14,11 @@
 
 """MySQL database analyzer plugin."""
 
+import asyncio
 import boto3
 import json
+import re
+import time
 from awslabs.dynamodb_mcp_server.common import validate_source_identifier
 from awslabs.dynamodb_mcp_server.db_analyzer.base_plugin import DatabasePlugin
 from awslabs.mysql_mcp_server.connection.asyncmy_pool_connection import AsyncmyPoolConnection
@@ -23,10 +26,19 @@ from awslabs.mysql_mcp_server.connection.rds_data_api_connection import RDSDataA
 from awslabs.mysql_mcp_server.server import DummyCtx
 from awslabs.mysql_mcp_server.server import run_query as mysql_query
 from loguru import logger
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 DEFAULT_READONLY = True
+# Analysis queries run at once in managed mode, also the size of the connection pool
+DEFAULT_QUERY_CONCURRENCY = 4
+# Server-side (MAX_EXECUTION_TIME) limit of each analysis query
+DEFAULT_QUERY_TIMEOUT_SECONDS = 60
+# The client stops waiting this long after the server-side limit, so the server
+# normally ends a slow query first and the connection stays usable
+CLIENT_TIMEOUT_MARGIN_SECONDS = 5
+
+_SELECT_PATTERN = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
 
 
 # SQL Query Templates for MySQL
@@ -329,8 +341,14 @@ class MySQLPlugin(DatabasePlugin):
         run_query,
         all_results: Dict[str, Any],
         all_errors: List[str],
+        max_concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+        timeout_seconds: Optional[float] = None,
+        query_timings: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> None:
-        """Execute a batch of queries and collect results.
+        """Execute a batch of queries concurrently and collect results.
+
+        Results and errors are recorded in the order of query_names, whatever the
+        order in which the queries complete.
 
         Args:
             query_names: List of query names to execute
@@ -339,38 +357,87 @@ class MySQLPlugin(DatabasePlugin):
             run_query: Async function to execute queries
             all_results: Dictionary to store results (modified in place)
             all_errors: List to store errors (modified in place)
+            max_concurrency: Maximum number of queries running at once
+            timeout_seconds: Server-side execution time limit of each query, None for no
+                limit. The client waits CLIENT_TIMEOUT_MARGIN_SECONDS longer.
+            query_timings: Dictionary to store the duration, status and row count of
+                each query (modified in place)
         """
-        for query_name in query_names:
-            try:
-                query_info = self.get_queries()[query_name]
-                sql = query_info['sql']
-
-                # Substitute parameters
-                if 'target_database' in query_info.get('parameters', []):
-                    sql = sql.format(target_database=database)
-
-                # Add LIMIT
-                sql = sql.rstrip(';')
-                sql = f'{sql} LIMIT {max_results};'
-
-                result = await run_query(sql)
-
-                if result and isinstance(result, list) and len(result) > 0:
-                    if 'error' in result[0]:
-                        all_errors.append(f'{query_name}: {result[0]["error"]}')
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def execute(query_name: str) -> Dict[str, Any]:
+            query_info = self.get_queries()[query_name]
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    sql = self._build_query(query_info, database, max_results, timeout_seconds)
+                    if timeout_seconds:
+                        result = await asyncio.wait_for(
+                            run_query(sql), timeout_seconds + CLIENT_TIMEOUT_MARGIN_SECONDS
+                        )
                     else:
-                        all_results[query_name] = {
-                            'description': query_info['description'],
-                            'data': result,
-                        }
+                        result = await run_query(sql)
+                    outcome = {'result': result}
+                except asyncio.TimeoutError:
+                    outcome = {'timeout': True}
+                except Exception as e:
+                    outcome = {'error': str(e)}
+                outcome['duration_ms'] = round((time.perf_counter() - start_time) * 1000, 1)
+            return outcome
+
+        outcomes = await asyncio.gather(*(execute(query_name) for query_name in query_names))
+
+        for query_name, outcome in zip(query_names, outcomes):
+            description = self.get_queries()[query_name]['description']
+            result = outcome.get('result')
+            rows = 0
+            if outcome.get('timeout'):
+                status = 'timeout'
+                all_errors.append(f'{query_name}: Query timed out after {timeout_seconds} seconds')
+            elif 'error' in outcome:
+                status = 'error'
+                all_errors.append(f'{query_name}: {outcome["error"]}')
+            elif result and isinstance(result, list) and len(result) > 0:
+                if 'error' in result[0]:
+                    status = 'error'
+                    all_errors.append(f'{query_name}: {result[0]["error"]}')
                 else:
-                    all_results[query_name] = {
-                        'description': query_info['description'],
-                        'data': [],
-                    }
+                    status = 'success'
+                    rows = len(result)
+                    all_results[query_name] = {'description': description, 'data': result}
+            else:
+                status = 'success'
+                all_results[query_name] = {'description': description, 'data': []}
+
+            if query_timings is not None:
+                query_timings[query_name] = {
+                    'duration_ms': outcome['duration_ms'],
+                    'status': status,
+                    'rows': rows,
+                }
+
+    @staticmethod
+    def _build_query(
+        query_info: Dict[str, Any],
+        database: str,
+        max_results: int,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        """Build the SQL of an analysis query with its parameters, limit and timeout hint."""
+        sql = query_info['sql']
 
-            except Exception as e:
-                all_errors.append(f'{query_name}: {str(e)}')
+        # Substitute parameters
+        if 'target_database' in query_info.get('parameters', []):
+            sql = sql.format(target_database=database)
+
+        # Let the server stop the query once it exceeds the timeout
+        if timeout_seconds:
+            hint = f'/*+ MAX_EXECUTION_TIME({int(timeout_seconds * 1000)}) */'
+            sql = _SELECT_PATTERN.sub(lambda match: f'{match.group(0)} {hint}', sql, count=1)
+
+        # Add LIMIT
+        sql = sql.rstrip(';')
+        return f'{sql} LIMIT {max_results};'
 
     async def execute_managed_mode(self, connection_params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute MySQL analysis in managed mode.
@@ -378,6 +445,11 @@ class MySQLPlugin(DatabasePlugin):
         Supports two connection methods:
         - RDS Data API: Uses cluster_arn for serverless Aurora connections
         - Connection-based: Uses hostname/port for direct MySQL connections
+
+        The schema and performance queries are independent and run concurrently, up to
+        query_concurrency at a time, each limited to query_timeout_seconds. Point
+        hostname at a read replica (or the Aurora reader endpoint) to keep the
+        analysis off the primary.
         """
         cluster_arn = connection_params.get('cluster_arn')
         hostname = connection_params.get('hostname')
@@ -386,6 +458,10 @@ class MySQLPlugin(DatabasePlugin):
         database = connection_params['database']
         region = connection_params['region']
         max_results = connection_params['max_results']
+        query_concurrency = connection_params.get('query_concurrency', DEFAULT_QUERY_CONCURRENCY)
+        query_timeout_seconds = connection_params.get(
+            'query_timeout_seconds', DEFAULT_QUERY_TIMEOUT_SECONDS
+        )
 
         # Validate database name
         validate_source_identifier(database)
@@ -410,6 +486,7 @@ class MySQLPlugin(DatabasePlugin):
                 readonly=DEFAULT_READONLY,
                 secret_arn=secret_arn,
                 region=region,
+                max_size=max(1, query_concurrency),
             )
 
         async def run_query(sql_cmd):
@@ -434,28 +511,27 @@ class MySQLPlugin(DatabasePlugin):
             performance_schema_value = str(perf_result[0].get('@@performance_schema', '0'))
             performance_enabled = performance_schema_value == '1'
 
-        # Execute schema queries
+        # Execute schema queries, and performance queries if enabled, concurrently
+        query_names = self.get_schema_queries()
+        if performance_enabled:
+            query_names = query_names + self.get_performance_queries()
+        else:
+            skipped_queries.extend(self.get_performance_queries())
+
+        query_timings = {}
         await self._execute_query_batch(
-            self.get_schema_queries(),
+            query_names,
             database,
             max_results,
             run_query,
             all_results,
             all_errors,
+            max_concurrency=query_concurrency,
+            timeout_seconds=query_timeout_seconds,
+            query_timings=query_timings,
         )
 
-        # Execute performance queries if enabled
-        if performance_enabled:
-            await self._execute_query_batch(
-                self.get_performance_queries(),
-                database,
-                max_results,
-                run_query,
-                all_results,
-                all_errors,
-            )
-        else:
-            skipped_queries.extend(self.get_performance_queries())
+        if not performance_enabled:
             all_errors.append('Performance Schema disabled - skipping performance queries')
 
         return {
@@ -464,6 +540,7 @@ class MySQLPlugin(DatabasePlugin):
             'performance_enabled': performance_enabled,
             'performance_feature': 'Performance Schema',
             'skipped_queries': skipped_queries,
+            'query_timings': query_timings,
         }
 
 
@@ -0,0 +1,527 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load replay of data model access patterns against DynamoDB Local."""
+
+import asyncio
+import math
+import random
+import re
+import time
+from awslabs.dynamodb_mcp_server.access_pattern_executor import (
+    DynamoDBCommandParser,
+    DynamoDBRequest,
+    UnsupportedCommandError,
+)
+from awslabs.dynamodb_mcp_server.model_validation_utils import insert_items
+from botocore import xform_name
+from botocore.exceptions import ClientError
+from dataclasses import dataclass
+from loguru import logger
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+DEFAULT_LOAD_REPLAY_CONCURRENCY = 16
+SEED_COPIES_PER_ITEM = 100
+HOT_KEY_REPORT_LIMIT = 5
+
+# Errors returned when a request exceeds the throughput of a table, index or partition
+THROTTLING_ERROR_CODES = frozenset(
+    {'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded'}
+)
+
+# Maximum throughput of a single DynamoDB partition, in capacity units per second
+PARTITION_READ_UNITS_PER_SECOND = 3000
+PARTITION_WRITE_UNITS_PER_SECOND = 1000
+
+# Equality conditions of a key condition expression, e.g. '#pk = :pk'
+_KEY_EQUALITY_PATTERN = re.compile(r'(#?[\w.-]+)\s*=\s*(:[\w-]+)')
+
+# Key of the partitions read by a Scan
+SCAN_PARTITION_KEY = '(scan)'
+
+
+@dataclass(frozen=True)
+class _ReplayPattern:
+    """Access pattern replayed with its parsed request and relative rate."""
+
+    pattern: Dict[str, Any]
+    request: DynamoDBRequest
+    rps: float
+    declared_rps: bool
+
+
+def _percentiles(latencies: List[float]) -> Dict[str, Optional[float]]:
+    """Get the nearest-rank p50, p95 and p99 of latencies in milliseconds."""
+    values = sorted(latencies)
+    result: Dict[str, Optional[float]] = {}
+    for percentile in (50, 95, 99):
+        if not values:
+            result[f'p{percentile}'] = None
+            continue
+        rank = max(math.ceil(percentile / 100 * len(values)), 1)
+        result[f'p{percentile}'] = round(values[rank - 1], 3)
+    return result
+
+
+def _format_key_value(value: Any) -> str:
+    """Format a DynamoDB attribute value of a key for the report."""
+    if isinstance(value, dict) and len(value) == 1:
+        return str(next(iter(value.values())))
+    return str(value)
+
+
+class KeySchemas:
+    """Partition key attributes of the tables and global secondary indexes of a data model."""
+
+    def __init__(self, tables: List[Dict[str, Any]]):
+        """Initialize the key schemas.
+
+        Args:
+            tables: Table definitions in boto3 create_table format
+        """
+        self._partition_keys: Dict[Tuple[str, Optional[str]], List[str]] = {}
+        for table in tables:
+            if not isinstance(table, dict) or 'TableName' not in table:
+                continue
+            name = table['TableName']
+            self._partition_keys[(name, None)] = self._hash_attributes(table.get('KeySchema'))
+            for index in table.get('GlobalSecondaryIndexes') or []:
+                self._partition_keys[(name, index.get('IndexName'))] = self._hash_attributes(
+                    index.get('KeySchema')
+                )
+
+    @staticmethod
+    def _hash_attributes(key_schema: Any) -> List[str]:
+        return [
+            key['AttributeName']
+            for key in key_schema or []
+            if isinstance(key, dict) and key.get('KeyType') == 'HASH'
+        ]
+
+    def partition_key(self, table: str, index: Optional[str] = None) -> List[str]:
+        """Get the partition key attributes of a table or index.
+
+        Args:
+            table: Table name
+            index: Global secondary index name, or None for the base table
+
+        Returns:
+            Partition key attribute names, empty if the table or index is not known
+        """
+        return self._partition_keys.get((table, index), [])
+
+    def indexes(self, table: str) -> List[str]:
+        """Get the global secondary index names of a table."""
+        return [index for name, index in self._partition_keys if name == table and index]
+
+    def partitions_of_request(
+        self, operation: str, params: Dict[str, Any]
+    ) -> List[Tuple[str, Optional[str], str]]:
+        """Get the partitions accessed by a request.
+
+        Args:
+            operation: API operation name (e.g. 'Query')
+            params: Request parameters
+
+        Returns:
+            (table, index, partition key) of each partition accessed by the request.
+            Items written with PutItem also count for the indexes they are projected to.
+        """
+        if operation in ('GetItem', 'UpdateItem', 'DeleteItem'):
+            return self._partitions_of_key(params.get('TableName'), params.get('Key'))
+        if operation == 'PutItem':
+            return self._partitions_of_item(params.get('TableName'), params.get('Item'))
+        if operation == 'Query':
+            return self._partitions_of_query(params)
+        if operation == 'Scan':
+            return [(params.get('TableName'), params.get('IndexName'), SCAN_PARTITION_KEY)]
+        if operation in ('BatchGetItem', 'BatchWriteItem'):
+            return self._partitions_of_batch(params.get('RequestItems'))
+        if operation in ('TransactGetItems', 'TransactWriteItems'):
+            return self._partitions_of_transaction(params.get('TransactItems'))
+        return []
+
+    def _partition_key_value(self, table: Any, index: Optional[str], item: Any) -> Optional[str]:
+        attributes = self.partition_key(table, index) if isinstance(table, str) else []
+        if not attributes or not isinstance(item, dict):
+            return None
+        if any(attribute not in item for attribute in attributes):
+            return None
+        return ', '.join(
+            f'{attribute}={_format_key_value(item[attribute])}' for attribute in attributes
+        )
+
+    def _partitions_of_key(self, table: Any, key: Any) -> List[Tuple[str, Optional[str], str]]:
+        value = self._partition_key_value(table, None, key)
+        return [(table, None, value)] if value is not None else []
+
+    def _partitions_of_item(self, table: Any, item: Any) -> List[Tuple[str, Optional[str], str]]:
+        partitions = self._partitions_of_key(table, item)
+        if partitions:
+            for index in self.indexes(table):
+                value = self._partition_key_value(table, index, item)
+                if value is not None:
+                    partitions.append((table, index, value))
+        return partitions
+
+    def _partitions_of_query(self, params: Dict[str, Any]) -> List[Tuple[str, Optional[str], str]]:
+        table = params.get('TableName')
+        index = params.get('IndexName')
+        names = params.get('ExpressionAttributeNames') or {}
+        values = params.get('ExpressionAttributeValues') or {}
+        conditions = {}
+        for name, placeholder in _KEY_EQUALITY_PATTERN.findall(
+            params.get('KeyConditionExpression', '')
+        ):
+            if placeholder in values:
+                conditions[names.get(name, name)] = values[placeholder]
+        value = self._partition_key_value(table, index, conditions)
+        return [(table, index, value)] if value is not None else []
+
+    def _partitions_of_batch(self, request_items: Any) -> List[Tuple[str, Optional[str], str]]:
+        partitions = []
+        for table, requests in (request_items or {}).items():
+            if isinstance(requests, dict):
+                for key in requests.get('Keys') or []:
+                    partitions.extend(self._partitions_of_key(table, key))
+                continue
+            for write in requests or []:
+                if not isinstance(write, dict):
+                    continue
+                if 'PutRequest' in write:
+                    partitions.extend(
+                        self._partitions_of_item(table, write['PutRequest'].get('Item'))
+                    )
+                elif 'DeleteRequest' in write:
+                    partitions.extend(
+                        self._partitions_of_key(table, write['DeleteRequest'].get('Key'))
+                    )
+        return partitions
+
+    def _partitions_of_transaction(
+        self, transact_items: Any
+    ) -> List[Tuple[str, Optional[str], str]]:
+        partitions = []
+        for transact_item in transact_items or []:
+            for action_name, action in (transact_item or {}).items():
+                if not isinstance(action, dict):
+                    continue
+                if action_name == 'Put':
+                    partitions.extend(
+                        self._partitions_of_item(action.get('TableName'), action.get('Item'))
+                    )
+                else:
+                    partitions.extend(
+                        self._partitions_of_key(action.get('TableName'), action.get('Key'))
+                    )
+        return partitions
+
+
+class LoadReplay:
+    """Replay the access pattern mix of a data model against DynamoDB Local.
+
+    The sample items of the data model are copied with the values of their base
+    table partition keys suffixed by the copy number, wherever those values appear
+    in the items, so every copy is a consistent set of entities. Requests are then
+    drawn from the access patterns at their relative `rps` and run against a random
+    copy by a pool of asyncio workers. Values that are not entity IDs, such as a
+    status used as a GSI partition key, stay the same in every copy: access patterns
+    on them keep hitting the same partition, as they would in production.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client,
+        tables: List[Dict[str, Any]],
+        items: Dict[str, List[Dict[str, Any]]],
+        seed_copies: int = SEED_COPIES_PER_ITEM,
+        concurrency: int = DEFAULT_LOAD_REPLAY_CONCURRENCY,
+        random_seed: Optional[int] = None,
+    ):
+        """Initialize the load replay.
+
+        Args:
+            dynamodb_client: boto3 DynamoDB client
+            tables: Table definitions in boto3 create_table format
+            items: Sample items in boto3 batch_write_item format, by table name
+            seed_copies: Number of copies of the sample items, including the originals
+            concurrency: Number of requests in flight at a time
+            random_seed: Seed of the request mix, for reproducible replays
+        """
+        self._client = dynamodb_client
+        self._parser = DynamoDBCommandParser(dynamodb_client.meta.service_model)
+        self._key_schemas = KeySchemas(tables if isinstance(tables, list) else [])
+        self._items = items if isinstance(items, dict) else {}
+        self.seed_copies = max(seed_copies, 1)
+        self.concurrency = max(concurrency, 1)
+        self._random = random.Random(random_seed)
+        self._entity_ids = self._collect_entity_ids(tables if isinstance(tables, list) else [])
+
+    def _collect_entity_ids(self, tables: List[Dict[str, Any]]) -> Set[Tuple[str, str]]:
+        """Collect the base table partition key values of the sample items."""
+        entity_ids = set()
+        for table in tables:
+            if not isinstance(table, dict) or 'TableName' not in table:
+                continue
+            attributes = self._key_schemas.partition_key(table['TableName'])
+            for write in self._items.get(table['TableName']) or []:
+                item = (
+                    write.get('PutRequest', {}).get('Item', {}) if isinstance(write, dict) else {}
+                )
+                for attribute in attributes:
+                    value = item.get(attribute)
+                    if isinstance(value, dict) and len(value) == 1:
+                        ((type_name, raw),) = value.items()
+                        if type_name == 'S' or (type_name == 'N' and str(raw).isdigit()):
+                            entity_ids.add((type_name, str(raw)))
+        return entity_ids
+
+    def _copy_value(self, value: Any, copy: int) -> Any:
+        """Replace the entity IDs of a value with the IDs of a copy of the sample items."""
+        if copy == 0:
+            return value
+        if isinstance(value, list):
+            return [self._copy_value(element, copy) for element in value]
+        if not isinstance(value, dict):
+            return value
+        if len(value) == 1:
+            ((type_name, raw),) = value.items()
+            if isinstance(raw, (str, int)) and (type_name, str(raw)) in self._entity_ids:
+                if type_name == 'S':
+                    return {'S': f'{raw}#{copy}'}
+                return {'N': str(int(raw) + copy * 10**9)}
+        return {key: self._copy_value(element, copy) for key, element in value.items()}
+
+    def seed(self) -> Dict[str, Any]:
+        """Insert the copies of the sample items, the originals being already inserted.
+
+        Returns:
+            Insertion response for each table
+        """
+        seed_items = {}
+        for table, writes in self._items.items():
+            if not isinstance(writes, list):
+                continue
+            seed_items[table] = [
+                self._copy_value(write, copy)
+                for copy in range(1, self.seed_copies)
+                for write in writes
+            ]
+        return insert_items(self._client, seed_items)
+
+    def _parse_patterns(
+        self, access_patterns: List[Dict[str, Any]]
+    ) -> Tuple[List[_ReplayPattern], List[Dict[str, Any]]]:
+        """Parse the replayed access patterns and collect the skipped ones."""
+        replayed, skipped = [], []
+        for pattern in access_patterns:
+            if 'implementation' not in pattern:
+                continue
+            try:
+                request = self._parser.parse(pattern['implementation'])
+            except (UnsupportedCommandError, ValueError) as e:
+                skipped.append({'pattern_id': pattern.get('pattern'), 'reason': str(e)})
+                continue
+            rps = pattern.get('rps')
+            declared_rps = isinstance(rps, (int, float)) and not isinstance(rps, bool) and rps > 0
+            replayed.append(
+                _ReplayPattern(
+                    pattern=pattern,
+                    request=request,
+                    rps=float(rps) if declared_rps else 1.0,
+                    declared_rps=declared_rps,
+                )
+            )
+        return replayed, skipped
+
+    def _send(self, request: DynamoDBRequest, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single request and classify its outcome."""
+        method = getattr(self._client, xform_name(request.operation))
+        start_time = time.perf_counter()
+        outcome: Dict[str, Any] = {'throttled': False, 'error': None, 'capacity_units': None}
+        try:
+            response = method(**params)
+            consumed = response.get('ConsumedCapacity')
+            if isinstance(consumed, list):
+                outcome['capacity_units'] = sum(c.get('CapacityUnits', 0) for c in consumed)
+            elif isinstance(consumed, dict):
+                outcome['capacity_units'] = consumed.get('CapacityUnits')
+        except ClientError as e:
+            outcome['throttled'] = (
+                e.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES
+            )
+            outcome['error'] = str(e)
+        except Exception as e:
+            outcome['error'] = str(e)
+        outcome['latency_ms'] = (time.perf_counter() - start_time) * 1000
+        return outcome
+
+    async def run(
+        self, access_patterns: List[Dict[str, Any]], total_requests: int
+    ) -> Dict[str, Any]:
+        """Replay the access pattern mix.
+
+        Args:
+            access_patterns: Access patterns with AWS CLI implementations and optional `rps`
+            total_requests: Number of requests to send
+
+        Returns:
+            Latency percentiles, throttles and failures overall and per access pattern,
+            and the partition key skew of each table and index
+        """
+        replayed, skipped = self._parse_patterns(access_patterns)
+        if not replayed or total_requests <= 0:
+            return {
+                'total_requests': 0,
+                'access_patterns': [],
+                'skipped_access_patterns': skipped,
+                'partitions': [],
+            }
+
+        pattern_indexes = self._random.choices(
+            range(len(replayed)), weights=[p.rps for p in replayed], k=total_requests
+        )
+        jobs = iter((index, self._random.randrange(self.seed_copies)) for index in pattern_indexes)
+        outcomes: List[List[Dict[str, Any]]] = [[] for _ in replayed]
+        partition_counts: List[Dict[Tuple[str, Optional[str], str], int]] = [{} for _ in replayed]
+
+        async def worker():
+            for index, copy in jobs:
+                request = replayed[index].request
+                params = self._copy_value(request.params, copy)
+                outcomes[index].append(await asyncio.to_thread(self._send, request, params))
+                counts = partition_counts[index]
+                for partition in self._key_schemas.partitions_of_request(
+                    request.operation, params
+                ):
+                    counts[partition] = counts.get(partition, 0) + 1
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, total_requests))))
+        duration = time.perf_counter() - start_time
+
+        all_outcomes = [outcome for pattern_outcomes in outcomes for outcome in pattern_outcomes]
+        logger.info(
+            f'Replayed {total_requests} requests of {len(replayed)} access patterns in '
+            f'{duration:.2f}s'
+        )
+        return {
+            'total_requests': total_requests,
+            'concurrency': self.concurrency,
+            'seed_copies': self.seed_copies,
+            'duration_seconds': round(duration, 3),
+            'requests_per_second': round(total_requests / duration, 1) if duration else None,
+            'latency_ms': _percentiles([o['latency_ms'] for o in all_outcomes]),
+            'throttled_requests': sum(o['throttled'] for o in all_outcomes),
+            'failed_requests': sum(o['error'] is not None for o in all_outcomes),
+            'access_patterns': [
+                self._pattern_report(pattern, pattern_outcomes)
+                for pattern, pattern_outcomes in zip(replayed, outcomes)
+            ],
+            'skipped_access_patterns': skipped,
+            'partitions': self._partition_report(replayed, outcomes, partition_counts),
+        }
+
+    @staticmethod
+    def _pattern_report(pattern: _ReplayPattern, outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        errors = [o['error'] for o in outcomes if o['error'] is not None]
+        return {
+            'pattern_id': pattern.pattern.get('pattern'),
+            'description': pattern.pattern.get('description'),
+            'dynamodb_operation': pattern.request.operation,
+            'declared_rps': pattern.rps if pattern.declared_rps else None,
+            'requests': len(outcomes),
+            'latency_ms': _percentiles([o['latency_ms'] for o in outcomes]),
+            'throttled_requests': sum(o['throttled'] for o in outcomes),
+            'failed_requests': len(errors),
+            'first_error': errors[0] if errors else None,
+        }
+
+    @staticmethod
+    def _partition_report(
+        replayed: List[_ReplayPattern],
+        outcomes: List[List[Dict[str, Any]]],
+        partition_counts: List[Dict[Tuple[str, Optional[str], str], int]],
+    ) -> List[Dict[str, Any]]:
+        """Report the request skew over the partition keys of each table and index.
+
+        The throughput a key would receive in production is projected from the
+        declared rps of each access pattern, the share of its replayed requests that
+        hit the key and its mean consumed capacity per request. Keys shared by every
+        copy of the sample items get the full rate of their access patterns, while
+        entity keys only get a share of it.
+        """
+        requests: Dict[Tuple[str, Optional[str]], Dict[str, int]] = {}
+        read_units: Dict[Tuple[str, Optional[str], str], float] = {}
+        write_units: Dict[Tuple[str, Optional[str], str], float] = {}
+        for pattern, pattern_outcomes, counts in zip(replayed, outcomes, partition_counts):
+            capacities = [o['capacity_units'] for o in pattern_outcomes if o['capacity_units']]
+            units_per_request = sum(capacities) / len(capacities) if capacities else 1.0
+            for partition, count in counts.items():
+                table_requests = requests.setdefault(partition[:2], {})
+                table_requests[partition[2]] = table_requests.get(partition[2], 0) + count
+                if not pattern.declared_rps:
+                    continue
+                units = pattern.rps * count / len(pattern_outcomes) * units_per_request
+                projected = read_units if pattern.request.is_read else write_units
+                projected[partition] = projected.get(partition, 0.0) + units
+
+        report = []
+        for (table, index), key_counts in sorted(
+            requests.items(), key=lambda entry: (str(entry[0][0]), str(entry[0][1] or ''))
+        ):
+            total = sum(key_counts.values())
+            hot_keys = sorted(key_counts.items(), key=lambda entry: entry[1], reverse=True)
+            report.append(
+                {
+                    'table': table,
+                    'index': index,
+                    'requests': total,
+                    'distinct_keys': len(key_counts),
+                    'top_key_share': round(hot_keys[0][1] / total, 4),
+                    'max_to_mean_ratio': round(hot_keys[0][1] * len(key_counts) / total, 2),
+                    'hot_keys': [
+                        LoadReplay._hot_key_report(
+                            key,
+                            count / total,
+                            count,
+                            read_units.get((table, index, key)),
+                            write_units.get((table, index, key)),
+                        )
+                        for key, count in hot_keys[:HOT_KEY_REPORT_LIMIT]
+                    ],
+                }
+            )
+        return report
+
+    @staticmethod
+    def _hot_key_report(
+        key: str,
+        share: float,
+        requests: int,
+        read_units: Optional[float],
+        write_units: Optional[float],
+    ) -> Dict[str, Any]:
+        report: Dict[str, Any] = {'key': key, 'requests': requests, 'share': round(share, 4)}
+        if read_units is not None or write_units is not None:
+            reads = read_units or 0.0
+            writes = write_units or 0.0
+            report['projected_read_units_per_second'] = round(reads, 1)
+            report['projected_write_units_per_second'] = round(writes, 1)
+            report['exceeds_partition_limit'] = (
+                reads > PARTITION_READ_UNITS_PER_SECOND
+                or writes > PARTITION_WRITE_UNITS_PER_SECOND
+            )
+        return report
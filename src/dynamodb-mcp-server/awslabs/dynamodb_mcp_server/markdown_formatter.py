@@ -391,6 +391,18 @@ class MarkdownFormatter:
             if total_triggers > 0:
                 content_parts.append(f'- **Triggers**: {total_triggers}')
 
+            # Add query timings if the queries were executed in managed mode
+            query_timings = self.metadata.get('query_timings') or {}
+            if query_timings:
+                content_parts.append('\n## Query Timings\n')
+                content_parts.append('| Query | Duration (ms) | Status | Rows |')
+                content_parts.append('| --- | --- | --- | --- |')
+                for query_name, timing in query_timings.items():
+                    content_parts.append(
+                        f'| {query_name.replace("_", " ").title()} | {timing["duration_ms"]} '
+                        f'| {timing["status"]} | {timing["rows"]} |'
+                    )
+
             # Add errors section if any errors occurred
             if self.errors:
                 content_parts.append('\n## Errors')
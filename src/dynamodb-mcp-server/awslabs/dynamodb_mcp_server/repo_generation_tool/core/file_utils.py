@@ -18,6 +18,7 @@ This module provides shared functionality for file loading, path validation, and
 that is used across loaders, validators, and other components.
 """
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict
@@ -53,6 +54,22 @@ class FileUtils:
         except Exception as e:
             raise ValueError(f'Error reading {file_name} file: {e}')
 
+    @staticmethod
+    def file_digest(file_path: str) -> str | None:
+        """Compute the SHA-256 digest of a file's content.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest of the content, or None if the file cannot be read
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except Exception:
+            return None
+
     @staticmethod
     def validate_and_resolve_path(
         file_path: Path,
@@ -34,10 +34,15 @@ class SchemaLoader:
             schema_path: Path to the schema file
         """
         self.schema_path = Path(schema_path).resolve()
+        self._schema: dict[str, Any] | None = None
+        self._schema_digest: str | None = None
 
     def load_schema(self) -> dict[str, Any]:
-        """Load and validate schema."""
+        """Load and validate schema, reusing the loaded schema while the file is unchanged."""
         validated_path = self.schema_path
+        digest = FileUtils.file_digest(str(validated_path))
+        if digest is not None and digest == self._schema_digest:
+            return self._schema
 
         # Use existing validator (don't duplicate logic)
         validation_result = validate_schema_file(str(validated_path))
@@ -52,7 +57,9 @@ class SchemaLoader:
             raise ValueError(f'Schema validation failed:\n{error_message}')
 
         # Load the validated schema using shared utility
-        return FileUtils.load_json_file(str(validated_path), 'Schema')
+        self._schema = FileUtils.load_json_file(str(validated_path), 'Schema')
+        self._schema_digest = digest
+        return self._schema
 
     @property
     def schema(self) -> dict[str, Any]:
@@ -18,6 +18,7 @@ This module provides validation for schema.json files used in code generation,
 ensuring they conform to expected structure and contain valid enum values.
 """
 
+import copy
 from awslabs.dynamodb_mcp_server.repo_generation_tool.core.cross_table_validator import (
     CrossTableValidator,
 )
@@ -53,9 +54,17 @@ from awslabs.dynamodb_mcp_server.repo_generation_tool.core.schema_definitions im
 from awslabs.dynamodb_mcp_server.repo_generation_tool.core.validation_utils import (
     ValidationResult,
 )
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
 
+# Validation results kept for the most recently validated schema files
+VALIDATION_CACHE_SIZE = 32
+
+_validation_cache: OrderedDict[tuple[str, str, bool], ValidationResult] = OrderedDict()
+
+
 class SchemaValidator:
     """Validates schema.json structure and values."""
 
@@ -650,8 +659,23 @@ def validate_schema_file(schema_path: str, strict_mode: bool = True) -> Validati
         schema_path: Path to schema.json file
         strict_mode: If True, treats warnings as errors
 
+    Results are cached by file content, so validating an unchanged schema again, as
+    code generation does after validating it, does not run the validators again.
+
     Returns:
         ValidationResult with errors and warnings
     """
-    validator = SchemaValidator(strict_mode=strict_mode)
-    return validator.validate_schema_file(schema_path)
+    digest = FileUtils.file_digest(schema_path)
+    if digest is None:
+        return SchemaValidator(strict_mode=strict_mode).validate_schema_file(schema_path)
+
+    key = (str(Path(schema_path).resolve()), digest, strict_mode)
+    result = _validation_cache.get(key)
+    if result is None:
+        result = SchemaValidator(strict_mode=strict_mode).validate_schema_file(schema_path)
+        _validation_cache[key] = result
+        if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    else:
+        _validation_cache.move_to_end(key)
+    return copy.deepcopy(result)
@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+from awslabs.dynamodb_mcp_server.repo_generation_tool.core.file_utils import FileUtils
 from awslabs.dynamodb_mcp_server.repo_generation_tool.core.key_template_parser import (
     KeyTemplateParser,
 )
@@ -37,11 +43,45 @@ from awslabs.dynamodb_mcp_server.repo_generation_tool.output.output_manager impo
     GenerationResult,
     OutputManager,
 )
-from jinja2 import Environment, FileSystemLoader
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from jinja2 import BytecodeCache, Environment, FileSystemLoader
+from jinja2.bccache import Bucket
 from pathlib import Path
 from typing import Any
 
 
+# Rendered entities kept between generate_all runs, by hash of their schema slice
+RENDER_CACHE_SIZE = 10_000
+# Entities to render, at least, for generate_all to render them in worker processes.
+# Rendering takes about a millisecond per entity and starting a worker over a second.
+PARALLEL_RENDER_MIN_ENTITIES = 2000
+
+_render_cache: OrderedDict[str, tuple[str, str, dict[str, Any]]] = OrderedDict()
+_worker_generator: 'Jinja2Generator | None' = None
+
+
+class _MemoryBytecodeCache(BytecodeCache):
+    """Keeps compiled templates in memory, so generators do not compile them again."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._bytecode: dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the compiled template of a bucket, if any."""
+        bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store the compiled template of a bucket."""
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+
+
+_bytecode_cache = _MemoryBytecodeCache()
+
+
 class Jinja2Generator(BaseGenerator):
     """Generator using Jinja2 templates."""
 
@@ -64,6 +104,8 @@ class Jinja2Generator(BaseGenerator):
             # Use language-specific templates directory
             generator_dir = Path(__file__).parent.parent
             templates_dir = generator_dir / 'languages' / language / 'templates'
+        self.templates_dir = Path(templates_dir)
+        self._render_fingerprint: str | None = None
 
         # Note: autoescape is explicitly set to False for code generation
         # This is appropriate because:
@@ -75,6 +117,7 @@ class Jinja2Generator(BaseGenerator):
         self.env = Environment(  # nosec B701 - Content is NOT HTML and NOT served
             loader=FileSystemLoader(templates_dir),
             autoescape=False,  # Explicitly disabled for code generation (not HTML)
+            bytecode_cache=_bytecode_cache,
         )
 
         # Add custom filter for parameter substitution
@@ -549,15 +592,15 @@ class Jinja2Generator(BaseGenerator):
             entity_config=processed_config,
         )
 
-        def format_parameters(params, pattern=None):
-            """Format parameter list for method signature, filtering out non-existent fields.
+        def select_parameters(params, pattern=None):
+            """Select and format the method parameters, filtering out non-existent fields.
 
             Args:
                 params: List of parameter dicts from access pattern
                 pattern: Optional access pattern dict for context (e.g., range_condition, filter_expression)
 
             Returns:
-                Comma-separated string of formatted parameters
+                List of formatted parameters, those with defaults last
             """
             # Collect filter parameter names for this pattern
             filter_param_names = set()
@@ -608,9 +651,24 @@ class Jinja2Generator(BaseGenerator):
                 param_type = self.type_mapper.map_parameter_type(param)
                 formatted.append(f'{param["name"]}: {param_type}')
             # Put params with defaults after params without defaults
-            all_params = formatted + defaults
-            # Return empty string if no valid parameters (avoid trailing comma)
-            return ', '.join(all_params) if all_params else ''
+            return formatted + defaults
+
+        def format_parameters(params, pattern=None):
+            """Format parameter list for method signature, filtering out non-existent fields.
+
+            Returns:
+                Comma-separated string of formatted parameters, empty if there are none
+            """
+            return ', '.join(select_parameters(params, pattern))
+
+        def format_arguments(params, pattern=None):
+            """Format the keyword arguments passing the parameters of format_parameters through.
+
+            Returns:
+                Comma-separated string of name=name arguments, empty if there are none
+            """
+            names = [param.split(':', 1)[0] for param in select_parameters(params, pattern)]
+            return ', '.join(f'{name}={name}' for name in names)
 
         # table_config should always be provided
         if table_config is None:
@@ -635,6 +693,7 @@ class Jinja2Generator(BaseGenerator):
             table_data=table_data,
             map_return_type=lambda rt, en: self.type_mapper.map_return_type(rt, en),
             format_parameters=format_parameters,
+            format_arguments=format_arguments,
             get_gsi_mapping_for_index=get_gsi_mapping_for_index,
             detect_item_collection=detect_item_collection,
             get_sk_prefix=get_sk_prefix,
@@ -661,6 +720,108 @@ class Jinja2Generator(BaseGenerator):
 
         return repo_code, entity_mapping
 
+    def render_entity(
+        self,
+        entity_name: str,
+        entity_config: dict[str, Any],
+        table_config: dict[str, Any],
+        table_data: dict[str, Any],
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Generate the entity code, repository code and mapping data of an entity."""
+        entity_code = self.generate_entity(entity_name, entity_config)
+        repo_code, entity_mapping = self.generate_repository_with_mapping(
+            entity_name, entity_config, table_config, table_data
+        )
+        return entity_code, repo_code, entity_mapping
+
+    def _get_render_fingerprint(self) -> str:
+        """Hash the templates and usage data that rendering depends on besides the schema."""
+        if self._render_fingerprint is None:
+            digest = hashlib.sha256(self.language.encode())
+            for template in sorted(self.templates_dir.rglob('*.j2')):
+                digest.update(template.name.encode())
+                digest.update(template.read_bytes())
+            usage_data_path = self.sample_generator.usage_data_path
+            if usage_data_path:
+                digest.update(str(FileUtils.file_digest(usage_data_path)).encode())
+            self._render_fingerprint = digest.hexdigest()
+        return self._render_fingerprint
+
+    def _get_render_key(
+        self, entity_name: str, entity_config: dict[str, Any], table_data: dict[str, Any]
+    ) -> str:
+        """Hash the slice of the schema that the code of an entity is rendered from.
+
+        Besides the entity, the code depends on its table but not on the other
+        entities of the table, except for whether they share its partition key.
+        """
+        schema_slice = {
+            'fingerprint': self._get_render_fingerprint(),
+            'entity_name': entity_name,
+            'entity_config': entity_config,
+            'table': {key: value for key, value in table_data.items() if key != 'entities'},
+            'item_collection': detect_item_collection(entity_name, entity_config, table_data),
+        }
+        return hashlib.sha256(
+            json.dumps(schema_slice, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _render_entities(
+        self,
+        entities: list[tuple[str, dict[str, Any], dict[str, Any], dict[str, Any]]],
+        max_workers: int | None,
+    ) -> list[tuple[str, str, dict[str, Any]]]:
+        """Render entities, reusing the code rendered for unchanged schema slices.
+
+        Args:
+            entities: Arguments of render_entity for each entity
+            max_workers: Worker processes to render in, defaults to the number of CPUs
+
+        Returns:
+            Result of render_entity for each entity, in order
+        """
+        keys = [self._get_render_key(name, config, table) for name, config, _, table in entities]
+        rendered = {key: _render_cache[key] for key in keys if key in _render_cache}
+        for key in rendered:
+            _render_cache.move_to_end(key)
+        missing_keys = [key for key in keys if key not in rendered]
+        missing = [entity for key, entity in zip(keys, entities) if key not in rendered]
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers > 1 and len(missing) >= PARALLEL_RENDER_MIN_ENTITIES:
+            # Spawned workers do not inherit the threads and locks of the MCP server
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_render_worker,
+                initargs=(
+                    str(self.schema_loader.schema_path),
+                    str(self.templates_dir),
+                    self.language,
+                    self.sample_generator.usage_data_path,
+                ),
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _render_in_worker,
+                        *zip(*missing),
+                        chunksize=max(1, len(missing) // (max_workers * 4)),
+                    )
+                )
+        else:
+            results = [self.render_entity(*entity) for entity in missing]
+
+        for key, result in zip(missing_keys, results):
+            rendered[key] = result
+            _render_cache[key] = result
+            if len(_render_cache) > RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
+
+        return [
+            (entity_code, repo_code, copy.deepcopy(entity_mapping))
+            for entity_code, repo_code, entity_mapping in (rendered[key] for key in keys)
+        ]
+
     def _format_parameters(self, params: list[dict[str, Any]]) -> str:
         """Format parameter list for transaction method signature.
 
@@ -923,9 +1084,21 @@ class Jinja2Generator(BaseGenerator):
             to_snake_case=to_snake_case,
         )
 
-    def generate_all(self, output_dir: str, generate_usage_examples: bool = False) -> None:
-        """Generate all entities and repositories."""
-        all_tables = self.schema['tables']
+    def generate_all(
+        self,
+        output_dir: str,
+        generate_usage_examples: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
+        """Generate all entities and repositories.
+
+        Entities whose slice of the schema has not changed since a previous run reuse
+        the code rendered then. When at least PARALLEL_RENDER_MIN_ENTITIES entities
+        have to be rendered, they are rendered in max_workers processes (default:
+        the number of CPUs).
+        """
+        schema = self.schema
+        all_tables = schema['tables']
 
         entities_code = []
         repositories_code = []
@@ -933,27 +1106,25 @@ class Jinja2Generator(BaseGenerator):
         all_entity_names = []
         all_entities = {}
 
-        # Iterate through all tables
-        for table in all_tables:
-            table_config = table['table_config']
-            table_entities = table['entities']
+        # Render each entity of each table with its table-specific configuration
+        entities = [
+            (entity_name, entity_config, table['table_config'], table)
+            for table in all_tables
+            for entity_name, entity_config in table['entities'].items()
+        ]
+        rendered = self._render_entities(entities, max_workers)
 
-            # Process each entity in the current table
-            for entity_name, entity_config in table_entities.items():
-                # Generate entity
-                entity_code = self.generate_entity(entity_name, entity_config)
-                entities_code.append(entity_code)
+        for (entity_name, entity_config, _, _), (entity_code, repo_code, entity_mapping) in zip(
+            entities, rendered
+        ):
+            entities_code.append(entity_code)
 
-                # Track all entities for imports and usage examples
-                all_entity_names.append(entity_name)
-                all_entities[entity_name] = entity_config
+            # Track all entities for imports and usage examples
+            all_entity_names.append(entity_name)
+            all_entities[entity_name] = entity_config
 
-                # Generate repository with table-specific configuration
-                repo_code, entity_mapping = self.generate_repository_with_mapping(
-                    entity_name, entity_config, table_config, table
-                )
-                repositories_code.append(repo_code)
-                access_pattern_mapping.update(entity_mapping)
+            repositories_code.append(repo_code)
+            access_pattern_mapping.update(entity_mapping)
 
         # Preprocess all entities for usage examples
         preprocessed_entities = {}
@@ -965,7 +1136,7 @@ class Jinja2Generator(BaseGenerator):
         if generate_usage_examples:
             # Pass all cross-table patterns to usage examples
             # The template will handle different operation types appropriately
-            cross_table_patterns = self.schema.get('cross_table_access_patterns', [])
+            cross_table_patterns = schema.get('cross_table_access_patterns', [])
 
             usage_examples_code = self.generate_usage_examples(
                 access_pattern_mapping,
@@ -1048,7 +1219,7 @@ class Jinja2Generator(BaseGenerator):
             )
 
         # Generate transaction service if cross-table patterns exist
-        cross_table_patterns = self.schema.get('cross_table_access_patterns', [])
+        cross_table_patterns = schema.get('cross_table_access_patterns', [])
         if cross_table_patterns and self.transaction_service_template:
             transaction_service_code = self.generate_transaction_service(
                 cross_table_patterns, all_entities
@@ -1080,3 +1251,21 @@ class Jinja2Generator(BaseGenerator):
         # Use output manager to write all files
         output_manager = OutputManager(output_dir, self.language)
         output_manager.write_generated_files(generation_result)
+
+
+def _init_render_worker(
+    schema_path: str, templates_dir: str, language: str, usage_data_path: str | None
+) -> None:
+    """Create the generator of a render worker process."""
+    global _worker_generator
+    _worker_generator = Jinja2Generator(schema_path, templates_dir, language, usage_data_path)
+
+
+def _render_in_worker(
+    entity_name: str,
+    entity_config: dict[str, Any],
+    table_config: dict[str, Any],
+    table_data: dict[str, Any],
+) -> tuple[str, str, dict[str, Any]]:
+    """Render an entity in a render worker process."""
+    return _worker_generator.render_entity(entity_name, entity_config, table_config, table_data)
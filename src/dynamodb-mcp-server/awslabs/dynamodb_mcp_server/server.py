@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import os
 from awslabs.aws_api_mcp_server.server import call_aws
+from awslabs.dynamodb_mcp_server.access_pattern_executor import AccessPatternExecutor
 from awslabs.dynamodb_mcp_server.cdk_generator.generator import CdkGenerator
 from awslabs.dynamodb_mcp_server.common import handle_exceptions
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.calculator_runner import (
@@ -23,16 +25,18 @@ from awslabs.dynamodb_mcp_server.cost_performance_calculator.calculator_runner i
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
     AccessPattern,
     DataModel,
+    ScenarioSweep,
     Table,
     format_validation_errors,
 )
 from awslabs.dynamodb_mcp_server.db_analyzer import analyzer_utils
 from awslabs.dynamodb_mcp_server.db_analyzer.plugin_registry import PluginRegistry
+from awslabs.dynamodb_mcp_server.load_replay import LoadReplay
 from awslabs.dynamodb_mcp_server.model_validation_utils import (
     DynamoDBClientConfig,
-    create_validation_resources,
+    _create_dynamodb_client,
+    dynamodb_local_manager,
     get_validation_result_transform_prompt,
-    setup_dynamodb_local,
 )
 from awslabs.dynamodb_mcp_server.repo_generation_tool.codegen import generate
 from loguru import logger
@@ -40,11 +44,12 @@ from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 from pathlib import Path
 from pydantic import Field, ValidationError
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 
 DATA_MODEL_JSON_FILE = 'dynamodb_data_model.json'
 DATA_MODEL_VALIDATION_RESULT_JSON_FILE = 'dynamodb_model_validation.json'
+DATA_MODEL_LOAD_REPLAY_RESULT_JSON_FILE = 'dynamodb_model_load_replay.json'
 GENERATED_DATA_ACCESS_LAYER_DIR = 'generated_dal'
 
 
@@ -81,7 +86,7 @@ Self-Service Mode Workflow:
 Use the `dynamodb_data_model_validation` tool to validate your DynamoDB data model:
 - Loads and validates dynamodb_data_model.json structure (checks required keys: tables, items, access_patterns)
 - Sets up DynamoDB Local environment automatically (tries containers first: Docker/Podman/Finch/nerdctl, falls back to Java)
-- Cleans up existing tables from previous validation runs
+- Reuses the tables of previous validation runs that are unchanged and were not written to, and deletes the others
 - Creates tables and inserts test data from your model specification
 - Tests all defined access patterns by executing their AWS CLI implementations
 - Saves detailed validation results to dynamodb_model_validation.json with pattern responses
@@ -548,6 +553,13 @@ async def _execute_dynamodb_command(
 @handle_exceptions
 async def dynamodb_data_model_validation(
     workspace_dir: str = Field(description='Absolute path of the workspace directory'),
+    load_replay_requests: Annotated[
+        int,
+        Field(
+            ge=0,
+            description='Number of requests of the optional load replay benchmark (0 disables it)',
+        ),
+    ] = 0,
 ) -> str:
     """Validates and tests DynamoDB data models against DynamoDB Local.
 
@@ -569,10 +581,13 @@ async def dynamodb_data_model_validation(
     2. If dynamodb_data_model.json exists:
        - Validates the JSON structure (checks for required keys: tables, items, access_patterns)
        - Sets up DynamoDB Local environment (Docker/Podman/Finch/nerdctl or Java fallback)
-       - Cleans up existing tables from previous validation runs
+       - Reuses unchanged, unmodified tables of previous validation runs and deletes the others
        - Creates tables and inserts test data from your model specification
        - Tests all defined access patterns by executing their AWS CLI implementations
        - Saves detailed validation results to dynamodb_model_validation.json
+       - If load_replay_requests > 0, seeds copies of the items and replays the access pattern
+         mix at the relative `rps` of each pattern, saving latency percentiles, throttles and
+         hot partition keys to dynamodb_model_load_replay.json
        - Transforms results to markdown format for comprehensive review
 
     WHAT TO DO ON SUCCESSFUL COMPLETION:
@@ -584,6 +599,7 @@ async def dynamodb_data_model_validation(
 
     Args:
         workspace_dir: Absolute path of the workspace directory
+        load_replay_requests: Number of requests of the load replay benchmark, 0 to skip it
 
     Returns:
         JSON generation guide (if file missing) or validation results with transformation prompt (if file exists)
@@ -619,13 +635,13 @@ async def dynamodb_data_model_validation(
         if missing_keys:
             return f'Error: Missing required keys in data model: {missing_keys}'
 
-        # Step 3: Setup DynamoDB Local
+        # Step 3: Setup DynamoDB Local, reusing the running instance of previous validations
         logger.info('Setting up DynamoDB Local environment')
-        endpoint_url = setup_dynamodb_local()
+        endpoint_url = dynamodb_local_manager.endpoint()
 
-        # Step 4: Create resources
+        # Step 4: Create resources, keeping the unchanged tables of previous validations
         logger.info('Creating validation resources')
-        create_validation_resources(data_model, endpoint_url)
+        dynamodb_local_manager.restore(data_model)
 
         # Step 5: Execute access patterns
         logger.info('Executing access patterns')
@@ -633,6 +649,10 @@ async def dynamodb_data_model_validation(
             workspace_dir, data_model.get('access_patterns', []), endpoint_url
         )
 
+        if load_replay_requests > 0:
+            logger.info(f'Replaying {load_replay_requests} access pattern requests')
+            await _run_load_replay(workspace_dir, data_model, endpoint_url, load_replay_requests)
+
         # Step 6: Transform validation results to markdown
         validation_prompt = get_validation_result_transform_prompt()
 
@@ -661,6 +681,12 @@ async def compute_performances_and_costs(
     workspace_dir: str = Field(
         description='Absolute path of the workspace directory (required). Cost analysis will be appended to dynamodb_data_model.md',
     ),
+    scenario_sweep: Annotated[
+        Optional[ScenarioSweep],
+        Field(
+            description='Optional what-if grid of traffic, item size and item count multipliers and GSI item sizes'
+        ),
+    ] = None,
 ) -> Dict[str, str]:
     """Calculate DynamoDB capacity units and monthly costs from access patterns.
 
@@ -677,6 +703,9 @@ async def compute_performances_and_costs(
             - gsi_list: optional for write operations (affected index names)
         table_list: Tables with name, item_count (>0), item_size_bytes (1-409600), gsi_list (each GSI needs name, item_count, item_size_bytes)
         workspace_dir: Absolute path to the folder containing dynamodb_data_model.md - report will be appended
+        scenario_sweep: Optional what-if grid for capacity planning, every combination is one scenario:
+            - rps_multipliers, item_size_multipliers, item_count_multipliers: lists of factors (default [1.0])
+            - gsi_item_size_bytes: GSI name to list of item sizes, e.g. KEYS_ONLY vs ALL projection sizes
 
     Returns:
         {'status': 'success', 'message': <success_message>} or {'status': 'error', 'message': <error_reason>}
@@ -748,7 +777,10 @@ async def compute_performances_and_costs(
     except ValidationError as e:
         return {'status': 'error', 'message': format_validation_errors(e)}
 
-    summary = run_cost_calculator(data_model, workspace_dir)
+    try:
+        summary = run_cost_calculator(data_model, workspace_dir, scenario_sweep)
+    except ValueError as e:
+        return {'status': 'error', 'message': str(e)}
 
     return {'status': 'success', 'message': summary}
 
@@ -958,6 +990,10 @@ async def _execute_access_patterns(
 ) -> dict:
     """Execute all data model validation access patterns operations.
 
+    Access patterns are sent directly to DynamoDB with a shared client, reads
+    concurrently, and their latency and consumed capacity are recorded. Commands
+    that cannot be translated into API requests are run with the AWS CLI.
+
     Args:
         workspace_dir: Absolute path of the workspace directory
         access_patterns: List of access patterns to test
@@ -967,23 +1003,14 @@ async def _execute_access_patterns(
         Dictionary with all execution results
     """
     try:
-        results = []
-        for pattern in access_patterns:
-            if 'implementation' not in pattern:
-                results.append(pattern)
-                continue
-
-            command = pattern['implementation']
-            result = await _execute_dynamodb_command(command, endpoint_url)
-            results.append(
-                {
-                    'pattern_id': pattern.get('pattern'),
-                    'description': pattern.get('description'),
-                    'dynamodb_operation': pattern.get('dynamodb_operation'),
-                    'command': command,
-                    'response': result if isinstance(result, dict) else str(result),
-                }
-            )
+        executor = AccessPatternExecutor(
+            _create_dynamodb_client(endpoint_url),
+            fallback=lambda command: _execute_dynamodb_command(command, endpoint_url),
+        )
+        try:
+            results = await executor.execute(access_patterns)
+        finally:
+            dynamodb_local_manager.mark_modified(executor.modified_tables)
 
         validation_response = {'validation_response': results}
 
@@ -997,5 +1024,44 @@ async def _execute_access_patterns(
         return {'validation_response': [], 'error': str(e)}
 
 
+async def _run_load_replay(
+    workspace_dir: str,
+    data_model: Dict[str, Any],
+    endpoint_url: Optional[str],
+    total_requests: int,
+) -> dict:
+    """Seed copies of the data model items and replay its access pattern mix.
+
+    Args:
+        workspace_dir: Absolute path of the workspace directory
+        data_model: Data model with tables, items and access patterns
+        endpoint_url: DynamoDB endpoint URL
+        total_requests: Number of requests to replay
+
+    Returns:
+        Dictionary with the load replay results
+    """
+    try:
+        load_replay = LoadReplay(
+            _create_dynamodb_client(endpoint_url),
+            data_model.get('tables', []),
+            data_model.get('items', {}),
+        )
+        # The seeded copies and replayed writes change the tables of the data model
+        dynamodb_local_manager.mark_modified()
+        seed_response = await asyncio.to_thread(load_replay.seed)
+        results = await load_replay.run(data_model.get('access_patterns', []), total_requests)
+        load_replay_response = {'seed_response': seed_response, 'load_replay': results}
+
+        output_file = os.path.join(workspace_dir, DATA_MODEL_LOAD_REPLAY_RESULT_JSON_FILE)
+        with open(output_file, 'w') as f:
+            json.dump(load_replay_response, f, indent=2)
+
+        return load_replay_response
+    except Exception as e:
+        logger.error(f'Failed to replay access patterns: {e}')
+        return {'load_replay': {}, 'error': str(e)}
+
+
 if __name__ == '__main__':
     main()
@@ -22,6 +22,7 @@ from awslabs.dynamodb_mcp_server.cost_performance_calculator.calculator_runner i
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
     MAX_ITEM_SIZE_BYTES,
     DataModel,
+    ScenarioSweep,
 )
 from awslabs.dynamodb_mcp_server.cost_performance_calculator.report_generator import (
     REPORT_END_MARKER,
@@ -84,7 +85,7 @@ class TestRunCostCalculator:
         assert '1 access patterns' in result
         assert '1 tables' in result
         mock_calculate_cost.assert_called_once_with(valid_data_model)
-        mock_generate_report.assert_called_once_with(valid_data_model, mock_cost_model)
+        mock_generate_report.assert_called_once_with(valid_data_model, mock_cost_model, None)
 
     @patch(
         'awslabs.dynamodb_mcp_server.cost_performance_calculator.calculator_runner.generate_report'
@@ -254,6 +255,19 @@ class TestRunCostCalculator:
         assert len(result) > 0
         assert 'Cost analysis complete' in result
 
+    def test_scenario_sweep_adds_report_section(self, valid_data_model, tmp_path):
+        """Test that a scenario sweep is summarized in the report."""
+        result = run_cost_calculator(
+            valid_data_model,
+            workspace_dir=str(tmp_path),
+            scenario_sweep=ScenarioSweep(rps_multipliers=[1, 2, 4], item_size_multipliers=[1, 2]),
+        )
+
+        assert 'swept 6 what-if scenarios' in result
+        report = (tmp_path / 'dynamodb_data_model.md').read_text()
+        assert '### What-If Scenarios' in report
+        assert report.index('### What-If Scenarios') < report.index(REPORT_END_MARKER)
+
 
 class TestReplaceOrAppendReport:
     """Tests for the replace-or-append report behavior."""
@@ -0,0 +1,280 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for scenario_sweep module."""
+
+import math
+import pytest
+import time
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.cost_calculator import (
+    calculate_cost,
+)
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.data_model import (
+    MAX_ITEM_SIZE_BYTES,
+    MAX_SWEEP_SCENARIOS,
+    DataModel,
+    ScenarioSweep,
+)
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.report_generator import (
+    generate_report,
+)
+from awslabs.dynamodb_mcp_server.cost_performance_calculator.scenario_sweep import sweep_costs
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pydantic import ValidationError
+
+
+TABLE_LIST = [
+    {
+        'name': 'users',
+        'item_size_bytes': 6000,
+        'item_count': 10000,
+        'gsi_list': [
+            {'name': 'email-index', 'item_size_bytes': 3000, 'item_count': 10000},
+            {'name': 'status-index', 'item_size_bytes': 500, 'item_count': 8000},
+        ],
+    },
+    {'name': 'orders', 'item_size_bytes': 2048, 'item_count': 50000},
+]
+
+ACCESS_PATTERN_LIST = [
+    {'operation': 'GetItem', 'item_size_bytes': 5000, 'strongly_consistent': True},
+    {'operation': 'Query', 'item_size_bytes': 2500, 'item_count': 3, 'gsi': 'email-index'},
+    {'operation': 'Scan', 'item_size_bytes': 400, 'item_count': 20, 'gsi': 'status-index'},
+    {'operation': 'PutItem', 'item_size_bytes': 6000, 'gsi_list': ['email-index']},
+    {'operation': 'UpdateItem', 'item_size_bytes': 1500, 'gsi_list': ['status-index']},
+    {'operation': 'DeleteItem', 'item_size_bytes': 100},
+    {'operation': 'BatchGetItem', 'item_size_bytes': 4097, 'item_count': 10},
+    {
+        'operation': 'BatchWriteItem',
+        'item_size_bytes': 1025,
+        'item_count': 25,
+        'gsi_list': ['email-index', 'status-index'],
+    },
+    {'operation': 'TransactGetItems', 'item_size_bytes': 900, 'item_count': 4},
+    {
+        'operation': 'TransactWriteItems',
+        'item_size_bytes': 2000,
+        'item_count': 2,
+        'gsi_list': ['status-index'],
+    },
+]
+
+
+def _data_model(rps_multiplier=1.0, size_multiplier=1.0, count_multiplier=1.0) -> DataModel:
+    """Build the test data model, scaled like a sweep scenario."""
+
+    def size(value):
+        return min(max(math.ceil(value * size_multiplier), 1), MAX_ITEM_SIZE_BYTES)
+
+    def storage(entity):
+        return {
+            **entity,
+            'item_size_bytes': size(entity['item_size_bytes']),
+            'item_count': math.ceil(entity['item_count'] * count_multiplier),
+        }
+
+    return DataModel(
+        access_pattern_list=[
+            {
+                'pattern': f'ap-{i}',
+                'description': ap['operation'],
+                'table': 'users',
+                'rps': 10.0 * (i + 1) * rps_multiplier,
+                **ap,
+                'item_size_bytes': size(ap['item_size_bytes']),
+            }
+            for i, ap in enumerate(ACCESS_PATTERN_LIST)
+        ],
+        table_list=[
+            {**storage(table), 'gsi_list': [storage(gsi) for gsi in table.get('gsi_list', [])]}
+            for table in TABLE_LIST
+        ],
+    )
+
+
+def _total_cost(cost_model) -> float:
+    """Total monthly cost of a cost model."""
+    return (
+        sum(ap.cost for ap in cost_model.access_patterns)
+        + sum(amp.cost for ap in cost_model.access_patterns for amp in ap.gsi_write_amplification)
+        + sum(table.storage_cost for table in cost_model.tables)
+        + sum(gsi.storage_cost for gsi in cost_model.gsis)
+    )
+
+
+class TestSweepCosts:
+    """Tests for sweep_costs function."""
+
+    def test_baseline_matches_calculate_cost(self):
+        """A scenario without changes costs the same as calculate_cost."""
+        data_model = _data_model()
+        cost_model = calculate_cost(data_model)
+
+        result = sweep_costs(data_model, ScenarioSweep())
+
+        assert len(result) == 1
+        read_cost = sum(ap.cost for ap in cost_model.access_patterns if ap.rcus > 0)
+        write_cost = sum(ap.cost for ap in cost_model.access_patterns if ap.wcus > 0)
+        gsi_write_cost = sum(
+            amp.cost for ap in cost_model.access_patterns for amp in ap.gsi_write_amplification
+        )
+        assert result.read_cost[0] == pytest.approx(read_cost)
+        assert result.write_cost[0] == pytest.approx(write_cost)
+        assert result.gsi_write_cost[0] == pytest.approx(gsi_write_cost)
+        assert result.total_cost[0] == pytest.approx(_total_cost(cost_model))
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        rps_multipliers=st.lists(st.floats(0.01, 100), min_size=1, max_size=3),
+        item_size_multipliers=st.lists(st.floats(0.01, 100), min_size=1, max_size=3),
+    )
+    def test_scenarios_match_scaled_data_models(self, rps_multipliers, item_size_multipliers):
+        """Every scenario costs the same as calculate_cost for the scaled data model."""
+        sweep = ScenarioSweep(
+            rps_multipliers=rps_multipliers,
+            item_size_multipliers=item_size_multipliers,
+            item_count_multipliers=[1.0, 3.0],
+        )
+
+        result = sweep_costs(_data_model(), sweep)
+
+        assert len(result) == sweep.scenario_count()
+        for i in range(len(result)):
+            scaled = _data_model(
+                result.rps_multiplier[i],
+                result.item_size_multiplier[i],
+                result.item_count_multiplier[i],
+            )
+            assert result.total_cost[i] == pytest.approx(_total_cost(calculate_cost(scaled)))
+
+    def test_gsi_item_sizes(self):
+        """GSI item sizes change GSI storage, writes and reads, within the table item size."""
+        data_model = _data_model()
+
+        result = sweep_costs(
+            data_model, ScenarioSweep(gsi_item_size_bytes={'email-index': [100, 3000, 9000]})
+        )
+
+        assert result.gsi_names == ['email-index']
+        assert result.gsi_item_size[:, 0].tolist() == [100, 3000, 9000]
+        # The baseline GSI item size costs the same as calculate_cost
+        assert result.total_cost[1] == pytest.approx(_total_cost(calculate_cost(data_model)))
+        assert result.read_cost[0] < result.read_cost[1] < result.read_cost[2]
+        assert result.gsi_write_cost[0] < result.gsi_write_cost[1] < result.gsi_write_cost[2]
+        assert result.storage_cost[0] < result.storage_cost[1] < result.storage_cost[2]
+        # 9000 bytes is capped at the 6000 bytes of the table
+        projected = _data_model()
+        projected.table_list[0].gsi_list[0].item_size_bytes = 6000
+        projected.access_pattern_list[1].item_size_bytes = 5000
+        assert result.total_cost[2] == pytest.approx(_total_cost(calculate_cost(projected)))
+
+    def test_unknown_gsi(self):
+        """GSI item sizes of GSIs that do not exist are rejected."""
+        with pytest.raises(ValueError, match='GSI does not exist. gsi: "missing"'):
+            sweep_costs(_data_model(), ScenarioSweep(gsi_item_size_bytes={'missing': [100]}))
+
+    def test_thousands_of_scenarios(self):
+        """A sweep of thousands of scenarios is faster than evaluating them one by one."""
+        data_model = _data_model()
+        sweep = ScenarioSweep(
+            rps_multipliers=[0.5 + i * 0.1 for i in range(20)],
+            item_size_multipliers=[1.0 + i * 0.1 for i in range(10)],
+            item_count_multipliers=[1.0, 2.0, 4.0, 8.0, 16.0],
+            gsi_item_size_bytes={'email-index': [200, 3000], 'status-index': [100, 500, 1000]},
+        )
+
+        start_time = time.perf_counter()
+        result = sweep_costs(data_model, sweep)
+        sweep_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for i in range(100):
+            calculate_cost(
+                _data_model(
+                    result.rps_multiplier[i],
+                    result.item_size_multiplier[i],
+                    result.item_count_multiplier[i],
+                )
+            )
+        scalar_time = (time.perf_counter() - start_time) * len(result) / 100
+
+        assert len(result) == 6000
+        assert sweep_time < scalar_time
+
+
+class TestScenarioSweep:
+    """Tests for ScenarioSweep model."""
+
+    def test_scenario_count(self):
+        """Every combination is one scenario."""
+        sweep = ScenarioSweep(
+            rps_multipliers=[1, 2],
+            item_size_multipliers=[1, 1.5, 2],
+            gsi_item_size_bytes={'a': [100, 200], 'b': [300]},
+        )
+
+        assert sweep.scenario_count() == 12
+
+    def test_too_many_scenarios(self):
+        """Sweeps are limited to MAX_SWEEP_SCENARIOS scenarios."""
+        with pytest.raises(ValidationError, match='too many scenarios'):
+            ScenarioSweep(
+                rps_multipliers=[1.0] * 1000,
+                item_size_multipliers=[1.0] * (MAX_SWEEP_SCENARIOS // 1000 + 1),
+            )
+
+    def test_invalid_values(self):
+        """Multipliers must be positive and lists not empty."""
+        with pytest.raises(ValidationError):
+            ScenarioSweep(rps_multipliers=[0])
+        with pytest.raises(ValidationError):
+            ScenarioSweep(item_size_multipliers=[])
+        with pytest.raises(ValidationError):
+            ScenarioSweep(gsi_item_size_bytes={'a': [MAX_ITEM_SIZE_BYTES + 1]})
+
+
+class TestSweepReport:
+    """Tests for the what-if scenarios report section."""
+
+    def test_report_section(self):
+        """The report shows the representative scenarios and the range per traffic."""
+        data_model = _data_model()
+        sweep_result = sweep_costs(
+            data_model,
+            ScenarioSweep(
+                rps_multipliers=[1, 2],
+                item_size_multipliers=[1, 1.5],
+                gsi_item_size_bytes={'email-index': [200, 3000]},
+            ),
+        )
+
+        report = generate_report(data_model, calculate_cost(data_model), sweep_result)
+
+        section = report[report.index('### What-If Scenarios') :]
+        assert '**Scenarios:** 8' in section
+        assert '| Lowest ' in section
+        assert '| Highest ' in section
+        assert 'email-index=200' in section
+        assert f'${sweep_result.total_cost.max():.2f}' in section
+        assert '| 2x ' in section
+        assert report.rstrip().endswith('<!-- end-cost-report -->')
+
+    def test_report_without_sweep(self):
+        """The report has no what-if section without a sweep."""
+        data_model = _data_model()
+
+        report = generate_report(data_model, calculate_cost(data_model))
+
+        assert 'What-If Scenarios' not in report
@@ -27,7 +27,11 @@ import os
 import pytest
 import tempfile
 from awslabs.dynamodb_mcp_server.db_analyzer import analyzer_utils
-from awslabs.dynamodb_mcp_server.db_analyzer.mysql import MySQLPlugin
+from awslabs.dynamodb_mcp_server.db_analyzer.mysql import (
+    DEFAULT_QUERY_CONCURRENCY,
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
+    MySQLPlugin,
+)
 
 
 class TestBuildConnectionParams:
@@ -92,6 +96,24 @@ class TestBuildConnectionParams:
         assert params['region'] == 'env-region'
         assert params['max_results'] == 999
 
+    def test_build_connection_params_query_concurrency_and_timeout(self, tmp_path, monkeypatch):
+        """Test query concurrency and timeout from env vars, with defaults for invalid values."""
+        params = analyzer_utils.build_connection_params('mysql', output_dir=str(tmp_path))
+        assert params['query_concurrency'] == DEFAULT_QUERY_CONCURRENCY
+        assert params['query_timeout_seconds'] == DEFAULT_QUERY_TIMEOUT_SECONDS
+
+        monkeypatch.setenv('MYSQL_QUERY_CONCURRENCY', '8')
+        monkeypatch.setenv('MYSQL_QUERY_TIMEOUT_SECONDS', '15')
+        params = analyzer_utils.build_connection_params('mysql', output_dir=str(tmp_path))
+        assert params['query_concurrency'] == 8
+        assert params['query_timeout_seconds'] == 15
+
+        monkeypatch.setenv('MYSQL_QUERY_CONCURRENCY', '0')
+        monkeypatch.setenv('MYSQL_QUERY_TIMEOUT_SECONDS', 'never')
+        params = analyzer_utils.build_connection_params('mysql', output_dir=str(tmp_path))
+        assert params['query_concurrency'] == DEFAULT_QUERY_CONCURRENCY
+        assert params['query_timeout_seconds'] == DEFAULT_QUERY_TIMEOUT_SECONDS
+
     def test_build_connection_params_explicit_overrides_env(self, tmp_path, monkeypatch):
         """Test that explicit parameters override environment variables."""
         monkeypatch.setenv('MYSQL_CLUSTER_ARN', 'env-cluster')
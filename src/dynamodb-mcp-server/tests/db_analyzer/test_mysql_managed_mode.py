@@ -18,6 +18,7 @@ These tests cover the execute_managed_mode and _execute_query_batch methods
 in the MySQLPlugin class which require mocking the MySQL MCP server connection.
 """
 
+import asyncio
 import json
 import pytest
 from awslabs.dynamodb_mcp_server.db_analyzer.mysql import _get_validated_hostname
@@ -274,6 +275,112 @@ class TestMySQLExecuteQueryBatch:
         assert len(all_errors) == 0
 
 
+class TestMySQLQueryConcurrency:
+    """Test concurrent execution, timeouts and timings of analysis queries."""
+
+    @pytest.mark.asyncio
+    async def test_queries_run_concurrently_up_to_limit(self, mysql_plugin):
+        """Queries overlap, never more than max_concurrency at once, results in order."""
+        running = 0
+        max_running = 0
+
+        async def mock_run_query(sql):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [{'sql': sql}]
+
+        query_names = mysql_plugin.get_schema_queries() + mysql_plugin.get_performance_queries()
+        all_results = {}
+        query_timings = {}
+        await mysql_plugin._execute_query_batch(
+            query_names,
+            'test_db',
+            500,
+            mock_run_query,
+            all_results,
+            [],
+            max_concurrency=2,
+            query_timings=query_timings,
+        )
+
+        assert max_running == 2
+        assert list(all_results) == query_names
+        assert list(query_timings) == query_names
+        assert all(timing['status'] == 'success' for timing in query_timings.values())
+        assert all(timing['rows'] == 1 for timing in query_timings.values())
+
+    @pytest.mark.asyncio
+    async def test_query_timeout(self, mysql_plugin):
+        """Queries are stopped by the server hint and by the client after a margin."""
+        sqls = []
+
+        async def mock_run_query(sql):
+            sqls.append(sql)
+            if 'ORDINAL_POSITION as position' in sql:
+                await asyncio.sleep(1)
+            else:
+                # Past the server-side limit, but within the client margin
+                await asyncio.sleep(0.1)
+            return [{'row': 1}]
+
+        all_results = {}
+        all_errors = []
+        query_timings = {}
+        with patch(
+            'awslabs.dynamodb_mcp_server.db_analyzer.mysql.CLIENT_TIMEOUT_MARGIN_SECONDS', 0.3
+        ):
+            await mysql_plugin._execute_query_batch(
+                ['comprehensive_table_analysis', 'column_analysis'],
+                'test_db',
+                500,
+                mock_run_query,
+                all_results,
+                all_errors,
+                timeout_seconds=0.05,
+                query_timings=query_timings,
+            )
+
+        assert all(sql.lstrip().startswith('SELECT /*+ MAX_EXECUTION_TIME(50) */') for sql in sqls)
+        assert list(all_results) == ['comprehensive_table_analysis']
+        assert all_errors == ['column_analysis: Query timed out after 0.05 seconds']
+        assert query_timings['column_analysis']['status'] == 'timeout'
+        assert query_timings['comprehensive_table_analysis']['status'] == 'success'
+
+    @pytest.mark.asyncio
+    async def test_execute_managed_mode_timings_and_pool_size(
+        self, mysql_plugin, mysql_connection_params
+    ):
+        """Managed mode returns query timings and sizes the pool to the concurrency."""
+        params = {
+            **mysql_connection_params,
+            'cluster_arn': None,
+            'hostname': 'replica.example.com',
+            'query_concurrency': 3,
+            'query_timeout_seconds': 30,
+        }
+        with (
+            patch(
+                'awslabs.dynamodb_mcp_server.db_analyzer.mysql._get_validated_hostname',
+                return_value='replica.example.com',
+            ),
+            patch(
+                'awslabs.dynamodb_mcp_server.db_analyzer.mysql.AsyncmyPoolConnection'
+            ) as mock_pool,
+            patch('awslabs.dynamodb_mcp_server.db_analyzer.mysql.mysql_query') as mock_query,
+        ):
+            mock_query.side_effect = [[{'@@performance_schema': '0'}]] + [[{'row': 1}]] * 4
+
+            result = await mysql_plugin.execute_managed_mode(params)
+
+        assert mock_pool.call_args.kwargs['max_size'] == 3
+        assert mock_pool.call_args.kwargs['hostname'] == 'replica.example.com'
+        assert list(result['query_timings']) == mysql_plugin.get_schema_queries()
+        assert 'MAX_EXECUTION_TIME(30000)' in mock_query.call_args_list[1].args[0]
+
+
 class TestGetValidatedHostname:
     """Tests for _get_validated_hostname hostname-secret consistency check."""
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import Brand, Deal, TrendingDeal, User, UserActivity, UserWatch
 from typing import Any
 
@@ -80,6 +81,19 @@ class DealRepository(BaseRepository[Deal]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_deals_by_brand(
+        self, brand_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Deal]:
+        """Iterate over all results of get_deals_by_brand, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_deals_by_brand(
+                brand_id=brand_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_deals_by_category(
         self,
         category_id: str,
@@ -123,6 +137,19 @@ class DealRepository(BaseRepository[Deal]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_deals_by_category(
+        self, category_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_deals_by_category, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_deals_by_category(
+                category_id=category_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_recent_deals_by_brand(
         self,
         brand_id: str,
@@ -162,6 +189,20 @@ class DealRepository(BaseRepository[Deal]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_recent_deals_by_brand(
+        self, brand_id: str, since_date: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Deal]:
+        """Iterate over all results of get_recent_deals_by_brand, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_recent_deals_by_brand(
+                brand_id=brand_id,
+                since_date=since_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User entity operations"""
@@ -301,6 +342,19 @@ class UserWatchRepository(BaseRepository[UserWatch]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_watches(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserWatch]:
+        """Iterate over all results of get_user_watches, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_watches(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_brand_watchers(
         self,
         brand_id: str,
@@ -338,6 +392,19 @@ class UserWatchRepository(BaseRepository[UserWatch]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_brand_watchers(
+        self, brand_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_brand_watchers, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_brand_watchers(
+                brand_id=brand_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_category_watchers(
         self,
         category_id: str,
@@ -381,6 +448,19 @@ class UserWatchRepository(BaseRepository[UserWatch]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_category_watchers(
+        self, category_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_category_watchers, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_category_watchers(
+                category_id=category_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_watches_by_type(
         self,
         watch_type: str,
@@ -418,6 +498,19 @@ class UserWatchRepository(BaseRepository[UserWatch]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_watches_by_type(
+        self, watch_type: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserWatch]:
+        """Iterate over all results of get_watches_by_type, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_watches_by_type(
+                watch_type=watch_type,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class UserActivityRepository(BaseRepository[UserActivity]):
     """Repository for UserActivity entity operations"""
@@ -481,6 +574,19 @@ class UserActivityRepository(BaseRepository[UserActivity]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_activities(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserActivity]:
+        """Iterate over all results of get_user_activities, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_activities(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_activities_after(
         self,
         user_id: str,
@@ -517,6 +623,24 @@ class UserActivityRepository(BaseRepository[UserActivity]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_activities_after(
+        self,
+        user_id: str,
+        since_timestamp: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[UserActivity]:
+        """Iterate over all results of get_user_activities_after, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_activities_after(
+                user_id=user_id,
+                since_timestamp=since_timestamp,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class TrendingDealRepository(BaseRepository[TrendingDeal]):
     """Repository for TrendingDeal entity operations"""
@@ -578,6 +702,19 @@ class TrendingDealRepository(BaseRepository[TrendingDeal]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_trending_by_category(
+        self, category_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TrendingDeal]:
+        """Iterate over all results of get_trending_by_category, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_trending_by_category(
+                category_id=category_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_highly_engaged_deals(
         self,
         category_id: str,
@@ -614,6 +751,24 @@ class TrendingDealRepository(BaseRepository[TrendingDeal]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_highly_engaged_deals(
+        self,
+        category_id: str,
+        min_score: int,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[TrendingDeal]:
+        """Iterate over all results of get_highly_engaged_deals, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_highly_engaged_deals(
+                category_id=category_id,
+                min_score=min_score,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_high_discount_deals(
         self,
         brand_id: str,
@@ -652,3 +807,21 @@ class TrendingDealRepository(BaseRepository[TrendingDeal]):
         # response = self.table.query(**query_params)
         # return self._parse_query_response(response, skip_invalid_items)
         pass
+
+    def iter_get_high_discount_deals(
+        self,
+        brand_id: str,
+        min_discount: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[TrendingDeal]:
+        """Iterate over all results of get_high_discount_deals, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_high_discount_deals(
+                brand_id=brand_id,
+                min_discount=min_discount,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
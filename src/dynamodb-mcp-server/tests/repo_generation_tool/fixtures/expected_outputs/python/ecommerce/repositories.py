@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import (
     Order,
     OrderItem,
@@ -146,6 +147,19 @@ class UserAddressRepository(BaseRepository[UserAddress]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_addresses(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserAddress]:
+        """Iterate over all results of get_user_addresses, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_addresses(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_user_address(self, address: UserAddress) -> UserAddress | None:
         """Add new address for user"""
         # TODO: Implement Access Pattern #5
@@ -289,6 +303,19 @@ class ProductCategoryRepository(BaseRepository[ProductCategory]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_products_by_category(
+        self, category_name: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[ProductCategory]:
+        """Iterate over all results of get_products_by_category, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_products_by_category(
+                category_name=category_name,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_product_to_category(self, category_item: ProductCategory) -> ProductCategory | None:
         """Add product to category index"""
         # TODO: Implement Access Pattern #10
@@ -337,6 +364,24 @@ class ProductCategoryRepository(BaseRepository[ProductCategory]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_category_products_after_id(
+        self,
+        category_name: str,
+        after_product_id: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[ProductCategory]:
+        """Iterate over all results of get_category_products_after_id, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_category_products_after_id(
+                category_name=category_name,
+                after_product_id=after_product_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class ProductReviewRepository(BaseRepository[ProductReview]):
     """Repository for ProductReview entity operations"""
@@ -400,6 +445,19 @@ class ProductReviewRepository(BaseRepository[ProductReview]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_product_reviews(
+        self, product_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[ProductReview]:
+        """Iterate over all results of get_product_reviews, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_product_reviews(
+                product_id=product_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def put_product_review(self, review: ProductReview, user: User) -> ProductReview | None:
         """Put (upsert) new product review with user reference"""
         # TODO: Implement Access Pattern #12
@@ -450,6 +508,24 @@ class ProductReviewRepository(BaseRepository[ProductReview]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_product_reviews_by_id_prefix(
+        self,
+        product_id: str,
+        review_id_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[ProductReview]:
+        """Iterate over all results of get_product_reviews_by_id_prefix, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_product_reviews_by_id_prefix(
+                product_id=product_id,
+                review_id_prefix=review_id_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class OrderRepository(BaseRepository[Order]):
     """Repository for Order entity operations"""
@@ -585,6 +661,19 @@ class OrderItemRepository(BaseRepository[OrderItem]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_order_items(
+        self, order_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[OrderItem]:
+        """Iterate over all results of get_order_items, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_order_items(
+                order_id=order_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_order_item(self, order_item: OrderItem, product: Product) -> OrderItem | None:
         """Add item to order with product reference"""
         # TODO: Implement Access Pattern #17
@@ -660,6 +749,19 @@ class UserOrderHistoryRepository(BaseRepository[UserOrderHistory]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_order_history_list(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserOrderHistory]:
+        """Iterate over all results of get_user_order_history_list, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_order_history_list(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_recent_orders(
         self,
         user_id: str,
@@ -695,6 +797,19 @@ class UserOrderHistoryRepository(BaseRepository[UserOrderHistory]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_recent_orders(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserOrderHistory]:
+        """Iterate over all results of get_user_recent_orders, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_recent_orders(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_order_to_user_history(
         self, user_order: UserOrderHistory, user: User, order: Order
     ) -> UserOrderHistory | None:
@@ -745,6 +860,20 @@ class UserOrderHistoryRepository(BaseRepository[UserOrderHistory]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_orders_after_date(
+        self, user_id: str, since_date: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserOrderHistory]:
+        """Iterate over all results of get_user_orders_after_date, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_orders_after_date(
+                user_id=user_id,
+                since_date=since_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_orders_in_date_range(
         self,
         user_id: str,
@@ -782,3 +911,23 @@ class UserOrderHistoryRepository(BaseRepository[UserOrderHistory]):
         # response = self.table.query(**query_params)
         # return self._parse_query_response(response, skip_invalid_items)
         pass
+
+    def iter_get_user_orders_in_date_range(
+        self,
+        user_id: str,
+        start_date: str,
+        end_date: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[UserOrderHistory]:
+        """Iterate over all results of get_user_orders_in_date_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_orders_in_date_range(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import (
     TenantCertificate,
     TenantCourse,
@@ -85,6 +86,20 @@ class TenantCertificateRepository(BaseRepository[TenantCertificate]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_certificates(
+        self, tenant_id: str, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TenantCertificate]:
+        """Iterate over all results of get_user_certificates, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_certificates(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def issue_course_certificate(self, certificate: TenantCertificate) -> TenantCertificate | None:
         """Issue certificate for course completion"""
         # TODO: Implement Access Pattern #19
@@ -251,6 +266,20 @@ class TenantEnrollmentRepository(BaseRepository[TenantEnrollment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_enrollments(
+        self, tenant_id: str, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TenantEnrollment]:
+        """Iterate over all results of get_user_enrollments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_enrollments(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def enroll_user_in_course(self, enrollment: TenantEnrollment) -> TenantEnrollment | None:
         """Enroll user in a course"""
         # TODO: Implement Access Pattern #10
@@ -370,6 +399,20 @@ class TenantLessonRepository(BaseRepository[TenantLesson]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_course_lessons(
+        self, tenant_id: str, course_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TenantLesson]:
+        """Iterate over all results of get_course_lessons, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_course_lessons(
+                tenant_id=tenant_id,
+                course_id=course_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_specific_lesson(
         self, tenant_id: str, course_id: str, lesson_order: int, lesson_id: str
     ) -> TenantLesson | None:
@@ -510,6 +553,26 @@ class TenantProgressRepository(BaseRepository[TenantProgress]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_course_progress(
+        self,
+        tenant_id: str,
+        user_id: str,
+        course_id: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[TenantProgress]:
+        """Iterate over all results of get_user_course_progress, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_course_progress(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                course_id=course_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def record_lesson_progress(self, progress: TenantProgress) -> TenantProgress | None:
         """Record user's progress on a lesson"""
         # TODO: Implement Access Pattern #16
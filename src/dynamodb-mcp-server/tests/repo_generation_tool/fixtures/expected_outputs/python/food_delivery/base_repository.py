@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import boto3
+import random
+import time
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 from pydantic import BaseModel
@@ -22,10 +27,20 @@ from typing import Any, Generic, TypeVar
 
 
 T = TypeVar('T', bound='ConfigurableEntity')
+R = TypeVar('R')
 
 # Type alias for DynamoDB key values (supports String and Number key types)
 KeyType = str | int | Decimal
 
+# DynamoDB limits of a single BatchGetItem / BatchWriteItem request
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Retries of unprocessed batch items, with exponential backoff and full jitter
+BATCH_MAX_RETRIES = 8
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+BATCH_RETRY_MAX_DELAY_SECONDS = 5.0
+
 
 class OptimisticLockException(Exception):
     """Raised when optimistic locking fails due to concurrent modification"""
@@ -96,6 +111,19 @@ class ConfigurableEntity(BaseModel):
         return f'{config.entity_type}#'
 
 
+def chunked(values: Sequence[R], size: int) -> Iterator[Sequence[R]]:
+    """Split values into consecutive chunks of at most size values"""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def batch_retry_delay(attempt: int) -> float:
+    """Seconds to wait before retrying unprocessed batch items (full jitter backoff)"""
+    return random.uniform(
+        0, min(BATCH_RETRY_MAX_DELAY_SECONDS, BATCH_RETRY_BASE_DELAY_SECONDS * 2**attempt)
+    )
+
+
 class BaseRepository(Generic[T]):
     """Generic base repository for DynamoDB operations"""
 
@@ -116,12 +144,7 @@ class BaseRepository(Generic[T]):
         won't be indexed in those GSIs.
         """
         try:
-            item = entity.model_dump(exclude_none=True)
-            item[self.pkey_name] = entity.pk()
-            if self.skey_name is not None:
-                sk_value = entity.sk()
-                if sk_value is not None:
-                    item[self.skey_name] = sk_value
+            item = self._item(entity)
 
             # Ensure version starts at 1
             item['version'] = 1
@@ -151,9 +174,7 @@ class BaseRepository(Generic[T]):
     ) -> T | None:
         """Generic get operation with optional consistent read"""
         try:
-            key = {self.pkey_name: pk}
-            if self.skey_name is not None and sk is not None:
-                key[self.skey_name] = sk
+            key = self._key(pk, sk)
             response = self.table.get_item(Key=key, ConsistentRead=consistent_read)
             if 'Item' in response:
                 return self.model_class(**response['Item'])
@@ -177,12 +198,7 @@ class BaseRepository(Generic[T]):
             expected_version = entity.version
             new_version = expected_version + 1
 
-            item = entity.model_dump(exclude_none=True)
-            item[self.pkey_name] = entity.pk()
-            if self.skey_name is not None:
-                sk_value = entity.sk()
-                if sk_value is not None:
-                    item[self.skey_name] = sk_value
+            item = self._item(entity)
 
             # Set new version
             item['version'] = new_version
@@ -212,9 +228,7 @@ class BaseRepository(Generic[T]):
     def delete(self, pk: KeyType, sk: KeyType | None = None) -> bool:
         """Generic delete operation"""
         try:
-            key = {self.pkey_name: pk}
-            if self.skey_name is not None and sk is not None:
-                key[self.skey_name] = sk
+            key = self._key(pk, sk)
             response = self.table.delete_item(Key=key)
             return response['ResponseMetadata']['HTTPStatusCode'] == 200
         except ClientError as e:
@@ -228,6 +242,132 @@ class BaseRepository(Generic[T]):
         """Delete using entity's pk/sk methods"""
         return self.delete(entity.pk(), entity.sk())
 
+    def batch_get(
+        self, keys: Sequence[tuple[KeyType, KeyType | None]], consistent_read: bool = False
+    ) -> list[T]:
+        """Get many entities by (pk, sk) key with BatchGetItem
+
+        Keys are deduplicated and sent 100 at a time. Keys that DynamoDB leaves
+        unprocessed (e.g. when throttled) are retried with exponential backoff.
+        Missing items are skipped and results are not in key order.
+
+        Args:
+            keys: (pk, sk) tuples, with sk None for tables without sort key
+            consistent_read: Use strongly consistent reads
+
+        Returns:
+            list: Entities found
+        """
+        client = self.dynamodb.meta.client
+        entities = []
+        for chunk in chunked(list(dict.fromkeys(keys)), BATCH_GET_MAX_KEYS):
+            request_items = {
+                self.table.name: {
+                    'Keys': [self._key(pk, sk) for pk, sk in chunk],
+                    'ConsistentRead': consistent_read,
+                }
+            }
+            for response in self._send_batch(
+                'get', lambda items: client.batch_get_item(RequestItems=items), request_items
+            ):
+                for item in response.get('Responses', {}).get(self.table.name, []):
+                    entities.append(self.model_class(**item))
+        return entities
+
+    def batch_write(
+        self,
+        entities: Sequence[T] = (),
+        delete_keys: Sequence[tuple[KeyType, KeyType | None]] = (),
+    ) -> None:
+        """Put and delete many items with BatchWriteItem
+
+        Requests are sent 25 at a time, and unprocessed items are retried with
+        exponential backoff.
+
+        WARNING: BatchWriteItem does NOT support optimistic locking. Entities are
+        written as is (version unchanged) and overwrite existing items.
+
+        Args:
+            entities: Entities to put
+            delete_keys: (pk, sk) tuples of the items to delete
+        """
+        client = self.dynamodb.meta.client
+        write_requests = [{'PutRequest': {'Item': self._item(entity)}} for entity in entities] + [
+            {'DeleteRequest': {'Key': self._key(pk, sk)}} for pk, sk in delete_keys
+        ]
+        for chunk in chunked(write_requests, BATCH_WRITE_MAX_ITEMS):
+            self._send_batch(
+                'write',
+                lambda items: client.batch_write_item(RequestItems=items),
+                {self.table.name: list(chunk)},
+            )
+
+    def _send_batch(
+        self, operation: str, send: Callable[[dict], dict], request_items: dict
+    ) -> list[dict]:
+        """Send a batch request, retrying its unprocessed keys or items
+
+        Returns:
+            list: Responses of the request and of its retries
+        """
+        unprocessed = 'UnprocessedKeys' if operation == 'get' else 'UnprocessedItems'
+        responses = []
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(batch_retry_delay(attempt - 1))
+            try:
+                response = send(request_items)
+            except ClientError as e:
+                error_code = e.response['Error']['Code']
+                error_msg = e.response['Error']['Message']
+                raise RuntimeError(
+                    f'Failed to batch {operation} {self.model_class.__name__}: {error_code} - {error_msg}'
+                ) from e
+            responses.append(response)
+            request_items = response.get(unprocessed) or {}
+            if not request_items:
+                return responses
+        raise RuntimeError(
+            f'Failed to batch {operation} {self.model_class.__name__}: '
+            f'items still unprocessed after {BATCH_MAX_RETRIES} retries'
+        )
+
+    def _key(self, pk: KeyType, sk: KeyType | None = None) -> dict[str, KeyType]:
+        """Build the primary key of an item"""
+        key = {self.pkey_name: pk}
+        if self.skey_name is not None and sk is not None:
+            key[self.skey_name] = sk
+        return key
+
+    def _item(self, entity: T) -> dict[str, Any]:
+        """Build the item of an entity, without None values (sparse GSIs)"""
+        item = entity.model_dump(exclude_none=True)
+        item[self.pkey_name] = entity.pk()
+        if self.skey_name is not None:
+            sk_value = entity.sk()
+            if sk_value is not None:
+                item[self.skey_name] = sk_value
+        return item
+
+    def _paginate(
+        self, fetch_page: Callable[[dict | None], tuple[list[R], dict | None]]
+    ) -> Iterator[R]:
+        """Iterate over the items of every page of a query or scan
+
+        Args:
+            fetch_page: Function returning (items, last_evaluated_key) for an
+                exclusive_start_key, such as a generated access pattern method
+
+        Yields:
+            Items of each page, fetching the next page when the previous one is consumed
+        """
+        exclusive_start_key = None
+        while True:
+            items, exclusive_start_key = fetch_page(exclusive_start_key)
+            yield from items
+            if not exclusive_start_key:
+                return
+
     def _parse_query_response(
         self, response: dict, skip_invalid_items: bool = True
     ) -> tuple[list[T], dict | None]:
@@ -274,3 +414,273 @@ class BaseRepository(Generic[T]):
         """
         items = response.get('Items', [])
         return items, response.get('LastEvaluatedKey')
+
+
+class AsyncBaseRepository(Generic[T]):
+    """Async variant of a repository, sending requests with aiobotocore
+
+    Wraps a (generated) repository and reuses its entity, table and key
+    configuration. Requires the optional aiobotocore package, unless a client is
+    given. Use as an async context manager to open and close the client:
+
+        async with AsyncBaseRepository(UserRepository()) as users:
+            user = await users.get(pk, sk)
+            async for user in users.iter_query(Key('pk').eq(pk)):
+                ...
+    """
+
+    def __init__(self, repository: BaseRepository[T], client: Any = None):
+        """Create the async variant of a repository
+
+        Args:
+            repository: Repository whose entities and table to use
+            client: Optional aiobotocore DynamoDB client; by default one is created
+                when entering the context manager
+        """
+        self.repository = repository
+        self.model_class = repository.model_class
+        self.table_name = repository.table.name
+        self.client = client
+        self._client_context = None
+        self._serializer = TypeSerializer()
+        self._deserializer = TypeDeserializer()
+
+    async def __aenter__(self) -> 'AsyncBaseRepository[T]':
+        """Create the aiobotocore client, unless one was given"""
+        if self.client is None:
+            from aiobotocore.session import get_session
+
+            self._client_context = get_session().create_client('dynamodb')
+            self.client = await self._client_context.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client created when entering"""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(*exc_info)
+            self._client_context = None
+            self.client = None
+
+    async def create(self, entity: T) -> T:
+        """Create a new entity with optimistic locking (prevents overwrites)"""
+        item = self.repository._item(entity)
+        item['version'] = 1
+        await self._call(
+            'create',
+            'put_item',
+            Item=self._serialize(item),
+            ConditionExpression=f'attribute_not_exists({self.repository.pkey_name})',
+            lock_message='Item already exists. Use update() to modify existing items.',
+        )
+        entity.version = 1
+        return entity
+
+    async def get(
+        self, pk: KeyType, sk: KeyType | None = None, consistent_read: bool = False
+    ) -> T | None:
+        """Get an entity by key with optional consistent read"""
+        response = await self._call(
+            'get',
+            'get_item',
+            Key=self._serialize(self.repository._key(pk, sk)),
+            ConsistentRead=consistent_read,
+        )
+        if 'Item' in response:
+            return self.model_class(**self._deserialize(response['Item']))
+        return None
+
+    async def update(self, entity: T) -> T:
+        """Update an existing entity with optimistic locking (prevents lost updates)"""
+        expected_version = entity.version
+        item = self.repository._item(entity)
+        item['version'] = expected_version + 1
+        await self._call(
+            'update',
+            'put_item',
+            Item=self._serialize(item),
+            ConditionExpression='version = :expected_version',
+            ExpressionAttributeValues=self._serialize({':expected_version': expected_version}),
+            lock_message=f'Item was modified by another process (expected version {expected_version})',
+        )
+        entity.version = expected_version + 1
+        return entity
+
+    async def delete(self, pk: KeyType, sk: KeyType | None = None) -> bool:
+        """Delete an item by key"""
+        response = await self._call(
+            'delete', 'delete_item', Key=self._serialize(self.repository._key(pk, sk))
+        )
+        return response['ResponseMetadata']['HTTPStatusCode'] == 200
+
+    async def batch_get(
+        self, keys: Sequence[tuple[KeyType, KeyType | None]], consistent_read: bool = False
+    ) -> list[T]:
+        """Get many entities by (pk, sk) key, like BaseRepository.batch_get
+
+        Chunks of 100 keys are sent concurrently.
+        """
+        chunks = chunked(list(dict.fromkeys(keys)), BATCH_GET_MAX_KEYS)
+        responses = await asyncio.gather(
+            *(
+                self._send_batch(
+                    'get',
+                    'batch_get_item',
+                    {
+                        self.table_name: {
+                            'Keys': [
+                                self._serialize(self.repository._key(pk, sk)) for pk, sk in chunk
+                            ],
+                            'ConsistentRead': consistent_read,
+                        }
+                    },
+                )
+                for chunk in chunks
+            )
+        )
+        return [
+            self.model_class(**self._deserialize(item))
+            for chunk_responses in responses
+            for response in chunk_responses
+            for item in response.get('Responses', {}).get(self.table_name, [])
+        ]
+
+    async def batch_write(
+        self,
+        entities: Sequence[T] = (),
+        delete_keys: Sequence[tuple[KeyType, KeyType | None]] = (),
+    ) -> None:
+        """Put and delete many items, like BaseRepository.batch_write
+
+        Chunks of 25 requests are sent concurrently. WARNING: BatchWriteItem does
+        NOT support optimistic locking.
+        """
+        write_requests = [
+            {'PutRequest': {'Item': self._serialize(self.repository._item(entity))}}
+            for entity in entities
+        ] + [
+            {'DeleteRequest': {'Key': self._serialize(self.repository._key(pk, sk))}}
+            for pk, sk in delete_keys
+        ]
+        await asyncio.gather(
+            *(
+                self._send_batch('write', 'batch_write_item', {self.table_name: list(chunk)})
+                for chunk in chunked(write_requests, BATCH_WRITE_MAX_ITEMS)
+            )
+        )
+
+    async def iter_query(
+        self,
+        key_condition: ConditionBase,
+        filter_expression: ConditionBase | None = None,
+        skip_invalid_items: bool = True,
+        **query_params: Any,
+    ) -> AsyncIterator[T]:
+        """Iterate over every entity matching a query, fetching pages as needed
+
+        Args:
+            key_condition: Key condition, e.g. Key('pk').eq(pk) & Key('sk').begins_with('ORDER#')
+            filter_expression: Optional filter condition, e.g. Attr('status').eq('ACTIVE')
+            skip_invalid_items: If True, skip items that fail deserialization
+            **query_params: Other Query parameters, e.g. IndexName, Limit (page size)
+                or ScanIndexForward
+        """
+        async for entity in self._iterate(
+            'query', key_condition, filter_expression, skip_invalid_items, query_params
+        ):
+            yield entity
+
+    async def iter_scan(
+        self,
+        filter_expression: ConditionBase | None = None,
+        skip_invalid_items: bool = True,
+        **scan_params: Any,
+    ) -> AsyncIterator[T]:
+        """Iterate over every entity of a scan, fetching pages as needed"""
+        async for entity in self._iterate(
+            'scan', None, filter_expression, skip_invalid_items, scan_params
+        ):
+            yield entity
+
+    async def _iterate(
+        self,
+        operation: str,
+        key_condition: ConditionBase | None,
+        filter_expression: ConditionBase | None,
+        skip_invalid_items: bool,
+        params: dict[str, Any],
+    ) -> AsyncIterator[T]:
+        """Iterate over the entities of every page of a query or scan"""
+        params = {'TableName': self.table_name, **params}
+        builder = ConditionExpressionBuilder()
+        names, values = {}, {}
+        for name, condition, is_key_condition in (
+            ('KeyConditionExpression', key_condition, True),
+            ('FilterExpression', filter_expression, False),
+        ):
+            if condition is not None:
+                expression = builder.build_expression(condition, is_key_condition)
+                params[name] = expression.condition_expression
+                names.update(expression.attribute_name_placeholders)
+                values.update(expression.attribute_value_placeholders)
+        if names:
+            params['ExpressionAttributeNames'] = names
+        if values:
+            params['ExpressionAttributeValues'] = self._serialize(values)
+
+        while True:
+            response = await self._call(operation, operation, **params)
+            entities, _ = self.repository._parse_query_response(
+                {'Items': [self._deserialize(item) for item in response.get('Items', [])]},
+                skip_invalid_items,
+            )
+            for entity in entities:
+                yield entity
+            if not response.get('LastEvaluatedKey'):
+                return
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    async def _send_batch(self, operation: str, method: str, request_items: dict) -> list[dict]:
+        """Send a batch request, retrying its unprocessed keys or items"""
+        unprocessed = 'UnprocessedKeys' if operation == 'get' else 'UnprocessedItems'
+        responses = []
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(batch_retry_delay(attempt - 1))
+            response = await self._call(f'batch {operation}', method, RequestItems=request_items)
+            responses.append(response)
+            request_items = response.get(unprocessed) or {}
+            if not request_items:
+                return responses
+        raise RuntimeError(
+            f'Failed to batch {operation} {self.model_class.__name__}: '
+            f'items still unprocessed after {BATCH_MAX_RETRIES} retries'
+        )
+
+    async def _call(
+        self, action: str, method: str, lock_message: str | None = None, **params: Any
+    ) -> dict:
+        """Call a client method, raising the same errors as BaseRepository"""
+        if self.client is None:
+            raise RuntimeError(
+                'AsyncBaseRepository has no client. Use "async with" to create one.'
+            )
+        if method in ('get_item', 'put_item', 'delete_item'):
+            params['TableName'] = self.table_name
+        try:
+            return await getattr(self.client, method)(**params)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if lock_message and error_code == 'ConditionalCheckFailedException':
+                raise OptimisticLockException(self.model_class.__name__, lock_message) from e
+            error_msg = e.response['Error']['Message']
+            raise RuntimeError(
+                f'Failed to {action} {self.model_class.__name__}: {error_code} - {error_msg}'
+            ) from e
+
+    def _serialize(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Convert Python values to DynamoDB attribute values"""
+        return {name: self._serializer.serialize(value) for name, value in values.items()}
+
+    def _deserialize(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Convert DynamoDB attribute values to Python values"""
+        return {name: self._deserializer.deserialize(value) for name, value in item.items()}
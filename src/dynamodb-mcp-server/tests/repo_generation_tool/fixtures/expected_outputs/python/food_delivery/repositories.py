@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from decimal import Decimal
 from entities import Delivery, DeliveryEvent, Driver, Restaurant
 
@@ -85,6 +86,26 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_active_customer_deliveries(
+        self,
+        customer_id: str,
+        min_total: Decimal,
+        excluded_status: str = 'CANCELLED',
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_active_customer_deliveries, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_active_customer_deliveries(
+                customer_id=customer_id,
+                min_total=min_total,
+                excluded_status=excluded_status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_customer_deliveries_by_fee_range(
         self,
         customer_id: str,
@@ -136,6 +157,26 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_customer_deliveries_by_fee_range(
+        self,
+        customer_id: str,
+        min_fee: Decimal,
+        max_fee: Decimal,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_customer_deliveries_by_fee_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_customer_deliveries_by_fee_range(
+                customer_id=customer_id,
+                min_fee=min_fee,
+                max_fee=max_fee,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_customer_deliveries_by_status(
         self,
         customer_id: str,
@@ -190,6 +231,28 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_customer_deliveries_by_status(
+        self,
+        customer_id: str,
+        status1: str,
+        status2: str,
+        status3: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_customer_deliveries_by_status, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_customer_deliveries_by_status(
+                customer_id=customer_id,
+                status1=status1,
+                status2=status2,
+                status3=status3,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_deliveries_with_special_instructions(
         self,
         customer_id: str,
@@ -238,6 +301,19 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_deliveries_with_special_instructions(
+        self, customer_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_deliveries_with_special_instructions, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_deliveries_with_special_instructions(
+                customer_id=customer_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_deliveries_with_min_items(
         self,
         customer_id: str,
@@ -286,6 +362,24 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_deliveries_with_min_items(
+        self,
+        customer_id: str,
+        min_items: int,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_deliveries_with_min_items, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_deliveries_with_min_items(
+                customer_id=customer_id,
+                min_items=min_items,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_deliveries_with_items_in_range(
         self,
         customer_id: str,
@@ -337,6 +431,26 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_deliveries_with_items_in_range(
+        self,
+        customer_id: str,
+        min_count: int,
+        max_count: int,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_deliveries_with_items_in_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_deliveries_with_items_in_range(
+                customer_id=customer_id,
+                min_count=min_count,
+                max_count=max_count,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_high_value_active_deliveries(
         self,
         customer_id: str,
@@ -389,6 +503,26 @@ class DeliveryRepository(BaseRepository[Delivery]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_high_value_active_deliveries(
+        self,
+        customer_id: str,
+        min_total: Decimal,
+        min_tip: Decimal,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Delivery]:
+        """Iterate over all results of get_high_value_active_deliveries, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_high_value_active_deliveries(
+                customer_id=customer_id,
+                min_total=min_total,
+                min_tip=min_tip,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def put_delivery(self, delivery: Delivery) -> Delivery | None:
         """Put (upsert) a new delivery"""
         # TODO: Implement Access Pattern #9
@@ -464,6 +598,19 @@ class DeliveryEventRepository(BaseRepository[DeliveryEvent]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_delivery_events(
+        self, delivery_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[DeliveryEvent]:
+        """Iterate over all results of get_delivery_events, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_delivery_events(
+                delivery_id=delivery_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_delivery_events_by_type(
         self,
         delivery_id: str,
@@ -512,6 +659,24 @@ class DeliveryEventRepository(BaseRepository[DeliveryEvent]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_delivery_events_by_type(
+        self,
+        delivery_id: str,
+        type_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[DeliveryEvent]:
+        """Iterate over all results of get_delivery_events_by_type, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_delivery_events_by_type(
+                delivery_id=delivery_id,
+                type_prefix=type_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class RestaurantRepository(BaseRepository[Restaurant]):
     """Repository for Restaurant entity operations"""
@@ -583,6 +748,19 @@ class RestaurantRepository(BaseRepository[Restaurant]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_scan_restaurants_by_cuisine(
+        self, cuisine_keyword: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Restaurant]:
+        """Iterate over all results of scan_restaurants_by_cuisine, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.scan_restaurants_by_cuisine(
+                cuisine_keyword=cuisine_keyword,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def scan_high_rated_active_restaurants(
         self,
         min_rating: Decimal,
@@ -630,6 +808,24 @@ class RestaurantRepository(BaseRepository[Restaurant]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_scan_high_rated_active_restaurants(
+        self,
+        min_rating: Decimal,
+        active_status: bool = True,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Restaurant]:
+        """Iterate over all results of scan_high_rated_active_restaurants, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.scan_high_rated_active_restaurants(
+                min_rating=min_rating,
+                active_status=active_status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class DriverRepository(BaseRepository[Driver]):
     """Repository for Driver entity operations"""
@@ -704,6 +900,24 @@ class DriverRepository(BaseRepository[Driver]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_scan_drivers_by_skill(
+        self,
+        skill_tag: str,
+        name_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Driver]:
+        """Iterate over all results of scan_drivers_by_skill, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.scan_drivers_by_skill(
+                skill_tag=skill_tag,
+                name_prefix=name_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def scan_available_experienced_drivers(
         self,
         min_deliveries: int,
@@ -754,3 +968,23 @@ class DriverRepository(BaseRepository[Driver]):
         # response = self.table.scan(**scan_params)
         # return self._parse_query_response(response, skip_invalid_items)
         pass
+
+    def iter_scan_available_experienced_drivers(
+        self,
+        min_deliveries: int,
+        min_rating: Decimal,
+        available_flag: bool = True,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Driver]:
+        """Iterate over all results of scan_available_experienced_drivers, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.scan_available_experienced_drivers(
+                min_deliveries=min_deliveries,
+                min_rating=min_rating,
+                available_flag=available_flag,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
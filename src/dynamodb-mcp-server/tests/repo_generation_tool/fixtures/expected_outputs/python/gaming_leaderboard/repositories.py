@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import Game, LeaderboardEntry, PlayerAchievement, TournamentEntry
 
 
@@ -63,6 +64,19 @@ class GameRepository(BaseRepository[Game]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_list_games(
+        self, filter_value: str = None, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Game]:
+        """Iterate over all results of list_games, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.list_games(
+                filter_value=filter_value,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_game_with_verification(self, game_id: str, verification_code: str) -> Game | None:
         """Get game with metadata verification"""
         # TODO: Implement Access Pattern #12
@@ -137,6 +151,19 @@ class LeaderboardEntryRepository(BaseRepository[LeaderboardEntry]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_top_scores(
+        self, game_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[LeaderboardEntry]:
+        """Iterate over all results of get_top_scores, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_top_scores(
+                game_id=game_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_player_scores(
         self,
         player_id: str,
@@ -173,6 +200,19 @@ class LeaderboardEntryRepository(BaseRepository[LeaderboardEntry]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_player_scores(
+        self, player_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[LeaderboardEntry]:
+        """Iterate over all results of get_player_scores, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_player_scores(
+                player_id=player_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def submit_score(self, entry: LeaderboardEntry) -> LeaderboardEntry | None:
         """Submit a new score"""
         # TODO: Implement Access Pattern #5
@@ -252,6 +292,19 @@ class PlayerAchievementRepository(BaseRepository[PlayerAchievement]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_player_achievements(
+        self, player_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[PlayerAchievement]:
+        """Iterate over all results of get_player_achievements, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_player_achievements(
+                player_id=player_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_game_achievements(
         self,
         game_id: str,
@@ -288,6 +341,19 @@ class PlayerAchievementRepository(BaseRepository[PlayerAchievement]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_game_achievements(
+        self, game_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[PlayerAchievement]:
+        """Iterate over all results of get_game_achievements, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_game_achievements(
+                game_id=game_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def unlock_achievement(self, achievement: PlayerAchievement) -> PlayerAchievement | None:
         """Unlock an achievement for a player"""
         # TODO: Implement Access Pattern #8
@@ -361,6 +427,19 @@ class TournamentEntryRepository(BaseRepository[TournamentEntry]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_tournament_rankings(
+        self, tournament_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TournamentEntry]:
+        """Iterate over all results of get_tournament_rankings, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_tournament_rankings(
+                tournament_id=tournament_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def update_ranking(self, tournament_id: str, ranking: int) -> TournamentEntry | None:
         """Update player ranking in tournament"""
         # TODO: Implement Access Pattern #10
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from decimal import Decimal
 from entities import Courier, Product, Rating, Recipient, Shipment, WarehouseProfile
 from typing import Any
@@ -181,6 +182,24 @@ class ProductRepository(BaseRepository[Product]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouse_products(
+        self,
+        warehouse_id: str,
+        sort_key_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Product]:
+        """Iterate over all results of get_warehouse_products, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouse_products(
+                warehouse_id=warehouse_id,
+                sort_key_prefix=sort_key_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_products_by_city_category(
         self,
         city: str,
@@ -227,6 +246,20 @@ class ProductRepository(BaseRepository[Product]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_products_by_city_category(
+        self, city: str, category: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_products_by_city_category, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_products_by_city_category(
+                city=city,
+                category=category,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class RatingRepository(BaseRepository[Rating]):
     """Repository for Rating entity operations"""
@@ -306,6 +339,24 @@ class RatingRepository(BaseRepository[Rating]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouse_ratings(
+        self,
+        warehouse_id: str,
+        sort_key_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Rating]:
+        """Iterate over all results of get_warehouse_ratings, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouse_ratings(
+                warehouse_id=warehouse_id,
+                sort_key_prefix=sort_key_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class WarehouseProfileRepository(BaseRepository[WarehouseProfile]):
     """Repository for WarehouseProfile entity operations"""
@@ -424,6 +475,20 @@ class WarehouseProfileRepository(BaseRepository[WarehouseProfile]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouses_by_city_category(
+        self, city: str, category: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_warehouses_by_city_category, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouses_by_city_category(
+                city=city,
+                category=category,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_warehouses_by_city_category_rating(
         self,
         city: str,
@@ -474,6 +539,26 @@ class WarehouseProfileRepository(BaseRepository[WarehouseProfile]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouses_by_city_category_rating(
+        self,
+        city: str,
+        category: str,
+        min_rating: Decimal,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_warehouses_by_city_category_rating, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouses_by_city_category_rating(
+                city=city,
+                category=category,
+                min_rating=min_rating,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def search_warehouses_by_name(
         self,
         city: str,
@@ -514,6 +599,20 @@ class WarehouseProfileRepository(BaseRepository[WarehouseProfile]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_search_warehouses_by_name(
+        self, city: str, name_prefix: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of search_warehouses_by_name, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.search_warehouses_by_name(
+                city=city,
+                name_prefix=name_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class ShipmentRepository(BaseRepository[Shipment]):
     """Repository for Shipment entity operations"""
@@ -676,6 +775,19 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_recipient_shipments(
+        self, recipient_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_recipient_shipments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_recipient_shipments(
+                recipient_id=recipient_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_recipient_shipments_by_status(
         self,
         recipient_id: str,
@@ -716,6 +828,20 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_recipient_shipments_by_status(
+        self, recipient_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_recipient_shipments_by_status, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_recipient_shipments_by_status(
+                recipient_id=recipient_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_warehouse_shipments(
         self,
         warehouse_id: str,
@@ -756,6 +882,20 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouse_shipments(
+        self, warehouse_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_warehouse_shipments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouse_shipments(
+                warehouse_id=warehouse_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_warehouse_shipments_by_status(
         self,
         warehouse_id: str,
@@ -796,6 +936,20 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_warehouse_shipments_by_status(
+        self, warehouse_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_warehouse_shipments_by_status, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_warehouse_shipments_by_status(
+                warehouse_id=warehouse_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_courier_shipments(
         self,
         courier_id: str,
@@ -833,6 +987,19 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_courier_shipments(
+        self, courier_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_courier_shipments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_courier_shipments(
+                courier_id=courier_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_courier_shipments_by_status(
         self,
         courier_id: str,
@@ -873,6 +1040,20 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_courier_shipments_by_status(
+        self, courier_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_courier_shipments_by_status, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_courier_shipments_by_status(
+                courier_id=courier_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_available_shipments_by_city(
         self,
         available_city: str,
@@ -910,6 +1091,19 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_available_shipments_by_city(
+        self, available_city: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_available_shipments_by_city, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_available_shipments_by_city(
+                available_city=available_city,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_courier_active_delivery(
         self,
         active_delivery: str,
@@ -946,3 +1140,16 @@ class ShipmentRepository(BaseRepository[Shipment]):
         # response = self.table.query(**query_params)
         # return self._parse_query_response(response, skip_invalid_items)
         pass
+
+    def iter_get_courier_active_delivery(
+        self, active_delivery: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Shipment]:
+        """Iterate over all results of get_courier_active_delivery, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_courier_active_delivery(
+                active_delivery=active_delivery,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from decimal import Decimal
 from entities import (
     Organization,
@@ -155,6 +156,19 @@ class OrganizationInviteRepository(BaseRepository[OrganizationInvite]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_organization_invites(
+        self, org_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[OrganizationInvite]:
+        """Iterate over all results of get_organization_invites, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_organization_invites(
+                org_id=org_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def put_organization_invite(
         self, invite: OrganizationInvite, inviter: OrganizationMember
     ) -> OrganizationInvite | None:
@@ -236,6 +250,19 @@ class OrganizationMemberRepository(BaseRepository[OrganizationMember]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_organization_members(
+        self, org_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[OrganizationMember]:
+        """Iterate over all results of get_organization_members, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_organization_members(
+                org_id=org_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_organization_member(self, member: OrganizationMember) -> OrganizationMember | None:
         """Add member to organization"""
         # TODO: Implement Access Pattern #5
@@ -347,6 +374,19 @@ class OrganizationProjectRepository(BaseRepository[OrganizationProject]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_organization_projects(
+        self, org_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[OrganizationProject]:
+        """Iterate over all results of get_organization_projects, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_organization_projects(
+                org_id=org_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_project_to_organization(
         self, org_project: OrganizationProject, organization: Organization, project: Project
     ) -> OrganizationProject | None:
@@ -496,6 +536,19 @@ class ProjectMilestoneRepository(BaseRepository[ProjectMilestone]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_project_milestones(
+        self, project_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[ProjectMilestone]:
+        """Iterate over all results of get_project_milestones, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_project_milestones(
+                project_id=project_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def put_project_milestone(self, milestone: ProjectMilestone) -> ProjectMilestone | None:
         """Put (upsert) milestone for project"""
         # TODO: Implement Access Pattern #13
@@ -573,6 +626,19 @@ class ProjectTaskRepository(BaseRepository[ProjectTask]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_project_tasks(
+        self, project_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[ProjectTask]:
+        """Iterate over all results of get_project_tasks, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_project_tasks(
+                project_id=project_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_project_tasks_by_status(
         self,
         project_id: str,
@@ -608,6 +674,20 @@ class ProjectTaskRepository(BaseRepository[ProjectTask]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_project_tasks_by_status(
+        self, project_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[ProjectTask]:
+        """Iterate over all results of get_project_tasks_by_status, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_project_tasks_by_status(
+                project_id=project_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_task_to_project(self, project_task: ProjectTask) -> ProjectTask | None:
         """Add task to project index"""
         # TODO: Implement Access Pattern #21
@@ -757,6 +837,19 @@ class TaskCommentRepository(BaseRepository[TaskComment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_task_comments(
+        self, task_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[TaskComment]:
+        """Iterate over all results of get_task_comments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_task_comments(
+                task_id=task_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_task_comment(
         self, comment: TaskComment, author: OrganizationMember
     ) -> TaskComment | None:
@@ -834,6 +927,19 @@ class UserTaskRepository(BaseRepository[UserTask]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_tasks(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserTask]:
+        """Iterate over all results of get_user_tasks, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_tasks(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_active_tasks(
         self,
         user_id: str,
@@ -869,6 +975,20 @@ class UserTaskRepository(BaseRepository[UserTask]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_active_tasks(
+        self, user_id: str, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[UserTask]:
+        """Iterate over all results of get_user_active_tasks, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_active_tasks(
+                user_id=user_id,
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def assign_task_to_user(
         self, user_task: UserTask, task: Task, member: OrganizationMember
     ) -> UserTask | None:
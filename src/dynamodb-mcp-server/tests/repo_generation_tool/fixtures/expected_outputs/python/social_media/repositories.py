@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import Comment, Follow, Like, Post, UserProfile
 from typing import Any
 
@@ -70,6 +71,20 @@ class CommentRepository(BaseRepository[Comment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_post_comments(
+        self, user_id: str, post_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Comment]:
+        """Iterate over all results of get_post_comments, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_post_comments(
+                user_id=user_id,
+                post_id=post_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def add_comment(self, comment: Comment) -> Comment | None:
         """Add comment to post"""
         # TODO: Implement Access Pattern #9
@@ -122,6 +137,26 @@ class CommentRepository(BaseRepository[Comment]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_comments_for_post_range(
+        self,
+        user_id: str,
+        start_comment_prefix: str,
+        end_comment_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Comment]:
+        """Iterate over all results of get_comments_for_post_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_comments_for_post_range(
+                user_id=user_id,
+                start_comment_prefix=start_comment_prefix,
+                end_comment_prefix=end_comment_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class FollowRepository(BaseRepository[Follow]):
     """Repository for Follow entity operations"""
@@ -207,6 +242,18 @@ class FollowRepository(BaseRepository[Follow]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_followers(
+        self, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Follow]:
+        """Iterate over all results of get_user_followers, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_followers(
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_following(
         self,
         user_id: str,
@@ -242,6 +289,19 @@ class FollowRepository(BaseRepository[Follow]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_following(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Follow]:
+        """Iterate over all results of get_user_following, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_following(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class LikeRepository(BaseRepository[Like]):
     """Repository for Like entity operations"""
@@ -335,6 +395,20 @@ class LikeRepository(BaseRepository[Like]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_post_likes(
+        self, user_id: str, post_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Like]:
+        """Iterate over all results of get_post_likes, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_post_likes(
+                user_id=user_id,
+                post_id=post_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_likes_after_prefix(
         self,
         user_id: str,
@@ -373,6 +447,20 @@ class LikeRepository(BaseRepository[Like]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_likes_after_prefix(
+        self, user_id: str, like_prefix: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Like]:
+        """Iterate over all results of get_likes_after_prefix, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_likes_after_prefix(
+                user_id=user_id,
+                like_prefix=like_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class PostRepository(BaseRepository[Post]):
     """Repository for Post entity operations"""
@@ -448,6 +536,19 @@ class PostRepository(BaseRepository[Post]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_posts(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[Post]:
+        """Iterate over all results of get_user_posts, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_posts(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_user_posts_by_prefix(
         self,
         user_id: str,
@@ -486,6 +587,24 @@ class PostRepository(BaseRepository[Post]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_user_posts_by_prefix(
+        self,
+        user_id: str,
+        post_id_prefix: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[Post]:
+        """Iterate over all results of get_user_posts_by_prefix, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_posts_by_prefix(
+                user_id=user_id,
+                post_id_prefix=post_id_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
 
 class UserProfileRepository(BaseRepository[UserProfile]):
     """Repository for UserProfile entity operations"""
@@ -552,3 +671,16 @@ class UserProfileRepository(BaseRepository[UserProfile]):
         # response = self.table.query(**query_params)
         # return self._parse_query_response_raw(response)
         pass
+
+    def iter_get_user_profile_and_posts(
+        self, user_id: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all results of get_user_profile_and_posts, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_user_profile_and_posts(
+                user_id=user_id,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from base_repository import BaseRepository
+from collections.abc import Iterator
 from entities import User
 
 
@@ -68,6 +69,19 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_active_users(
+        self, status: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_active_users, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_active_users(
+                status=status,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_recent_active_users(
         self,
         status: str,
@@ -107,6 +121,20 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_recent_active_users(
+        self, status: str, since_date: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_recent_active_users, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_recent_active_users(
+                status=status,
+                since_date=since_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_users_by_location(
         self,
         country: str,
@@ -145,6 +173,20 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_users_by_location(
+        self, country: str, city: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_users_by_location, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_users_by_location(
+                country=country,
+                city=city,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_users_by_country_prefix(
         self,
         country: str,
@@ -184,6 +226,20 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_users_by_country_prefix(
+        self, country: str, city_prefix: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_users_by_country_prefix, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_users_by_country_prefix(
+                country=country,
+                city_prefix=city_prefix,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_users_by_engagement_level(
         self,
         engagement_level: str,
@@ -220,6 +276,19 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_users_by_engagement_level(
+        self, engagement_level: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_users_by_engagement_level, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_users_by_engagement_level(
+                engagement_level=engagement_level,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_highly_engaged_users_by_session_range(
         self,
         engagement_level: str,
@@ -261,6 +330,26 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_highly_engaged_users_by_session_range(
+        self,
+        engagement_level: str,
+        min_sessions: int,
+        max_sessions: int,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[User]:
+        """Iterate over all results of get_highly_engaged_users_by_session_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_highly_engaged_users_by_session_range(
+                engagement_level=engagement_level,
+                min_sessions=min_sessions,
+                max_sessions=max_sessions,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_users_by_age_group(
         self,
         age_group: str,
@@ -297,6 +386,19 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_users_by_age_group(
+        self, age_group: str, page_size: int = 100, skip_invalid_items: bool = True
+    ) -> Iterator[User]:
+        """Iterate over all results of get_users_by_age_group, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_users_by_age_group(
+                age_group=age_group,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_recent_signups_by_age_group(
         self,
         age_group: str,
@@ -336,6 +438,24 @@ class UserRepository(BaseRepository[User]):
         # return self._parse_query_response(response, skip_invalid_items)
         pass
 
+    def iter_get_recent_signups_by_age_group(
+        self,
+        age_group: str,
+        since_date: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[User]:
+        """Iterate over all results of get_recent_signups_by_age_group, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_recent_signups_by_age_group(
+                age_group=age_group,
+                since_date=since_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
+
     def get_users_signup_date_range(
         self,
         age_group: str,
@@ -376,3 +496,23 @@ class UserRepository(BaseRepository[User]):
         # response = self.table.query(**query_params)
         # return self._parse_query_response(response, skip_invalid_items)
         pass
+
+    def iter_get_users_signup_date_range(
+        self,
+        age_group: str,
+        start_date: str,
+        end_date: str,
+        page_size: int = 100,
+        skip_invalid_items: bool = True,
+    ) -> Iterator[User]:
+        """Iterate over all results of get_users_signup_date_range, fetching pages of page_size items as needed"""
+        return self._paginate(
+            lambda exclusive_start_key: self.get_users_signup_date_range(
+                age_group=age_group,
+                start_date=start_date,
+                end_date=end_date,
+                limit=page_size,
+                exclusive_start_key=exclusive_start_key,
+                skip_invalid_items=skip_invalid_items,
+            )
+        )
@@ -22,8 +22,10 @@ class TestSparseGSIIntegration:
 
         content = base_repo_file.read_text()
 
-        # Verify mode='json' and exclude_none=True are used in both create() and update()
-        assert content.count('model_dump(exclude_none=True)') == 2
+        # Verify exclude_none=True is used to build items, for create(), update() and batch_write()
+        assert content.count('model_dump(exclude_none=True)') == 1
+        assert content.count('item = self._item(entity)') == 2
+        assert "{'PutRequest': {'Item': self._item(entity)}}" in content
 
     def test_sparse_gsi_with_optional_key_field(
         self, generation_output_dir, sample_schemas, code_generator
@@ -0,0 +1,276 @@
+"""Unit tests for the batch, pagination and async helpers of the generated base repository."""
+
+import os
+import pytest
+from awslabs.dynamodb_mcp_server.repo_generation_tool.languages.python.base_repository import (
+    BATCH_MAX_RETRIES,
+    AsyncBaseRepository,
+    BaseRepository,
+    ConfigurableEntity,
+    EntityConfig,
+    OptimisticLockException,
+)
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+BASE_REPOSITORY_MODULE = (
+    'awslabs.dynamodb_mcp_server.repo_generation_tool.languages.python.base_repository'
+)
+
+
+class Order(ConfigurableEntity):
+    """Test entity."""
+
+    user_id: str
+    order_id: str
+    total: Decimal | None = None
+
+    @classmethod
+    def get_config(cls) -> EntityConfig:
+        """Get entity configuration for key generation."""
+        return EntityConfig(
+            entity_type='ORDER',
+            pk_builder=lambda self: f'USER#{self.user_id}',
+            pk_lookup_builder=lambda user_id: f'USER#{user_id}',
+            sk_builder=lambda self: f'ORDER#{self.order_id}',
+            sk_lookup_builder=lambda order_id: f'ORDER#{order_id}',
+        )
+
+
+def _order_item(order_id: str) -> dict:
+    return {'pk': 'USER#1', 'sk': f'ORDER#{order_id}', 'user_id': '1', 'order_id': order_id}
+
+
+@pytest.fixture
+def repository():
+    """Repository with a mock client."""
+    repository = BaseRepository(Order, 'Orders', 'pk', 'sk')
+    with patch.object(repository.dynamodb.meta, 'client', MagicMock()):
+        yield repository
+
+
+class TestBatchGet:
+    """Tests for BaseRepository.batch_get."""
+
+    def test_chunks_deduplicates_and_retries_unprocessed_keys(self, repository):
+        """Keys are sent 100 at a time, once each, until none is unprocessed."""
+        client = repository.dynamodb.meta.client
+        keys = [('USER#1', f'ORDER#{i}') for i in range(150)] + [('USER#1', 'ORDER#0')]
+        unprocessed = {'Orders': {'Keys': [{'pk': 'USER#1', 'sk': 'ORDER#3'}]}}
+        client.batch_get_item.side_effect = [
+            {'Responses': {'Orders': [_order_item('1')]}, 'UnprocessedKeys': unprocessed},
+            {'Responses': {'Orders': [_order_item('3')]}, 'UnprocessedKeys': {}},
+            {'Responses': {'Orders': [_order_item('120')]}},
+        ]
+
+        with patch(f'{BASE_REPOSITORY_MODULE}.time.sleep') as mock_sleep:
+            orders = repository.batch_get(keys, consistent_read=True)
+
+        assert [order.order_id for order in orders] == ['1', '3', '120']
+        requests = [call.kwargs['RequestItems'] for call in client.batch_get_item.call_args_list]
+        assert len(requests[0]['Orders']['Keys']) == 100
+        assert requests[0]['Orders']['ConsistentRead'] is True
+        assert requests[1] == unprocessed
+        assert len(requests[2]['Orders']['Keys']) == 50
+        mock_sleep.assert_called_once()
+
+    def test_gives_up_after_retries(self, repository):
+        """Keys still unprocessed after the retries raise an error."""
+        client = repository.dynamodb.meta.client
+        client.batch_get_item.return_value = {
+            'UnprocessedKeys': {'Orders': {'Keys': [{'pk': 'USER#1', 'sk': 'ORDER#1'}]}}
+        }
+
+        with patch(f'{BASE_REPOSITORY_MODULE}.time.sleep'):
+            with pytest.raises(RuntimeError, match='still unprocessed'):
+                repository.batch_get([('USER#1', 'ORDER#1')])
+
+        assert client.batch_get_item.call_count == BATCH_MAX_RETRIES + 1
+
+
+class TestBatchWrite:
+    """Tests for BaseRepository.batch_write."""
+
+    def test_puts_and_deletes_in_chunks(self, repository):
+        """Puts and deletes are sent 25 at a time, retrying unprocessed items."""
+        client = repository.dynamodb.meta.client
+        unprocessed = {'Orders': [{'DeleteRequest': {'Key': {'pk': 'USER#1', 'sk': 'ORDER#x'}}}]}
+        client.batch_write_item.side_effect = [{'UnprocessedItems': unprocessed}, {}, {}]
+        orders = [Order(user_id='1', order_id=str(i)) for i in range(20)]
+
+        with patch(f'{BASE_REPOSITORY_MODULE}.time.sleep'):
+            repository.batch_write(orders, delete_keys=[('USER#1', 'ORDER#x')] * 10)
+
+        requests = [
+            call.kwargs['RequestItems']['Orders']
+            for call in client.batch_write_item.call_args_list
+        ]
+        assert [len(request) for request in requests] == [25, 1, 5]
+        assert requests[0][0] == {
+            'PutRequest': {
+                'Item': {
+                    'pk': 'USER#1',
+                    'sk': 'ORDER#0',
+                    'user_id': '1',
+                    'order_id': '0',
+                    'version': 1,
+                }
+            }
+        }
+        assert requests[1] == unprocessed['Orders']
+
+    def test_client_errors(self, repository):
+        """Client errors are raised as RuntimeError."""
+        repository.dynamodb.meta.client.batch_write_item.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Bad key'}}, 'BatchWriteItem'
+        )
+
+        with pytest.raises(RuntimeError, match='Failed to batch write Order: ValidationException'):
+            repository.batch_write(delete_keys=[('USER#1', 'ORDER#1')])
+
+
+def test_paginate(repository):
+    """Pages are fetched lazily until there is no last evaluated key."""
+    pages = {None: ([1, 2], {'k': 1}), 1: ([3], {'k': 2}), 2: ([], None)}
+    fetched = []
+
+    def fetch_page(exclusive_start_key):
+        fetched.append(exclusive_start_key)
+        return pages[exclusive_start_key and exclusive_start_key['k']]
+
+    items = repository._paginate(fetch_page)
+
+    assert next(items) == 1
+    assert fetched == [None]
+    assert list(items) == [2, 3]
+    assert fetched == [None, {'k': 1}, {'k': 2}]
+
+
+class TestAsyncBaseRepository:
+    """Tests for AsyncBaseRepository."""
+
+    def setup_method(self):
+        """Create an async repository with a mock aiobotocore client."""
+        self.client = MagicMock()
+        self.repository = AsyncBaseRepository(
+            BaseRepository(Order, 'Orders', 'pk', 'sk'), client=self.client
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_serialize_attribute_values(self):
+        """Items and keys are sent as DynamoDB attribute values."""
+        self.client.put_item = AsyncMock(return_value={})
+        self.client.get_item = AsyncMock(
+            return_value={
+                'Item': {
+                    'pk': {'S': 'USER#1'},
+                    'sk': {'S': 'ORDER#7'},
+                    'user_id': {'S': '1'},
+                    'order_id': {'S': '7'},
+                    'total': {'N': '9.5'},
+                    'version': {'N': '1'},
+                }
+            }
+        )
+
+        async with self.repository as orders:
+            await orders.create(Order(user_id='1', order_id='7', total=Decimal('9.5')))
+            order = await orders.get('USER#1', 'ORDER#7')
+
+        put = self.client.put_item.call_args.kwargs
+        assert put['TableName'] == 'Orders'
+        assert put['Item']['total'] == {'N': '9.5'}
+        assert put['Item']['version'] == {'N': '1'}
+        assert put['ConditionExpression'] == 'attribute_not_exists(pk)'
+        assert self.client.get_item.call_args.kwargs['Key'] == {
+            'pk': {'S': 'USER#1'},
+            'sk': {'S': 'ORDER#7'},
+        }
+        assert order.total == Decimal('9.5')
+
+    @pytest.mark.asyncio
+    async def test_update_conflict(self):
+        """A concurrent modification raises OptimisticLockException."""
+        self.client.put_item = AsyncMock(
+            side_effect=ClientError(
+                {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': ''}}, 'PutItem'
+            )
+        )
+
+        with pytest.raises(OptimisticLockException, match='expected version 1'):
+            await self.repository.update(Order(user_id='1', order_id='7'))
+
+    @pytest.mark.asyncio
+    async def test_batch_get_retries_unprocessed_keys(self):
+        """Chunks are sent concurrently and unprocessed keys are retried."""
+        unprocessed = {'Orders': {'Keys': [{'pk': {'S': 'USER#1'}, 'sk': {'S': 'ORDER#2'}}]}}
+        self.client.batch_get_item = AsyncMock(
+            side_effect=[
+                {'Responses': {'Orders': []}, 'UnprocessedKeys': unprocessed},
+                {'Responses': {'Orders': []}},
+                {
+                    'Responses': {
+                        'Orders': [
+                            {
+                                'pk': {'S': 'USER#1'},
+                                'sk': {'S': 'ORDER#2'},
+                                'user_id': {'S': '1'},
+                                'order_id': {'S': '2'},
+                            }
+                        ]
+                    }
+                },
+            ]
+        )
+
+        with patch(f'{BASE_REPOSITORY_MODULE}.asyncio.sleep', AsyncMock()):
+            orders = await self.repository.batch_get(
+                [('USER#1', f'ORDER#{i}') for i in range(120)]
+            )
+
+        assert [order.order_id for order in orders] == ['2']
+        assert self.client.batch_get_item.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_query_follows_pages(self):
+        """Key conditions and filters are built like the boto3 resource, and pages followed."""
+        self.client.query = AsyncMock(
+            side_effect=[
+                {
+                    'Items': [{'user_id': {'S': '1'}, 'order_id': {'S': '1'}}],
+                    'LastEvaluatedKey': {'pk': {'S': 'USER#1'}, 'sk': {'S': 'ORDER#1'}},
+                },
+                {'Items': [{'user_id': {'S': '1'}, 'order_id': {'S': '2'}}]},
+            ]
+        )
+
+        orders = [
+            order
+            async for order in self.repository.iter_query(
+                Key('pk').eq('USER#1') & Key('sk').begins_with('ORDER#'),
+                filter_expression=Attr('total').gt(Decimal('10')),
+                Limit=1,
+            )
+        ]
+
+        assert [order.order_id for order in orders] == ['1', '2']
+        first, second = (call.kwargs for call in self.client.query.call_args_list)
+        assert first['TableName'] == 'Orders'
+        assert first['Limit'] == 1
+        assert first['KeyConditionExpression'] == '(#n0 = :v0 AND begins_with(#n1, :v1))'
+        assert first['FilterExpression'] == '#n2 > :v2'
+        assert first['ExpressionAttributeValues'][':v2'] == {'N': '10'}
+        assert second['ExclusiveStartKey'] == {'pk': {'S': 'USER#1'}, 'sk': {'S': 'ORDER#1'}}
+
+    @pytest.mark.asyncio
+    async def test_requires_client(self):
+        """Requests without a client explain how to create one."""
+        repository = AsyncBaseRepository(BaseRepository(Order, 'Orders', 'pk', 'sk'))
+
+        with pytest.raises(RuntimeError, match='async with'):
+            await repository.delete('USER#1', 'ORDER#1')
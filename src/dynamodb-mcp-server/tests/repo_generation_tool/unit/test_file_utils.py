@@ -40,6 +40,18 @@ class TestFileUtils:
                 with pytest.raises(ValueError, match='Error reading Test file'):
                     FileUtils.load_json_file('test.json', 'Test')
 
+    def test_file_digest(self, tmp_path):
+        """Test that the digest follows the file content, and is None for unreadable files."""
+        test_file = tmp_path / 'test.json'
+        test_file.write_text('{}')
+        digest = FileUtils.file_digest(str(test_file))
+
+        assert digest == FileUtils.file_digest(str(test_file))
+        test_file.write_text('{"key": 1}')
+        assert FileUtils.file_digest(str(test_file)) != digest
+        assert FileUtils.file_digest(str(tmp_path / 'missing.json')) is None
+        assert FileUtils.file_digest(str(tmp_path)) is None
+
     def test_validate_and_resolve_path_valid_file(self, tmp_path):
         """Test successful path validation for existing file."""
         test_file = tmp_path / 'test.txt'
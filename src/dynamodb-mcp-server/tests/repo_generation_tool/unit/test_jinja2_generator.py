@@ -2,9 +2,13 @@
 
 import json
 import pytest
+import shutil
+from awslabs.dynamodb_mcp_server.repo_generation_tool.generators import jinja2_generator
 from awslabs.dynamodb_mcp_server.repo_generation_tool.generators.jinja2_generator import (
     Jinja2Generator,
 )
+from pathlib import Path
+from unittest.mock import patch
 
 
 @pytest.mark.unit
@@ -2536,3 +2540,154 @@ class TestJinja2GeneratorFilterExpression:
         assert 'status2' in result
         assert 'status3' in result
         assert 'IN (:status1, :status2, :status3)' in result
+
+
+def _large_schema(entity_count: int) -> dict:
+    """Schema with tables of 10 entities sharing a partition key."""
+    tables = []
+    for table_index in range(entity_count // 10):
+        entities = {}
+        for entity_index in range(10):
+            name = f'Entity{table_index}x{entity_index}'
+            pattern_id = (table_index * 10 + entity_index) * 2 + 1
+            entities[name] = {
+                'entity_type': name.upper(),
+                'pk_template': 'TENANT#{tenant_id}',
+                'sk_template': f'{name.upper()}#{{item_id}}',
+                'fields': [
+                    {'name': 'tenant_id', 'type': 'string', 'required': True},
+                    {'name': 'item_id', 'type': 'string', 'required': True},
+                    {'name': 'title', 'type': 'string', 'required': True},
+                    {'name': 'amount', 'type': 'decimal', 'required': False},
+                ],
+                'access_patterns': [
+                    {
+                        'pattern_id': pattern_id,
+                        'name': f'get_{name.lower()}_item',
+                        'description': 'Get an item',
+                        'operation': 'GetItem',
+                        'parameters': [
+                            {'name': 'tenant_id', 'type': 'string'},
+                            {'name': 'item_id', 'type': 'string'},
+                        ],
+                        'return_type': 'single_entity',
+                    },
+                    {
+                        'pattern_id': pattern_id + 1,
+                        'name': f'list_{name.lower()}_items',
+                        'description': 'List the items of a tenant',
+                        'operation': 'Query',
+                        'parameters': [{'name': 'tenant_id', 'type': 'string'}],
+                        'return_type': 'entity_list',
+                    },
+                ],
+            }
+        tables.append(
+            {
+                'table_config': {
+                    'table_name': f'Table{table_index}',
+                    'partition_key': 'pk',
+                    'sort_key': 'sk',
+                },
+                'entities': entities,
+            }
+        )
+    return {'tables': tables}
+
+
+def _read_output(output_dir: Path) -> dict[str, str]:
+    """Read the generated files of an output directory."""
+    return {path.name: path.read_text() for path in sorted(output_dir.iterdir())}
+
+
+@pytest.mark.unit
+class TestIncrementalGeneration:
+    """Tests for the incremental and parallel rendering of generate_all."""
+
+    @pytest.fixture(autouse=True)
+    def empty_render_cache(self):
+        """Start each test without rendered entities."""
+        jinja2_generator._render_cache.clear()
+        yield
+        jinja2_generator._render_cache.clear()
+
+    def _generate(self, schema: dict, tmp_path: Path, name: str, **kwargs) -> dict[str, str]:
+        schema_file = tmp_path / 'schema.json'
+        schema_file.write_text(json.dumps(schema))
+        generator = Jinja2Generator(str(schema_file), language='python')
+        generator.generate_all(str(tmp_path / name), **kwargs)
+        return _read_output(tmp_path / name)
+
+    def test_only_changed_entities_are_rendered_again(self, tmp_path):
+        """Entities are rendered again when their entity, table or item collection changes."""
+        schema = _large_schema(20)
+        self._generate(schema, tmp_path, 'first')
+        schema['tables'][0]['entities']['Entity0x3']['fields'].append(
+            {'name': 'note', 'type': 'string', 'required': False}
+        )
+        # Entity1x4 no longer shares its partition key with the other entities of its table
+        schema['tables'][1]['entities']['Entity1x4']['pk_template'] = 'ITEM#{item_id}'
+
+        with patch.object(
+            Jinja2Generator,
+            'render_entity',
+            autospec=True,
+            side_effect=Jinja2Generator.render_entity,
+        ) as render_entity:
+            incremental = self._generate(schema, tmp_path, 'incremental')
+
+        assert [call.args[1] for call in render_entity.call_args_list] == [
+            'Entity0x3',
+            'Entity1x4',
+        ]
+        jinja2_generator._render_cache.clear()
+        assert incremental == self._generate(schema, tmp_path, 'full')
+        assert 'note: str = None' in incremental['entities.py']
+
+    def test_template_changes_render_all_entities_again(self, tmp_path):
+        """Entities rendered with other templates are not reused."""
+        schema = _large_schema(10)
+        templates_dir = tmp_path / 'templates'
+        shutil.copytree(
+            Path(jinja2_generator.__file__).parent.parent / 'languages' / 'python' / 'templates',
+            templates_dir,
+        )
+        schema_file = tmp_path / 'schema.json'
+        schema_file.write_text(json.dumps(schema))
+        Jinja2Generator(str(schema_file), str(templates_dir)).generate_all(str(tmp_path / 'first'))
+        entity_template = templates_dir / 'entity_template.j2'
+        entity_template.write_text('# Custom template\n' + entity_template.read_text())
+
+        Jinja2Generator(str(schema_file), str(templates_dir)).generate_all(
+            str(tmp_path / 'second')
+        )
+
+        assert (tmp_path / 'second' / 'entities.py').read_text().count('# Custom template') == 10
+
+    def test_parallel_rendering_matches_serial_rendering(self, tmp_path):
+        """Entities rendered in worker processes are the same, in the same order."""
+        schema = _large_schema(20)
+        serial = self._generate(schema, tmp_path, 'serial', max_workers=1)
+        jinja2_generator._render_cache.clear()
+
+        with patch.object(jinja2_generator, 'PARALLEL_RENDER_MIN_ENTITIES', 1):
+            parallel = self._generate(schema, tmp_path, 'parallel', max_workers=2)
+
+        assert parallel == serial
+
+    def test_regenerating_500_entities(self, tmp_path):
+        """Regenerating a 500-entity schema after changing an entity renders only that entity."""
+        schema = _large_schema(500)
+        self._generate(schema, tmp_path, 'first', max_workers=1)
+
+        schema['tables'][7]['entities']['Entity7x7']['fields'][2]['required'] = False
+        with patch.object(
+            Jinja2Generator,
+            'render_entity',
+            autospec=True,
+            side_effect=Jinja2Generator.render_entity,
+        ) as render_entity:
+            output = self._generate(schema, tmp_path, 'second', max_workers=1)
+
+        assert render_entity.call_count == 1
+        assert output['repositories.py'].count('Repository(BaseRepository[') == 500
@@ -83,3 +83,22 @@ class TestSchemaLoader:
         loader = SchemaLoader(str(test_dir))
         with pytest.raises(ValueError, match='Error reading Schema file'):
             loader.load_schema()
+
+    def test_schema_is_loaded_again_only_when_the_file_changes(self, mock_schema_data, tmp_path):
+        """Test that the schema is validated and loaded once while the file is unchanged."""
+        schema_file = tmp_path / 'schema.json'
+        schema_file.write_text(json.dumps(mock_schema_data))
+        loader = SchemaLoader(str(schema_file))
+
+        with patch(
+            'awslabs.dynamodb_mcp_server.repo_generation_tool.core.schema_loader.validate_schema_file'
+        ) as mock_validate:
+            mock_validate.return_value.is_valid = True
+            schema = loader.schema
+            assert loader.schema is schema
+            assert mock_validate.call_count == 1
+
+            mock_schema_data['tables'][0]['table_config']['table_name'] = 'OtherTable'
+            schema_file.write_text(json.dumps(mock_schema_data))
+            assert loader.schema['tables'][0]['table_config']['table_name'] == 'OtherTable'
+            assert mock_validate.call_count == 2
@@ -4,8 +4,10 @@ import json
 import os
 import pytest
 import tempfile
+from awslabs.dynamodb_mcp_server.repo_generation_tool.core import schema_validator
 from awslabs.dynamodb_mcp_server.repo_generation_tool.core.schema_validator import (
     SchemaValidator,
+    validate_schema_file,
 )
 from awslabs.dynamodb_mcp_server.repo_generation_tool.core.validation_utils import (
     ValidationError,
@@ -13,6 +15,7 @@ from awslabs.dynamodb_mcp_server.repo_generation_tool.core.validation_utils impo
 )
 from hypothesis import given
 from hypothesis import strategies as st
+from unittest.mock import patch
 
 
 @pytest.mark.unit
@@ -1348,3 +1351,30 @@ class TestSchemaValidator:
         result = self._validate_schema_dict(validator, schema)
         # Should have validation errors
         assert not result.is_valid
+
+
+@pytest.mark.unit
+def test_validate_schema_file_reuses_results_of_unchanged_files(mock_schema_data, tmp_path):
+    """Validating an unchanged schema file again does not run the validators again."""
+    schema_file = tmp_path / 'schema.json'
+    schema_file.write_text(json.dumps(mock_schema_data))
+    schema_validator._validation_cache.clear()
+
+    with patch.object(
+        SchemaValidator,
+        'validate_schema_file',
+        autospec=True,
+        side_effect=SchemaValidator.validate_schema_file,
+    ) as validate:
+        first = validate_schema_file(str(schema_file))
+        second = validate_schema_file(str(schema_file))
+        assert validate.call_count == 1
+        assert first.is_valid and second.is_valid
+        # Callers get their own copy of the result
+        second.add_error('test', 'Modified by the caller')
+        assert validate_schema_file(str(schema_file)).is_valid
+
+        mock_schema_data['tables'][0]['entities']['TestEntity']['fields'] = []
+        schema_file.write_text(json.dumps(mock_schema_data))
+        assert not validate_schema_file(str(schema_file)).is_valid
+        assert validate.call_count == 2
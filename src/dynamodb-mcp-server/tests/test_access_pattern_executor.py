@@ -0,0 +1,349 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the access pattern executor."""
+
+import botocore.session
+import datetime
+import json
+import pytest
+import threading
+import time
+from awslabs.dynamodb_mcp_server.access_pattern_executor import (
+    AccessPatternExecutor,
+    DynamoDBCommandParser,
+    UnsupportedCommandError,
+)
+from unittest.mock import AsyncMock, MagicMock
+
+
+DYNAMODB_SERVICE_MODEL = botocore.session.get_session().get_service_model('dynamodb')
+
+
+def _mock_dynamodb_client():
+    """Create a mock DynamoDB client with the DynamoDB service model."""
+    client = MagicMock()
+    client.meta.service_model = DYNAMODB_SERVICE_MODEL
+    return client
+
+
+def _pattern(pattern_id, implementation):
+    return {
+        'pattern': pattern_id,
+        'description': f'Pattern {pattern_id}',
+        'dynamodb_operation': implementation.split()[2],
+        'implementation': implementation,
+    }
+
+
+class TestDynamoDBCommandParser:
+    """Tests for DynamoDBCommandParser."""
+
+    def setup_method(self):
+        """Set up the parser."""
+        self.parser = DynamoDBCommandParser(DYNAMODB_SERVICE_MODEL)
+
+    def test_parse_query(self):
+        """Test that options are mapped to request parameters of their types."""
+        request = self.parser.parse(
+            'aws dynamodb query --table-name Orders --index-name GSI1 '
+            "--key-condition-expression '#pk = :pk' "
+            '--expression-attribute-names \'{"#pk": "GSI1PK"}\' '
+            '--expression-attribute-values \'{":pk": {"S": "USER#1"}}\' '
+            '--no-scan-index-forward --consistent-read --limit 10 --output json'
+        )
+
+        assert request.operation == 'Query'
+        assert request.params == {
+            'TableName': 'Orders',
+            'IndexName': 'GSI1',
+            'KeyConditionExpression': '#pk = :pk',
+            'ExpressionAttributeNames': {'#pk': 'GSI1PK'},
+            'ExpressionAttributeValues': {':pk': {'S': 'USER#1'}},
+            'ScanIndexForward': False,
+            'ConsistentRead': True,
+            'Limit': 10,
+            'ReturnConsumedCapacity': 'TOTAL',
+        }
+        assert request.tables == frozenset(['Orders'])
+        assert request.is_read
+        # An explicit limit returns a single page
+        assert not request.paginate
+
+    def test_parse_keeps_requested_consumed_capacity(self):
+        """Test that an explicit ReturnConsumedCapacity is not overridden."""
+        request = self.parser.parse(
+            'aws dynamodb scan --table-name Users --return-consumed-capacity INDEXES'
+        )
+
+        assert request.params['ReturnConsumedCapacity'] == 'INDEXES'
+        assert request.paginate
+
+    def test_parse_write_tables(self):
+        """Test the tables of batch and transactional writes."""
+        batch = self.parser.parse(
+            'aws dynamodb batch-write-item --request-items '
+            '\'{"Users": [{"PutRequest": {"Item": {"id": {"S": "1"}}}}], "Orders": []}\''
+        )
+        transaction = self.parser.parse(
+            'aws dynamodb transact-write-items --transact-items '
+            '\'[{"Put": {"TableName": "Users", "Item": {}}}, '
+            '{"Delete": {"TableName": "Orders", "Key": {}}}]\''
+        )
+        statement = self.parser.parse(
+            'aws dynamodb execute-statement --statement "SELECT * FROM Users"'
+        )
+
+        assert batch.tables == frozenset(['Users', 'Orders'])
+        assert not batch.is_read
+        assert transaction.tables == frozenset(['Users', 'Orders'])
+        assert not transaction.is_read
+        assert statement.tables is None
+        assert statement.is_read
+
+    @pytest.mark.parametrize(
+        'command',
+        [
+            'aws dynamodb get-item --table-name Users --key id={S=1}',
+            'aws dynamodb put-item --table-name Users --item file://item.json',
+            'aws dynamodb scan --table-name Users --query Items[0]',
+            'aws dynamodb scan --table-name Users --max-items 5',
+            'aws dynamodb scan --table-name Users --limit ten',
+            'aws dynamodb scan --table-name',
+            'aws dynamodb scan Users',
+            'aws dynamodb frobnicate --table-name Users',
+            "aws dynamodb scan --table-name 'Users",
+        ],
+    )
+    def test_parse_unsupported_commands(self, command):
+        """Test that commands the parser cannot translate are rejected."""
+        with pytest.raises(UnsupportedCommandError):
+            self.parser.parse(command)
+
+    def test_parse_non_dynamodb_command(self):
+        """Test that commands other than aws dynamodb raise ValueError."""
+        with pytest.raises(ValueError, match="Command must start with 'aws dynamodb'"):
+            self.parser.parse('aws s3 ls')
+
+
+class TestAccessPatternExecutor:
+    """Tests for AccessPatternExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_execute_records_latency_and_consumed_capacity(self):
+        """Test the result of each pattern, in order."""
+        client = _mock_dynamodb_client()
+        client.get_item.return_value = {
+            'Item': {'id': {'S': '1'}, 'avatar': {'B': b'\x00\x01'}},
+            'ConsumedCapacity': {'TableName': 'Users', 'CapacityUnits': 0.5},
+        }
+        external = {'pattern': 'AP2', 'reason': 'Uses OpenSearch'}
+        patterns = [
+            _pattern(
+                'AP1', 'aws dynamodb get-item --table-name Users --key \'{"id": {"S": "1"}}\''
+            ),
+            external,
+        ]
+
+        results = await AccessPatternExecutor(client).execute(patterns)
+
+        assert results[1] is external
+        result = results[0]
+        assert result['pattern_id'] == 'AP1'
+        assert result['dynamodb_operation'] == 'get-item'
+        assert result['command'] == patterns[0]['implementation']
+        # Binary values are base64 encoded like in the AWS CLI output
+        assert result['response']['Item']['avatar'] == {'B': 'AAE='}
+        assert result['consumed_capacity'] == {'TableName': 'Users', 'CapacityUnits': 0.5}
+        assert result['latency_ms'] >= 0
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_json_serializable_response(self):
+        """Test that timestamps are ISO 8601 strings and the response metadata is dropped."""
+        client = _mock_dynamodb_client()
+        client.describe_table.return_value = {
+            'Table': {
+                'TableName': 'Users',
+                'CreationDateTime': datetime.datetime(
+                    2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+                ),
+            },
+            'ResponseMetadata': {'RequestId': 'abc', 'HTTPHeaders': {'date': 'today'}},
+        }
+
+        results = await AccessPatternExecutor(client).execute(
+            [_pattern('AP1', 'aws dynamodb describe-table --table-name Users')]
+        )
+
+        response = results[0]['response']
+        assert response == {
+            'Table': {'TableName': 'Users', 'CreationDateTime': '2024-01-02T03:04:05+00:00'}
+        }
+        json.dumps(results)
+
+    @pytest.mark.asyncio
+    async def test_execute_follows_pages(self):
+        """Test that Query and Scan pages are aggregated like in the AWS CLI."""
+        client = _mock_dynamodb_client()
+        client.scan.side_effect = [
+            {
+                'Items': [{'id': {'S': '1'}}],
+                'Count': 1,
+                'ScannedCount': 1,
+                'LastEvaluatedKey': {'id': {'S': '1'}},
+                'ConsumedCapacity': {'TableName': 'Users', 'CapacityUnits': 0.5},
+            },
+            {
+                'Items': [{'id': {'S': '2'}}],
+                'Count': 1,
+                'ScannedCount': 2,
+                'ConsumedCapacity': {'TableName': 'Users', 'CapacityUnits': 1.0},
+            },
+        ]
+
+        results = await AccessPatternExecutor(client).execute(
+            [_pattern('AP1', 'aws dynamodb scan --table-name Users')]
+        )
+
+        response = results[0]['response']
+        assert response['Items'] == [{'id': {'S': '1'}}, {'id': {'S': '2'}}]
+        assert response['Count'] == 2
+        assert response['ScannedCount'] == 3
+        assert 'LastEvaluatedKey' not in response
+        assert results[0]['consumed_capacity'] == {'TableName': 'Users', 'CapacityUnits': 1.5}
+        assert client.scan.call_args_list[1].kwargs['ExclusiveStartKey'] == {'id': {'S': '1'}}
+
+    @pytest.mark.asyncio
+    async def test_execute_records_errors(self):
+        """Test that failed requests record the error message."""
+        client = _mock_dynamodb_client()
+        client.query.side_effect = Exception('Requested resource not found')
+
+        results = await AccessPatternExecutor(client).execute(
+            [_pattern('AP1', 'aws dynamodb query --table-name Missing')]
+        )
+
+        assert results[0]['response'] == 'Requested resource not found'
+        assert results[0]['consumed_capacity'] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_reads_concurrently(self):
+        """Test that reads run at the same time."""
+        client = _mock_dynamodb_client()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_other_reads(**kwargs):
+            barrier.wait()
+            return {}
+
+        client.get_item.side_effect = wait_for_other_reads
+        client.query.side_effect = wait_for_other_reads
+
+        results = await AccessPatternExecutor(client).execute(
+            [
+                _pattern('AP1', 'aws dynamodb get-item --table-name Users --key \'{"id": {}}\''),
+                _pattern('AP2', 'aws dynamodb query --table-name Users'),
+                _pattern('AP3', 'aws dynamodb query --table-name Orders'),
+            ]
+        )
+
+        # Each read waited for the other two at the barrier
+        assert all(isinstance(result['response'], dict) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_execute_orders_writes(self):
+        """Test that writes wait for earlier patterns on the same table and vice versa."""
+        client = _mock_dynamodb_client()
+        events = []
+
+        def record(name, delay=0.0):
+            def request(**kwargs):
+                events.append(f'start {name} {kwargs["TableName"]}')
+                time.sleep(delay)
+                events.append(f'end {name} {kwargs["TableName"]}')
+                return {}
+
+            return request
+
+        client.query.side_effect = record('query', delay=0.05)
+        client.put_item.side_effect = record('put')
+
+        await AccessPatternExecutor(client).execute(
+            [
+                _pattern('AP1', 'aws dynamodb query --table-name Users'),
+                _pattern('AP2', "aws dynamodb put-item --table-name Users --item '{}'"),
+                _pattern('AP3', 'aws dynamodb query --table-name Users'),
+            ]
+        )
+
+        assert events == [
+            'start query Users',
+            'end query Users',
+            'start put Users',
+            'end put Users',
+            'start query Users',
+            'end query Users',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_falls_back_to_cli(self):
+        """Test that commands that cannot be translated are run with the fallback."""
+        client = _mock_dynamodb_client()
+        fallback = AsyncMock(return_value=['cli response'])
+        command = 'aws dynamodb get-item --table-name Users --key id={S=1}'
+
+        results = await AccessPatternExecutor(client, fallback=fallback).execute(
+            [_pattern('AP1', command)]
+        )
+
+        fallback.assert_awaited_once_with(command)
+        client.get_item.assert_not_called()
+        assert results[0]['response'] == "['cli response']"
+        assert results[0]['consumed_capacity'] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_non_dynamodb_commands(self):
+        """Test that no pattern runs if a command is not an aws dynamodb command."""
+        client = _mock_dynamodb_client()
+
+        with pytest.raises(ValueError):
+            await AccessPatternExecutor(client).execute(
+                [
+                    _pattern('AP1', 'aws dynamodb scan --table-name Users'),
+                    _pattern('AP2', 'aws s3 ls'),
+                ]
+            )
+
+        client.scan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_records_modified_tables(self):
+        """Test the tables written by the access patterns, and unknown writes."""
+        client = _mock_dynamodb_client()
+        fallback = AsyncMock(return_value={})
+        executor = AccessPatternExecutor(client, fallback=fallback)
+        read = _pattern('AP1', 'aws dynamodb scan --table-name Users')
+        write = _pattern(
+            'AP2', 'aws dynamodb delete-item --table-name Orders --key \'{"id": {"S": "1"}}\''
+        )
+
+        await executor.execute([read, write, {'pattern': 'AP3', 'reason': 'External'}])
+        assert executor.modified_tables == frozenset({'Orders'})
+
+        await executor.execute([read])
+        assert executor.modified_tables == frozenset()
+
+        # Commands run with the AWS CLI may write to any table
+        await executor.execute([read, _pattern('AP4', 'aws dynamodb scan --table-name Users x')])
+        assert executor.modified_tables is None
@@ -1,3 +1,4 @@
+import botocore.session
 import json
 import os
 import pytest
@@ -21,7 +22,17 @@ from awslabs.dynamodb_mcp_server.server import (
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import MagicMock, Mock, mock_open, patch
+
+
+DYNAMODB_SERVICE_MODEL = botocore.session.get_session().get_service_model('dynamodb')
+
+
+def _mock_dynamodb_client():
+    """Create a mock DynamoDB client with the DynamoDB service model."""
+    client = MagicMock()
+    client.meta.service_model = DYNAMODB_SERVICE_MODEL
+    return client
 
 
 @pytest_asyncio.fixture
@@ -721,18 +732,34 @@ async def test_execute_access_patterns_success():
         },
     ]
 
-    with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
-        with patch('builtins.open', mock_open()) as mock_file:
-            mock_execute.side_effect = [{'Items': []}, {'Item': {'id': {'S': '123'}}}]
+    mock_client = _mock_dynamodb_client()
+    mock_client.scan.return_value = {
+        'Items': [],
+        'ConsumedCapacity': {'TableName': 'Users', 'CapacityUnits': 0.5},
+    }
+    mock_client.get_item.return_value = {'Item': {'id': {'S': '123'}}}
 
+    with patch(
+        'awslabs.dynamodb_mcp_server.server._create_dynamodb_client', return_value=mock_client
+    ) as mock_create_client:
+        with patch('builtins.open', mock_open()) as mock_file:
             result = await _execute_access_patterns(
                 '/tmp', access_patterns, endpoint_url='http://localhost:8000'
             )
 
+            mock_create_client.assert_called_once_with('http://localhost:8000')
             assert 'validation_response' in result
             assert len(result['validation_response']) == 2
             assert result['validation_response'][0]['pattern_id'] == 'AP1'
             assert result['validation_response'][1]['pattern_id'] == 'AP2'
+            assert result['validation_response'][0]['consumed_capacity'] == {
+                'TableName': 'Users',
+                'CapacityUnits': 0.5,
+            }
+            assert result['validation_response'][1]['response'] == {'Item': {'id': {'S': '123'}}}
+            mock_client.get_item.assert_called_once_with(
+                TableName='Users', Key={'id': {'S': '123'}}, ReturnConsumedCapacity='TOTAL'
+            )
 
             mock_file.assert_called_once()
             args, kwargs = mock_file.call_args
@@ -745,7 +772,13 @@ async def test_execute_access_patterns_missing_implementation():
     """Test execute_access_patterns with patterns missing implementation."""
     access_patterns = [{'pattern': 'AP1', 'description': 'Pattern without implementation'}]
 
-    with patch('builtins.open', mock_open()):
+    with (
+        patch(
+            'awslabs.dynamodb_mcp_server.server._create_dynamodb_client',
+            return_value=_mock_dynamodb_client(),
+        ),
+        patch('builtins.open', mock_open()),
+    ):
         result = await _execute_access_patterns('/tmp', access_patterns)
 
         assert 'validation_response' in result
@@ -756,11 +789,21 @@ async def test_execute_access_patterns_missing_implementation():
 @pytest.mark.asyncio
 async def test_execute_access_patterns_exception_handling():
     """Test execute_access_patterns exception handling."""
+    # Shorthand syntax cannot be sent directly and is run with the AWS CLI
     access_patterns = [
-        {'pattern': 'AP1', 'implementation': 'aws dynamodb scan --table-name Users'}
+        {
+            'pattern': 'AP1',
+            'implementation': 'aws dynamodb get-item --table-name Users --key id={S=123}',
+        }
     ]
 
-    with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+    with (
+        patch(
+            'awslabs.dynamodb_mcp_server.server._create_dynamodb_client',
+            return_value=_mock_dynamodb_client(),
+        ),
+        patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute,
+    ):
         mock_execute.side_effect = Exception('Command failed')
 
         result = await _execute_access_patterns('/tmp', access_patterns)
@@ -784,23 +827,70 @@ async def test_dynamodb_data_model_validation_success():
 
     with patch('os.path.exists') as mock_exists:
         with patch('builtins.open', mock_open(read_data=json.dumps(mock_data_model))):
-            with patch('awslabs.dynamodb_mcp_server.server.setup_dynamodb_local') as mock_setup:
-                with patch('awslabs.dynamodb_mcp_server.server.create_validation_resources'):
+            with patch(
+                'awslabs.dynamodb_mcp_server.server.dynamodb_local_manager'
+            ) as mock_manager:
+                with patch(
+                    'awslabs.dynamodb_mcp_server.server._execute_access_patterns'
+                ) as mock_test:
                     with patch(
-                        'awslabs.dynamodb_mcp_server.server._execute_access_patterns'
-                    ) as mock_test:
-                        with patch(
-                            'awslabs.dynamodb_mcp_server.server.get_validation_result_transform_prompt'
-                        ) as mock_transform:
-                            mock_exists.return_value = True
-                            mock_setup.return_value = 'http://localhost:8000'
-                            mock_test.return_value = {'validation_response': []}
-                            mock_transform.return_value = 'Validation complete'
+                        'awslabs.dynamodb_mcp_server.server.get_validation_result_transform_prompt'
+                    ) as mock_transform:
+                        mock_exists.return_value = True
+                        mock_manager.endpoint.return_value = 'http://localhost:8000'
+                        mock_test.return_value = {'validation_response': []}
+                        mock_transform.return_value = 'Validation complete'
+
+                        result = await dynamodb_data_model_validation(workspace_dir='/tmp')
+
+                        assert isinstance(result, str)
+                        assert 'Validation complete' in result
+                        mock_manager.restore.assert_called_once_with(mock_data_model)
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_data_model_validation_with_load_replay(tmp_path):
+    """Test that dynamodb_data_model_validation replays the access patterns when requested."""
+    data_model = {
+        'tables': [
+            {
+                'TableName': 'Users',
+                'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}],
+            }
+        ],
+        'items': {'Users': [{'PutRequest': {'Item': {'id': {'S': 'USER#1'}}}}]},
+        'access_patterns': [
+            {
+                'pattern': 'AP1',
+                'implementation': 'aws dynamodb get-item --table-name Users '
+                '--key \'{"id": {"S": "USER#1"}}\'',
+                'rps': 10,
+            }
+        ],
+    }
+    (tmp_path / 'dynamodb_data_model.json').write_text(json.dumps(data_model))
+    client = _mock_dynamodb_client()
+    client.batch_write_item.return_value = {}
+    client.get_item.return_value = {'ConsumedCapacity': {'CapacityUnits': 0.5}}
 
-                            result = await dynamodb_data_model_validation(workspace_dir='/tmp')
+    with (
+        patch('awslabs.dynamodb_mcp_server.server.dynamodb_local_manager') as mock_manager,
+        patch(
+            'awslabs.dynamodb_mcp_server.server._execute_access_patterns',
+            return_value={'validation_response': []},
+        ),
+        patch('awslabs.dynamodb_mcp_server.server._create_dynamodb_client', return_value=client),
+    ):
+        mock_manager.endpoint.return_value = 'http://localhost:8000'
+        await dynamodb_data_model_validation(workspace_dir=str(tmp_path), load_replay_requests=20)
 
-                            assert isinstance(result, str)
-                            assert 'Validation complete' in result
+    results = json.loads((tmp_path / 'dynamodb_model_load_replay.json').read_text())
+    assert results['load_replay']['total_requests'] == 20
+    assert results['load_replay']['access_patterns'][0]['requests'] == 20
+    assert results['seed_response']['Users']['status'] == 'success'
+    assert client.get_item.call_count == 20
+    # The load replay leaves none of the tables in their seeded state
+    mock_manager.mark_modified.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -849,9 +939,11 @@ async def test_dynamodb_data_model_validation_setup_exception():
 
     with patch('os.path.exists') as mock_exists:
         with patch('builtins.open', mock_open(read_data=json.dumps(mock_data_model))):
-            with patch('awslabs.dynamodb_mcp_server.server.setup_dynamodb_local') as mock_setup:
+            with patch(
+                'awslabs.dynamodb_mcp_server.server.dynamodb_local_manager'
+            ) as mock_manager:
                 mock_exists.return_value = True
-                mock_setup.side_effect = Exception('DynamoDB Local setup failed')
+                mock_manager.endpoint.side_effect = Exception('DynamoDB Local setup failed')
 
                 result = await dynamodb_data_model_validation(workspace_dir='/tmp')
 
@@ -1056,17 +1148,16 @@ async def test_error_propagation_in_validation_chain():
 
     with patch('os.path.exists') as mock_exists:
         with patch('builtins.open', mock_open(read_data=json.dumps(mock_data_model))):
-            with patch('awslabs.dynamodb_mcp_server.server.setup_dynamodb_local') as mock_setup:
-                with patch(
-                    'awslabs.dynamodb_mcp_server.server.create_validation_resources'
-                ) as mock_create:
-                    mock_exists.return_value = True
-                    mock_setup.return_value = 'http://localhost:8000'
-                    mock_create.side_effect = Exception('Table creation failed')
+            with patch(
+                'awslabs.dynamodb_mcp_server.server.dynamodb_local_manager'
+            ) as mock_manager:
+                mock_exists.return_value = True
+                mock_manager.endpoint.return_value = 'http://localhost:8000'
+                mock_manager.restore.side_effect = Exception('Table creation failed')
 
-                    result = await dynamodb_data_model_validation(workspace_dir='/tmp')
+                result = await dynamodb_data_model_validation(workspace_dir='/tmp')
 
-                    assert 'Table creation failed' in result
+                assert 'Table creation failed' in result
 
 
 @pytest.mark.asyncio
@@ -1158,17 +1249,16 @@ async def test_dynamodb_data_model_validation_file_not_found_exception():
 
     with patch('os.path.exists') as mock_exists:
         with patch('builtins.open', mock_open(read_data=json.dumps(mock_data_model))):
-            with patch('awslabs.dynamodb_mcp_server.server.setup_dynamodb_local') as mock_setup:
-                with patch(
-                    'awslabs.dynamodb_mcp_server.server.create_validation_resources'
-                ) as mock_create:
-                    mock_exists.return_value = True
-                    mock_setup.return_value = 'http://localhost:8000'
-                    mock_create.side_effect = FileNotFoundError('Required file missing')
+            with patch(
+                'awslabs.dynamodb_mcp_server.server.dynamodb_local_manager'
+            ) as mock_manager:
+                mock_exists.return_value = True
+                mock_manager.endpoint.return_value = 'http://localhost:8000'
+                mock_manager.restore.side_effect = FileNotFoundError('Required file missing')
 
-                    result = await dynamodb_data_model_validation(workspace_dir='/tmp')
+                result = await dynamodb_data_model_validation(workspace_dir='/tmp')
 
-                    assert 'Required file not found' in result
+                assert 'Required file not found' in result
 
 
 @settings(max_examples=100)
@@ -1188,7 +1278,7 @@ def test_property_access_pattern_response_format_consistency(
 
     *For any* valid access pattern executed through `_execute_access_patterns`, the response
     dictionary SHALL contain keys `pattern_id`, `description`, `dynamodb_operation`, `command`,
-    and `response`.
+    `response`, `latency_ms` and `consumed_capacity`.
 
     This property test verifies that regardless of the access pattern content, the response
     format remains consistent with the required keys.
@@ -1206,11 +1296,15 @@ def test_property_access_pattern_response_format_consistency(
     }
 
     async def check_response_format():
-        with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+        mock_client = _mock_dynamodb_client()
+        getattr(mock_client, dynamodb_operation.replace('-', '_')).return_value = {
+            'Items': [],
+            'Count': 0,
+        }
+        with patch(
+            'awslabs.dynamodb_mcp_server.server._create_dynamodb_client', return_value=mock_client
+        ):
             with patch('builtins.open', mock_open()):
-                # Mock successful command execution
-                mock_execute.return_value = {'Items': [], 'Count': 0}
-
                 with tempfile.TemporaryDirectory() as tmp_dir:
                     result = await _execute_access_patterns(
                         tmp_dir, [access_pattern], endpoint_url='http://localhost:8000'
@@ -1235,6 +1329,8 @@ def test_property_access_pattern_response_format_consistency(
                         'dynamodb_operation',
                         'command',
                         'response',
+                        'latency_ms',
+                        'consumed_capacity',
                     }
                     actual_keys = set(pattern_result.keys())
 
@@ -1283,9 +1379,9 @@ def test_property_error_response_format_consistency(
     *For any* access pattern that fails during execution, the error SHALL be captured in the
     `response` field of the result dictionary, maintaining the same format as successful executions.
 
-    This property test verifies that when _execute_dynamodb_command returns an error (exception object
-    or error dict), the response format remains consistent with successful executions - containing
-    all required keys (pattern_id, description, dynamodb_operation, command, response).
+    This property test verifies that when the DynamoDB request fails, the response format remains
+    consistent with successful executions - containing all required keys (pattern_id, description,
+    dynamodb_operation, command, response, latency_ms, consumed_capacity).
     """
     import asyncio
     import tempfile
@@ -1300,12 +1396,15 @@ def test_property_error_response_format_consistency(
     }
 
     async def check_error_response_format():
-        with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+        mock_client = _mock_dynamodb_client()
+        # Mock the DynamoDB request raising an error, which is converted to a string
+        getattr(mock_client, dynamodb_operation.replace('-', '_')).side_effect = Exception(
+            error_message
+        )
+        with patch(
+            'awslabs.dynamodb_mcp_server.server._create_dynamodb_client', return_value=mock_client
+        ):
             with patch('builtins.open', mock_open()):
-                # Mock command execution returning an error (as exception object converted to string)
-                # This simulates what happens when _execute_dynamodb_command catches an exception
-                mock_execute.return_value = Exception(error_message)
-
                 with tempfile.TemporaryDirectory() as tmp_dir:
                     result = await _execute_access_patterns(
                         tmp_dir, [access_pattern], endpoint_url='http://localhost:8000'
@@ -1330,6 +1429,8 @@ def test_property_error_response_format_consistency(
                         'dynamodb_operation',
                         'command',
                         'response',
+                        'latency_ms',
+                        'consumed_capacity',
                     }
                     actual_keys = set(pattern_result.keys())
 
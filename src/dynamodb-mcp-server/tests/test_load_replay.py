@@ -0,0 +1,273 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the load replay benchmark."""
+
+import botocore.session
+import pytest
+from awslabs.dynamodb_mcp_server.load_replay import (
+    SCAN_PARTITION_KEY,
+    KeySchemas,
+    LoadReplay,
+    _percentiles,
+)
+from botocore.exceptions import ClientError
+from unittest.mock import MagicMock
+
+
+DYNAMODB_SERVICE_MODEL = botocore.session.get_session().get_service_model('dynamodb')
+
+TABLES = [
+    {
+        'TableName': 'Users',
+        'KeySchema': [
+            {'AttributeName': 'pk', 'KeyType': 'HASH'},
+            {'AttributeName': 'sk', 'KeyType': 'RANGE'},
+        ],
+    },
+    {
+        'TableName': 'Orders',
+        'KeySchema': [{'AttributeName': 'order_id', 'KeyType': 'HASH'}],
+        'GlobalSecondaryIndexes': [
+            {
+                'IndexName': 'ByUser',
+                'KeySchema': [{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+            },
+            {
+                'IndexName': 'ByStatus',
+                'KeySchema': [
+                    {'AttributeName': 'status', 'KeyType': 'HASH'},
+                    {'AttributeName': 'region', 'KeyType': 'HASH'},
+                ],
+            },
+        ],
+    },
+]
+
+ITEMS = {
+    'Users': [
+        {'PutRequest': {'Item': {'pk': {'S': 'USER#1'}, 'sk': {'S': 'PROFILE'}}}},
+        {'PutRequest': {'Item': {'pk': {'S': 'USER#2'}, 'sk': {'S': 'PROFILE'}}}},
+    ],
+    'Orders': [
+        {
+            'PutRequest': {
+                'Item': {
+                    'order_id': {'N': '7'},
+                    'user_id': {'S': 'USER#1'},
+                    'status': {'S': 'PENDING'},
+                    'region': {'S': 'EU'},
+                }
+            }
+        }
+    ],
+}
+
+
+def _mock_dynamodb_client():
+    """Create a mock DynamoDB client with the DynamoDB service model."""
+    client = MagicMock()
+    client.meta.service_model = DYNAMODB_SERVICE_MODEL
+    client.batch_write_item.return_value = {}
+    return client
+
+
+def _query(index, key, value, rps=None):
+    pattern = {
+        'pattern': f'{index}-{value}',
+        'implementation': (
+            f'aws dynamodb query --table-name Orders --index-name {index} '
+            "--key-condition-expression '#k = :v' "
+            f'--expression-attribute-names \'{{"#k": "{key}"}}\' '
+            f'--expression-attribute-values \'{{":v": {{"S": "{value}"}}}}\''
+        ),
+    }
+    if rps is not None:
+        pattern['rps'] = rps
+    return pattern
+
+
+def test_percentiles():
+    """Test nearest-rank percentiles."""
+    assert _percentiles([float(value) for value in range(100, 0, -1)]) == {
+        'p50': 50.0,
+        'p95': 95.0,
+        'p99': 99.0,
+    }
+    assert _percentiles([3.0]) == {'p50': 3.0, 'p95': 3.0, 'p99': 3.0}
+    assert _percentiles([]) == {'p50': None, 'p95': None, 'p99': None}
+
+
+class TestKeySchemas:
+    """Tests for KeySchemas."""
+
+    def setup_method(self):
+        """Set up the key schemas."""
+        self.key_schemas = KeySchemas(TABLES)
+
+    def test_partitions_of_query(self):
+        """Test the partition of a query, with a multi-attribute GSI partition key."""
+        assert self.key_schemas.partitions_of_request(
+            'Query',
+            {
+                'TableName': 'Orders',
+                'IndexName': 'ByStatus',
+                'KeyConditionExpression': '#s = :s AND #r = :r',
+                'ExpressionAttributeNames': {'#s': 'status', '#r': 'region'},
+                'ExpressionAttributeValues': {':s': {'S': 'PENDING'}, ':r': {'S': 'EU'}},
+            },
+        ) == [('Orders', 'ByStatus', 'status=PENDING, region=EU')]
+
+    def test_partitions_of_put_item_include_indexes(self):
+        """Test that a put counts for the base table and the indexes the item is in."""
+        item = ITEMS['Orders'][0]['PutRequest']['Item']
+
+        assert self.key_schemas.partitions_of_request(
+            'PutItem', {'TableName': 'Orders', 'Item': item}
+        ) == [
+            ('Orders', None, 'order_id=7'),
+            ('Orders', 'ByUser', 'user_id=USER#1'),
+            ('Orders', 'ByStatus', 'status=PENDING, region=EU'),
+        ]
+
+    def test_partitions_of_batch_and_transaction(self):
+        """Test the partitions of batch and transactional requests."""
+        user_key = {'pk': {'S': 'USER#1'}, 'sk': {'S': 'PROFILE'}}
+
+        assert self.key_schemas.partitions_of_request(
+            'BatchGetItem', {'RequestItems': {'Users': {'Keys': [user_key]}}}
+        ) == [('Users', None, 'pk=USER#1')]
+        assert self.key_schemas.partitions_of_request(
+            'TransactWriteItems',
+            {
+                'TransactItems': [
+                    {'Delete': {'TableName': 'Users', 'Key': user_key}},
+                    {'Put': {'TableName': 'Orders', 'Item': {'order_id': {'N': '8'}}}},
+                ]
+            },
+        ) == [('Users', None, 'pk=USER#1'), ('Orders', None, 'order_id=8')]
+        assert self.key_schemas.partitions_of_request('Scan', {'TableName': 'Users'}) == [
+            ('Users', None, SCAN_PARTITION_KEY)
+        ]
+
+
+class TestLoadReplay:
+    """Tests for LoadReplay."""
+
+    def test_seed_copies_entity_ids(self):
+        """Test that copies replace entity IDs wherever they appear, and keep other values."""
+        client = _mock_dynamodb_client()
+
+        response = LoadReplay(client, TABLES, ITEMS, seed_copies=3).seed()
+
+        assert response['Orders'] == {'status': 'success', 'items_processed': 2}
+        written = [
+            request['PutRequest']['Item']
+            for call in client.batch_write_item.call_args_list
+            for requests in call.kwargs['RequestItems'].values()
+            for request in requests
+        ]
+        assert {'pk': {'S': 'USER#1#2'}, 'sk': {'S': 'PROFILE'}} in written
+        assert {
+            'order_id': {'N': '1000000007'},
+            'user_id': {'S': 'USER#1#1'},
+            'status': {'S': 'PENDING'},
+            'region': {'S': 'EU'},
+        } in written
+        # The originals are inserted by the validation
+        assert len(written) == 6
+
+    @pytest.mark.asyncio
+    async def test_run_reports_hot_partition_keys(self):
+        """Test that queries on a shared value concentrate on one key and exceed its limit."""
+        client = _mock_dynamodb_client()
+        client.query.return_value = {'Items': [], 'ConsumedCapacity': {'CapacityUnits': 2.0}}
+        patterns = [
+            _query('ByUser', 'user_id', 'USER#1', rps=100),
+            # Every order is also stored under a shared user_id, as in a badly designed GSI
+            _query('ByUser', 'user_id', 'ORDERS#ALL', rps=2000),
+            {'pattern': 'AP3', 'reason': 'Uses OpenSearch'},
+        ]
+
+        results = await LoadReplay(client, TABLES, ITEMS, seed_copies=50, random_seed=1).run(
+            patterns, 400
+        )
+
+        assert results['total_requests'] == 400
+        assert results['throttled_requests'] == 0
+        assert results['latency_ms']['p99'] is not None
+        by_pattern = {p['pattern_id']: p for p in results['access_patterns']}
+        assert by_pattern['ByUser-USER#1']['declared_rps'] == 100
+        # Requests follow the declared relative rates
+        assert by_pattern['ByUser-ORDERS#ALL']['requests'] > 300
+
+        (partitions,) = results['partitions']
+        assert (partitions['table'], partitions['index']) == ('Orders', 'ByUser')
+        hot_key = partitions['hot_keys'][0]
+        assert hot_key['key'] == 'user_id=ORDERS#ALL'
+        assert hot_key['share'] > 0.75
+        assert hot_key['projected_read_units_per_second'] == 4000.0
+        assert hot_key['exceeds_partition_limit']
+        # Requests for a user are spread over the copies of the user
+        assert partitions['distinct_keys'] > 5
+        assert not any(key['exceeds_partition_limit'] for key in partitions['hot_keys'][1:])
+
+    @pytest.mark.asyncio
+    async def test_run_counts_throttles_and_skips_unsupported_patterns(self):
+        """Test throttled and failed requests, and patterns that cannot be replayed."""
+        client = _mock_dynamodb_client()
+        client.get_item.side_effect = [
+            ClientError(
+                {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': ''}},
+                'GetItem',
+            ),
+            ClientError({'Error': {'Code': 'ValidationException', 'Message': ''}}, 'GetItem'),
+        ]
+        patterns = [
+            {
+                'pattern': 'AP1',
+                'implementation': 'aws dynamodb get-item --table-name Users '
+                '--key \'{"pk": {"S": "USER#1"}, "sk": {"S": "PROFILE"}}\'',
+            },
+            {
+                'pattern': 'AP2',
+                'implementation': 'aws dynamodb get-item --table-name Users --key pk={S=1}',
+            },
+        ]
+
+        results = await LoadReplay(client, TABLES, ITEMS, concurrency=1).run(patterns, 2)
+
+        assert results['throttled_requests'] == 1
+        assert results['failed_requests'] == 2
+        assert results['access_patterns'][0]['declared_rps'] is None
+        assert (
+            'ProvisionedThroughputExceededException'
+            in results['access_patterns'][0]['first_error']
+        )
+        assert results['skipped_access_patterns'][0]['pattern_id'] == 'AP2'
+        # Without declared rates there is no projected throughput
+        hot_key = results['partitions'][0]['hot_keys'][0]
+        assert 'exceeds_partition_limit' not in hot_key
+
+    @pytest.mark.asyncio
+    async def test_run_without_replayable_patterns(self):
+        """Test that nothing is sent when no pattern can be replayed."""
+        client = _mock_dynamodb_client()
+
+        results = await LoadReplay(client, TABLES, ITEMS).run(
+            [{'pattern': 'AP1', 'reason': 'External'}], 10
+        )
+
+        assert results['total_requests'] == 0
+        assert results['access_patterns'] == []
@@ -427,6 +427,26 @@ def test_manifest_with_skipped_queries(tmp_path, sample_results, mysql_plugin):
         assert 'The following queries were not executed:' in content
 
 
+def test_manifest_with_query_timings(tmp_path, sample_results, sample_metadata, mysql_plugin):
+    """Test manifest includes the query timings of managed mode."""
+    metadata = {
+        **sample_metadata,
+        'query_timings': {
+            'comprehensive_table_analysis': {'duration_ms': 12.5, 'status': 'success', 'rows': 3},
+            'column_analysis': {'duration_ms': 60000.2, 'status': 'timeout', 'rows': 0},
+        },
+    }
+
+    formatter = MarkdownFormatter(sample_results, metadata, str(tmp_path), plugin=mysql_plugin)
+    formatter.generate_all_files()
+
+    with open(os.path.join(str(tmp_path), 'manifest.md'), 'r') as f:
+        content = f.read()
+    assert '## Query Timings' in content
+    assert '| Comprehensive Table Analysis | 12.5 | success | 3 |' in content
+    assert '| Column Analysis | 60000.2 | timeout | 0 |' in content
+
+
 def test_error_handling_invalid_data(tmp_path, sample_metadata, mysql_plugin):
     """Test error handling with invalid data."""
     results = {
@@ -15,6 +15,8 @@
 import os
 import pytest
 from awslabs.dynamodb_mcp_server.model_validation_utils import (
+    DynamoDBClientConfig,
+    DynamoDBLocalManager,
     DynamoDBLocalVersionError,
     _check_version_meets_minimum,
     _extract_port_from_cmdline,
@@ -782,6 +784,176 @@ class TestCreateValidationResources:
             mock_insert_items.assert_called_once_with(mock_client, {})
 
 
+class _FakeDynamoDBLocal:
+    """In-memory stand-in for the table operations of DynamoDB Local."""
+
+    class ResourceInUseException(Exception):
+        pass
+
+    class ResourceNotFoundException(Exception):
+        pass
+
+    def __init__(self, endpoint_url='http://localhost:8000'):
+        self.meta = Mock(endpoint_url=endpoint_url)
+        self.exceptions = Mock(
+            ResourceInUseException=self.ResourceInUseException,
+            ResourceNotFoundException=self.ResourceNotFoundException,
+        )
+        self.tables = {}
+        self.created = []
+        self.creation_date_times = {}
+
+    def list_tables(self, **kwargs):
+        return {'TableNames': sorted(self.tables)}
+
+    def create_table(self, TableName, **kwargs):
+        if TableName in self.tables:
+            raise self.ResourceInUseException()
+        self.tables[TableName] = []
+        self.created.append(TableName)
+        self.creation_date_times[TableName] = len(self.created)
+        return {'TableDescription': {'TableArn': f'arn:aws:dynamodb:::table/{TableName}'}}
+
+    def describe_table(self, TableName):
+        if TableName not in self.tables:
+            raise self.ResourceNotFoundException()
+        return {
+            'Table': {
+                'TableName': TableName,
+                'CreationDateTime': self.creation_date_times.get(TableName),
+                'ItemCount': len(self.tables[TableName]),
+            }
+        }
+
+    def delete_table(self, TableName):
+        if self.tables.pop(TableName, None) is None:
+            raise self.ResourceNotFoundException()
+
+    def batch_write_item(self, RequestItems):
+        for table_name, requests in RequestItems.items():
+            self.tables[table_name].extend(requests)
+        return {}
+
+
+class TestDynamoDBLocalManager:
+    """Test cases for DynamoDBLocalManager."""
+
+    RESOURCES = {
+        'tables': [
+            TestDataFactory.create_table_config('Users'),
+            TestDataFactory.create_table_config('Orders'),
+        ],
+        'items': {
+            'Users': [{'PutRequest': {'Item': {'id': {'S': '1'}}}}],
+            'Orders': [{'PutRequest': {'Item': {'id': {'S': '2'}}}}],
+        },
+    }
+
+    def setup_method(self):
+        """Set up a manager and a fake DynamoDB Local."""
+        self.manager = DynamoDBLocalManager()
+        self.client = _FakeDynamoDBLocal()
+        self.patches = [
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils.setup_dynamodb_local',
+                return_value='http://localhost:8000',
+            ),
+            patch(
+                'awslabs.dynamodb_mcp_server.model_validation_utils._create_dynamodb_client',
+                return_value=self.client,
+            ),
+        ]
+        self.mock_setup, self.mock_create_client = (p.start() for p in self.patches)
+
+    def teardown_method(self):
+        """Stop the patches."""
+        for p in self.patches:
+            p.stop()
+
+    def test_endpoint_is_reused_while_serving(self):
+        """Test that DynamoDB Local is only set up again once it stops responding."""
+        assert self.manager.endpoint() == 'http://localhost:8000'
+        assert self.manager.endpoint() == 'http://localhost:8000'
+        assert self.mock_setup.call_count == 1
+        self.mock_create_client.assert_called_with(
+            'http://localhost:8000', DynamoDBClientConfig.PROBE_CONFIG
+        )
+
+        with patch.object(
+            self.client, 'list_tables', side_effect=EndpointConnectionError(endpoint_url='x')
+        ):
+            assert self.manager.endpoint() == 'http://localhost:8000'
+        assert self.mock_setup.call_count == 2
+
+    def test_restore_reuses_unchanged_tables(self):
+        """Test that only new, changed and modified tables are recreated."""
+        first = self.manager.restore(self.RESOURCES)
+        assert first['tables']['Users']['status'] == 'success'
+        assert first['items']['Orders'] == {'status': 'success', 'items_processed': 1}
+
+        second = self.manager.restore(self.RESOURCES)
+        assert second['tables']['Users']['status'] == 'warm'
+        assert second['items']['Orders'] == {'status': 'warm', 'items_processed': 1}
+        assert self.client.created == ['Users', 'Orders']
+
+        self.manager.mark_modified(['Users'])
+        changed = {
+            'tables': self.RESOURCES['tables'],
+            'items': {**self.RESOURCES['items'], 'Orders': []},
+        }
+        third = self.manager.restore(changed)
+        assert third['tables']['Users']['status'] == 'success'
+        assert third['tables']['Orders']['status'] == 'success'
+        assert self.client.tables['Orders'] == []
+        assert len(self.client.tables['Users']) == 1
+
+        self.manager.mark_modified()
+        self.manager.restore(changed)
+        assert self.client.created == ['Users', 'Orders'] * 3
+
+    def test_restore_reseeds_tables_changed_by_another_process(self):
+        """Test that tables recreated or written to outside this manager are reseeded."""
+        self.manager.restore(self.RESOURCES)
+
+        # Another server process recreates Users and writes an item to Orders
+        self.client.delete_table(TableName='Users')
+        self.client.create_table(TableName='Users')
+        self.client.batch_write_item({'Orders': [{'PutRequest': {'Item': {'id': {'S': '3'}}}}]})
+        result = self.manager.restore(self.RESOURCES)
+
+        assert result['tables']['Users']['status'] == 'success'
+        assert result['tables']['Orders']['status'] == 'success'
+        assert self.client.tables == self.RESOURCES['items']
+        assert self.manager.restore(self.RESOURCES)['tables']['Users']['status'] == 'warm'
+
+    def test_restore_deletes_other_tables(self):
+        """Test that tables that are not in the data model, or not seeded by it, are deleted."""
+        self.client.tables = {'Users': [{'stale': True}], 'Legacy': []}
+
+        result = self.manager.restore(self.RESOURCES)
+
+        assert sorted(self.client.tables) == ['Orders', 'Users']
+        assert self.client.tables['Users'] == self.RESOURCES['items']['Users']
+        assert result['tables']['Users']['status'] == 'success'
+
+    def test_restore_keeps_failed_tables_cold(self):
+        """Test that tables that could not be seeded are recreated on the next restore."""
+        with patch.object(self.client, 'batch_write_item', side_effect=Exception('boom')):
+            result = self.manager.restore(self.RESOURCES)
+        assert result['items']['Users']['status'] == 'error'
+
+        self.manager.restore(self.RESOURCES)
+
+        assert self.client.created == ['Users', 'Orders'] * 2
+
+    def test_restore_only_on_localhost(self):
+        """Test that tables are never deleted from a remote endpoint."""
+        self.client.meta.endpoint_url = 'https://dynamodb.us-east-1.amazonaws.com'
+
+        with pytest.raises(ValueError, match='SAFETY VIOLATION'):
+            self.manager.restore(self.RESOURCES)
+
+
 class TestCreateTables:
     """Test cases for create_tables function."""
 
@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Catalog metadata cache for postgres MCP Server.
+
+Agents tend to call ``get_table_schema`` for the same tables over and over
+within a session, and every call is a full round-trip to pg_catalog (a
+billable Data API call on the RDS_API path). This module keeps the results
+per connection and bounds their staleness two ways:
+
+  - a hard TTL after which an entry is dropped and re-fetched, and
+  - a cheap per-table catalog version (an md5 over the xmin of the
+    pg_class / pg_attribute / pg_description / pg_index rows describing the
+    table). Any DDL that changes columns, types, comments or indexes writes a
+    new version of one of those catalog rows, so a changed fingerprint means
+    the cached entry is stale. The fingerprint is re-checked at most once per
+    ``revalidate_seconds`` so a burst of lookups costs no round-trips at all.
+
+An event trigger would catch DDL without polling, but creating one requires
+superuser, which the least-privilege guardrail deliberately refuses to run as.
+"""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# Hard upper bound on how long a cached catalog entry may be served.
+DEFAULT_CATALOG_CACHE_TTL_SECONDS = 300
+
+# Minimum interval between catalog-version checks for a cached entry.
+DEFAULT_CATALOG_REVALIDATE_SECONDS = 30
+
+# Fingerprint of everything get_table_schema / describe_schema report for one
+# relation. ``{relation}`` is an expression yielding the relation's regclass
+# (``to_regclass(:table_name)`` for a single lookup, ``c.oid`` inside the bulk
+# query). xmin changes whenever a catalog row is rewritten, and dropped rows
+# disappear from the aggregate, so any relevant DDL changes the md5.
+_CATALOG_VERSION_TEMPLATE = """
+    SELECT md5(string_agg(v, ',' ORDER BY v)) FROM (
+        SELECT 'c' || pc.xmin::text AS v FROM pg_class pc WHERE pc.oid = {relation}
+        UNION ALL
+        SELECT 'a' || pa.attnum || ':' || pa.xmin::text FROM pg_attribute pa
+            WHERE pa.attrelid = {relation}
+        UNION ALL
+        SELECT 'd' || pd.objsubid || ':' || pd.xmin::text FROM pg_description pd
+            WHERE pd.objoid = {relation} AND pd.classoid = 'pg_class'::regclass
+        UNION ALL
+        SELECT 'i' || pi.indexrelid || ':' || pi.xmin::text FROM pg_index pi
+            WHERE pi.indrelid = {relation}
+    ) catalog_rows
+"""
+
+TABLE_CATALOG_VERSION_SQL = (
+    f'SELECT ({_CATALOG_VERSION_TEMPLATE.format(relation="to_regclass(:table_name)")}) '
+    'AS catalog_version'
+)
+
+# Column metadata for a single table plus its catalog version. The version is
+# an uncorrelated scalar subquery, so Postgres evaluates it once (InitPlan) and
+# the whole lookup stays a single round-trip.
+TABLE_SCHEMA_SQL = f"""
+    SELECT
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        col_description(a.attrelid, a.attnum) AS column_comment,
+        ({_CATALOG_VERSION_TEMPLATE.format(relation='to_regclass(:table_name)')}) AS catalog_version
+    FROM
+        pg_attribute a
+    WHERE
+        a.attrelid = to_regclass(:table_name)
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    ORDER BY a.attnum
+"""
+
+# Bulk "describe every table in a schema" in one round-trip: one row per
+# column, with the per-table comment, index definitions (newline separated)
+# and catalog version repeated on each row of that table. ``table_key`` is the
+# quote_ident-qualified name, i.e. the same text to_regclass accepts, so
+# entries filled here are hit by get_table_schema('schema.table').
+SCHEMA_DESCRIBE_SQL = f"""
+    SELECT
+        quote_ident(n.nspname) || '.' || quote_ident(c.relname) AS table_key,
+        c.relname AS table_name,
+        obj_description(c.oid, 'pg_class') AS table_comment,
+        (
+            SELECT string_agg(pg_get_indexdef(i.indexrelid), E'\\n' ORDER BY i.indexrelid)
+            FROM pg_index i WHERE i.indrelid = c.oid
+        ) AS index_definitions,
+        ({_CATALOG_VERSION_TEMPLATE.format(relation='c.oid')}) AS catalog_version,
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        col_description(a.attrelid, a.attnum) AS column_comment
+    FROM
+        pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = c.oid
+    WHERE
+        n.nspname = :schema_name
+        AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    ORDER BY c.relname, a.attnum
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """A cached catalog lookup result.
+
+    Attributes:
+        value: The cached payload (rows as returned to the caller).
+        version: Catalog version fingerprint at fetch time, or None if the
+            result did not carry one (in which case only the TTL applies).
+        fetched_at: Monotonic time the payload was fetched.
+        validated_at: Monotonic time the version was last confirmed current.
+    """
+
+    value: Any
+    version: Optional[str]
+    fetched_at: float
+    validated_at: float
+
+
+class CatalogCache:
+    """TTL + version-validated cache of catalog lookups for one connection."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CATALOG_CACHE_TTL_SECONDS,
+        revalidate_seconds: float = DEFAULT_CATALOG_REVALIDATE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Maximum age of an entry. 0 disables caching.
+            revalidate_seconds: How long an entry is served before its catalog
+                version must be re-checked.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.ttl_seconds = ttl_seconds
+        self.revalidate_seconds = revalidate_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, CatalogEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are retained at all."""
+        return self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[CatalogEntry]:
+        """Return the live entry for ``key``, dropping it if the TTL has passed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry.fetched_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            return entry
+
+    def needs_revalidation(self, entry: CatalogEntry) -> bool:
+        """Whether ``entry`` must have its catalog version re-checked before use."""
+        return self._clock() - entry.validated_at >= self.revalidate_seconds
+
+    def mark_validated(self, key: Hashable) -> None:
+        """Record that the catalog version of ``key`` was just confirmed current."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.validated_at = self._clock()
+
+    def put(self, key: Hashable, value: Any, version: Optional[str] = None) -> None:
+        """Store ``value`` under ``key``. No-op when caching is disabled."""
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = CatalogEntry(
+                value=value, version=version, fetched_at=now, validated_at=now
+            )
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """Number of entries currently held (including not-yet-pruned expired ones)."""
+        with self._lock:
+            return len(self._entries)
+
+
+class CatalogCacheMap:
+    """Per-connection catalog caches.
+
+    Keyed weakly on the connection object so a connection evicted from the
+    DBConnectionMap (and garbage collected) takes its cache with it; a
+    reconnect therefore always starts cold.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CATALOG_CACHE_TTL_SECONDS,
+        revalidate_seconds: float = DEFAULT_CATALOG_REVALIDATE_SECONDS,
+    ):
+        """Initialize the map with the settings applied to each new cache."""
+        self.ttl_seconds = ttl_seconds
+        self.revalidate_seconds = revalidate_seconds
+        self._caches: 'weakref.WeakKeyDictionary[Any, CatalogCache]' = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def configure(self, ttl_seconds: float, revalidate_seconds: float) -> None:
+        """Change the settings and drop every existing cache."""
+        with self._lock:
+            self.ttl_seconds = ttl_seconds
+            self.revalidate_seconds = revalidate_seconds
+            self._caches.clear()
+
+    def for_connection(self, conn: Any) -> CatalogCache:
+        """Return (creating if needed) the cache belonging to ``conn``."""
+        with self._lock:
+            cache = self._caches.get(conn)
+            if cache is None:
+                cache = CatalogCache(self.ttl_seconds, self.revalidate_seconds)
+                self._caches[conn] = cache
+            return cache
+
+    def clear(self) -> None:
+        """Drop every cache."""
+        with self._lock:
+            self._caches.clear()
@@ -15,7 +15,7 @@
 """Abstract database connection interface for postgres MCP Server."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 
 class AbstractDBConnection(ABC):
@@ -67,6 +67,20 @@ class AbstractDBConnection(ABC):
         """Record the privilege-probe result (diagnostic use only)."""
         self._effective_is_over_privileged = value
 
+    @property
+    def catalog_identity(self) -> Optional[Hashable]:
+        """Identity of the database target and role this connection runs as.
+
+        Two connections with the same identity see the same catalog and the
+        same role privileges, so server.validate_connection may reuse a recent
+        privilege-probe result across them (see catalog_cache). None (the
+        default) opts out of sharing.
+
+        Returns:
+            Optional[Hashable]: a hashable identity, or None if unknown.
+        """
+        return None
+
     @abstractmethod
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
@@ -30,7 +30,7 @@ from botocore.config import Config
 from datetime import datetime, timedelta
 from loguru import logger
 from psycopg_pool import AsyncConnectionPool
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 
 def get_credentials_from_secret(
@@ -169,6 +169,17 @@ class PsycopgPoolConnection(AbstractDBConnection):
             self.pool_expiry_min = 14
             logger.debug(f'Use IAM auth for user: {db_user}')
 
+    @property
+    def catalog_identity(self) -> Optional[Hashable]:
+        """Host, port, database and role this pool connects as.
+
+        None until the role is known (it is read from Secrets Manager when the
+        pool is first initialized on the non-IAM path).
+        """
+        if not self.user:
+            return None
+        return ('pgwire', self.host, self.port, self.database, self.user)
+
     async def initialize_pool(self):
         """Initialize the connection pool."""
         async with self.rw_lock.reader_lock:
@@ -20,7 +20,7 @@ from awslabs.postgres_mcp_server import __user_agent__
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
 from botocore.config import Config
 from loguru import logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 
 class RDSDataAPIConnection(AbstractDBConnection):
@@ -54,6 +54,11 @@ class RDSDataAPIConnection(AbstractDBConnection):
                 'rds-data', region_name=region, config=Config(user_agent_extra=__user_agent__)
             )
 
+    @property
+    def catalog_identity(self) -> Optional[Hashable]:
+        """Cluster, secret (and so role) and database this connection targets."""
+        return ('rdsapi', self.cluster_arn, self.secret_arn, self.database)
+
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
+from typing import Dict, List, NamedTuple, Tuple
 
 
 MUTATING_KEYWORDS = {
@@ -98,11 +100,17 @@ MUTATING_PATTERN = re.compile(
 # a comment are not mistaken for real ones.
 COMMENT_INJECTION_PATTERN = r"(?i)'.*?--"
 
+# UNION followed by SELECT on the same line. Like COMMENT_INJECTION_PATTERN,
+# the regex form is quadratic on pathological input, so scan_sql evaluates
+# both with linear equivalents (the union branch of _scan_sql and
+# _has_comment_injection).
+UNION_SELECT_PATTERN = r'(?i)\bunion\b.*\bselect\b'
+
 SUSPICIOUS_PATTERNS = [
     COMMENT_INJECTION_PATTERN,  # comment injection: a string followed by --
     r'(?i)\bor\b\s+\d+\s*=\s*\d+',  # numeric tautology e.g. OR 1=1
     r"(?i)\bor\b\s*'[^']+'\s*=\s*'[^']+'",  # string tautology e.g. OR '1'='1'
-    r'(?i)\bunion\b.*\bselect\b',  # UNION SELECT
+    UNION_SELECT_PATTERN,  # UNION SELECT
     r'(?i)\bdrop\b',  # DROP statement
     r'(?i)\btruncate\b',  # TRUNCATE
     r'(?i)\bgrant\b|\brevoke\b',  # GRANT or REVOKE
@@ -338,6 +346,38 @@ def strip_quoted_identifiers(sql: str) -> str:
     return _QUOTED_IDENTIFIER_PATTERN.sub(r' \1 ', sql)
 
 
+# Tokens the comment scanner has to act on. Everything between two of these
+# is copied in one slice, so the Python-level loop runs once per literal /
+# comment boundary rather than once per character.
+_LEXER_SPECIAL_RE = re.compile(r"['\"$]|--|/\*")
+
+# Opening tag of a dollar-quoted string ($tag$, tag may be empty: $$). Matched
+# with .match(sql, pos) so the scanner never slices sql[i:] (which would copy an
+# O(n) tail on every `$` and make a `$`-heavy query O(n^2)).
+_DOLLAR_TAG_RE = re.compile(r'\$\w*\$')
+
+# Nesting tokens inside a block comment.
+_BLOCK_COMMENT_TOKEN_RE = re.compile(r'/\*|\*/')
+
+
+def _end_of_quoted(sql: str, i: int, quote: str) -> int:
+    """Return the index just past the quoted token opened by ``sql[i]``.
+
+    Handles the doubled-quote escape ('' in a string, "" in an identifier).
+    Returns ``len(sql)`` for an unterminated token.
+    """
+    n = len(sql)
+    i += 1
+    while True:
+        i = sql.find(quote, i)
+        if i == -1:
+            return n
+        if i + 1 < n and sql[i + 1] == quote:
+            i += 2
+            continue
+        return i + 1
+
+
 def strip_sql_comments(sql: str) -> str:
     """Replace SQL comments with a space, ignoring comment-like text in literals.
 
@@ -355,6 +395,11 @@ def strip_sql_comments(sql: str) -> str:
     really data is not mistaken for a comment. This is detection-only
     normalization; the original SQL is what executes.
 
+    The scan is a single linear pass: it jumps between literal / comment
+    boundaries with compiled searches and copies the text in between as
+    whole slices, so a multi-megabyte ``INSERT ... VALUES`` costs time
+    proportional to its length.
+
     Known limitations (best-effort, see README security note): backslash
     escapes inside E'' strings and other exotic lexer corners are not
     modelled. True fidelity needs a real parser.
@@ -363,78 +408,56 @@ def strip_sql_comments(sql: str) -> str:
     i = 0
     n = len(sql)
     while i < n:
-        ch = sql[i]
-
-        # Single-quoted string literal: '' is an embedded quote.
-        if ch == "'":
-            out.append(ch)
-            i += 1
-            while i < n:
-                out.append(sql[i])
-                if sql[i] == "'":
-                    if i + 1 < n and sql[i + 1] == "'":
-                        out.append("'")
-                        i += 2
-                        continue
-                    i += 1
-                    break
-                i += 1
-            continue
-
-        # Double-quoted identifier: "" is an embedded quote.
-        if ch == '"':
-            out.append(ch)
-            i += 1
-            while i < n:
-                out.append(sql[i])
-                if sql[i] == '"':
-                    if i + 1 < n and sql[i + 1] == '"':
-                        out.append('"')
-                        i += 2
-                        continue
-                    i += 1
-                    break
-                i += 1
+        m = _LEXER_SPECIAL_RE.search(sql, i)
+        if m is None:
+            out.append(sql[i:])
+            break
+        j = m.start()
+        if j > i:
+            out.append(sql[i:j])
+        token = m.group(0)
+
+        # Single-quoted string literal / double-quoted identifier: copy verbatim.
+        if token == "'" or token == '"':
+            end = _end_of_quoted(sql, j, token)
+            out.append(sql[j:end])
+            i = end
             continue
 
         # Dollar-quoted string: $tag$ ... $tag$ (tag may be empty: $$).
-        if ch == '$':
-            m = re.match(r'\$\w*\$', sql[i:])
-            if m:
-                tag = m.group(0)
-                end = sql.find(tag, i + len(tag))
-                if end == -1:
-                    out.append(sql[i:])  # unterminated — copy verbatim
-                    break
-                out.append(sql[i : end + len(tag)])
-                i = end + len(tag)
+        if token == '$':
+            dm = _DOLLAR_TAG_RE.match(sql, j)
+            if dm is None:
+                out.append('$')
+                i = j + 1
                 continue
+            tag = dm.group(0)
+            close = sql.find(tag, j + len(tag))
+            if close == -1:
+                out.append(sql[j:])  # unterminated — copy verbatim
+                break
+            out.append(sql[j : close + len(tag)])
+            i = close + len(tag)
+            continue
 
         # Line comment: -- to end of line.
-        if ch == '-' and i + 1 < n and sql[i + 1] == '-':
-            nl = sql.find('\n', i)
+        if token == '--':
+            nl = sql.find('\n', j)
             out.append(' ')
             i = n if nl == -1 else nl
             continue
 
         # Block comment: /* ... */ with nesting.
-        if ch == '/' and i + 1 < n and sql[i + 1] == '*':
-            depth = 1
-            i += 2
-            while i < n and depth > 0:
-                if sql[i] == '/' and i + 1 < n and sql[i + 1] == '*':
-                    depth += 1
-                    i += 2
-                elif sql[i] == '*' and i + 1 < n and sql[i + 1] == '/':
-                    depth -= 1
-                    i += 2
-                else:
-                    i += 1
-            out.append(' ')
-            continue
-
-        out.append(ch)
-        i += 1
+        depth = 1
+        i = j + 2
+        while depth > 0:
+            bm = _BLOCK_COMMENT_TOKEN_RE.search(sql, i)
+            if bm is None:
+                i = n
+                break
+            depth += 1 if bm.group(0) == '/*' else -1
+            i = bm.end()
+        out.append(' ')
 
     return ''.join(out)
 
@@ -450,93 +473,245 @@ def normalize_for_detection(sql: str) -> str:
     return strip_quoted_identifiers(strip_sql_comments(sql))
 
 
-def detect_mutating_keywords(sql_text: str) -> list[str]:
-    """Return a list of mutating keywords found in the SQL.
+class SqlScanResult(NamedTuple):
+    """Everything the detectors found in one query.
 
-    The SQL is comment-normalized first so a comment wedged between the
-    words of a multi-word keyword (IMPORT/**/FOREIGN/**/SCHEMA) or before
-    a function paren cannot hide the keyword from the read-only gate.
+    Attributes:
+        mutating_keywords: Deduplicated, uppercased mutating keywords.
+        issues: Injection / safety issues, in the shape returned by
+            check_sql_injection_risk (at most one entry).
     """
-    matches = MUTATING_PATTERN.findall(normalize_for_detection(sql_text))
-    return list({m.upper() for m in matches})  # Deduplicated and normalized to uppercase
 
+    mutating_keywords: Tuple[str, ...]
+    issues: Tuple[Dict[str, str], ...]
 
-def check_sql_injection_risk(sql: str) -> list[dict]:
-    """Check for potential SQL injection risks in sql query.
 
-    Args:
-        sql: query string
+# run_query checks the same text with both detect_mutating_keywords and
+# check_sql_injection_risk, and agents re-issue identical queries, so scan
+# results are memoized on the query text. Queries longer than
+# SCAN_CACHE_MAX_SQL_LENGTH (bulk INSERT ... VALUES payloads) are scanned but
+# not retained, so the cache cannot pin megabytes of SQL in memory.
+SCAN_CACHE_SIZE = 1024
+SCAN_CACHE_MAX_SQL_LENGTH = 64 * 1024
 
-    Returns:
-        dictionaries containing detected security issue
+# --- Single-pass scanner -------------------------------------------------
+#
+# Every detector except a few cheap ones (COPY ... PROGRAM, which is anchored
+# at the start of the statement; the stacked-query ';' check; and the
+# comment-injection heuristic) begins with a specific keyword or function
+# name on a word boundary. Instead of running each pattern as its own
+# case-insensitive pass over the whole query, scan_sql makes ONE pass that
+# finds every such anchor word and then tries only the detectors that can
+# start with that word, anchored at that position. Per-anchor work is
+# constant, so the total cost is linear in the query length, and anything
+# that is not an anchor word (bulk VALUES data, identifiers) is skipped at
+# regex-engine speed.
+#
+# The anchored matchers below are the existing patterns (or their exact
+# anchored forms), so the scan reports precisely what the individual
+# patterns report: MUTATING_PATTERN.findall's non-overlapping keyword set,
+# and the first SECURITY_GUC_PATTERN / SECURITY_SET_CONFIG_PATTERN /
+# DANGEROUS_FUNCTION_PATTERN match (the optional schema qualifier in the
+# latter two never changes whether, or which name, matches).
+
+# set_config('<guc>', ...) anchored at the function name.
+_SET_CONFIG_AT = re.compile(
+    r'(?i)set_config\s*\(\s*[\'"]('
+    + '|'.join(re.escape(g) for g in SECURITY_SENSITIVE_GUCS)
+    + r')[\'"]'
+)
+
+# A dangerous function call anchored at the function name.
+_DANGEROUS_FUNCTION_AT = re.compile(
+    r'(?i)('
+    + '|'.join(re.escape(fn) for fn in sorted(DANGEROUS_FUNCTIONS, key=len, reverse=True))
+    + r')\s*\('
+)
+
+
+# SUSPICIOUS_PATTERNS of the form (?i)\b<word>... (or an alternation of
+# such branches), keyed by their leading word(s) so they are tried only where
+# that word occurs. Anything else is searched in full as before, so a pattern
+# added later without a keyword anchor is never silently skipped. The comment
+# injection and UNION SELECT heuristics are evaluated by linear equivalents
+# (see _has_comment_injection and the union branch in _scan_sql).
+def _index_suspicious_patterns() -> Tuple[
+    Dict[str, List['re.Pattern[str]']], List['re.Pattern[str]']
+]:
+    by_anchor: Dict[str, List['re.Pattern[str]']] = {}
+    unanchored: List['re.Pattern[str]'] = []
+    for pattern in SUSPICIOUS_PATTERNS:
+        if pattern in (COMMENT_INJECTION_PATTERN, UNION_SELECT_PATTERN):
+            continue
+        words = re.findall(r'(?:^\(\?i\)|\|)\\b(\w+)', pattern)
+        branches = pattern.removeprefix('(?i)').split('|')
+        if pattern.startswith('(?i)') and len(words) == len(branches):
+            for word in words:
+                by_anchor.setdefault(word.lower(), []).append(re.compile(pattern))
+        else:
+            unanchored.append(re.compile(pattern))
+    return by_anchor, unanchored
+
+
+_SUSPICIOUS_BY_ANCHOR, _UNANCHORED_SUSPICIOUS = _index_suspicious_patterns()
+
+_MUTATING_ANCHORS = frozenset(k.split()[0].lower() for k in MUTATING_KEYWORDS)
+_FUNCTION_ANCHORS = frozenset(fn.lower() for fn in DANGEROUS_FUNCTIONS)
+_ANCHOR_WORDS = (
+    _MUTATING_ANCHORS
+    | _FUNCTION_ANCHORS
+    | frozenset(_SUSPICIOUS_BY_ANCHOR)
+    | {'set', 'set_config', 'union'}
+)
+_ANCHOR_ALTERNATION = '|'.join(re.escape(w) for w in sorted(_ANCHOR_WORDS, key=len, reverse=True))
+# Matched against the lowercased query, which is several times faster than
+# IGNORECASE. Lowercasing alone disagrees with IGNORECASE on four non-ASCII
+# letters that match ASCII ones: U+0130 (which also lowercases to two
+# characters), U+0131, U+017F and U+212A. They are mapped to their ASCII
+# letter first, so positions line up and every anchor the IGNORECASE
+# patterns would match is found.
+_ANCHOR_RE = re.compile(r'\b(?:' + _ANCHOR_ALTERNATION + r')\b')
+_IGNORECASE_ASCII_FOLDS = str.maketrans(
+    {'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'}
+)
+_SELECT_RE = re.compile(r'(?i)\bselect\b')
+
+
+def _has_comment_injection(sql: str) -> bool:
+    """Linear equivalent of ``re.search(COMMENT_INJECTION_PATTERN, sql)``.
+
+    The regex ``'.*?--`` (no DOTALL) asks for a quote followed by ``--`` later
+    on the same line, but each quote restarts the lazy scan to the end of the
+    line, so a single-line bulk INSERT with many literals is O(n^2). Checking,
+    line by line, whether a ``--`` follows the first quote gives the same
+    answer in one pass.
     """
-    issues = []
+    line_start, n = 0, len(sql)
+    while line_start < n:
+        nl = sql.find('\n', line_start)
+        line_end = n if nl == -1 else nl
+        quote_at = sql.find("'", line_start, line_end)
+        if quote_at != -1 and sql.find('--', quote_at + 1, line_end) != -1:
+            return True
+        line_start = line_end + 1
+    return False
+
+
+def _issue(message: str) -> Dict[str, str]:
+    return {'type': 'sql', 'message': message, 'severity': 'high'}
 
+
+def _scan_sql(sql: str) -> SqlScanResult:
+    """Run every detector over one normalization of ``sql`` in a single pass."""
     # Canonicalize first: fold comments to whitespace and unwrap
     # double-quoted identifiers. A quoted spelling like "pg_sleep"(1) or a
     # comment wedged between tokens (INTO/**/OUTFILE, SET/**/row_security,
     # pg_sleep/**/(1)) is semantically identical to the plain form in
     # PostgreSQL but otherwise slips past the word-boundary / adjacency
-    # anchors below. All subsequent regex checks run on the
-    # normalized text; the original sql is preserved for messages.
+    # anchors below. All subsequent checks run on the normalized text; the
+    # original sql is preserved for messages.
     normalized_sql = normalize_for_detection(sql)
+    n = len(normalized_sql)
+
+    if normalized_sql.isascii():
+        lowered = normalized_sql.lower()
+    else:
+        lowered = normalized_sql.translate(_IGNORECASE_ASCII_FOLDS).lower()
+
+    mutating_keywords = set()
+    mutating_end = 0
+    guc_match = None
+    set_config_match = None
+    fn_match = None
+    suspicious = False
+    union_line_end = -1
+
+    for anchor in _ANCHOR_RE.finditer(lowered):
+        pos = anchor.start()
+        word = anchor.group(0)
+
+        if word in _MUTATING_ANCHORS and pos >= mutating_end:
+            m = MUTATING_PATTERN.match(normalized_sql, pos)
+            if m:
+                mutating_keywords.add(m.group(1).upper())
+                mutating_end = m.end()
+
+        if word == 'set':
+            if guc_match is None:
+                guc_match = SECURITY_GUC_PATTERN.match(normalized_sql, pos)
+        elif word == 'set_config':
+            if set_config_match is None:
+                set_config_match = _SET_CONFIG_AT.match(normalized_sql, pos)
+        elif word in _FUNCTION_ANCHORS:
+            if fn_match is None:
+                fn_match = _DANGEROUS_FUNCTION_AT.match(normalized_sql, pos)
+
+        if suspicious:
+            continue
+        if word == 'union':
+            # UNION followed by SELECT later on the same line. Only the first
+            # union of a line needs checking: a later one cannot find a
+            # select that the first one did not.
+            if pos > union_line_end:
+                nl = normalized_sql.find('\n', anchor.end())
+                union_line_end = n if nl == -1 else nl
+                if _SELECT_RE.search(normalized_sql, anchor.end(), union_line_end):
+                    suspicious = True
+            continue
+        for pattern in _SUSPICIOUS_BY_ANCHOR.get(word, ()):
+            if pattern.match(normalized_sql, pos):
+                suspicious = True
+                break
+
+    mutating = tuple(mutating_keywords)
 
     # COPY ... TO/FROM PROGRAM is server-side command execution.
     # COPY alone is gated in read-only mode as a mutating keyword, but the
     # PROGRAM form is RCE that must be rejected even with writes enabled.
     if COPY_PROGRAM_PATTERN.search(normalized_sql):
-        issues.append(
-            {
-                'type': 'sql',
-                'message': (
+        return SqlScanResult(
+            mutating,
+            (
+                _issue(
                     'COPY ... TO/FROM PROGRAM rejected: this executes an arbitrary '
                     'command on the database host (remote code execution) and is '
                     'blocked regardless of read/write mode.'
                 ),
-                'severity': 'high',
-            }
+            ),
         )
-        return issues
 
     # Security-GUC check first — these disable RLS / triggers and are
     # rejected in both read and write mode. Named explicitly so the
     # operator sees which GUC was blocked rather than a generic message.
-    guc_match = SECURITY_GUC_PATTERN.search(normalized_sql) or SECURITY_SET_CONFIG_PATTERN.search(
-        normalized_sql
-    )
+    guc_match = guc_match or set_config_match
     if guc_match:
-        issues.append(
-            {
-                'type': 'sql',
-                'message': (
+        return SqlScanResult(
+            mutating,
+            (
+                _issue(
                     f'Security-sensitive session setting rejected: {guc_match.group(1)}. '
                     'Changing this setting (via SET or set_config) disables a '
                     'data-access or integrity control (RLS / triggers) and is '
                     'blocked regardless of read/write mode.'
                 ),
-                'severity': 'high',
-            }
+            ),
         )
-        return issues
 
     # Dangerous-function check next so the rejection reason names the
     # specific function instead of one of the generic suspicious
     # patterns (e.g. pg_sleep would otherwise hit the 'sleep(' pattern
     # with a vaguer message).
-    fn_match = DANGEROUS_FUNCTION_PATTERN.search(normalized_sql)
     if fn_match:
-        issues.append(
-            {
-                'type': 'sql',
-                'message': (
+        return SqlScanResult(
+            mutating,
+            (
+                _issue(
                     f'Dangerous function call rejected: {fn_match.group(1)}. '
                     'This function has cluster-wide side effects (DoS, filesystem '
                     'access, server control) and is blocked regardless of read/write mode.'
                 ),
-                'severity': 'high',
-            }
+            ),
         )
-        return issues
 
     # Suspicious-pattern heuristics run against the normalized text, so a
     # keyword or semicolon that appears only inside a comment (which the
@@ -544,14 +719,54 @@ def check_sql_injection_risk(sql: str) -> list[dict]:
     # The comment-injection heuristic is the exception: a genuine trailing
     # -- is removed by normalization, so it is additionally tested against
     # the raw SQL.
-    flagged = any(re.search(pattern, normalized_sql) for pattern in SUSPICIOUS_PATTERNS)
-    flagged = flagged or bool(re.search(COMMENT_INJECTION_PATTERN, sql))
-    if flagged:
-        issues.append(
-            {
-                'type': 'sql',
-                'message': f'Suspicious pattern in query: {sql}',
-                'severity': 'high',
-            }
-        )
-    return issues
+    suspicious = (
+        suspicious
+        or any(pattern.search(normalized_sql) for pattern in _UNANCHORED_SUSPICIOUS)
+        or _has_comment_injection(normalized_sql)
+        or _has_comment_injection(sql)
+    )
+    if suspicious:
+        return SqlScanResult(mutating, (_issue(f'Suspicious pattern in query: {sql}'),))
+    return SqlScanResult(mutating, ())
+
+
+_scan_sql_cached = functools.lru_cache(maxsize=SCAN_CACHE_SIZE)(_scan_sql)
+
+
+def scan_sql(sql: str) -> SqlScanResult:
+    """Scan ``sql`` once for mutating keywords and injection risks.
+
+    Results for queries up to SCAN_CACHE_MAX_SQL_LENGTH characters are
+    memoized on the query text.
+
+    Args:
+        sql: query string
+
+    Returns:
+        SqlScanResult with every detection for the query
+    """
+    if len(sql) > SCAN_CACHE_MAX_SQL_LENGTH:
+        return _scan_sql(sql)
+    return _scan_sql_cached(sql)
+
+
+def detect_mutating_keywords(sql_text: str) -> list[str]:
+    """Return a list of mutating keywords found in the SQL.
+
+    The SQL is comment-normalized first so a comment wedged between the
+    words of a multi-word keyword (IMPORT/**/FOREIGN/**/SCHEMA) or before
+    a function paren cannot hide the keyword from the read-only gate.
+    """
+    return list(scan_sql(sql_text).mutating_keywords)
+
+
+def check_sql_injection_risk(sql: str) -> list[dict]:
+    """Check for potential SQL injection risks in sql query.
+
+    Args:
+        sql: query string
+
+    Returns:
+        dictionaries containing detected security issue
+    """
+    return [dict(issue) for issue in scan_sql(sql).issues]
@@ -19,6 +19,15 @@ import asyncio
 import json
 import sys
 import threading
+from awslabs.postgres_mcp_server.catalog_cache import (
+    DEFAULT_CATALOG_CACHE_TTL_SECONDS,
+    DEFAULT_CATALOG_REVALIDATE_SECONDS,
+    SCHEMA_DESCRIBE_SQL,
+    TABLE_CATALOG_VERSION_SQL,
+    TABLE_SCHEMA_SQL,
+    CatalogCache,
+    CatalogCacheMap,
+)
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
 from awslabs.postgres_mcp_server.connection.cp_api_connection import (
     DEFAULT_POSTGRES_PORT,
@@ -68,6 +77,13 @@ query_comment_prohibited_key = 'The comment in query is prohibited because of in
 query_injection_risk_key = 'Your query contains risky injection patterns'
 readonly_query = True
 
+# Per-connection cache of get_table_schema / describe_schema results, and a
+# cache of privilege-probe rows keyed by AbstractDBConnection.catalog_identity
+# so reconnecting to the same target as the same role does not re-probe.
+# Both are bounded by the --catalog_cache_ttl CLI arg (0 disables them).
+catalog_cache_map = CatalogCacheMap()
+privilege_cache = CatalogCache()
+
 # Least-privilege guardrail policy for post-connect validation.
 #   'warn' (default): log a warning but allow a connection whose Postgres role
 #       is a superuser or a member of rds_superuser. Chosen as the default so
@@ -216,9 +232,21 @@ async def validate_connection(db_connection: AbstractDBConnection, policy: str)
             raise ConnectionValidationError('Connectivity check failed: SELECT 1 did not succeed.')
         return
 
+    # Reuse a recent probe result for the same target and role (see
+    # AbstractDBConnection.catalog_identity). Connections without an identity
+    # are always probed.
+    identity = db_connection.catalog_identity
+    cached = privilege_cache.get(identity) if identity is not None else None
+
     try:
-        response = await db_connection.execute_query(POSTGRES_PRIVILEGE_QUERY)
-        rows = parse_execute_response(response)
+        if cached is not None:
+            logger.debug('Reusing cached role privilege probe result.')
+            rows = cached.value
+        else:
+            response = await db_connection.execute_query(POSTGRES_PRIVILEGE_QUERY)
+            rows = parse_execute_response(response)
+            if identity is not None and rows:
+                privilege_cache.put(identity, rows)
     except Exception as e:
         # A thrown error here means the probe query did not execute at all —
         # a genuine connectivity/auth failure, not merely an "unverifiable
@@ -397,8 +425,8 @@ async def run_query(
         await ctx.error(err)
         return [{'error': err}]
 
+    matches = detect_mutating_keywords(sql)
     if db_connection.readonly_query:
-        matches = detect_mutating_keywords(sql)
         if (bool)(matches):
             logger.info(
                 (
@@ -444,6 +472,13 @@ async def run_query(
         error_details = f'{type(e).__name__}: {str(e)}'
         await ctx.error(str({'message': error_details}))
         return [{'error': error_details}]
+    finally:
+        if matches:
+            # The statement may have changed tables, columns or role grants, even
+            # when it failed part way, so cached catalog and privilege probes of
+            # this connection can no longer be trusted.
+            catalog_cache_map.for_connection(db_connection).invalidate()
+            privilege_cache.invalidate()
 
 
 @mcp.tool(name='get_table_schema', description='Fetch table columns and comments from Postgres')
@@ -480,24 +515,45 @@ async def get_table_schema(
             ErrorData(code=INVALID_PARAMS, message=(f"Invalid table name: '{table_name}'. "))
         )
 
-    sql = """
-        SELECT
-            a.attname AS column_name,
-            pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-            col_description(a.attrelid, a.attnum) AS column_comment
-        FROM
-            pg_attribute a
-        WHERE
-            a.attrelid = to_regclass(:table_name)
-            AND a.attnum > 0
-            AND NOT a.attisdropped
-        ORDER BY a.attnum
-    """
-
     params = [{'name': 'table_name', 'value': {'stringValue': table_name}}]
 
-    return await run_query(
-        sql=sql,
+    db_connection = db_connection_map.get(
+        method=connection_method,
+        cluster_identifier=cluster_identifier,
+        db_endpoint=db_endpoint,
+        database=database,
+    )
+    cache = catalog_cache_map.for_connection(db_connection) if db_connection else None
+
+    if cache is not None:
+        entry = cache.get(table_name)
+        if entry is not None and cache.needs_revalidation(entry):
+            current_version = None
+            if entry.version is not None:
+                version_rows = await run_query(
+                    sql=TABLE_CATALOG_VERSION_SQL,
+                    ctx=ctx,
+                    connection_method=connection_method,
+                    cluster_identifier=cluster_identifier,
+                    db_endpoint=db_endpoint,
+                    database=database,
+                    query_parameters=params,
+                )
+                if version_rows:
+                    current_version = version_rows[0].get('catalog_version')
+            if current_version is not None and current_version == entry.version:
+                cache.mark_validated(table_name)
+            else:
+                logger.debug(f'get_table_schema: catalog changed for {table_name}, refetching')
+                cache.invalidate(table_name)
+                entry = None
+
+        if entry is not None:
+            logger.debug(f'get_table_schema: catalog cache hit for {table_name}')
+            return [dict(row) for row in entry.value]
+
+    rows = await run_query(
+        sql=TABLE_SCHEMA_SQL,
         ctx=ctx,
         connection_method=connection_method,
         cluster_identifier=cluster_identifier,
@@ -506,6 +562,110 @@ async def get_table_schema(
         query_parameters=params,
     )
 
+    # The catalog version rides along on every row; strip it from the result.
+    version = None
+    for row in rows:
+        if 'error' in row:
+            return rows
+        version = row.pop('catalog_version', None) or version
+
+    if cache is not None and rows:
+        cache.put(table_name, [dict(row) for row in rows], version)
+
+    return rows
+
+
+@mcp.tool(
+    name='describe_schema',
+    description=(
+        'Fetch columns, comments and indexes of every table in a Postgres schema in one query'
+    ),
+)
+async def describe_schema(
+    connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
+    cluster_identifier: Annotated[str, Field(description='Cluster identifier')],
+    db_endpoint: Annotated[str, Field(description='database endpoint')],
+    database: Annotated[str, Field(description='database name')],
+    ctx: Context,
+    schema_name: Annotated[str, Field(description='name of the schema')] = 'public',
+) -> list[dict]:
+    """Describe every table, view and materialized view in a schema.
+
+    Fetches all tables of the schema in a single catalog query and fills the
+    catalog cache, so subsequent get_table_schema calls for
+    ``<schema>.<table>`` are answered without a round-trip.
+
+    Args:
+        connection_method: connection method
+        cluster_identifier: Cluster identifier
+        db_endpoint: database endpoint
+        database: database name
+        ctx: MCP context for logging and state management
+        schema_name: name of the schema
+
+    Returns:
+        List of dictionary, one per table, with its comment, columns and index definitions
+    """
+    logger.info(
+        (
+            f'Entered describe_schema: schema_name:{schema_name} connection_method:{connection_method}, '
+            f'cluster_identifier:{cluster_identifier}, db_endpoint:{db_endpoint}, database:{database}'
+        )
+    )
+
+    if not schema_name or not schema_name.strip():
+        raise McpError(
+            ErrorData(code=INVALID_PARAMS, message=(f"Invalid schema name: '{schema_name}'. "))
+        )
+
+    rows = await run_query(
+        sql=SCHEMA_DESCRIBE_SQL,
+        ctx=ctx,
+        connection_method=connection_method,
+        cluster_identifier=cluster_identifier,
+        db_endpoint=db_endpoint,
+        database=database,
+        query_parameters=[{'name': 'schema_name', 'value': {'stringValue': schema_name}}],
+    )
+    if rows and 'error' in rows[0]:
+        return rows
+
+    tables: Dict[str, dict] = {}
+    versions: Dict[str, Optional[str]] = {}
+    for row in rows:
+        key = row.get('table_key')
+        table = tables.get(key)
+        if table is None:
+            indexes = row.get('index_definitions')
+            table = {
+                'table_name': row.get('table_name'),
+                'table_comment': row.get('table_comment'),
+                'columns': [],
+                'indexes': indexes.split('\n') if indexes else [],
+            }
+            tables[key] = table
+            versions[key] = row.get('catalog_version')
+        table['columns'].append(
+            {
+                'column_name': row.get('column_name'),
+                'data_type': row.get('data_type'),
+                'column_comment': row.get('column_comment'),
+            }
+        )
+
+    db_connection = db_connection_map.get(
+        method=connection_method,
+        cluster_identifier=cluster_identifier,
+        db_endpoint=db_endpoint,
+        database=database,
+    )
+    if db_connection:
+        cache = catalog_cache_map.for_connection(db_connection)
+        for key, table in tables.items():
+            cache.put(key, [dict(column) for column in table['columns']], versions[key])
+
+    return list(tables.values())
+
 
 @mcp.tool(
     name='connect_to_database',
@@ -1367,6 +1527,17 @@ def main():
     parser.add_argument(
         '--allow_write_query', action='store_true', help='Enforce readonly SQL statements'
     )
+    parser.add_argument(
+        '--catalog_cache_ttl',
+        type=int,
+        default=DEFAULT_CATALOG_CACHE_TTL_SECONDS,
+        help=(
+            'Seconds that table schema lookups and role privilege probes are cached '
+            f'(default: {DEFAULT_CATALOG_CACHE_TTL_SECONDS}). Cached table schemas are '
+            f're-checked against the catalog every {DEFAULT_CATALOG_REVALIDATE_SECONDS} '
+            'seconds. 0 disables the cache.'
+        ),
+    )
     parser.add_argument('--database', help='Database name')
     parser.add_argument('--port', type=int, default=5432, help='Database port (default: 5432)')
     parser.add_argument(
@@ -1440,12 +1611,16 @@ def main():
         f'allow_write_query:{args.allow_write_query}\n'
         f'database:{args.database}\n'
         f'port:{args.port}\n'
+        f'catalog_cache_ttl:{args.catalog_cache_ttl}\n'
         f'secret_arn entries: {len(secret_arn_map)} per-target, '
         f'default={"set" if default_secret_arn else "unset"}\n'
     )
 
     readonly_query = not args.allow_write_query
     privilege_check_policy = args.privilege_check
+    catalog_cache_map.configure(args.catalog_cache_ttl, DEFAULT_CATALOG_REVALIDATE_SECONDS)
+    privilege_cache.ttl_seconds = args.catalog_cache_ttl
+    privilege_cache.invalidate()
     configured_secret_arns.clear()
     configured_secret_arns.update(secret_arn_map)
     configured_default_secret_arn = default_secret_arn
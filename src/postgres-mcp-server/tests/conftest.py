@@ -4,6 +4,26 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 
+def pytest_addoption(parser):
+    """Add the --run-benchmarks option."""
+    parser.addoption(
+        '--run-benchmarks',
+        action='store_true',
+        default=False,
+        help='run the wall-clock tests marked benchmark',
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests, whose timings depend on the machine, unless asked for."""
+    if config.getoption('--run-benchmarks'):
+        return
+    skip_benchmark = pytest.mark.skip(reason='benchmark, use --run-benchmarks to run')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 class MockException(Enum):
     """Mock exception type."""
 
@@ -0,0 +1,448 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the catalog metadata cache and its use by the server tools."""
+
+import pytest
+from awslabs.postgres_mcp_server.catalog_cache import (
+    SCHEMA_DESCRIBE_SQL,
+    TABLE_CATALOG_VERSION_SQL,
+    TABLE_SCHEMA_SQL,
+    CatalogCache,
+    CatalogCacheMap,
+)
+from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from awslabs.postgres_mcp_server.connection.db_connection_map import ConnectionMethod
+from awslabs.postgres_mcp_server.mutable_sql_detector import (
+    check_sql_injection_risk,
+    detect_mutating_keywords,
+)
+from awslabs.postgres_mcp_server.server import (
+    POSTGRES_PRIVILEGE_QUERY,
+    PRIVILEGE_CHECK_ENFORCE,
+    DummyCtx,
+    catalog_cache_map,
+    db_connection_map,
+    describe_schema,
+    get_table_schema,
+    privilege_cache,
+    run_query,
+    validate_connection,
+)
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def response(columns: List[str], rows: List[List[Any]]) -> dict:
+    """Build an execute_query response from plain values."""
+
+    def cell(value):
+        if value is None:
+            return {'isNull': True}
+        if isinstance(value, bool):
+            return {'booleanValue': value}
+        return {'stringValue': value}
+
+    return {
+        'columnMetadata': [{'name': c} for c in columns],
+        'records': [[cell(v) for v in row] for row in rows],
+    }
+
+
+def schema_response(version: Optional[str], columns=(('id', 'integer'), ('name', 'text'))):
+    """Response for TABLE_SCHEMA_SQL."""
+    return response(
+        ['column_name', 'data_type', 'column_comment', 'catalog_version'],
+        [[name, data_type, None, version] for name, data_type in columns],
+    )
+
+
+def version_response(version: Optional[str]):
+    """Response for TABLE_CATALOG_VERSION_SQL."""
+    return response(['catalog_version'], [[version]])
+
+
+class ScriptedConnection(AbstractDBConnection):
+    """Connection returning scripted responses keyed by SQL text."""
+
+    def __init__(self, identity=None):
+        """Initialize with an optional catalog identity."""
+        super().__init__(readonly=True)
+        self.responses: Dict[str, List[dict]] = {}
+        self.queries: List[str] = []
+        self.identity = identity
+
+    @property
+    def catalog_identity(self):
+        """Return the configured identity."""
+        return self.identity
+
+    def script(self, sql: str, *responses: dict) -> None:
+        """Queue responses for ``sql``."""
+        self.responses.setdefault(sql, []).extend(responses)
+
+    async def execute_query(
+        self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Pop the next scripted response for ``sql``."""
+        self.queries.append(sql)
+        return self.responses[sql].pop(0)
+
+    async def close(self) -> None:
+        """No-op."""
+
+    async def check_connection_health(self) -> bool:
+        """Always healthy."""
+        return True
+
+
+@pytest.fixture
+def connection():
+    """Register a ScriptedConnection with a controllable cache clock."""
+    conn = ScriptedConnection()
+    db_connection_map.set(ConnectionMethod.RDS_API, 'cache-cluster', 'cache-endpoint', 'db', conn)
+    clock = FakeClock()
+    cache = catalog_cache_map.for_connection(conn)
+    cache._clock = clock
+    yield conn, clock
+    db_connection_map.remove_connection(conn)
+
+
+async def call_get_table_schema(table_name='public.users'):
+    """Invoke get_table_schema against the fixture connection."""
+    return await get_table_schema(
+        ConnectionMethod.RDS_API, 'cache-cluster', 'cache-endpoint', 'db', table_name, DummyCtx()
+    )
+
+
+class TestCatalogCache:
+    """Unit tests for CatalogCache."""
+
+    def test_ttl_expiry(self):
+        """Entries disappear once the TTL has elapsed."""
+        clock = FakeClock()
+        cache = CatalogCache(ttl_seconds=10, revalidate_seconds=5, clock=clock)
+        cache.put('k', [1], 'v1')
+        clock.now = 9.9
+        assert cache.get('k').value == [1]
+        clock.now = 10
+        assert cache.get('k') is None
+        assert len(cache) == 0
+
+    def test_revalidation_window(self):
+        """needs_revalidation flips after the interval and resets on mark_validated."""
+        clock = FakeClock()
+        cache = CatalogCache(ttl_seconds=100, revalidate_seconds=5, clock=clock)
+        cache.put('k', [1], 'v1')
+        assert not cache.needs_revalidation(cache.get('k'))
+        clock.now = 5
+        assert cache.needs_revalidation(cache.get('k'))
+        cache.mark_validated('k')
+        assert not cache.needs_revalidation(cache.get('k'))
+
+    def test_disabled(self):
+        """A zero TTL stores nothing."""
+        cache = CatalogCache(ttl_seconds=0)
+        cache.put('k', [1])
+        assert cache.get('k') is None
+
+    def test_invalidate(self):
+        """Invalidating drops one key or everything."""
+        cache = CatalogCache()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.invalidate('a')
+        assert cache.get('a') is None and cache.get('b') is not None
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_map_is_per_connection(self):
+        """Each connection gets its own cache, reused on later lookups."""
+        cache_map = CatalogCacheMap()
+        a, b = ScriptedConnection(), ScriptedConnection()
+        assert cache_map.for_connection(a) is cache_map.for_connection(a)
+        assert cache_map.for_connection(a) is not cache_map.for_connection(b)
+
+    def test_catalog_sql_passes_guardrails(self):
+        """The catalog queries must not trip the read-only or injection checks."""
+        for sql in (TABLE_SCHEMA_SQL, TABLE_CATALOG_VERSION_SQL, SCHEMA_DESCRIBE_SQL):
+            assert detect_mutating_keywords(sql) == []
+            assert check_sql_injection_risk(sql) == []
+
+
+class TestGetTableSchemaCache:
+    """get_table_schema answers repeat lookups from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_revalidate_window(self, connection):
+        """A second call inside the window costs no query and hides catalog_version."""
+        conn, _ = connection
+        conn.script(TABLE_SCHEMA_SQL, schema_response('v1'))
+
+        first = await call_get_table_schema()
+        second = await call_get_table_schema()
+
+        assert first == second
+        assert [r['column_name'] for r in first] == ['id', 'name']
+        assert all('catalog_version' not in r for r in first)
+        assert conn.queries == [TABLE_SCHEMA_SQL]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_revalidates(self, connection):
+        """After the window only the cheap version query runs when nothing changed."""
+        conn, clock = connection
+        conn.script(TABLE_SCHEMA_SQL, schema_response('v1'))
+        conn.script(TABLE_CATALOG_VERSION_SQL, version_response('v1'))
+
+        await call_get_table_schema()
+        clock.now = 60
+        result = await call_get_table_schema()
+
+        assert [r['column_name'] for r in result] == ['id', 'name']
+        assert conn.queries == [TABLE_SCHEMA_SQL, TABLE_CATALOG_VERSION_SQL]
+
+    @pytest.mark.asyncio
+    async def test_changed_version_refetches(self, connection):
+        """A DDL change (new catalog version) triggers a refetch."""
+        conn, clock = connection
+        conn.script(
+            TABLE_SCHEMA_SQL,
+            schema_response('v1'),
+            schema_response('v2', columns=(('id', 'bigint'),)),
+        )
+        conn.script(TABLE_CATALOG_VERSION_SQL, version_response('v2'))
+
+        await call_get_table_schema()
+        clock.now = 60
+        result = await call_get_table_schema()
+
+        assert result == [{'column_name': 'id', 'data_type': 'bigint', 'column_comment': None}]
+        assert conn.queries == [TABLE_SCHEMA_SQL, TABLE_CATALOG_VERSION_SQL, TABLE_SCHEMA_SQL]
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_refetches(self, connection):
+        """Past the TTL the entry is re-fetched without a version check."""
+        conn, clock = connection
+        conn.script(TABLE_SCHEMA_SQL, schema_response('v1'), schema_response('v1'))
+
+        await call_get_table_schema()
+        clock.now = 10_000
+        await call_get_table_schema()
+
+        assert conn.queries == [TABLE_SCHEMA_SQL, TABLE_SCHEMA_SQL]
+
+    @pytest.mark.asyncio
+    async def test_caller_cannot_mutate_cache(self, connection):
+        """Returned rows are copies of the cached ones."""
+        conn, _ = connection
+        conn.script(TABLE_SCHEMA_SQL, schema_response('v1'))
+
+        first = await call_get_table_schema()
+        first[0]['column_name'] = 'tampered'
+        second = await call_get_table_schema()
+
+        assert second[0]['column_name'] == 'id'
+
+
+class TestRunQueryInvalidation:
+    """run_query drops cached catalog and privilege probes after mutating SQL."""
+
+    @staticmethod
+    async def call_run_query(sql: str):
+        """Invoke run_query against the fixture connection."""
+        return await run_query(
+            sql, DummyCtx(), ConnectionMethod.RDS_API, 'cache-cluster', 'cache-endpoint', 'db'
+        )
+
+    @pytest.mark.asyncio
+    async def test_ddl_invalidates_caches(self, connection):
+        """An ALTER TABLE forces the next lookup to refetch the schema."""
+        conn, _ = connection
+        conn._readonly = False
+        alter = 'ALTER TABLE public.users ALTER COLUMN id TYPE bigint'
+        conn.script(
+            TABLE_SCHEMA_SQL,
+            schema_response('v1'),
+            schema_response('v2', columns=(('id', 'bigint'),)),
+        )
+        conn.script(alter, response([], []))
+        privilege_cache.put(('rdsapi', 'arn:cluster', 'arn:secret', 'ddl-db'), [])
+
+        await call_get_table_schema()
+        await self.call_run_query(alter)
+        result = await call_get_table_schema()
+
+        assert result == [{'column_name': 'id', 'data_type': 'bigint', 'column_comment': None}]
+        assert conn.queries == [TABLE_SCHEMA_SQL, alter, TABLE_SCHEMA_SQL]
+        assert len(privilege_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_select_keeps_caches(self, connection):
+        """A read-only query leaves the cached schema in place."""
+        conn, _ = connection
+        select = 'SELECT id FROM public.users'
+        conn.script(TABLE_SCHEMA_SQL, schema_response('v1'))
+        conn.script(select, response(['id'], [['1']]))
+
+        await call_get_table_schema()
+        await self.call_run_query(select)
+        await call_get_table_schema()
+
+        assert conn.queries == [TABLE_SCHEMA_SQL, select]
+
+
+class TestDescribeSchema:
+    """describe_schema groups rows per table and fills the cache."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_fill(self, connection):
+        """One query describes the schema and later lookups are cache hits."""
+        conn, _ = connection
+        conn.script(
+            SCHEMA_DESCRIBE_SQL,
+            response(
+                [
+                    'table_key',
+                    'table_name',
+                    'table_comment',
+                    'index_definitions',
+                    'catalog_version',
+                    'column_name',
+                    'data_type',
+                    'column_comment',
+                ],
+                [
+                    [
+                        'public.orders',
+                        'orders',
+                        None,
+                        None,
+                        'vo',
+                        'id',
+                        'integer',
+                        None,
+                    ],
+                    [
+                        'public.users',
+                        'users',
+                        'people',
+                        'CREATE UNIQUE INDEX a ON public.users USING btree (id)\n'
+                        'CREATE INDEX b ON public.users USING btree (name)',
+                        'vu',
+                        'id',
+                        'integer',
+                        'pk',
+                    ],
+                    [
+                        'public.users',
+                        'users',
+                        'people',
+                        'CREATE UNIQUE INDEX a ON public.users USING btree (id)\n'
+                        'CREATE INDEX b ON public.users USING btree (name)',
+                        'vu',
+                        'name',
+                        'text',
+                        None,
+                    ],
+                ],
+            ),
+        )
+
+        tables = await describe_schema(
+            ConnectionMethod.RDS_API, 'cache-cluster', 'cache-endpoint', 'db', DummyCtx()
+        )
+
+        assert [t['table_name'] for t in tables] == ['orders', 'users']
+        users = tables[1]
+        assert users['table_comment'] == 'people'
+        assert len(users['indexes']) == 2
+        assert [c['column_name'] for c in users['columns']] == ['id', 'name']
+
+        result = await call_get_table_schema('public.users')
+        assert result == users['columns']
+        assert conn.queries == [SCHEMA_DESCRIBE_SQL]
+
+    @pytest.mark.asyncio
+    async def test_error_passthrough(self):
+        """Without a connection the run_query error is returned as-is."""
+        result = await describe_schema(
+            ConnectionMethod.RDS_API, 'missing', 'missing', 'db', DummyCtx()
+        )
+        assert 'error' in result[0]
+
+
+class TestPrivilegeCache:
+    """validate_connection reuses probe results per catalog identity."""
+
+    @pytest.mark.asyncio
+    async def test_same_identity_probes_once(self):
+        """A second connection with the same identity reuses the probe result."""
+        ok = response(
+            ['is_superuser', 'is_bypassrls', 'is_rds_superuser'], [[False, False, False]]
+        )
+        identity = ('rdsapi', 'arn:cluster', 'arn:secret', 'cache-test-db')
+        first, second = ScriptedConnection(identity), ScriptedConnection(identity)
+        first.script(POSTGRES_PRIVILEGE_QUERY, ok)
+        privilege_cache.invalidate()
+
+        await validate_connection(first, PRIVILEGE_CHECK_ENFORCE)
+        await validate_connection(second, PRIVILEGE_CHECK_ENFORCE)
+
+        assert first.queries == [POSTGRES_PRIVILEGE_QUERY]
+        assert second.queries == []
+        assert second.effective_is_over_privileged is False
+        privilege_cache.invalidate()
+
+    @pytest.mark.asyncio
+    async def test_no_identity_always_probes(self):
+        """Connections without an identity are never served from the cache."""
+        ok = response(
+            ['is_superuser', 'is_bypassrls', 'is_rds_superuser'], [[False, False, False]]
+        )
+        conn = ScriptedConnection()
+        conn.script(POSTGRES_PRIVILEGE_QUERY, ok, ok)
+
+        await validate_connection(conn, PRIVILEGE_CHECK_ENFORCE)
+        await validate_connection(conn, PRIVILEGE_CHECK_ENFORCE)
+
+        assert conn.queries == [POSTGRES_PRIVILEGE_QUERY, POSTGRES_PRIVILEGE_QUERY]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_probes(self):
+        """With a zero TTL every connection is probed."""
+        ok = response(
+            ['is_superuser', 'is_bypassrls', 'is_rds_superuser'], [[False, False, False]]
+        )
+        identity = ('rdsapi', 'arn:cluster', 'arn:secret', 'cache-test-db-2')
+        first, second = ScriptedConnection(identity), ScriptedConnection(identity)
+        first.script(POSTGRES_PRIVILEGE_QUERY, ok)
+        second.script(POSTGRES_PRIVILEGE_QUERY, ok)
+
+        with patch.object(privilege_cache, 'ttl_seconds', 0):
+            await validate_connection(first, PRIVILEGE_CHECK_ENFORCE)
+            await validate_connection(second, PRIVILEGE_CHECK_ENFORCE)
+
+        assert second.queries == [POSTGRES_PRIVILEGE_QUERY]
@@ -24,10 +24,13 @@ import pytest
 from awslabs.postgres_mcp_server.mutable_sql_detector import (
     DANGEROUS_FUNCTIONS,
     MUTATING_KEYWORDS,
+    SCAN_CACHE_MAX_SQL_LENGTH,
     SECURITY_SENSITIVE_GUCS,
+    _scan_sql_cached,
     check_sql_injection_risk,
     detect_mutating_keywords,
     normalize_for_detection,
+    scan_sql,
     strip_quoted_identifiers,
     strip_sql_comments,
 )
@@ -1259,3 +1262,125 @@ class TestKnownFalsePositives:
         """
         issues = check_sql_injection_risk("SELECT q FROM t WHERE q = 'SELECT pg_sleep(1)'")
         assert len(issues) >= 1
+
+
+def _bulk_insert(rows: int) -> str:
+    """Generate an INSERT ... VALUES statement with quotes, escapes and `$`."""
+    return 'INSERT INTO t (id, name, note) VALUES ' + ', '.join(
+        f"({i}, 'name{i}', 'it''s \"q{i}\" $x')" for i in range(rows)
+    )
+
+
+class TestScannerPerformance:
+    """The single-pass scanner must stay linear and memoize repeat queries.
+
+    The previous implementation re-sliced the remaining SQL at every `$` and
+    ran a ``'.*?--`` regex, so a multi-MB bulk INSERT never finished.
+    """
+
+    def test_multi_megabyte_insert_is_scanned(self):
+        """A ~2 MB bulk INSERT, which never finished before, is scanned correctly."""
+        sql = _bulk_insert(50_000)
+        assert len(sql) > 2_000_000
+        assert detect_mutating_keywords(sql) == ['INSERT']
+        assert check_sql_injection_risk(sql) == []
+
+    @pytest.mark.benchmark
+    def test_multi_megabyte_insert_scans_quickly(self):
+        """A ~2 MB bulk INSERT is scanned in well under the old timeout."""
+        import time
+
+        sql = _bulk_insert(50_000)
+        start = time.perf_counter()
+        detect_mutating_keywords(sql)
+        check_sql_injection_risk(sql)
+        elapsed = time.perf_counter() - start
+        assert elapsed < 10.0, f'2 MB INSERT too slow ({elapsed:.2f}s)'
+
+    @pytest.mark.benchmark
+    def test_scan_time_scales_linearly(self):
+        """Quadrupling the input must not do much worse than quadruple the time."""
+        import time
+
+        def best_of(sql, runs=3):
+            best = float('inf')
+            for _ in range(runs):
+                start = time.perf_counter()
+                strip_sql_comments(sql)
+                check_sql_injection_risk(sql)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        small = best_of(_bulk_insert(5_000))
+        large = best_of(_bulk_insert(20_000))
+        # Quadratic behaviour would give a ratio near 16.
+        assert large / small < 8, f'{small:.3f}s -> {large:.3f}s is not linear'
+
+    def test_repeat_queries_hit_the_cache(self):
+        """Identical SQL is scanned once; later calls come from the LRU cache."""
+        _scan_sql_cached.cache_clear()
+        sql = 'SELECT id FROM cache_probe WHERE x = 1'
+        detect_mutating_keywords(sql)
+        check_sql_injection_risk(sql)
+        scan_sql(sql)
+        info = _scan_sql_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_oversized_queries_are_not_cached(self):
+        """Bulk payloads above SCAN_CACHE_MAX_SQL_LENGTH bypass the cache."""
+        _scan_sql_cached.cache_clear()
+        sql = _bulk_insert(5_000)
+        assert len(sql) > SCAN_CACHE_MAX_SQL_LENGTH
+        scan_sql(sql)
+        scan_sql(sql)
+        assert _scan_sql_cached.cache_info().currsize == 0
+
+    def test_mutating_returned_results_does_not_poison_cache(self):
+        """Callers get fresh lists/dicts, never the cached tuples."""
+        sql = 'SELECT 1 UNION SELECT pg_sleep(1) -- x'
+        issues = check_sql_injection_risk(sql)
+        assert issues
+        issues[0]['message'] = 'tampered'
+        issues.clear()
+        assert check_sql_injection_risk(sql)
+        assert all(i['message'] != 'tampered' for i in check_sql_injection_risk(sql))
+
+        keywords = detect_mutating_keywords('DELETE FROM t')
+        keywords.append('BOGUS')
+        assert detect_mutating_keywords('DELETE FROM t') == ['DELETE']
+
+
+class TestIgnoreCaseOnlyLetters:
+    """Non-ASCII letters that match ASCII ones only under IGNORECASE.
+
+    The scanner finds keyword anchors in the lowercased query, but U+017F
+    (long s), U+0131 (dotless i), U+0130 (dotted capital I) and U+212A
+    (Kelvin sign) match ASCII letters under re.IGNORECASE without lowercasing
+    to them. They must be detected exactly like the ASCII spelling.
+    """
+
+    @pytest.mark.parametrize(
+        'sql,expected',
+        [
+            ('ſet search_path = public', ['SET']),
+            ('dıscard all', ['DISCARD']),
+            ('DİSCARD ALL', ['DİSCARD']),
+        ],
+    )
+    def test_mutating_keywords(self, sql, expected):
+        """Session-state keywords spelled with fold-only letters are mutating."""
+        assert detect_mutating_keywords(sql) == expected
+
+    @pytest.mark.parametrize(
+        'sql',
+        [
+            'ſET row_security = off',
+            'SELECT pg_ſleep(1)',
+            'SELECT 1 UNİON SELECT 2',
+            'SELECT pg_terminate_bacKend(1)',
+        ],
+    )
+    def test_injection_risks(self, sql):
+        """Security checks anchored on fold-only letters still reject the query."""
+        assert check_sql_injection_risk(sql)
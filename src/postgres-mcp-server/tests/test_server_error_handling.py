@@ -115,6 +115,7 @@ class TestConnectToDatabaseErrorHandling:
     async def test_connect_to_database_success(self):
         """Test connect_to_database success path."""
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_response = {
             'connection_method': 'rdsapi',
             'cluster_identifier': 'test-cluster',
@@ -247,6 +248,7 @@ class TestConnectToDatabaseErrorHandling:
         # reports a superuser role, which validate_connection rejects under the
         # 'enforce' policy (patched below, since the default is now 'warn').
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -333,6 +335,7 @@ class TestConnectToDatabaseErrorHandling:
 
         # execute_query reports a superuser role -> rejected under 'enforce'.
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -408,6 +411,7 @@ class TestConnectToDatabaseErrorHandling:
         mask the original rejection or leave the connection reachable.
         """
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -593,6 +597,7 @@ class TestConnectToDatabaseErrorHandling:
         database = 'testdb'
 
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -659,6 +664,7 @@ class TestConnectToDatabaseErrorHandling:
         database = 'testdb'
 
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -729,6 +735,7 @@ class TestConnectToDatabaseErrorHandling:
         database = 'testdb'
 
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -798,6 +805,7 @@ class TestConnectToDatabaseErrorHandling:
         database = 'testdb'
 
         mock_connection = MagicMock()
+        mock_connection.catalog_identity = None
         mock_connection.execute_query = AsyncMock(
             return_value={
                 'columnMetadata': [
@@ -22,7 +22,19 @@ CLIENT_USER_AGENT_NAME = 'awslabs/mcp/redshift-mcp-server'
 DEFAULT_LOG_LEVEL = 'WARNING'
 QUERY_TIMEOUT = 3600
 QUERY_POLL_INTERVAL = 1
+# The first status poll of a statement comes after this many seconds; later polls
+# back off by STATEMENT_POLL_BACKOFF up to QUERY_POLL_INTERVAL.
+STATEMENT_FIRST_POLL_INTERVAL = 0.1
+STATEMENT_POLL_BACKOFF = 2.0
 SESSION_KEEPALIVE = 600
+# How long discover_clusters results are reused before the control plane is asked again.
+CLUSTER_CACHE_TTL = 60
+# How long database, schema, table and column discovery results are reused.
+METADATA_CACHE_TTL = 300
+# Rows returned by fetch_query_results when the caller sets no max_rows.
+FETCH_QUERY_RESULTS_DEFAULT_MAX_ROWS = 1000
+# Maximum number of review_cluster signal queries in flight at once.
+REVIEW_MAX_CONCURRENCY = 5
 
 # SQL discovery commands. Results are read positionally; {placeholders} are
 # filled with quoted identifiers by the caller.
@@ -31,6 +43,17 @@ SCHEMAS_SQL = 'SHOW SCHEMAS FROM DATABASE {database};'
 TABLES_SQL = 'SHOW TABLES FROM SCHEMA {database}.{schema};'
 COLUMNS_SQL = 'SHOW COLUMNS FROM TABLE {database}.{schema}.{table};'
 
+# Columns of every table in a schema in one query; the select list matches the
+# SHOW COLUMNS result so both parse into RedshiftColumn. Bound with :database and
+# :schema parameters.
+SCHEMA_COLUMNS_SQL = (
+    'SELECT database_name, schema_name, table_name, column_name, ordinal_position, '
+    'column_default, is_nullable, data_type, character_maximum_length, numeric_precision, '
+    'numeric_scale, remarks FROM svv_all_columns '
+    'WHERE database_name = :database AND schema_name = :schema '
+    'ORDER BY table_name, ordinal_position;'
+)
+
 # SQL guardrails
 
 # Read-only guard limits and deny-list (used by sql_guard.py; sqlglot AST-based).
@@ -157,3 +157,8 @@ class QueryResult(BaseModel):
     rows: list[list] = Field(..., description='List of rows, where each row is a list of values')
     row_count: int = Field(..., description='Number of rows returned')
     query_id: str = Field(..., description='Unique identifier for the query execution')
+    next_token: Optional[str] = Field(
+        None,
+        description='Continuation token for the remaining rows when the result was cut off by '
+        'max_rows; pass it to fetch_query_results. None when all rows were returned',
+    )
@@ -15,8 +15,16 @@
 """AWS client management for Redshift MCP Server."""
 
 import asyncio
+import base64
+import binascii
 import boto3
+import csv
+import hashlib
+import hmac
+import io
+import json
 import os
+import secrets
 import time
 from awslabs.redshift_mcp_server import __version__
 from awslabs.redshift_mcp_server.consts import (
@@ -24,10 +32,14 @@ from awslabs.redshift_mcp_server.consts import (
     CLIENT_READ_TIMEOUT,
     CLIENT_RETRIES,
     CLIENT_USER_AGENT_NAME,
+    CLUSTER_CACHE_TTL,
     COLUMNS_SQL,
     DATABASES_SQL,
+    FETCH_QUERY_RESULTS_DEFAULT_MAX_ROWS,
+    METADATA_CACHE_TTL,
     QUERY_POLL_INTERVAL,
     QUERY_TIMEOUT,
+    SCHEMA_COLUMNS_SQL,
     SCHEMAS_SQL,
     SESSION_KEEPALIVE,
     TABLES_SQL,
@@ -41,10 +53,15 @@ from awslabs.redshift_mcp_server.models import (
     RedshiftTable,
 )
 from awslabs.redshift_mcp_server.sql_guard import assert_executable
+from awslabs.redshift_mcp_server.statement_waiter import StatementWaiter
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from loguru import logger
 from sqlglot import exp
+from typing import Any, AsyncIterator, Callable, Literal
+
+
+ResultFormat = Literal['JSON', 'CSV']
 
 
 def _sql_identifier(value: str) -> str:
@@ -216,7 +233,7 @@ class RedshiftSessionManager:
 
         # Get session ID from the response
         data_client = client_manager.redshift_data_client()
-        status_response = data_client.describe_statement(Id=statement_id)
+        status_response = await asyncio.to_thread(data_client.describe_statement, Id=statement_id)
         session_id = status_response['SessionId']
 
         logger.debug(f'Created session with application name: {session_id}')
@@ -234,6 +251,70 @@ class RedshiftSessionManager:
         return (time.time() - session_info['created_at']) > self._session_keepalive
 
 
+class RedshiftMetadataCache:
+    """Hierarchical cache of discovery results.
+
+    Entries are keyed by their position in the cluster -> database -> schema ->
+    table hierarchy:
+
+    - () holds the cluster list,
+    - (cluster,) the databases of a cluster,
+    - (cluster, database) the schemas of a database,
+    - (cluster, database, schema) the tables of a schema,
+    - (cluster, database, schema, table) the columns of a table.
+
+    Every discovery statement costs a Data API submit and poll round trip, and
+    every statement looks its cluster up, so results are reused for a while.
+    Invalidating a path drops everything below it as well.
+
+    Schemas whose columns were prefetched in one query are remembered separately,
+    so a table the prefetch did not cover does not trigger it again.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize an empty cache.
+
+        Args:
+            clock: Monotonic time source (overridable in tests).
+        """
+        self._clock = clock
+        self._entries: dict[tuple[str, ...], tuple[float, list]] = {}
+        self._prefetched: dict[tuple[str, ...], float] = {}
+
+    def get(self, path: tuple[str, ...], max_age: float) -> list | None:
+        """Return the entry at path if it is younger than max_age seconds, else None."""
+        entry = self._entries.get(path)
+        if entry is None or self._clock() - entry[0] >= max_age:
+            return None
+        return list(entry[1])
+
+    def put(self, path: tuple[str, ...], value: list) -> None:
+        """Store a fresh discovery result at path."""
+        self._entries[path] = (self._clock(), list(value))
+
+    def mark_prefetched(self, path: tuple[str, ...]) -> None:
+        """Record that the columns of the schema at path were just prefetched."""
+        self._prefetched[path] = self._clock()
+
+    def was_prefetched(self, path: tuple[str, ...], max_age: float) -> bool:
+        """Whether the schema at path was prefetched less than max_age seconds ago."""
+        prefetched_at = self._prefetched.get(path)
+        return prefetched_at is not None and self._clock() - prefetched_at < max_age
+
+    def invalidate(self, path: tuple[str, ...] = ()) -> None:
+        """Drop the entry at path and every entry below it."""
+        depth = len(path)
+        for key in [key for key in self._entries if key[:depth] == path]:
+            del self._entries[key]
+        for key in [key for key in self._prefetched if key[:depth] == path]:
+            del self._prefetched[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._prefetched.clear()
+
+
 async def _execute_protected_statement(
     cluster_identifier: str,
     database_name: str,
@@ -241,6 +322,64 @@ async def _execute_protected_statement(
     parameters: list[dict] | None = None,
     allow_read_write: bool = False,
 ) -> tuple[dict, str]:
+    """Execute a SQL statement in a protected fashion and fetch its complete result.
+
+    Runs the statement via _run_protected_statement, then follows NextToken across
+    every GetStatementResult page. Suited to the bounded metadata queries issued by
+    the discover_* functions; execute_query reads results page by page instead.
+
+    Args:
+        cluster_identifier: The cluster identifier to query.
+        database_name: The database to execute the query against.
+        sql: The SQL statement to execute.
+        parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
+        allow_read_write: Indicates if read-write mode should be activated.
+
+    Returns:
+        Tuple containing:
+        - Dictionary shaped like a get_statement_result response, with the Records
+          of all pages.
+        - String with the query_id.
+
+    Raises:
+        Exception: If cluster not found, query fails, or times out.
+    """
+    user_query_id, has_result_set = await _run_protected_statement(
+        cluster_identifier=cluster_identifier,
+        database_name=database_name,
+        sql=sql,
+        parameters=parameters,
+        allow_read_write=allow_read_write,
+    )
+
+    # Only fetch results when the statement produced a result set (e.g. SET does not).
+    if not has_result_set:
+        return {'Records': [], 'ColumnMetadata': []}, user_query_id
+
+    data_client = client_manager.redshift_data_client()
+    results_response = await asyncio.to_thread(data_client.get_statement_result, Id=user_query_id)
+    records = list(results_response.get('Records', []))
+    next_token = results_response.get('NextToken')
+    while next_token:
+        page = await asyncio.to_thread(
+            data_client.get_statement_result, Id=user_query_id, NextToken=next_token
+        )
+        records.extend(page.get('Records', []))
+        next_token = page.get('NextToken')
+    results_response = {**results_response, 'Records': records}
+    results_response.pop('NextToken', None)
+    return results_response, user_query_id
+
+
+async def _run_protected_statement(
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    parameters: list[dict] | None = None,
+    allow_read_write: bool = False,
+    result_format: ResultFormat = 'JSON',
+    use_session: bool = True,
+) -> tuple[str, bool]:
     """Execute a SQL statement against a Redshift cluster in a protected fashion.
 
     The SQL is first validated by the read-only guard (single-statement enforcement,
@@ -264,17 +403,25 @@ async def _execute_protected_statement(
         sql: The SQL statement to execute.
         parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
         allow_read_write: Indicates if read-write mode should be activated.
+        result_format: Data API result format of the user statement (JSON or CSV).
+        use_session: Run on the shared cluster:database session. When False the
+            statement runs on its own Data API connection and does not wait for the
+            session lock, so independent statements can run concurrently. Only
+            supported in read-write mode, as the read-only transaction wrapper
+            needs a session.
 
     Returns:
         Tuple containing:
-        - Dictionary with the raw results_response from get_statement_result.
-        - String with the query_id.
+        - String with the query_id of the user statement.
+        - Whether the statement produced a result set.
 
     Raises:
         Exception: If cluster not found, query fails, or times out.
     """
     # Validate the statement with the read-only guard before doing any work.
     assert_executable(sql, allow_read_write=allow_read_write)
+    if not use_session and not allow_read_write:
+        raise ValueError('Read-only statements must run on a session (use_session=True)')
 
     # Get cluster info
     clusters = await discover_clusters()
@@ -289,6 +436,21 @@ async def _execute_protected_statement(
             f'Cluster {cluster_identifier} not found. Please use list_clusters to get valid cluster identifiers.'
         )
 
+    if not use_session:
+        # Standalone autocommit statement on its own connection; nothing to serialize.
+        user_query_id = await _execute_statement(
+            cluster_info=cluster_info,
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            parameters=parameters,
+            result_format=result_format,
+        )
+        describe_response = await asyncio.to_thread(
+            client_manager.redshift_data_client().describe_statement, Id=user_query_id
+        )
+        return user_query_id, bool(describe_response.get('HasResultSet'))
+
     # Serialize work on the shared per cluster:database session.
     async with session_manager.lock(cluster_identifier, database_name):
         session_id = await session_manager.session(cluster_identifier, database_name, cluster_info)
@@ -303,6 +465,7 @@ async def _execute_protected_statement(
                 sql=sql,
                 parameters=parameters,
                 session_id=session_id,
+                result_format=result_format,
             )
         else:
             # Read-only: BEGIN READ ONLY ... ROLLBACK. The engine rejects data writes
@@ -327,6 +490,7 @@ async def _execute_protected_statement(
                     sql=sql,
                     parameters=parameters,
                     session_id=session_id,
+                    result_format=result_format,
                 )
             except Exception as e:
                 user_sql_error = e
@@ -356,19 +520,14 @@ async def _execute_protected_statement(
             if user_sql_error is not None:
                 raise user_sql_error
 
-    # Get results from user query (shared by both modes); runs outside the lock.
+    # Inspect the user query (shared by both modes); runs outside the lock.
     # describe_statement / get_statement_result are keyed by query_id, not session-bound,
-    # so the lock is not held during the (potentially unbounded) results wait.
+    # so the lock is not held while the caller reads the (potentially large) results.
     data_client = client_manager.redshift_data_client()
     assert user_query_id is not None, 'user_query_id should not be None at this point'
 
-    # Only fetch results when the statement produced a result set (e.g. SET does not).
-    describe_response = data_client.describe_statement(Id=user_query_id)
-    if describe_response.get('HasResultSet'):
-        results_response = data_client.get_statement_result(Id=user_query_id)
-    else:
-        results_response = {'Records': [], 'ColumnMetadata': []}
-    return results_response, user_query_id
+    describe_response = await asyncio.to_thread(data_client.describe_statement, Id=user_query_id)
+    return user_query_id, bool(describe_response.get('HasResultSet'))
 
 
 async def _execute_statement(
@@ -381,6 +540,7 @@ async def _execute_statement(
     session_keepalive: int | None = None,
     query_poll_interval: float = QUERY_POLL_INTERVAL,
     query_timeout: float = QUERY_TIMEOUT,
+    result_format: ResultFormat = 'JSON',
 ) -> str:
     """Execute a single statement with optional session support and parameters.
 
@@ -392,8 +552,10 @@ async def _execute_statement(
         parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
         session_id: Optional session ID to use.
         session_keepalive: Optional session keepalive seconds (only used when session_id is None).
-        query_poll_interval: Polling interval in seconds for checking query status.
+        query_poll_interval: Maximum interval in seconds between query status polls.
         query_timeout: Maximum time in seconds to wait for query completion.
+        result_format: Result format to request; CSV results are read with
+            get_statement_result_v2.
 
     Returns:
         Statement ID from the ExecuteStatement response.
@@ -423,50 +585,247 @@ async def _execute_statement(
     elif session_keepalive is not None:
         request_params['SessionKeepAliveSeconds'] = session_keepalive
 
-    response = data_client.execute_statement(**request_params)
+    # JSON is the Data API default; only send ResultFormat when it differs.
+    if result_format != 'JSON':
+        request_params['ResultFormat'] = result_format
+
+    # Submit and wait off the event loop; boto3 calls block.
+    response = await asyncio.to_thread(data_client.execute_statement, **request_params)
     statement_id = response['Id']
 
     logger.debug(
         f'Executed statement: {statement_id}' + (f' in session {session_id}' if session_id else '')
     )
 
-    # Wait for statement completion
-    wait_time = 0
-    while wait_time < query_timeout:
-        status_response = data_client.describe_statement(Id=statement_id)
-        status = status_response['Status']
+    await statement_waiter.wait(
+        statement_id, timeout=query_timeout, max_poll_interval=query_poll_interval
+    )
+
+    return statement_id
 
-        if status == 'FINISHED':
-            logger.debug(f'Statement completed: {statement_id}')
-            break
-        elif status in ['FAILED', 'ABORTED']:
-            error_msg = status_response.get('Error', 'Unknown error')
-            logger.error(f'Statement failed: {error_msg}')
-            raise Exception(f'Statement failed: {error_msg}')
 
-        await asyncio.sleep(query_poll_interval)
-        wait_time += query_poll_interval
+# Redshift type names (ColumnMetadata typeName) converted when parsing CSV results,
+# matching the Python types the JSON format yields for the same columns.
+_CSV_INT_TYPES = frozenset({'int2', 'int4', 'int8', 'smallint', 'integer', 'bigint'})
+_CSV_FLOAT_TYPES = frozenset({'float4', 'float8', 'float', 'real', 'double precision'})
+_CSV_BOOL_TYPES = frozenset({'bool', 'boolean'})
+_CSV_TEXT_TYPES = frozenset(
+    {'varchar', 'char', 'bpchar', 'text', 'name', 'character varying', 'character'}
+)
 
-    if wait_time >= query_timeout:
-        logger.error(f'Statement timed out: {statement_id}')
-        raise Exception(f'Statement timed out after {wait_time} seconds')
 
-    return statement_id
+def _csv_converter(type_name: str | None) -> Callable[[str], Any]:
+    """Return the CSV field parser for a column of the given Redshift type.
+
+    CSV has no NULL marker distinct from an empty field. An empty field is read
+    as None, except in character columns where it is kept as '' (NULL and the
+    empty string are indistinguishable there).
+    """
+    type_name = (type_name or '').lower()
+    if type_name in _CSV_TEXT_TYPES:
+        return lambda value: value
+    if type_name in _CSV_INT_TYPES:
+        return lambda value: int(value) if value != '' else None
+    if type_name in _CSV_FLOAT_TYPES:
+        return lambda value: float(value) if value != '' else None
+    if type_name in _CSV_BOOL_TYPES:
+        return lambda value: value.lower() in ('t', 'true', '1') if value != '' else None
+    return lambda value: value if value != '' else None
+
+
+def _parse_csv_records(
+    records: list[dict], column_metadata: list[dict], skip_header: bool
+) -> list[list]:
+    """Parse get_statement_result_v2 CSVRecords chunks into typed rows."""
+    converters = [_csv_converter(col.get('typeName')) for col in column_metadata]
+    names = [col.get('name') for col in column_metadata]
+    rows = []
+    for chunk in records:
+        for fields in csv.reader(io.StringIO(chunk.get('CSVRecords', ''))):
+            if skip_header:
+                skip_header = False
+                # The first line of a result may be a header naming the columns.
+                if fields == names:
+                    continue
+            rows.append([convert(value) for convert, value in zip(converters, fields)])
+    return rows
+
+
+async def _iter_statement_result_pages(
+    query_id: str, result_format: ResultFormat = 'JSON', page_token: str | None = None
+) -> AsyncIterator[tuple[list[dict], list[list], str | None]]:
+    """Yield the result of a finished statement one GetStatementResult page at a time.
+
+    Pages are fetched in a worker thread, as boto3 calls block the event loop.
+
+    Args:
+        query_id: The statement ID.
+        result_format: The format the statement was executed with.
+        page_token: Data API NextToken to start from, or None for the first page.
+
+    Yields:
+        Tuples of (column metadata, typed rows of the page, NextToken of the following
+        page or None on the last page).
+    """
+    data_client = client_manager.redshift_data_client()
+    first_page = page_token is None
+    while True:
+        request: dict[str, str] = {'Id': query_id}
+        if page_token:
+            request['NextToken'] = page_token
+
+        if result_format == 'CSV':
+            response = await asyncio.to_thread(data_client.get_statement_result_v2, **request)
+            column_metadata = response.get('ColumnMetadata', [])
+            rows = _parse_csv_records(
+                response.get('Records', []), column_metadata, skip_header=first_page
+            )
+        else:
+            response = await asyncio.to_thread(data_client.get_statement_result, **request)
+            column_metadata = response.get('ColumnMetadata', [])
+            rows = [
+                [RedshiftDataModel.cell_value(cell) for cell in record]
+                for record in response.get('Records', [])
+            ]
+
+        page_token = response.get('NextToken')
+        yield column_metadata, rows, page_token
+        if not page_token:
+            return
+        first_page = False
+
+
+# Continuation tokens are signed with a key that only lives as long as the server
+# process, so callers cannot forge one to read the result of another statement.
+_CONTINUATION_KEY = secrets.token_bytes(32)
+
+
+def _sign_continuation(payload: str) -> str:
+    """HMAC of a continuation token payload under the per-process key."""
+    digest = hmac.new(_CONTINUATION_KEY, payload.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode()
+
+
+def _encode_continuation(
+    query_id: str, page_token: str | None, offset: int, result_format: ResultFormat
+) -> str:
+    """Pack a position inside a statement result into an opaque, signed continuation token."""
+    state = {'q': query_id, 't': page_token, 'o': offset, 'f': result_format}
+    payload = base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+    return f'{payload}.{_sign_continuation(payload)}'
 
 
-async def discover_clusters() -> list[RedshiftCluster]:
+def _decode_continuation(next_token: str) -> tuple[str, str | None, int, ResultFormat]:
+    """Unpack a continuation token produced by _encode_continuation.
+
+    Raises:
+        ValueError: If the token is malformed or was not signed by this server process.
+    """
+    payload, _, signature = next_token.partition('.')
+    if not hmac.compare_digest(signature, _sign_continuation(payload)):
+        raise ValueError(
+            f'Invalid next_token: {next_token!r}. Tokens are only valid for the server '
+            'process that issued them; run the query again to get a new one.'
+        )
+    try:
+        state = json.loads(base64.urlsafe_b64decode(payload.encode()))
+        query_id, page_token = state['q'], state['t']
+        offset, result_format = state['o'], state['f']
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f'Invalid next_token: {next_token!r}') from e
+    if (
+        not isinstance(query_id, str)
+        or not isinstance(offset, int)
+        or offset < 0
+        or result_format not in ('JSON', 'CSV')
+    ):
+        raise ValueError(f'Invalid next_token: {next_token!r}')
+    return query_id, page_token, offset, result_format
+
+
+async def read_statement_result(
+    query_id: str | None = None,
+    max_rows: int | None = None,
+    next_token: str | None = None,
+    result_format: ResultFormat = 'JSON',
+) -> dict:
+    """Read the result of a finished statement page by page, up to a row budget.
+
+    Args:
+        query_id: The statement ID. Ignored when next_token is given.
+        max_rows: Maximum number of rows to return; None reads every page.
+        next_token: Continuation token from a previous call to resume from.
+        result_format: The format the statement was executed with. Ignored when
+            next_token is given.
+
+    Returns:
+        Dictionary with columns, rows, row_count, query_id and next_token. next_token
+        is None when the result was read to the end, otherwise it resumes right
+        after the last returned row.
+    """
+    page_token = None
+    offset = 0
+    if next_token:
+        query_id, page_token, offset, result_format = _decode_continuation(next_token)
+    if not query_id:
+        raise ValueError('Either query_id or next_token is required')
+
+    columns: list[str] | None = None
+    rows: list[list] = []
+    continuation = None
+    async for column_metadata, page_rows, next_page_token in _iter_statement_result_pages(
+        query_id, result_format, page_token
+    ):
+        if columns is None:
+            columns = [col.get('name') for col in column_metadata]
+        page_start = offset
+        offset = 0
+        page_rows = page_rows[page_start:]
+
+        if max_rows is not None and len(rows) + len(page_rows) > max_rows:
+            taken = max_rows - len(rows)
+            rows.extend(page_rows[:taken])
+            continuation = _encode_continuation(
+                query_id, page_token, page_start + taken, result_format
+            )
+            break
+        rows.extend(page_rows)
+        if max_rows is not None and len(rows) == max_rows and next_page_token:
+            continuation = _encode_continuation(query_id, next_page_token, 0, result_format)
+            break
+        page_token = next_page_token
+
+    return {
+        'columns': columns or [],
+        'rows': rows,
+        'row_count': len(rows),
+        'query_id': query_id,
+        'next_token': continuation,
+    }
+
+
+async def discover_clusters(max_age: float = CLUSTER_CACHE_TTL) -> list[RedshiftCluster]:
     """Discover all Redshift clusters and serverless workgroups.
 
     Discovery is best-effort for each type: if either provisioned or serverless
     discovery succeeds, the function returns whatever was found. It only raises
     if both fail (i.e., no clusters could be discovered at all).
 
+    Args:
+        max_age: Reuse a previous discovery result younger than this many seconds.
+            Pass 0 to always query the control plane (the result is still cached).
+
     Returns:
         List of RedshiftCluster models.
 
     Raises:
         Exception: If both provisioned and serverless discovery fail.
     """
+    cached = metadata_cache.get((), max_age)
+    if cached is not None:
+        logger.debug(f'Using {len(cached)} cached clusters')
+        return cached
+
     clusters = []
     provisioned_error = None
     serverless_error = None
@@ -563,21 +922,31 @@ async def discover_clusters() -> list[RedshiftCluster]:
         raise PermissionError(msg)
 
     logger.info(f'Total clusters discovered: {len(clusters)}')
+    metadata_cache.put((), clusters)
     return clusters
 
 
 async def discover_databases(
-    cluster_identifier: str, database_name: str = 'dev'
+    cluster_identifier: str, database_name: str = 'dev', refresh: bool = False
 ) -> list[RedshiftDatabase]:
     """Discover databases in a Redshift cluster using the Data API.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to connect to for querying system views.
+        refresh: Drop cached metadata of the cluster and query it again.
 
     Returns:
         List of RedshiftDatabase models.
     """
+    cache_path = (cluster_identifier,)
+    if refresh:
+        metadata_cache.invalidate(cache_path)
+    cached = metadata_cache.get(cache_path, METADATA_CACHE_TTL)
+    if cached is not None:
+        logger.debug(f'Using cached databases of cluster {cluster_identifier}')
+        return cached
+
     try:
         logger.info(f'Discovering databases in cluster {cluster_identifier}')
 
@@ -589,6 +958,7 @@ async def discover_databases(
 
         databases = RedshiftDatabase.from_redshift_response(results_response)
         logger.info(f'Found {len(databases)} databases in cluster {cluster_identifier}')
+        metadata_cache.put(cache_path, databases)
         return databases
 
     except Exception as e:
@@ -597,17 +967,26 @@ async def discover_databases(
 
 
 async def discover_schemas(
-    cluster_identifier: str, schema_database_name: str
+    cluster_identifier: str, schema_database_name: str, refresh: bool = False
 ) -> list[RedshiftSchema]:
     """Discover schemas in a Redshift database using the Data API.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         schema_database_name: The database name to filter schemas for. Also used to connect to.
+        refresh: Drop cached metadata of the database and query it again.
 
     Returns:
         List of RedshiftSchema models.
     """
+    cache_path = (cluster_identifier, schema_database_name)
+    if refresh:
+        metadata_cache.invalidate(cache_path)
+    cached = metadata_cache.get(cache_path, METADATA_CACHE_TTL)
+    if cached is not None:
+        logger.debug(f'Using cached schemas of database {schema_database_name}')
+        return cached
+
     try:
         logger.info(
             f'Discovering schemas in database {schema_database_name} in cluster {cluster_identifier}'
@@ -623,6 +1002,7 @@ async def discover_schemas(
         logger.info(
             f'Found {len(schemas)} schemas in database {schema_database_name} in cluster {cluster_identifier}'
         )
+        metadata_cache.put(cache_path, schemas)
         return schemas
 
     except Exception as e:
@@ -633,7 +1013,10 @@ async def discover_schemas(
 
 
 async def discover_tables(
-    cluster_identifier: str, table_database_name: str, table_schema_name: str
+    cluster_identifier: str,
+    table_database_name: str,
+    table_schema_name: str,
+    refresh: bool = False,
 ) -> list[RedshiftTable]:
     """Discover tables in a Redshift schema using the Data API.
 
@@ -641,10 +1024,19 @@ async def discover_tables(
         cluster_identifier: The cluster identifier to query.
         table_database_name: The database name to filter tables for. Also used to connect to.
         table_schema_name: The schema name to filter tables for.
+        refresh: Drop cached metadata of the schema and query it again.
 
     Returns:
         List of RedshiftTable models.
     """
+    cache_path = (cluster_identifier, table_database_name, table_schema_name)
+    if refresh:
+        metadata_cache.invalidate(cache_path)
+    cached = metadata_cache.get(cache_path, METADATA_CACHE_TTL)
+    if cached is not None:
+        logger.debug(f'Using cached tables of schema {table_schema_name}')
+        return cached
+
     try:
         logger.info(
             f'Discovering tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
@@ -663,6 +1055,7 @@ async def discover_tables(
         logger.info(
             f'Found {len(tables)} tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
         )
+        metadata_cache.put(cache_path, tables)
         return tables
 
     except Exception as e:
@@ -672,28 +1065,100 @@ async def discover_tables(
         raise
 
 
+async def prefetch_schema_columns(
+    cluster_identifier: str, database_name: str, schema_name: str
+) -> dict[str, list[RedshiftColumn]]:
+    """Fetch the columns of every table in a schema with one SVV_ALL_COLUMNS query.
+
+    The result is stored in the metadata cache per table, so subsequent
+    discover_columns calls for any table of the schema are served from the cache.
+
+    Args:
+        cluster_identifier: The cluster identifier to query.
+        database_name: The database of the schema. Also used to connect to.
+        schema_name: The schema whose columns to fetch.
+
+    Returns:
+        Dictionary mapping table name to its list of RedshiftColumn models.
+    """
+    logger.info(
+        f'Prefetching columns of schema {schema_name} in database {database_name} in cluster {cluster_identifier}'
+    )
+    results_response, _ = await _execute_protected_statement(
+        cluster_identifier=cluster_identifier,
+        database_name=database_name,
+        sql=SCHEMA_COLUMNS_SQL,
+        parameters=[
+            {'name': 'database', 'value': database_name},
+            {'name': 'schema', 'value': schema_name},
+        ],
+    )
+
+    columns_by_table: dict[str, list[RedshiftColumn]] = {}
+    for column in RedshiftColumn.from_redshift_response(results_response):
+        columns_by_table.setdefault(column.table_name, []).append(column)
+    for table_name, columns in columns_by_table.items():
+        metadata_cache.put((cluster_identifier, database_name, schema_name, table_name), columns)
+
+    logger.info(f'Prefetched columns of {len(columns_by_table)} tables in schema {schema_name}')
+    return columns_by_table
+
+
 async def discover_columns(
     cluster_identifier: str,
     column_database_name: str,
     column_schema_name: str,
     column_table_name: str,
+    refresh: bool = False,
 ) -> list[RedshiftColumn]:
     """Discover columns in a Redshift table using the Data API.
 
+    On the first cache miss in a schema the columns of the whole schema are
+    prefetched in one query (see prefetch_schema_columns), so browsing the other
+    tables of the schema needs no further round trips. Tables the prefetch does
+    not cover, and every table when the prefetch fails, are looked up
+    individually with SHOW COLUMNS.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         column_database_name: The database name to filter columns for. Also used to connect to.
         column_schema_name: The schema name to filter columns for.
         column_table_name: The table name to filter columns for.
+        refresh: Drop the cached columns of the table and query them again.
 
     Returns:
         List of RedshiftColumn models.
     """
+    cache_path = (cluster_identifier, column_database_name, column_schema_name, column_table_name)
+    if refresh:
+        metadata_cache.invalidate(cache_path)
+    cached = metadata_cache.get(cache_path, METADATA_CACHE_TTL)
+    if cached is not None:
+        logger.debug(f'Using cached columns of table {column_table_name}')
+        return cached
+
     try:
         logger.info(
             f'Discovering columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
         )
 
+        schema_path = cache_path[:3]
+        if not refresh and not metadata_cache.was_prefetched(schema_path, METADATA_CACHE_TTL):
+            # Remembered whatever the outcome, so neither a table missing from
+            # svv_all_columns nor a failing prefetch reruns it on every miss.
+            metadata_cache.mark_prefetched(schema_path)
+            try:
+                prefetched = await prefetch_schema_columns(
+                    cluster_identifier, column_database_name, column_schema_name
+                )
+            except Exception as e:
+                logger.warning(
+                    f'Prefetching columns of schema {column_schema_name} failed, falling back to SHOW COLUMNS: {str(e)}'
+                )
+            else:
+                if column_table_name in prefetched:
+                    return list(prefetched[column_table_name])
+
         results_response, _ = await _execute_protected_statement(
             cluster_identifier=cluster_identifier,
             database_name=column_database_name,
@@ -708,6 +1173,7 @@ async def discover_columns(
         logger.info(
             f'Found {len(columns)} columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
         )
+        metadata_cache.put(cache_path, columns)
         return columns
 
     except Exception as e:
@@ -718,7 +1184,13 @@ async def discover_columns(
 
 
 async def execute_query(
-    cluster_identifier: str, database_name: str, sql: str, allow_read_write: bool = False
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    allow_read_write: bool = False,
+    max_rows: int | None = None,
+    result_format: ResultFormat = 'JSON',
+    use_session: bool = True,
 ) -> dict:
     """Execute a SQL query against a Redshift cluster using the Data API.
 
@@ -727,6 +1199,14 @@ async def execute_query(
         database_name: The database to execute the query against.
         sql: The SQL statement to execute.
         allow_read_write: Whether to use a read-write transaction. Defaults to False (read-only).
+        max_rows: Maximum number of rows to return; remaining rows can be read with
+            fetch_query_results using the returned next_token. None returns every row.
+        result_format: JSON (default) or CSV. CSV results are fetched with
+            get_statement_result_v2, which is cheaper to transfer and parse for wide
+            result sets.
+        use_session: Whether to run on the shared cluster:database session. Pass False
+            (read-write only) to run on a dedicated connection that does not queue
+            behind other statements to the same target.
 
     Returns:
         Dictionary with query results including columns, rows, and metadata.
@@ -736,34 +1216,61 @@ async def execute_query(
         logger.debug(f'SQL: {sql}')
 
         # Execute the query using the common function
-        results_response, query_id = await _execute_protected_statement(
+        query_id, has_result_set = await _run_protected_statement(
             cluster_identifier=cluster_identifier,
             database_name=database_name,
             sql=sql,
             allow_read_write=allow_read_write,
+            result_format=result_format,
+            use_session=use_session,
+        )
+
+        if has_result_set:
+            query_result = await read_statement_result(
+                query_id, max_rows=max_rows, result_format=result_format
+            )
+        else:
+            query_result = {
+                'columns': [],
+                'rows': [],
+                'row_count': 0,
+                'query_id': query_id,
+                'next_token': None,
+            }
+
+        logger.info(
+            f'Query executed successfully: {query_id}, returned {query_result["row_count"]} rows'
+            + (' (more available)' if query_result['next_token'] else '')
         )
+        return query_result
+
+    except Exception as e:
+        logger.error(f'Error executing query on cluster {cluster_identifier}: {str(e)}')
+        raise
 
-        # Extract column names
-        columns = [col.get('name') for col in results_response.get('ColumnMetadata', [])]
 
-        # Extract rows
-        rows = [
-            [RedshiftDataModel.cell_value(cell) for cell in record]
-            for record in results_response.get('Records', [])
-        ]
+async def fetch_query_results(next_token: str, max_rows: int | None = None) -> dict:
+    """Fetch further rows of a query result using a continuation token.
 
-        query_result = {
-            'columns': columns,
-            'rows': rows,
-            'row_count': len(rows),
-            'query_id': query_id,
-        }
+    Args:
+        next_token: The next_token returned by execute_query or a previous call.
+        max_rows: Maximum number of rows to return; None returns up to
+            FETCH_QUERY_RESULTS_DEFAULT_MAX_ROWS rows.
 
-        logger.info(f'Query executed successfully: {query_id}, returned {len(rows)} rows')
+    Returns:
+        Dictionary with query results including columns, rows, and metadata.
+    """
+    try:
+        if max_rows is None:
+            max_rows = FETCH_QUERY_RESULTS_DEFAULT_MAX_ROWS
+        query_result = await read_statement_result(max_rows=max_rows, next_token=next_token)
+        logger.info(
+            f'Fetched {query_result["row_count"]} more rows of query {query_result["query_id"]}'
+        )
         return query_result
 
     except Exception as e:
-        logger.error(f'Error executing query on cluster {cluster_identifier}: {str(e)}')
+        logger.error(f'Error fetching query results: {str(e)}')
         raise
 
 
@@ -783,3 +1290,14 @@ client_manager = RedshiftClientManager(
 session_manager = RedshiftSessionManager(
     session_keepalive=SESSION_KEEPALIVE, app_name=f'{CLIENT_USER_AGENT_NAME}/{__version__}'
 )
+
+# Global discovery metadata cache instance
+metadata_cache = RedshiftMetadataCache()
+
+# Global statement completion waiter instance. The client is looked up on every poll
+# so a recreated client manager is picked up.
+statement_waiter = StatementWaiter(
+    describe=lambda statement_id: client_manager.redshift_data_client().describe_statement(
+        Id=statement_id
+    )
+)
@@ -14,6 +14,8 @@
 
 """Review executor orchestrating signal evaluation."""
 
+import asyncio
+from awslabs.redshift_mcp_server.consts import REVIEW_MAX_CONCURRENCY
 from awslabs.redshift_mcp_server.review.definitions import (
     RECOMMENDATIONS,
     SIGNAL_EVALUATION_SQL,
@@ -34,15 +36,21 @@ async def review_cluster(
     discover_clusters_func: Callable[..., Any],
     database_name: str = 'dev',
     progress_reporter_func: Callable[[int, int], Any] | None = None,
+    max_concurrency: int = REVIEW_MAX_CONCURRENCY,
 ):
     """Execute a full cluster review.
 
+    The signal queries are independent of each other, so up to max_concurrency of
+    them run at once. Findings are still assembled in query definition order.
+
     Args:
         cluster_identifier: The cluster identifier to review.
         execute_query_func: Async callable matching the signature of execute_query().
         discover_clusters_func: Async callable matching the signature of discover_clusters().
         database_name: The database to run the review against. Defaults to 'dev'.
-        progress_reporter_func: Optional async callable receiving (current, total) after each query.
+        progress_reporter_func: Optional async callable receiving (current, total) after each
+            query. current counts completed queries and increases by one on every call.
+        max_concurrency: Maximum number of signal queries in flight at once.
 
     Returns:
         ReviewResult with findings and deduplicated recommendations.
@@ -77,34 +85,59 @@ async def review_cluster(
     findings: list[ReviewFinding] = []
     queries_executed: list[str] = []
 
-    # Stage 2 & 3: Execute each query and collect one finding per triggered branch.
+    # Stage 2: Execute the queries concurrently, bounded by a semaphore. Progress is
+    # reported under a lock so (current, total) calls never interleave or go backwards.
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    progress_lock = asyncio.Lock()
+    completed = 0
+
+    async def _run_query(query_name: str, sql: str) -> dict:
+        nonlocal completed
+        async with semaphore:
+            logger.debug('Executing review query: {}', query_name)
+            try:
+                result = await execute_query_func(
+                    cluster_identifier=cluster_identifier,
+                    database_name=database_name,
+                    sql=sql,
+                    allow_read_write=True,
+                )
+            except Exception as e:
+                logger.error('Review query {} failed: {}', query_name, str(e))
+                if 'permission denied' in str(e).lower():
+                    raise Exception(
+                        f'Review requires superuser or sys:monitor access. Request an '
+                        f'administrator to run: '
+                        f'GRANT ROLE sys:monitor TO "<database_user>"; where <database_user> is '
+                        f'the output of SELECT current_user - for IAM identities it looks like '
+                        f'IAM:alice or IAMR:MyRole and the quotes are required. '
+                        f'Query {query_name} failed with: {e}'
+                    ) from e
+                raise
+
+        async with progress_lock:
+            completed += 1
+            logger.debug('Review query {} done ({}/{})', query_name, completed, total_queries)
+            if progress_reporter_func:
+                await progress_reporter_func(completed, total_queries)
+        return result
+
+    tasks = [asyncio.ensure_future(_run_query(name, sql)) for name, sql in queries]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # Any query failure aborts the review; stop waiting on the others.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    # Stage 3: Collect one finding per triggered branch, in query definition order.
     # Findings are kept per branch (not collapsed): each branch carries its own
     # -- Signal: label in signal_name, so branches that share a recommendation
     # (for example, several QMR checks all mapping to REC_019) stay distinct with
     # their own affected_row_count. Recommendation-level dedup happens in Stage 4.
-    for idx, (query_name, sql) in enumerate(queries):
-        logger.debug('Executing review query: {} ({}/{})', query_name, idx + 1, total_queries)
-
-        try:
-            result = await execute_query_func(
-                cluster_identifier=cluster_identifier,
-                database_name=database_name,
-                sql=sql,
-                allow_read_write=True,
-            )
-        except Exception as e:
-            logger.error('Review query {} failed: {}', query_name, str(e))
-            if 'permission denied' in str(e).lower():
-                raise Exception(
-                    f'Review requires superuser or sys:monitor access. Request an administrator '
-                    f'to run: '
-                    f'GRANT ROLE sys:monitor TO "<database_user>"; where <database_user> is the '
-                    f'output of SELECT current_user - for IAM identities it looks like '
-                    f'IAM:alice or IAMR:MyRole and the quotes are required. '
-                    f'Query {query_name} failed with: {e}'
-                ) from e
-            raise
-
+    for (query_name, _), result in zip(queries, results):
         queries_executed.append(query_name)
 
         rows = result.get('rows', [])
@@ -135,9 +168,6 @@ async def review_cluster(
             query_findings,
         )
 
-        if progress_reporter_func:
-            await progress_reporter_func(idx + 1, total_queries)
-
     # Stage 4: Resolve recommendations (deduplicate, preserve first-occurrence order)
     seen: dict[str, list[str]] = {}
     for finding in findings:
@@ -14,6 +14,7 @@
 
 """Redshift MCP Server implementation."""
 
+import functools
 import os
 import sys
 from awslabs.redshift_mcp_server.consts import (
@@ -34,6 +35,7 @@ from awslabs.redshift_mcp_server.redshift import (
     discover_schemas,
     discover_tables,
     execute_query,
+    fetch_query_results,
 )
 from awslabs.redshift_mcp_server.review.executor import review_cluster
 from awslabs.redshift_mcp_server.review.models import ReviewResult
@@ -41,6 +43,7 @@ from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import ToolAnnotations
 from pydantic import Field
+from typing import Literal, Optional
 
 
 # Remove default handler and add custom configuration
@@ -83,6 +86,10 @@ This tool runs the SHOW COLUMNS command to discover available columns.
 ### execute_query
 Executes SQL queries against a Redshift cluster or serverless workgroup.
 This tool uses the Redshift Data API to run queries and return results.
+Use max_rows to cap large result sets; the remaining rows can be read with fetch_query_results.
+
+### fetch_query_results
+Fetches further rows of a query result cut off by max_rows, using its next_token.
 
 ### review_cluster
 Runs a diagnostic review of a Redshift cluster or serverless workgroup.
@@ -101,6 +108,8 @@ The server reuses one Redshift Data API session per `cluster:database`:
 - Queries to the same `cluster:database` are serialized (parallel calls queue; a long-running query blocks later ones to that target).
 - Queries to different targets run concurrently on independent sessions.
 - Each read-only query runs isolated in its own transaction.
+- Database, schema, table and column listings are cached for 5 minutes; pass refresh=true after DDL. Listing the columns of one table caches the columns of its whole schema.
+- review_cluster runs its diagnostic queries concurrently on dedicated connections, outside the shared session.
 
 ## AWS Client Best Practices
 
@@ -200,7 +209,8 @@ async def list_clusters_tool(ctx: Context) -> list[RedshiftCluster]:
     """
     try:
         logger.info('Discovering Redshift clusters and serverless workgroups')
-        clusters = await discover_clusters()
+        # Always report current cluster status; this also refreshes the cache.
+        clusters = await discover_clusters(max_age=0)
 
         logger.info(f'Successfully retrieved {len(clusters)} clusters')
         return clusters
@@ -225,6 +235,10 @@ async def list_databases_tool(
         'dev',
         description='The database to connect to for metadata discovery. Defaults to "dev".',
     ),
+    refresh: bool = Field(
+        False,
+        description='Bypass the metadata cache and fetch fresh databases. Use after creating or altering objects.',
+    ),
 ) -> list[RedshiftDatabase]:
     """List all databases in a specified Amazon Redshift cluster.
 
@@ -244,6 +258,7 @@ async def list_databases_tool(
     - cluster_identifier: The unique identifier of the Redshift cluster to query.
                          IMPORTANT: Use a valid cluster identifier from the list_clusters tool.
     - database_name: The database to connect to for metadata discovery (defaults to 'dev').
+    - refresh: Set to true to bypass the metadata cache and fetch fresh databases.
 
     ## Response Structure
 
@@ -274,7 +289,9 @@ async def list_databases_tool(
     try:
         logger.info(f'Discovering databases on cluster: {cluster_identifier}')
         databases = await discover_databases(
-            cluster_identifier=cluster_identifier, database_name=database_name
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            refresh=refresh,
         )
 
         logger.info(
@@ -302,6 +319,10 @@ async def list_schemas_tool(
         ...,
         description='The database name to list schemas for. Also used to connect to. Must be a valid database name from the list_databases tool.',
     ),
+    refresh: bool = Field(
+        False,
+        description='Bypass the metadata cache and fetch fresh schemas. Use after creating or altering objects.',
+    ),
 ) -> list[RedshiftSchema]:
     """List all schemas in a specified database within a Redshift cluster.
 
@@ -322,6 +343,7 @@ async def list_schemas_tool(
                          IMPORTANT: Use a valid cluster identifier from the list_clusters tool.
     - schema_database_name: The database name to list schemas for. Also used to connect to.
                            IMPORTANT: Use a valid database name from the list_databases tool.
+    - refresh: Set to true to bypass the metadata cache and fetch fresh schemas.
 
     ## Response Structure
 
@@ -357,7 +379,9 @@ async def list_schemas_tool(
             f'Discovering schemas in database {schema_database_name} on cluster {cluster_identifier}'
         )
         schemas = await discover_schemas(
-            cluster_identifier=cluster_identifier, schema_database_name=schema_database_name
+            cluster_identifier=cluster_identifier,
+            schema_database_name=schema_database_name,
+            refresh=refresh,
         )
 
         logger.info(
@@ -391,6 +415,10 @@ async def list_tables_tool(
         ...,
         description='The schema name to list tables for. Also used to connect to. Must be a valid schema name from the list_schemas tool.',
     ),
+    refresh: bool = Field(
+        False,
+        description='Bypass the metadata cache and fetch fresh tables. Use after creating or altering objects.',
+    ),
 ) -> list[RedshiftTable]:
     """List all tables in a specified schema within a Redshift database.
 
@@ -413,6 +441,7 @@ async def list_tables_tool(
                           IMPORTANT: Use a valid database name from the list_databases tool.
     - table_schema_name: The schema name to list tables for.
                         IMPORTANT: Use a valid schema name from the list_schemas tool.
+    - refresh: Set to true to bypass the metadata cache and fetch fresh tables.
 
     ## Response Structure
 
@@ -450,6 +479,7 @@ async def list_tables_tool(
             cluster_identifier=cluster_identifier,
             table_database_name=table_database_name,
             table_schema_name=table_schema_name,
+            refresh=refresh,
         )
 
         logger.info(
@@ -487,6 +517,10 @@ async def list_columns_tool(
         ...,
         description='The table name to list columns for. Must be a valid table name from the list_tables tool.',
     ),
+    refresh: bool = Field(
+        False,
+        description='Bypass the metadata cache and fetch fresh columns. Use after creating or altering objects.',
+    ),
 ) -> list[RedshiftColumn]:
     """List all columns in a specified table within a Redshift schema.
 
@@ -511,6 +545,7 @@ async def list_columns_tool(
                          IMPORTANT: Use a valid schema name from the list_schemas tool.
     - column_table_name: The table name to list columns for.
                         IMPORTANT: Use a valid table name from the list_tables tool.
+    - refresh: Set to true to bypass the metadata cache and fetch fresh columns.
 
     ## Response Structure
 
@@ -556,6 +591,7 @@ async def list_columns_tool(
             column_database_name=column_database_name,
             column_schema_name=column_schema_name,
             column_table_name=column_table_name,
+            refresh=refresh,
         )
 
         logger.info(
@@ -588,6 +624,15 @@ async def execute_query_tool(
     sql: str = Field(
         ..., description='The SQL statement to execute. Should be a single SQL statement.'
     ),
+    max_rows: Optional[int] = Field(
+        None,
+        ge=1,
+        description='Maximum number of rows to return. Remaining rows can be read with the fetch_query_results tool using the returned next_token. Defaults to returning all rows.',
+    ),
+    result_format: Literal['JSON', 'CSV'] = Field(
+        'JSON',
+        description='Data API result format. CSV is cheaper to transfer and parse for wide result sets; values are typed from the column metadata.',
+    ),
 ) -> QueryResult:
     """Execute a SQL query against a Redshift cluster or serverless workgroup.
 
@@ -609,6 +654,8 @@ async def execute_query_tool(
     - database_name: The database name to execute the query against.
                     IMPORTANT: Use a valid database name from the list_databases tool.
     - sql: The SQL statement to execute. Should be a single SQL statement.
+    - max_rows: Optional maximum number of rows to return.
+    - result_format: JSON (default) or CSV.
 
     ## Response Structure
 
@@ -618,6 +665,7 @@ async def execute_query_tool(
     - rows: List of rows, where each row is a list of values.
     - row_count: Number of rows returned.
     - query_id: Unique identifier for the query execution.
+    - next_token: Continuation token when more rows are available, otherwise null.
 
     ## Usage Tips
 
@@ -626,6 +674,7 @@ async def execute_query_tool(
     3. Ensure the cluster status is 'available' before executing queries.
     4. Use LIMIT clauses for exploratory queries to avoid large result sets.
     5. Consider using the metadata discovery tools to understand table structures before querying.
+    6. Set max_rows to preview a large result and page through the rest with fetch_query_results.
 
     ## Data Type Handling
 
@@ -646,7 +695,11 @@ async def execute_query_tool(
     try:
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
         query_result_data = await execute_query(
-            cluster_identifier=cluster_identifier, database_name=database_name, sql=sql
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            max_rows=max_rows,
+            result_format=result_format,
         )
 
         # Convert to QueryResult model
@@ -665,6 +718,60 @@ async def execute_query_tool(
         raise
 
 
+@mcp.tool(
+    name='fetch_query_results',
+    annotations=_read_only_annotations('Fetch more Redshift query results'),
+)
+async def fetch_query_results_tool(
+    ctx: Context,
+    next_token: str = Field(
+        ...,
+        description='The next_token returned by execute_query or a previous fetch_query_results call.',
+    ),
+    max_rows: Optional[int] = Field(
+        None,
+        ge=1,
+        description='Maximum number of rows to return. Defaults to 1000; page through the rest with the returned next_token.',
+    ),
+) -> QueryResult:
+    """Fetch further rows of a query result that was cut off by max_rows.
+
+    Results are read from the Redshift Data API, which keeps them for 24 hours
+    after the query finished; the query itself is not run again.
+
+    ## Usage Requirements
+
+    - Required IAM permissions: redshift-data:GetStatementResult (and
+      redshift-data:GetStatementResultV2 for queries run with result_format CSV).
+
+    ## Parameters
+
+    - next_token: The continuation token from execute_query or a previous call of this tool.
+      Tokens are only valid for the server process that issued them.
+    - max_rows: Optional maximum number of rows to return (default 1000).
+
+    ## Response Structure
+
+    Returns a QueryResult object shaped like the execute_query response. next_token
+    is null once the last row has been returned.
+    """
+    try:
+        logger.info('Fetching further query results')
+        query_result = QueryResult(
+            **await fetch_query_results(next_token=next_token, max_rows=max_rows)
+        )
+
+        logger.info(
+            f'Successfully fetched {query_result.row_count} rows of query {query_result.query_id}'
+        )
+        return query_result
+
+    except Exception as e:
+        logger.error(f'Error in fetch_query_results_tool: {str(e)}')
+        await ctx.error(f'Failed to fetch query results: {str(e)}')
+        raise
+
+
 @mcp.tool(
     name='review_cluster',
     annotations=_read_only_annotations('Review Redshift cluster'),
@@ -758,7 +865,10 @@ async def review_cluster_tool(
 
         result = await review_cluster(
             cluster_identifier=cluster_identifier,
-            execute_query_func=execute_query,
+            # Signal queries are independent reads of system views: run them on their
+            # own connections so they execute concurrently instead of queueing on the
+            # shared session.
+            execute_query_func=functools.partial(execute_query, use_session=False),
             discover_clusters_func=discover_clusters,
             database_name=database_name,
             progress_reporter_func=ctx.report_progress,
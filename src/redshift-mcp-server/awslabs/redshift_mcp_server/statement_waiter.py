@@ -0,0 +1,253 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared waiter for Redshift Data API statement completion.
+
+The Data API has no completion notification, so a statement's status has to be
+polled with DescribeStatement. Rather than each caller running its own
+fixed-interval sleep loop, every outstanding statement is registered with one
+StatementWaiter. A single poller task per event loop polls all statements that
+are due in one round, concurrently and in worker threads so the blocking boto3
+calls never stall the event loop. Each statement is first polled shortly after
+submission and then with exponential backoff up to a maximum interval, so short
+queries return quickly and long ones do not flood DescribeStatement.
+"""
+
+import asyncio
+import time
+from awslabs.redshift_mcp_server.consts import (
+    QUERY_POLL_INTERVAL,
+    STATEMENT_FIRST_POLL_INTERVAL,
+    STATEMENT_POLL_BACKOFF,
+)
+from collections import deque
+from dataclasses import dataclass
+from loguru import logger
+from typing import Any, Callable, Deque
+
+
+# Statements due within this many seconds of the current round are polled with it.
+_POLL_COALESCE_WINDOW = 0.02
+
+
+@dataclass(frozen=True)
+class StatementTiming:
+    """Latency breakdown of a statement that reached a terminal status.
+
+    Attributes:
+        statement_id: The Data API statement ID.
+        status: Terminal status (FINISHED, FAILED or ABORTED).
+        queue_seconds: Time between submission and the start of execution, derived
+            from CreatedAt, UpdatedAt and Duration. None if they were not reported.
+        execution_seconds: Time the statement ran in Redshift (Duration), or None.
+        wait_seconds: Time from registering with the waiter to seeing the terminal status.
+        polls: Number of DescribeStatement calls made for the statement.
+    """
+
+    statement_id: str
+    status: str
+    queue_seconds: float | None
+    execution_seconds: float | None
+    wait_seconds: float
+    polls: int
+
+
+@dataclass(eq=False)
+class _PendingStatement:
+    statement_id: str
+    future: asyncio.Future
+    registered_at: float
+    deadline: float
+    interval: float
+    max_interval: float
+    next_poll_at: float
+    polls: int = 0
+
+
+def _statement_timing(
+    statement_id: str, response: dict, wait_seconds: float, polls: int
+) -> StatementTiming:
+    """Build the timing record of a finished statement from its DescribeStatement response."""
+    duration_ns = response.get('Duration')
+    execution_seconds = (
+        duration_ns / 1e9 if isinstance(duration_ns, int) and duration_ns >= 0 else None
+    )
+
+    queue_seconds = None
+    created_at, updated_at = response.get('CreatedAt'), response.get('UpdatedAt')
+    if created_at is not None and updated_at is not None and execution_seconds is not None:
+        total_seconds = (updated_at - created_at).total_seconds()
+        queue_seconds = max(total_seconds - execution_seconds, 0.0)
+
+    return StatementTiming(
+        statement_id=statement_id,
+        status=response.get('Status', 'UNKNOWN'),
+        queue_seconds=queue_seconds,
+        execution_seconds=execution_seconds,
+        wait_seconds=wait_seconds,
+        polls=polls,
+    )
+
+
+class StatementWaiter:
+    """Waits for Data API statements to complete, polling all of them from one task."""
+
+    def __init__(
+        self,
+        describe: Callable[[str], dict],
+        first_poll_interval: float = STATEMENT_FIRST_POLL_INTERVAL,
+        backoff: float = STATEMENT_POLL_BACKOFF,
+        timings_kept: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the waiter.
+
+        Args:
+            describe: Blocking callable returning the DescribeStatement response for an ID.
+                It is invoked in worker threads.
+            first_poll_interval: Delay before the first status poll of a statement.
+            backoff: Factor the poll interval grows by after every unfinished poll.
+            timings_kept: Number of recent StatementTiming records retained.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self._describe = describe
+        self.first_poll_interval = first_poll_interval
+        self.backoff = backoff
+        self._clock = clock
+        self.timings: Deque[StatementTiming] = deque(maxlen=timings_kept)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: set[_PendingStatement] = set()
+        self._poller: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+
+    async def wait(
+        self,
+        statement_id: str,
+        timeout: float,
+        max_poll_interval: float = QUERY_POLL_INTERVAL,
+    ) -> dict:
+        """Wait until a statement finishes.
+
+        Args:
+            statement_id: The Data API statement ID.
+            timeout: Maximum time in seconds to wait for completion.
+            max_poll_interval: Upper bound for the backoff between status polls.
+
+        Returns:
+            The DescribeStatement response reporting the FINISHED status.
+
+        Raises:
+            Exception: If the statement fails, is aborted, or does not finish in time.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Waiting state is bound to the loop its futures and poller task live on.
+            self._loop = loop
+            self._pending = set()
+            self._poller = None
+            self._wakeup = asyncio.Event()
+
+        now = self._clock()
+        interval = min(self.first_poll_interval, max_poll_interval)
+        entry = _PendingStatement(
+            statement_id=statement_id,
+            future=loop.create_future(),
+            registered_at=now,
+            deadline=now + timeout,
+            interval=interval,
+            max_interval=max_poll_interval,
+            next_poll_at=min(now + interval, now + timeout),
+        )
+        self._pending.add(entry)
+        self._wakeup.set()
+        if self._poller is None or self._poller.done():
+            self._poller = loop.create_task(self._run())
+
+        try:
+            return await entry.future
+        finally:
+            self._pending.discard(entry)
+
+    async def _run(self) -> None:
+        while self._pending:
+            now = self._clock()
+            due = [
+                entry
+                for entry in self._pending
+                if not entry.future.done() and entry.next_poll_at <= now + _POLL_COALESCE_WINDOW
+            ]
+            if due:
+                responses = await asyncio.gather(
+                    *(asyncio.to_thread(self._describe, entry.statement_id) for entry in due),
+                    return_exceptions=True,
+                )
+                now = self._clock()
+                for entry, response in zip(due, responses):
+                    self._handle(entry, response, now)
+                continue
+
+            waiting = [entry for entry in self._pending if not entry.future.done()]
+            if not waiting:
+                # Every remaining waiter has its result; it deregisters on resumption.
+                return
+            next_poll_at = min(entry.next_poll_at for entry in waiting)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(next_poll_at - now, 0))
+            except asyncio.TimeoutError:
+                pass
+
+    def _handle(self, entry: _PendingStatement, response: Any, now: float) -> None:
+        if entry.future.done():
+            return
+        if isinstance(response, BaseException):
+            entry.future.set_exception(response)
+            return
+
+        entry.polls += 1
+        status = response.get('Status')
+        if status == 'FINISHED':
+            timing = self._record(entry, response, now)
+            logger.debug(
+                f'Statement completed: {entry.statement_id} '
+                f'(queued {_format_seconds(timing.queue_seconds)}, '
+                f'executed {_format_seconds(timing.execution_seconds)}, '
+                f'waited {timing.wait_seconds:.2f}s over {timing.polls} polls)'
+            )
+            entry.future.set_result(response)
+        elif status in ('FAILED', 'ABORTED'):
+            self._record(entry, response, now)
+            error_msg = response.get('Error', 'Unknown error')
+            logger.error(f'Statement failed: {error_msg}')
+            entry.future.set_exception(Exception(f'Statement failed: {error_msg}'))
+        elif now >= entry.deadline:
+            waited = now - entry.registered_at
+            logger.error(f'Statement timed out: {entry.statement_id}')
+            entry.future.set_exception(
+                Exception(f'Statement timed out after {waited:.1f} seconds')
+            )
+        else:
+            entry.interval = min(entry.interval * self.backoff, entry.max_interval)
+            entry.next_poll_at = min(now + entry.interval, entry.deadline)
+
+    def _record(self, entry: _PendingStatement, response: dict, now: float) -> StatementTiming:
+        timing = _statement_timing(
+            entry.statement_id, response, now - entry.registered_at, entry.polls
+        )
+        self.timings.append(timing)
+        return timing
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return 'n/a' if seconds is None else f'{seconds:.2f}s'
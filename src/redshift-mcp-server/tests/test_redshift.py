@@ -15,12 +15,15 @@
 """Tests for the redshift module."""
 
 import asyncio
+import base64
+import json
 import pytest
 import sqlglot
 import time
 from awslabs.redshift_mcp_server.models import RedshiftCluster
 from awslabs.redshift_mcp_server.redshift import (
     RedshiftClientManager,
+    RedshiftMetadataCache,
     RedshiftSessionManager,
     _execute_protected_statement,
     _execute_statement,
@@ -31,6 +34,9 @@ from awslabs.redshift_mcp_server.redshift import (
     discover_schemas,
     discover_tables,
     execute_query,
+    fetch_query_results,
+    metadata_cache,
+    read_statement_result,
 )
 from botocore.config import Config
 from botocore.exceptions import ClientError
@@ -45,6 +51,14 @@ def _fake_cluster(identifier='test-cluster', type='provisioned', status='availab
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    """Start every test without cached discovery results."""
+    metadata_cache.clear()
+    yield
+    metadata_cache.clear()
+
+
 class TestRedshiftClientManagerRedshiftClient:
     """Tests for RedshiftClientManager redshift_client() method."""
 
@@ -452,6 +466,72 @@ class TestExecuteProtectedStatement:
         assert query_id == 'user-stmt-id'
         assert results_response == expected_result
 
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_without_session(self, mocker):
+        """use_session=False runs standalone, bypassing the session and its lock."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters',
+            return_value=[_fake_cluster()],
+        )
+        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement',
+            return_value='user-stmt-id',
+        )
+        mock_data_client = mocker.Mock()
+        mock_data_client.describe_statement.return_value = {'HasResultSet': True}
+        mock_data_client.get_statement_result.return_value = _json_page([1])
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_data_client
+
+        result = await execute_query(
+            'test-cluster', 'dev', 'SELECT 1', allow_read_write=True, use_session=False
+        )
+
+        assert result['rows'] == [[1]]
+        mock_execute_statement.assert_called_once()
+        assert 'session_id' not in mock_execute_statement.call_args.kwargs
+        mock_session_manager.lock.assert_not_called()
+        mock_session_manager.session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_read_only_requires_session(self, mocker):
+        """The read-only transaction wrapper cannot run without a session."""
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement'
+        )
+
+        with pytest.raises(ValueError, match='must run on a session'):
+            await execute_query('test-cluster', 'dev', 'SELECT 1', use_session=False)
+        mock_execute_statement.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_follows_next_token(self, mocker):
+        """Every result page is fetched and merged, not just the first one."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('user-stmt-id', True),
+        )
+        mock_data_client = mocker.Mock()
+        mock_data_client.get_statement_result.side_effect = [
+            {
+                'Records': [[{'longValue': 1}]],
+                'ColumnMetadata': [{'name': 'n'}],
+                'NextToken': 'page-2',
+            },
+            {'Records': [[{'longValue': 2}]], 'ColumnMetadata': [{'name': 'n'}]},
+        ]
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_data_client
+
+        results_response, _ = await _execute_protected_statement('test-cluster', 'test-db', 'SQL')
+
+        assert results_response['Records'] == [[{'longValue': 1}], [{'longValue': 2}]]
+        assert 'NextToken' not in results_response
+        mock_data_client.get_statement_result.assert_called_with(
+            Id='user-stmt-id', NextToken='page-2'
+        )
+
     @pytest.mark.asyncio
     async def test_execute_protected_statement_denylisted_statements_rejected(self, mocker):
         """Deny-listed and multi-statement SQL is rejected before it reaches the engine."""
@@ -947,6 +1027,218 @@ class TestRedshiftSessionManager:
         assert lock_b1 is not lock_a1
 
 
+class TestMetadataCache:
+    """Tests for caching of discovery results."""
+
+    @pytest.fixture
+    def mock_control_plane(self, mocker):
+        """Patch the control plane clients with one provisioned cluster."""
+        mock_redshift_client = mocker.Mock()
+        mock_redshift_client.get_paginator.return_value.paginate.return_value = [
+            {'Clusters': [{'ClusterIdentifier': 'test-cluster', 'ClusterStatus': 'available'}]}
+        ]
+        mock_serverless_client = mocker.Mock()
+        mock_serverless_client.get_paginator.return_value.paginate.return_value = [
+            {'workgroups': []}
+        ]
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_client',
+            return_value=mock_redshift_client,
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_serverless_client',
+            return_value=mock_serverless_client,
+        )
+        return mock_redshift_client
+
+    @pytest.mark.asyncio
+    async def test_discover_clusters_reuses_recent_result(self, mock_control_plane):
+        """A second discovery within the cache TTL does not call the control plane."""
+        first = await discover_clusters()
+        second = await discover_clusters()
+
+        assert [c.identifier for c in second] == [c.identifier for c in first]
+        assert mock_control_plane.get_paginator.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_discover_clusters_max_age_zero_refreshes(self, mock_control_plane):
+        """max_age=0 always queries the control plane."""
+        await discover_clusters()
+        await discover_clusters(max_age=0)
+
+        assert mock_control_plane.get_paginator.call_count == 2
+
+    def test_cache_expires(self):
+        """Entries older than max_age are not returned."""
+        clock = SimpleNamespace(now=0.0)
+        cache = RedshiftMetadataCache(clock=lambda: clock.now)
+        cache.put((), [_fake_cluster()])
+
+        clock.now = 59
+        assert cache.get((), max_age=60) is not None
+        clock.now = 60
+        assert cache.get((), max_age=60) is None
+
+    def test_invalidate_drops_subtree(self):
+        """Invalidating a path drops it and everything below, but nothing else."""
+        cache = RedshiftMetadataCache()
+        for path in [
+            (),
+            ('c1',),
+            ('c1', 'dev'),
+            ('c1', 'dev', 'public'),
+            ('c1', 'dev', 'public', 't1'),
+            ('c1', 'dev', 'sales'),
+            ('c2', 'dev'),
+        ]:
+            cache.put(path, ['x'])
+
+        cache.invalidate(('c1', 'dev', 'public'))
+        assert cache.get(('c1', 'dev', 'public'), 60) is None
+        assert cache.get(('c1', 'dev', 'public', 't1'), 60) is None
+        assert cache.get(('c1', 'dev', 'sales'), 60) == ['x']
+
+        cache.invalidate(('c1',))
+        assert cache.get(('c1', 'dev'), 60) is None
+        assert cache.get(('c2', 'dev'), 60) == ['x']
+        assert cache.get((), 60) == ['x']
+
+    @pytest.mark.asyncio
+    async def test_failed_discovery_is_not_cached(self, mocker):
+        """Errors propagate and leave the cache empty."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_client',
+            side_effect=ClientError({'Error': {'Code': 'Throttling'}}, 'DescribeClusters'),
+        )
+
+        with pytest.raises(ClientError):
+            await discover_clusters()
+        assert metadata_cache.get((), max_age=60) is None
+
+    @pytest.mark.asyncio
+    async def test_discover_tables_cached_until_refresh(self, mocker):
+        """Tables are read from the cache until refresh=True is passed."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                _show_response(
+                    ['database_name', 'schema_name', 'table_name'], [['dev', 'public', 'users']]
+                ),
+                'query-1',
+            ),
+        )
+
+        first = await discover_tables('test-cluster', 'dev', 'public')
+        second = await discover_tables('test-cluster', 'dev', 'public')
+        assert [t.table_name for t in second] == [t.table_name for t in first] == ['users']
+        assert mock_execute_protected.call_count == 1
+
+        await discover_tables('test-cluster', 'dev', 'public', refresh=True)
+        assert mock_execute_protected.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discover_columns_prefetches_whole_schema(self, mocker):
+        """One SVV_ALL_COLUMNS query serves the columns of every table in the schema."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                _show_response(
+                    ['database_name', 'schema_name', 'table_name', 'column_name'],
+                    [
+                        ['dev', 'public', 'orders', 'id'],
+                        ['dev', 'public', 'orders', 'total'],
+                        ['dev', 'public', 'users', 'id'],
+                    ],
+                ),
+                'query-1',
+            ),
+        )
+
+        orders = await discover_columns('test-cluster', 'dev', 'public', 'orders')
+        users = await discover_columns('test-cluster', 'dev', 'public', 'users')
+
+        assert [c.column_name for c in orders] == ['id', 'total']
+        assert [c.column_name for c in users] == ['id']
+        mock_execute_protected.assert_called_once()
+        kwargs = mock_execute_protected.call_args.kwargs
+        assert 'svv_all_columns' in kwargs['sql']
+        assert kwargs['parameters'] == [
+            {'name': 'database', 'value': 'dev'},
+            {'name': 'schema', 'value': 'public'},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_discover_columns_failed_prefetch_falls_back(self, mocker):
+        """A failing SVV_ALL_COLUMNS query falls back to SHOW COLUMNS and is not retried."""
+        show_columns = (
+            _show_response(
+                ['database_name', 'schema_name', 'table_name', 'column_name'],
+                [['dev', 'public', 'users', 'id']],
+            ),
+            'query-2',
+        )
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            side_effect=[Exception('permission denied for svv_all_columns'), show_columns],
+        )
+
+        columns = await discover_columns('test-cluster', 'dev', 'public', 'users')
+
+        assert [c.column_name for c in columns] == ['id']
+        sqls = [call.kwargs['sql'] for call in mock_execute_protected.call_args_list]
+        assert 'svv_all_columns' in sqls[0]
+        assert 'SHOW COLUMNS' in sqls[1]
+
+        mock_execute_protected.side_effect = None
+        mock_execute_protected.return_value = show_columns
+        await discover_columns('test-cluster', 'dev', 'public', 'orders')
+        assert 'SHOW COLUMNS' in mock_execute_protected.call_args.kwargs['sql']
+        assert mock_execute_protected.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_discover_columns_prefetches_schema_once(self, mocker):
+        """Tables missing from the prefetch do not rerun it until the schema is invalidated."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                _show_response(
+                    ['database_name', 'schema_name', 'table_name', 'column_name'],
+                    [['dev', 'public', 'users', 'id']],
+                ),
+                'query-1',
+            ),
+        )
+
+        await discover_columns('test-cluster', 'dev', 'public', 'late_binding_view')
+        await discover_columns('test-cluster', 'dev', 'public', 'other_view')
+        sqls = [call.kwargs['sql'] for call in mock_execute_protected.call_args_list]
+        assert ['svv_all_columns' in sql for sql in sqls] == [True, False, False]
+
+        metadata_cache.invalidate(('test-cluster', 'dev', 'public'))
+        await discover_columns('test-cluster', 'dev', 'public', 'other_view')
+        assert 'svv_all_columns' in mock_execute_protected.call_args_list[3].kwargs['sql']
+
+    @pytest.mark.asyncio
+    async def test_discover_columns_refresh_requeries_single_table(self, mocker):
+        """refresh=True re-reads one table with SHOW COLUMNS instead of the whole schema."""
+        metadata_cache.put(('test-cluster', 'dev', 'public', 'users'), [])
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                _show_response(
+                    ['database_name', 'schema_name', 'table_name', 'column_name'],
+                    [['dev', 'public', 'users', 'email']],
+                ),
+                'query-1',
+            ),
+        )
+
+        columns = await discover_columns('test-cluster', 'dev', 'public', 'users', refresh=True)
+
+        assert [c.column_name for c in columns] == ['email']
+        assert 'SHOW COLUMNS' in mock_execute_protected.call_args.kwargs['sql']
+
+
 class TestDiscoverFunctions:
     """Tests for discover_*() functions."""
 
@@ -1639,19 +1931,25 @@ class TestDiscoverFunctions:
         assert result[0].ordinal_position == 1
         assert result[0].data_type == 'integer'
 
-        # db.schema.table is embedded as quoted identifiers (no bind params).
+        # The schema's columns are prefetched in one bound-parameter query.
         mock_execute_protected.assert_called_once()
         call_args = mock_execute_protected.call_args
-        sql = call_args[1]['sql']
-        assert 'SHOW COLUMNS FROM TABLE' in sql
-        assert '"dev"."public"."users"' in sql
-        assert call_args[1].get('parameters') is None
+        assert 'FROM svv_all_columns' in call_args[1]['sql']
+        assert call_args[1]['parameters'] == [
+            {'name': 'database', 'value': 'dev'},
+            {'name': 'schema', 'value': 'public'},
+        ]
 
-        # Double quotes in the identifiers are doubled so the values cannot
-        # break out of them (injection-safe).
+        # A table the prefetch does not cover falls back to SHOW COLUMNS, with
+        # db.schema.table embedded as quoted identifiers (no bind params). Double
+        # quotes in the identifiers are doubled so the values cannot break out of
+        # them (injection-safe).
         mock_execute_protected.return_value = ({'Records': []}, 'query-102')
         await discover_columns('test-cluster', 'd"b', 's"c', 't"l')
-        assert '"d""b"."s""c"."t""l"' in mock_execute_protected.call_args[1]['sql']
+        call_args = mock_execute_protected.call_args
+        assert 'SHOW COLUMNS FROM TABLE' in call_args[1]['sql']
+        assert '"d""b"."s""c"."t""l"' in call_args[1]['sql']
+        assert call_args[1].get('parameters') is None
 
     @pytest.mark.asyncio
     async def test_discover_columns_error(self, mocker):
@@ -1665,39 +1963,63 @@ class TestDiscoverFunctions:
             await discover_columns('test-cluster', 'dev', 'public', 'users')
 
 
+def _show_response(names, rows):
+    """Build a Data API result set of string cells with the given column names."""
+    return {
+        'ColumnMetadata': [{'name': name} for name in names],
+        'Records': [[{'stringValue': value} for value in row] for row in rows],
+    }
+
+
+def _json_page(values, next_token=None):
+    """Build a get_statement_result page with a single long column named n."""
+    page = {
+        'ColumnMetadata': [{'name': 'n'}],
+        'Records': [[{'longValue': v}] for v in values],
+    }
+    if next_token:
+        page['NextToken'] = next_token
+    return page
+
+
 class TestExecuteQuery:
     """Tests for execute_query function."""
 
+    @pytest.fixture
+    def mock_data_client(self, mocker):
+        """Patch the Data API client used to read results."""
+        data_client = mocker.Mock()
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = data_client
+        return data_client
+
     @pytest.mark.asyncio
-    async def test_execute_query_success(self, mocker):
+    async def test_execute_query_success(self, mocker, mock_data_client):
         """Test successful query execution."""
-        # Mock _execute_protected_statement
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
-        )
-        mock_execute_protected.return_value = (
-            {
-                'ColumnMetadata': [
-                    {'name': 'id'},
-                    {'name': 'name'},
-                    {'name': 'score'},
-                    {'name': 'active'},
-                    {'name': 'deleted'},
-                    {'name': 'unknown'},
-                ],
-                'Records': [
-                    [
-                        {'longValue': 1},
-                        {'stringValue': 'Test User'},
-                        {'doubleValue': 95.5},
-                        {'booleanValue': True},
-                        {'isNull': True},
-                        {'unknownType': 'fallback'},
-                    ]
-                ],
-            },
-            'query-123',
+        mock_run_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement'
         )
+        mock_run_protected.return_value = ('query-123', True)
+        mock_data_client.get_statement_result.return_value = {
+            'ColumnMetadata': [
+                {'name': 'id'},
+                {'name': 'name'},
+                {'name': 'score'},
+                {'name': 'active'},
+                {'name': 'deleted'},
+                {'name': 'unknown'},
+            ],
+            'Records': [
+                [
+                    {'longValue': 1},
+                    {'stringValue': 'Test User'},
+                    {'doubleValue': 95.5},
+                    {'booleanValue': True},
+                    {'isNull': True},
+                    {'unknownType': 'fallback'},
+                ]
+            ],
+        }
 
         result = await execute_query(
             'test-cluster',
@@ -1711,17 +2033,15 @@ class TestExecuteQuery:
         ]
         assert result['row_count'] == 1
         assert result['query_id'] == 'query-123'
+        assert result['next_token'] is None
+        mock_data_client.get_statement_result.assert_called_once_with(Id='query-123')
 
     @pytest.mark.asyncio
-    async def test_execute_query_no_result_set(self, mocker):
+    async def test_execute_query_no_result_set(self, mocker, mock_data_client):
         """SET-style statements with no result set return an empty, successful result."""
-        # Mock _execute_protected_statement to mimic a no-result-set statement
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
-        )
-        mock_execute_protected.return_value = (
-            {'Records': [], 'ColumnMetadata': []},
-            'set-query-123',
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('set-query-123', False),
         )
 
         result = await execute_query(
@@ -1734,20 +2054,229 @@ class TestExecuteQuery:
         assert result['rows'] == []
         assert result['row_count'] == 0
         assert result['query_id'] == 'set-query-123'
+        assert result['next_token'] is None
+        mock_data_client.get_statement_result.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_query_reads_all_pages(self, mocker, mock_data_client):
+        """Without a row budget every result page is read."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('query-123', True),
+        )
+        mock_data_client.get_statement_result.side_effect = [
+            _json_page([1, 2], next_token='p2'),
+            _json_page([3], next_token='p3'),
+            _json_page([4]),
+        ]
+
+        result = await execute_query('test-cluster', 'dev', 'SELECT n FROM t')
+
+        assert result['rows'] == [[1], [2], [3], [4]]
+        assert result['next_token'] is None
+        assert mock_data_client.get_statement_result.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_query_max_rows_and_continuation(self, mocker, mock_data_client):
+        """A row budget stops reading early; the continuation resumes mid-page."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('query-123', True),
+        )
+        pages = {
+            None: _json_page([1, 2, 3], next_token='p2'),
+            'p2': _json_page([4, 5]),
+        }
+        mock_data_client.get_statement_result.side_effect = lambda Id, NextToken=None: pages[
+            NextToken
+        ]
+
+        first = await execute_query('test-cluster', 'dev', 'SELECT n FROM t', max_rows=2)
+        assert first['rows'] == [[1], [2]]
+        assert first['next_token'] is not None
+        # Only the first page was needed to fill the budget.
+        assert mock_data_client.get_statement_result.call_count == 1
+
+        second = await fetch_query_results(first['next_token'], max_rows=2)
+        assert second['columns'] == ['n']
+        assert second['rows'] == [[3], [4]]
+        assert second['query_id'] == 'query-123'
+
+        third = await fetch_query_results(second['next_token'])
+        assert third['rows'] == [[5]]
+        assert third['next_token'] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_query_budget_at_page_boundary(self, mocker, mock_data_client):
+        """A budget that ends exactly on a page points the continuation at the next page."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('query-123', True),
+        )
+        mock_data_client.get_statement_result.side_effect = [
+            _json_page([1, 2], next_token='p2'),
+            _json_page([3]),
+        ]
+
+        first = await execute_query('test-cluster', 'dev', 'SELECT n FROM t', max_rows=2)
+        rest = await fetch_query_results(first['next_token'])
+
+        assert first['rows'] == [[1], [2]]
+        assert rest['rows'] == [[3]]
+        mock_data_client.get_statement_result.assert_called_with(Id='query-123', NextToken='p2')
+
+    @pytest.mark.asyncio
+    async def test_execute_query_budget_covering_result_has_no_token(
+        self, mocker, mock_data_client
+    ):
+        """A budget equal to the result size does not hand out a continuation."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('query-123', True),
+        )
+        mock_data_client.get_statement_result.return_value = _json_page([1, 2])
+
+        result = await execute_query('test-cluster', 'dev', 'SELECT n FROM t', max_rows=2)
+
+        assert result['rows'] == [[1], [2]]
+        assert result['next_token'] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_query_csv_format(self, mocker, mock_data_client):
+        """CSV results are read with get_statement_result_v2 and typed from column metadata."""
+        mock_run_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement',
+            return_value=('query-123', True),
+        )
+        column_metadata = [
+            {'name': 'id', 'typeName': 'int4'},
+            {'name': 'name', 'typeName': 'varchar'},
+            {'name': 'score', 'typeName': 'float8'},
+            {'name': 'active', 'typeName': 'bool'},
+            {'name': 'amount', 'typeName': 'numeric'},
+        ]
+        mock_data_client.get_statement_result_v2.side_effect = [
+            {
+                'ColumnMetadata': column_metadata,
+                'Records': [
+                    {'CSVRecords': 'id,name,score,active,amount\n1,"Smith, J",95.5,t,10.25\n'}
+                ],
+                'NextToken': 'p2',
+            },
+            {
+                'ColumnMetadata': column_metadata,
+                'Records': [{'CSVRecords': '2,,,f,\n'}],
+            },
+        ]
+
+        result = await execute_query(
+            'test-cluster', 'dev', 'SELECT * FROM users', result_format='CSV'
+        )
+
+        assert mock_run_protected.call_args.kwargs['result_format'] == 'CSV'
+        assert result['columns'] == ['id', 'name', 'score', 'active', 'amount']
+        assert result['rows'] == [
+            [1, 'Smith, J', 95.5, True, '10.25'],
+            [2, '', None, False, None],
+        ]
+        mock_data_client.get_statement_result.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_query_error_handling(self, mocker):
         """Test error handling in execute_query."""
-        # Mock _execute_protected_statement to raise exception
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
+        mock_run_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._run_protected_statement'
         )
-        mock_execute_protected.side_effect = Exception('Query execution failed')
+        mock_run_protected.side_effect = Exception('Query execution failed')
 
         with pytest.raises(Exception, match='Query execution failed'):
             await execute_query('test-cluster', 'dev', 'SELECT * FROM nonexistent')
 
 
+class TestReadStatementResult:
+    """Tests for read_statement_result and its continuation tokens."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_next_token_rejected(self):
+        """Tokens that were not produced by the reader are rejected before any API call."""
+        with pytest.raises(ValueError, match='Invalid next_token'):
+            await read_statement_result(next_token='not-a-token')
+
+    @pytest.mark.asyncio
+    async def test_forged_next_token_rejected(self, mocker):
+        """A token pointing at another statement without a valid signature is rejected."""
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        data_client = mock_client_manager.redshift_data_client.return_value
+        data_client.get_statement_result.return_value = _json_page([1, 2, 3])
+        first = await read_statement_result('query-123', max_rows=1)
+
+        payload, _, signature = first['next_token'].partition('.')
+        state = json.loads(base64.urlsafe_b64decode(payload))
+        state['q'] = 'someone-elses-query'
+        forged = base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+        for token in (f'{forged}.{signature}', forged):
+            with pytest.raises(ValueError, match='Invalid next_token'):
+                await read_statement_result(next_token=token)
+        assert data_client.get_statement_result.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_query_results_applies_default_budget(self, mocker):
+        """Without max_rows, fetch_query_results stops at the default row budget."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.FETCH_QUERY_RESULTS_DEFAULT_MAX_ROWS', 2
+        )
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        data_client = mock_client_manager.redshift_data_client.return_value
+        data_client.get_statement_result.return_value = _json_page([1, 2, 3, 4, 5])
+        first = await read_statement_result('query-123', max_rows=1)
+
+        rest = await fetch_query_results(first['next_token'])
+
+        assert rest['rows'] == [[2], [3]]
+        assert rest['next_token'] is not None
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_off_event_loop(self, mocker):
+        """GetStatementResult runs in a worker thread, not on the event loop."""
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        data_client = mock_client_manager.redshift_data_client.return_value
+        data_client.get_statement_result.return_value = _json_page([1])
+        to_thread = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.asyncio.to_thread', wraps=asyncio.to_thread
+        )
+
+        result = await read_statement_result('query-123')
+
+        assert result['rows'] == [[1]]
+        to_thread.assert_called_once_with(data_client.get_statement_result, Id='query-123')
+
+    @pytest.mark.asyncio
+    async def test_query_id_or_token_required(self):
+        """Reading requires something to read."""
+        with pytest.raises(ValueError, match='query_id or next_token'):
+            await read_statement_result()
+
+    @pytest.mark.asyncio
+    async def test_continuation_keeps_result_format(self, mocker):
+        """A continuation of a CSV read keeps using get_statement_result_v2."""
+        data_client = mocker.Mock()
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = data_client
+        data_client.get_statement_result_v2.return_value = {
+            'ColumnMetadata': [{'name': 'n', 'typeName': 'int8'}],
+            'Records': [{'CSVRecords': '1\n2\n3\n'}],
+        }
+
+        first = await read_statement_result('query-123', max_rows=1, result_format='CSV')
+        rest = await read_statement_result(next_token=first['next_token'])
+
+        assert first['rows'] == [[1]]
+        assert rest['rows'] == [[2], [3]]
+        assert data_client.get_statement_result_v2.call_count == 2
+        data_client.get_statement_result.assert_not_called()
+
+
 # Shared fakes and parametrization for the TestConcurrency tests below.
 _CONCURRENCY_CLUSTER_TYPES = pytest.mark.parametrize(
     'cluster_type',
@@ -14,6 +14,7 @@
 
 """Tests for review cluster executor."""
 
+import asyncio
 import pytest
 from awslabs.redshift_mcp_server.models import RedshiftCluster
 from awslabs.redshift_mcp_server.review.executor import review_cluster
@@ -440,3 +441,110 @@ class TestNodeTypeSubstitution:
         )
 
         assert 'NodeDetails' not in recorded
+
+
+# ---------------------------------------------------------------------------
+# Concurrent execution
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentExecution:
+    """Signal queries run concurrently, bounded, with deterministic output."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency queries are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def _execute(*a, **kw):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return _make_empty_response()
+
+        result = await review_cluster(
+            cluster_identifier='test-cluster',
+            execute_query_func=_execute,
+            discover_clusters_func=_make_discover_clusters(),
+            max_concurrency=3,
+        )
+
+        assert result.signals_evaluated > 3
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_findings_keep_query_order_when_completion_order_differs(self):
+        """Findings and queries_executed follow definition order, not completion order."""
+        started: list[str] = []
+
+        async def _execute(cluster_identifier, database_name, sql, allow_read_write=False):
+            query_name = sql.splitlines()[0].removeprefix('--').strip()
+            started.append(query_name)
+            # Earlier queries finish last.
+            await asyncio.sleep(0.001 * (50 - len(started)))
+            return _make_response([(1, 'REC_001', f'{query_name}Signal')])
+
+        result = await review_cluster(
+            cluster_identifier='test-cluster',
+            execute_query_func=_execute,
+            discover_clusters_func=_make_discover_clusters(),
+            max_concurrency=50,
+        )
+
+        assert result.queries_executed == started
+        assert [f.section for f in result.findings] == started
+
+    @pytest.mark.asyncio
+    async def test_progress_is_monotonic_under_concurrency(self):
+        """Progress counts completed queries one by one, whatever order they finish in."""
+        progress_calls = []
+
+        async def _execute(*a, **kw):
+            await asyncio.sleep(0)
+            return _make_empty_response()
+
+        async def mock_progress(current, total):
+            await asyncio.sleep(0)
+            progress_calls.append((current, total))
+
+        result = await review_cluster(
+            cluster_identifier='test-cluster',
+            execute_query_func=_execute,
+            discover_clusters_func=_make_discover_clusters(),
+            progress_reporter_func=mock_progress,
+            max_concurrency=4,
+        )
+
+        total = result.signals_evaluated
+        assert progress_calls == [(i, total) for i in range(1, total + 1)]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_outstanding_queries(self):
+        """The first failure aborts the review and cancels queries still running."""
+        cancelled = 0
+
+        async def _execute(cluster_identifier, database_name, sql, allow_read_write=False):
+            nonlocal cancelled
+            if 'NodeDetails' in sql.splitlines()[0]:
+                raise RuntimeError('boom')
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return _make_empty_response()
+
+        with pytest.raises(RuntimeError, match='boom'):
+            await asyncio.wait_for(
+                review_cluster(
+                    cluster_identifier='test-cluster',
+                    execute_query_func=_execute,
+                    discover_clusters_func=_make_discover_clusters(),
+                    max_concurrency=50,
+                ),
+                timeout=5,
+            )
+        assert cancelled > 0
@@ -30,6 +30,7 @@ from awslabs.redshift_mcp_server.review.models import (
 )
 from awslabs.redshift_mcp_server.server import (
     execute_query_tool,
+    fetch_query_results_tool,
     list_clusters_tool,
     list_columns_tool,
     list_databases_tool,
@@ -52,6 +53,7 @@ async def test_tool_annotations():
         'list_tables': 'List Redshift tables',
         'list_columns': 'List Redshift columns',
         'execute_query': 'Execute read-only Redshift query',
+        'fetch_query_results': 'Fetch more Redshift query results',
         'review_cluster': 'Review Redshift cluster',
     }
 
@@ -559,6 +561,76 @@ class TestExecuteQueryTool:
             'Failed to execute query on cluster test-cluster in database test-db: Query error'
         )
 
+    @pytest.mark.asyncio
+    async def test_execute_query_tool_passes_budget_and_format(self, mocker):
+        """max_rows and result_format reach execute_query; next_token is returned."""
+        mock_execute_query = mocker.patch('awslabs.redshift_mcp_server.server.execute_query')
+        mock_execute_query.return_value = {
+            'columns': ['n'],
+            'rows': [[1]],
+            'row_count': 1,
+            'query_id': 'query-789',
+            'next_token': 'token-1',
+        }
+
+        result = await execute_query_tool(
+            Context(),
+            cluster_identifier='test-cluster',
+            database_name='dev',
+            sql='SELECT n FROM t',
+            max_rows=1,
+            result_format='CSV',
+        )
+
+        assert result.next_token == 'token-1'
+        mock_execute_query.assert_called_once_with(
+            cluster_identifier='test-cluster',
+            database_name='dev',
+            sql='SELECT n FROM t',
+            max_rows=1,
+            result_format='CSV',
+        )
+
+
+class TestFetchQueryResultsTool:
+    """Tests for the fetch_query_results MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_query_results_tool_success(self, mocker):
+        """The continuation is passed through and the rows are returned as a QueryResult."""
+        mock_fetch = mocker.patch('awslabs.redshift_mcp_server.server.fetch_query_results')
+        mock_fetch.return_value = {
+            'columns': ['n'],
+            'rows': [[2], [3]],
+            'row_count': 2,
+            'query_id': 'query-789',
+            'next_token': None,
+        }
+
+        result = await fetch_query_results_tool(Context(), next_token='token-1', max_rows=5)
+
+        assert isinstance(result, QueryResult)
+        assert result.rows == [[2], [3]]
+        assert result.next_token is None
+        mock_fetch.assert_called_once_with(next_token='token-1', max_rows=5)
+
+    @pytest.mark.asyncio
+    async def test_fetch_query_results_tool_error(self, mocker):
+        """Errors such as an invalid token are reported to the client and re-raised."""
+        from unittest.mock import AsyncMock, Mock
+
+        mock_ctx = Mock()
+        mock_ctx.error = AsyncMock()
+        mocker.patch(
+            'awslabs.redshift_mcp_server.server.fetch_query_results',
+            side_effect=ValueError('Invalid next_token'),
+        )
+
+        with pytest.raises(ValueError, match='Invalid next_token'):
+            await fetch_query_results_tool(mock_ctx, next_token='bogus', max_rows=None)
+
+        mock_ctx.error.assert_called_once_with('Failed to fetch query results: Invalid next_token')
+
 
 class TestReviewClusterTool:
     """Tests for the review_cluster MCP tool."""
@@ -625,6 +697,8 @@ class TestReviewClusterTool:
         call_kwargs = mock_pipeline.call_args.kwargs
         assert call_kwargs['cluster_identifier'] == 'test-cluster'
         assert call_kwargs['database_name'] == 'dev'
+        # Signal queries run off the shared session so they can execute concurrently.
+        assert call_kwargs['execute_query_func'].keywords == {'use_session': False}
 
     @pytest.mark.asyncio
     async def test_review_cluster_empty_results(self, mocker):
@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the statement completion waiter."""
+
+import asyncio
+import pytest
+import threading
+import time
+from awslabs.redshift_mcp_server.statement_waiter import StatementWaiter, _statement_timing
+from datetime import datetime, timedelta
+
+
+def _make_describe(statuses: dict[str, list[dict]]):
+    """Build a describe callable replaying a list of responses per statement ID.
+
+    The last response of each list is repeated once the list is exhausted.
+
+    Returns:
+        A (describe, calls) tuple, where calls records (statement_id, monotonic time).
+    """
+    calls: list[tuple[str, float]] = []
+    lock = threading.Lock()
+
+    def describe(statement_id):
+        with lock:
+            calls.append((statement_id, time.monotonic()))
+            responses = statuses[statement_id]
+            return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return describe, calls
+
+
+class TestStatementWaiter:
+    """Tests for StatementWaiter."""
+
+    @pytest.mark.asyncio
+    async def test_short_statement_returns_after_first_poll(self):
+        """A statement that is already finished costs one poll after the first interval."""
+        describe, calls = _make_describe({'s1': [{'Status': 'FINISHED', 'HasResultSet': True}]})
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        started = time.monotonic()
+        response = await waiter.wait('s1', timeout=5, max_poll_interval=1)
+
+        assert response['HasResultSet'] is True
+        assert len(calls) == 1
+        assert time.monotonic() - started < 0.5
+        assert waiter.timings[-1].polls == 1
+        assert waiter.timings[-1].status == 'FINISHED'
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_backs_off_to_maximum(self):
+        """Gaps between polls grow by the backoff factor and stop at the maximum."""
+        describe, calls = _make_describe(
+            {'s1': [{'Status': 'STARTED'}] * 5 + [{'Status': 'FINISHED'}]}
+        )
+        waiter = StatementWaiter(describe, first_poll_interval=0.01, backoff=2)
+
+        await waiter.wait('s1', timeout=5, max_poll_interval=0.04)
+
+        times = [t for _, t in calls]
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert len(calls) == 6
+        # Expected gaps: 0.02, 0.04, 0.04, 0.04, 0.04 (never more than the maximum).
+        assert gaps[0] < gaps[-1] + 0.01
+        assert all(gap < 0.2 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_outstanding_statements_are_polled_together(self):
+        """Statements due at the same time are described concurrently in one round."""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def describe(statement_id):
+            # Only passes if all three describe calls are in flight at once.
+            barrier.wait()
+            return {'Status': 'FINISHED'}
+
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        responses = await asyncio.gather(
+            *(waiter.wait(f's{i}', timeout=5, max_poll_interval=1) for i in range(3))
+        )
+
+        assert [r['Status'] for r in responses] == ['FINISHED'] * 3
+
+    @pytest.mark.asyncio
+    async def test_polling_does_not_block_event_loop(self):
+        """Slow DescribeStatement calls run in threads while other coroutines progress."""
+        ticks = 0
+
+        def describe(statement_id):
+            time.sleep(0.2)
+            return {'Status': 'FINISHED'}
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await waiter.wait('s1', timeout=5, max_poll_interval=1)
+        finally:
+            ticker_task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_raises(self):
+        """FAILED and ABORTED surface the Data API error and are still timed."""
+        describe, _ = _make_describe({'s1': [{'Status': 'FAILED', 'Error': 'syntax error'}]})
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        with pytest.raises(Exception, match='Statement failed: syntax error'):
+            await waiter.wait('s1', timeout=5)
+
+        assert waiter.timings[-1].status == 'FAILED'
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """A statement still running at the deadline times out."""
+        describe, calls = _make_describe({'s1': [{'Status': 'STARTED'}]})
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        with pytest.raises(Exception, match='Statement timed out after'):
+            await waiter.wait('s1', timeout=0.1, max_poll_interval=0.02)
+
+        assert len(calls) > 1
+
+    @pytest.mark.asyncio
+    async def test_describe_error_propagates_to_its_waiter_only(self):
+        """An API error for one statement fails that wait, not the others."""
+
+        def describe(statement_id):
+            if statement_id == 'bad':
+                raise RuntimeError('throttled')
+            return {'Status': 'FINISHED'}
+
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        results = await asyncio.gather(
+            waiter.wait('bad', timeout=5),
+            waiter.wait('good', timeout=5),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == {'Status': 'FINISHED'}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_stops_polling(self):
+        """A cancelled waiter is dropped from the polling set."""
+        replay, calls = _make_describe({'s1': [{'Status': 'STARTED'}]})
+        polled = threading.Event()
+
+        def describe(statement_id):
+            response = replay(statement_id)
+            polled.set()
+            return response
+
+        waiter = StatementWaiter(describe, first_poll_interval=0.01)
+
+        task = asyncio.create_task(waiter.wait('s1', timeout=5, max_poll_interval=0.01))
+        assert await asyncio.to_thread(polled.wait, 2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # A poll already in flight may still complete, then the poller stops.
+        await asyncio.wait_for(waiter._poller, 2)
+        polls_after_cancel = len(calls)
+        await asyncio.sleep(0.05)
+
+        assert not waiter._pending
+        assert len(calls) == polls_after_cancel
+
+
+class TestStatementTiming:
+    """Tests for the queue/execution breakdown."""
+
+    def test_queue_and_execution_time_from_describe_statement(self):
+        """Queue time is the submit-to-finish time not spent executing."""
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        response = {
+            'Status': 'FINISHED',
+            'CreatedAt': created_at,
+            'UpdatedAt': created_at + timedelta(seconds=3),
+            'Duration': 2_500_000_000,
+        }
+
+        timing = _statement_timing('s1', response, wait_seconds=3.2, polls=4)
+
+        assert timing.execution_seconds == pytest.approx(2.5)
+        assert timing.queue_seconds == pytest.approx(0.5)
+        assert timing.wait_seconds == 3.2
+        assert timing.polls == 4
+
+    def test_missing_fields_leave_breakdown_unknown(self):
+        """Duration of -1 (not reported) yields no execution or queue time."""
+        timing = _statement_timing('s1', {'Status': 'FAILED', 'Duration': -1}, 0.1, 1)
+
+        assert timing.execution_seconds is None
+        assert timing.queue_seconds is None